@@ -0,0 +1,54 @@
+"""Add job queue lease columns to backtest_results
+
+Revision ID: c2d3e4f5a6b7
+Revises: b1c2d3e4f5g6
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c2d3e4f5a6b7"
+down_revision: Union[str, None] = "b1c2d3e4f5g6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add lease/attempt tracking for the persistent backtest job queue."""
+    op.add_column(
+        "backtest_results", sa.Column("lease_owner", sa.String(), nullable=True)
+    )
+    op.add_column(
+        "backtest_results", sa.Column("lease_expires_at", sa.DateTime(), nullable=True)
+    )
+    op.add_column(
+        "backtest_results",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "backtest_results", sa.Column("started_at", sa.DateTime(), nullable=True)
+    )
+    op.add_column(
+        "backtest_results", sa.Column("finished_at", sa.DateTime(), nullable=True)
+    )
+    op.create_index(
+        "idx_backtest_status_created",
+        "backtest_results",
+        ["status", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop backtest job queue columns."""
+    op.drop_index("idx_backtest_status_created", table_name="backtest_results")
+    op.drop_column("backtest_results", "finished_at")
+    op.drop_column("backtest_results", "started_at")
+    op.drop_column("backtest_results", "attempts")
+    op.drop_column("backtest_results", "lease_expires_at")
+    op.drop_column("backtest_results", "lease_owner")
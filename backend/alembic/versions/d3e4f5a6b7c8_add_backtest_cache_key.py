@@ -0,0 +1,37 @@
+"""Add result cache key to backtest_results
+
+Revision ID: d3e4f5a6b7c8
+Revises: c2d3e4f5a6b7
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3e4f5a6b7c8"
+down_revision: Union[str, None] = "c2d3e4f5a6b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add content-addressed cache key for completed backtest results."""
+    op.add_column(
+        "backtest_results", sa.Column("cache_key", sa.String(), nullable=True)
+    )
+    op.create_index(
+        "idx_backtest_user_cache_key",
+        "backtest_results",
+        ["user_id", "cache_key"],
+    )
+
+
+def downgrade() -> None:
+    """Drop backtest result cache key."""
+    op.drop_index("idx_backtest_user_cache_key", table_name="backtest_results")
+    op.drop_column("backtest_results", "cache_key")
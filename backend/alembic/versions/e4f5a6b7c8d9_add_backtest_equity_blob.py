@@ -0,0 +1,36 @@
+"""Add compressed equity curve and preview to backtest_results
+
+Revision ID: e4f5a6b7c8d9
+Revises: d3e4f5a6b7c8
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4f5a6b7c8d9"
+down_revision: Union[str, None] = "d3e4f5a6b7c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store equity curves as a compressed blob plus a downsampled preview."""
+    op.add_column(
+        "backtest_results",
+        sa.Column("equity_curve_blob", sa.LargeBinary(), nullable=True),
+    )
+    op.add_column(
+        "backtest_results", sa.Column("equity_preview", sa.Text(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Drop compressed equity columns."""
+    op.drop_column("backtest_results", "equity_preview")
+    op.drop_column("backtest_results", "equity_curve_blob")
@@ -0,0 +1,31 @@
+"""Add Monte Carlo analysis column to backtest_results
+
+Revision ID: f5a6b7c8d9e0
+Revises: e4f5a6b7c8d9
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f5a6b7c8d9e0"
+down_revision: Union[str, None] = "e4f5a6b7c8d9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store Monte Carlo robustness results next to the backtest."""
+    op.add_column(
+        "backtest_results", sa.Column("monte_carlo", sa.Text(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Drop Monte Carlo results column."""
+    op.drop_column("backtest_results", "monte_carlo")
@@ -0,0 +1,7 @@
+"""
+백테스트 성능 벤치마크 (오프라인)
+
+    python -m benchmarks.run              # 전체 (10k / 100k / 1M 캔들)
+    python -m benchmarks.run --quick      # 10k / 100k
+    python -m benchmarks.compare base.json head.json
+"""
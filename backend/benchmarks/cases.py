@@ -0,0 +1,259 @@
+"""
+벤치마크 케이스 정의
+
+그룹:
+- candle_load: 업로드 CSV 파싱 vs 캔들 저장소(CandleCacheManager) 배열 로드
+- indicators: DynamicStrategyExecutor 지표 함수 (라이브 봇 윈도우 크기별)
+- backtest: 루프 vs 벡터화 엔진 (캔들 수별)
+- metrics: BacktestMetricsCalculator / 롤링 지표
+- persistence: equity 곡선 압축/복원, 거래 bulk insert (SQLite 메모리 DB)
+"""
+
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence
+
+from src.services import performance_metrics as pm
+from src.services.backtest_engine import BacktestEngine
+from src.services.backtest_metrics import BacktestMetricsCalculator
+from src.services.backtest_persistence import (
+    BacktestPersistenceService,
+    decode_equity_curve,
+    downsample_equity_curve,
+    encode_equity_curve,
+)
+from src.services.candle_arrays import CandleArrays
+from src.services.candle_cache import CandleCacheManager
+from src.services.strategies.registry import get_strategy
+
+from .data import (
+    FIXTURE_CACHE_DIR,
+    FIXTURE_SERIES,
+    fixture_path,
+    synthetic_candles,
+    synthetic_trades,
+    write_csv,
+)
+from .harness import Bench
+
+INDICATOR_WINDOWS = (50, 200, 1000, 5000)
+
+
+_workdirs: List[Path] = []
+
+
+def _workdir() -> Path:
+    path = Path(tempfile.mkdtemp(prefix="backtest-bench-"))
+    _workdirs.append(path)
+    return path
+
+
+def cleanup():
+    for path in _workdirs:
+        shutil.rmtree(path, ignore_errors=True)
+    _workdirs.clear()
+
+
+def candle_load_cases(sizes: Sequence[int]) -> List[Bench]:
+    benches = []
+    engine = BacktestEngine()
+    for n in sizes:
+        if n > 100_000:
+            continue  # CSV dict 파싱은 100k에서 충분히 비교됨
+        workdir = _workdir()
+        path = write_csv(synthetic_candles(n), workdir / "BENCHUSDT_1m.csv")
+
+        def csv_upload(path=path):
+            CandleArrays.from_dicts(asyncio.run(engine.load_candles(str(path))))
+
+        def store_cold(workdir=workdir):
+            # 새 매니저 = 배열 캐시 없음 → 파일 파싱 포함
+            asyncio.run(
+                CandleCacheManager(str(workdir)).get_candle_arrays(
+                    "BENCHUSDT", "1m", "2020-09-13", "2030-01-01", cache_only=True
+                )
+            )
+
+        warm_manager = CandleCacheManager(str(workdir))
+
+        def store_warm(manager=warm_manager):
+            asyncio.run(
+                manager.get_candle_arrays(
+                    "BENCHUSDT", "1m", "2020-09-14", "2020-09-20", cache_only=True
+                )
+            )
+
+        params = {"bars": n, "source": "synthetic"}
+        benches += [
+            Bench("candle_load", "csv_upload", csv_upload, n, params=params),
+            Bench("candle_load", "store_cold", store_cold, n, params=params),
+            Bench("candle_load", "store_warm", store_warm, n, params=params),
+        ]
+
+    path = fixture_path()
+    if path is not None:
+        symbol, timeframe = FIXTURE_SERIES
+        rows = sum(1 for _ in open(path)) - 1
+
+        def fixture_cold():
+            asyncio.run(
+                CandleCacheManager(str(FIXTURE_CACHE_DIR)).get_candle_arrays(
+                    symbol, timeframe, "2000-01-01", "2100-01-01", cache_only=True
+                )
+            )
+
+        def fixture_csv():
+            CandleArrays.from_dicts(asyncio.run(engine.load_candles(str(path))))
+
+        params = {"bars": rows, "source": f"{symbol}_{timeframe}"}
+        benches += [
+            Bench("candle_load", "csv_upload", fixture_csv, rows, params=params),
+            Bench("candle_load", "store_cold", fixture_cold, rows, params=params),
+        ]
+    return benches
+
+
+def indicator_cases(windows: Sequence[int] = INDICATOR_WINDOWS) -> List[Bench]:
+    from src.services.strategy_loader import load_strategy_class
+
+    executor = load_strategy_class("proven_balanced", "{}")
+    series = synthetic_candles(max(windows), seed=1)
+    indicators: Dict[str, Callable] = {
+        "rsi": lambda c: executor._calculate_rsi(c, 14),
+        "ema": lambda c: executor._calculate_ema(c, 50),
+        "sma": lambda c: executor._calculate_sma(c, 20),
+        "macd": lambda c: executor._calculate_macd(c),
+        "bollinger": lambda c: executor._calculate_bollinger_bands(c),
+        "atr": lambda c: executor._calculate_atr(c, 14),
+        "adx": lambda c: executor._calculate_adx(c, 14),
+    }
+
+    benches = []
+    for window in windows:
+        candles = [series.candle(i) for i in range(len(series) - window, len(series))]
+        for name, func in indicators.items():
+            benches.append(
+                Bench(
+                    "indicators",
+                    name,
+                    lambda func=func, candles=candles: func(candles),
+                    window,
+                    unit="candles",
+                    params={"window": window},
+                )
+            )
+    return benches
+
+
+def backtest_cases(sizes: Sequence[int]) -> List[Bench]:
+    benches = []
+    for n in sizes:
+        candles = synthetic_candles(n, seed=2)
+        for mode in ("loop", "vector"):
+            params = {"initial_balance": 10_000, "timeframe": "1m", "mode": mode}
+
+            def run(params=params, candles=candles):
+                BacktestEngine(get_strategy("ema")).run_on_candles(candles, params)
+
+            benches.append(
+                Bench(
+                    "backtest",
+                    f"ema_{mode}",
+                    run,
+                    n,
+                    params={"bars": n},
+                    repeat=1 if n >= 1_000_000 else None,
+                )
+            )
+
+    # proven_* 어댑터 (라이브 봇 전략 코드, 루프 전용)
+    n = min(sizes)
+    candles = synthetic_candles(n, seed=3)
+
+    def run_dynamic():
+        BacktestEngine(get_strategy("proven_balanced")).run_on_candles(
+            candles, {"initial_balance": 10_000, "timeframe": "1m"}
+        )
+
+    benches.append(
+        Bench("backtest", "proven_balanced_loop", run_dynamic, n, params={"bars": n}, repeat=1)
+    )
+    return benches
+
+
+def metrics_cases(sizes: Sequence[int]) -> List[Bench]:
+    benches = []
+    trades = synthetic_trades(1_000)
+    for n in sizes:
+        equity = 10_000 + (synthetic_candles(n, seed=4).close - 100.0) * 10
+
+        def compute(equity=equity, n=n):
+            BacktestMetricsCalculator().compute(
+                trades, equity, 10_000, timeframe="1m", bars_in_position=n // 2
+            )
+
+        def rolling(equity=equity):
+            returns = pm.simple_returns(equity)
+            pm.rolling_sharpe(returns, 500, 525_600)
+            pm.rolling_max_drawdown(equity, 500)
+
+        params = {"bars": n}
+        benches += [
+            Bench("metrics", "compute", compute, n, params=params),
+            Bench("metrics", "rolling_500", rolling, n, params=params),
+        ]
+    return benches
+
+
+def persistence_cases(sizes: Sequence[int], trade_counts: Sequence[int] = (1_000, 10_000)) -> List[Bench]:
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from src.database.models import BacktestResult, BacktestTrade
+
+    benches = []
+    for n in sizes:
+        equity = (10_000 + (synthetic_candles(n, seed=5).close - 100.0) * 10).tolist()
+        blob = encode_equity_curve(equity)
+        params = {"bars": n}
+        benches += [
+            Bench("persistence", "equity_encode", lambda e=equity: encode_equity_curve(e), n, params=params),
+            Bench("persistence", "equity_decode", lambda b=blob: decode_equity_curve(b), n, params=params),
+            Bench("persistence", "equity_preview", lambda e=equity: downsample_equity_curve(e, 500), n, params=params),
+        ]
+
+    engine = create_engine("sqlite://")
+    BacktestResult.metadata.create_all(
+        engine, tables=[BacktestResult.__table__, BacktestTrade.__table__]
+    )
+    Session = sessionmaker(bind=engine)
+    equity = [10_000.0] * 1_000
+
+    for count in trade_counts:
+        run_output = {"final_balance": 10_000.0, "trades": synthetic_trades(count), "equity_curve": equity}
+
+        def save(run_output=run_output):
+            session = Session()
+            try:
+                BacktestPersistenceService.save_result(
+                    session, run_output, {"user_id": 1, "pair": "BENCHUSDT", "timeframe": "1m"}
+                )
+                session.commit()
+            finally:
+                session.close()
+
+        benches.append(
+            Bench("persistence", "save_result", save, count, unit="trades", params={"trades": count})
+        )
+    return benches
+
+
+GROUPS = {
+    "candle_load": candle_load_cases,
+    "indicators": lambda sizes: indicator_cases(),
+    "backtest": backtest_cases,
+    "metrics": metrics_cases,
+    "persistence": persistence_cases,
+}
@@ -0,0 +1,77 @@
+"""
+벤치마크 결과 비교
+
+    python -m benchmarks.compare BASE.json HEAD.json [--threshold 0.10]
+
+같은 케이스(group/name/params)의 best 시간과 peak 메모리를 비교하여
+threshold(기본 10%)보다 느려지거나 메모리가 늘어난 케이스가 있으면 종료 코드 1.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict
+
+from .harness import result_key
+
+
+def _load(path: str) -> Dict[str, dict]:
+    with open(path) as f:
+        data = json.load(f)
+    return {result_key(r): r for r in data["results"]}
+
+
+def _ratio(head, base):
+    if not base or head is None:
+        return None
+    return head / base
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare benchmark result files")
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown ratio")
+    parser.add_argument(
+        "--memory-threshold", type=float, default=0.20, help="allowed peak memory growth ratio"
+    )
+    args = parser.parse_args(argv)
+
+    base, head = _load(args.base), _load(args.head)
+    regressions = []
+
+    print(f"{'case':<55} {'base ms':>11} {'head ms':>11} {'time':>8} {'memory':>8}")
+    for key in sorted(base.keys() & head.keys()):
+        b, h = base[key], head[key]
+        time_ratio = _ratio(h["best_seconds"], b["best_seconds"])
+        mem_ratio = _ratio(h.get("peak_memory_bytes"), b.get("peak_memory_bytes"))
+
+        flags = []
+        if time_ratio is not None and time_ratio > 1 + args.threshold:
+            flags.append("SLOWER")
+        if mem_ratio is not None and mem_ratio > 1 + args.memory_threshold:
+            flags.append("MEMORY")
+        if flags:
+            regressions.append(key)
+
+        print(
+            f"{key:<55} {b['best_seconds'] * 1000:11.2f} {h['best_seconds'] * 1000:11.2f} "
+            f"{(f'{time_ratio:7.2f}x' if time_ratio is not None else '       -'):>8} "
+            f"{(f'{mem_ratio:7.2f}x' if mem_ratio is not None else '       -'):>8}"
+            f"  {' '.join(flags)}"
+        )
+
+    for key in sorted(base.keys() - head.keys()):
+        print(f"{key:<55} (removed)")
+    for key in sorted(head.keys() - base.keys()):
+        print(f"{key:<55} (new)")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above threshold")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+벤치마크 입력 데이터
+
+- 합성 캔들: 고정 시드 기하 브라운 운동 (네트워크/DB 없이 재현 가능)
+- 픽스처: backend/candle_cache의 실제 캔들 파일 (있을 때만)
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from src.services.candle_arrays import CANDLE_FIELDS, CandleArrays
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+FIXTURE_CACHE_DIR = BACKEND_DIR / "candle_cache"
+FIXTURE_SERIES = ("ETHUSDT", "1m")
+
+# 2020-09-13 00:00 UTC (1분 정렬)
+START_TS = 1_599_955_200_000
+
+
+def synthetic_candles(
+    n: int, seed: int = 0, step_ms: int = 60_000, start_price: float = 100.0
+) -> CandleArrays:
+    """n개 합성 OHLCV 캔들"""
+    rng = np.random.default_rng(seed)
+    close = start_price * np.exp(np.cumsum(rng.normal(0.0, 0.002, n)))
+    open_ = np.concatenate(([start_price], close[:-1]))
+    wick = np.abs(rng.normal(0.0, 0.001, (2, n)))
+    high = np.maximum(open_, close) * (1 + wick[0])
+    low = np.minimum(open_, close) * (1 - wick[1])
+    volume = rng.gamma(2.0, 50.0, n)
+    timestamp = START_TS + np.arange(n, dtype=np.int64) * step_ms
+    return CandleArrays(timestamp, open_, high, low, close, volume)
+
+
+def write_csv(candles: CandleArrays, path: Path) -> Path:
+    """캔들 저장소와 같은 형식(timestamp,open,high,low,close,volume)으로 저장"""
+    data = np.column_stack(
+        [candles.timestamp.astype(np.float64)]
+        + [getattr(candles, f) for f in CANDLE_FIELDS[1:]]
+    )
+    np.savetxt(
+        path,
+        data,
+        delimiter=",",
+        header=",".join(CANDLE_FIELDS),
+        comments="",
+        fmt=["%d"] + ["%.8f"] * 5,
+    )
+    return path
+
+
+def fixture_path() -> Optional[Path]:
+    symbol, timeframe = FIXTURE_SERIES
+    path = FIXTURE_CACHE_DIR / f"{symbol}_{timeframe}.csv"
+    return path if path.exists() else None
+
+
+def synthetic_trades(n: int, seed: int = 0) -> list:
+    """엔진 출력 형식의 거래 n개"""
+    rng = np.random.default_rng(seed)
+    entry = 100 + rng.normal(0, 5, n)
+    exit_ = entry * (1 + rng.normal(0, 0.01, n))
+    pnl = exit_ - entry
+    return [
+        {
+            "timestamp": int(START_TS + i * 60_000),
+            "side": "exit",
+            "direction": "long",
+            "entry_price": float(entry[i]),
+            "exit_price": float(exit_[i]),
+            "qty": 1.0,
+            "fee": float((entry[i] + exit_[i]) * 0.001),
+            "pnl": float(pnl[i]),
+        }
+        for i in range(n)
+    ]
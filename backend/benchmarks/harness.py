@@ -0,0 +1,106 @@
+"""
+벤치마크 실행기
+
+- 시간: warmup 1회 후 repeat회 측정, 최솟값(best)과 평균 기록
+- 메모리: tracemalloc으로 1회 더 실행하여 peak 할당량 기록 (numpy 배열 포함)
+- 처리량: items / best 초 (items 단위는 케이스별: 캔들, 호출, 거래 등)
+"""
+
+import gc
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class Bench:
+    """측정할 케이스 하나 (fn은 인자 없는 callable)"""
+
+    group: str
+    name: str
+    fn: Callable[[], Any]
+    items: int
+    unit: str = "bars"
+    params: Dict[str, Any] = field(default_factory=dict)
+    repeat: Optional[int] = None  # None이면 실행기 기본값
+
+
+@dataclass
+class BenchResult:
+    group: str
+    name: str
+    params: Dict[str, Any]
+    items: int
+    unit: str
+    repeat: int
+    best_seconds: float
+    mean_seconds: float
+    throughput: float  # items / best_seconds
+    peak_memory_bytes: Optional[int]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @property
+    def key(self) -> str:
+        return result_key(self.to_dict())
+
+
+def result_key(result: Dict[str, Any]) -> str:
+    """결과 비교용 키: group/name[k=v,...]"""
+    params = ",".join(f"{k}={v}" for k, v in sorted(result.get("params", {}).items()))
+    return f"{result['group']}/{result['name']}[{params}]"
+
+
+def _timed(fn: Callable[[], Any]) -> float:
+    gc.collect()
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def _peak_memory(fn: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_bench(bench: Bench, repeat: int = 3, measure_memory: bool = True) -> BenchResult:
+    repeat = bench.repeat or repeat
+    bench.fn()  # warmup (지연 import, 캐시 등)
+    timings = [_timed(bench.fn) for _ in range(repeat)]
+    best = min(timings)
+    return BenchResult(
+        group=bench.group,
+        name=bench.name,
+        params=bench.params,
+        items=bench.items,
+        unit=bench.unit,
+        repeat=repeat,
+        best_seconds=round(best, 6),
+        mean_seconds=round(sum(timings) / len(timings), 6),
+        throughput=round(bench.items / best, 2) if best > 0 else 0.0,
+        peak_memory_bytes=_peak_memory(bench.fn) if measure_memory else None,
+    )
+
+
+def run_all(
+    benches: List[Bench],
+    repeat: int = 3,
+    measure_memory: bool = True,
+    on_result: Optional[Callable[[BenchResult], None]] = None,
+) -> List[BenchResult]:
+    results = []
+    for bench in benches:
+        result = run_bench(bench, repeat, measure_memory)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return results
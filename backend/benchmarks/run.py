@@ -0,0 +1,127 @@
+"""
+벤치마크 실행 (backend 디렉토리에서)
+
+    python -m benchmarks.run [--quick] [--groups backtest,metrics] [--output PATH]
+
+결과는 JSON으로 저장됩니다 (기본: benchmarks/results/<commit>.json).
+두 결과 파일은 benchmarks.compare로 비교합니다.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from . import cases
+from .harness import BenchResult, run_all
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+FULL_SIZES = (10_000, 100_000, 1_000_000)
+QUICK_SIZES = (10_000, 100_000)
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+def environment() -> dict:
+    return {
+        "commit": _git("rev-parse", "HEAD") or None,
+        "dirty": bool(_git("status", "--porcelain", "--", "src", "benchmarks")),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+    }
+
+
+def _format(result: BenchResult) -> str:
+    memory = (
+        f"{result.peak_memory_bytes / 1024 / 1024:9.1f} MB"
+        if result.peak_memory_bytes is not None
+        else "        - MB"
+    )
+    return (
+        f"{result.key:<55} {result.best_seconds * 1000:11.2f} ms "
+        f"{result.throughput:14,.0f} {result.unit}/s {memory}"
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Backtest performance benchmarks")
+    parser.add_argument("--quick", action="store_true", help="10k / 100k bars only")
+    parser.add_argument(
+        "--groups",
+        default=",".join(cases.GROUPS),
+        help=f"comma separated ({', '.join(cases.GROUPS)})",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc pass")
+    parser.add_argument("--output", help="result JSON path")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("src").setLevel(logging.WARNING)
+
+    groups = [g.strip() for g in args.groups.split(",") if g.strip()]
+    unknown = [g for g in groups if g not in cases.GROUPS]
+    if unknown:
+        parser.error(f"unknown groups: {', '.join(unknown)}")
+
+    sizes = QUICK_SIZES if args.quick else FULL_SIZES
+    env = environment()
+
+    results = []
+    try:
+        for group in groups:
+            print(f"== {group}", flush=True)
+            benches = cases.GROUPS[group](sizes)
+            results += run_all(
+                benches,
+                repeat=args.repeat,
+                measure_memory=not args.no_memory,
+                on_result=lambda r: print(_format(r), flush=True),
+            )
+    finally:
+        cases.cleanup()
+
+    if args.output:
+        output = Path(args.output)
+    else:
+        name = (env["commit"] or "local")[:12] + ("-dirty" if env["dirty"] else "")
+        output = RESULTS_DIR / f"{name}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "environment": env,
+                "profile": "quick" if args.quick else "full",
+                "results": [r.to_dict() for r in results],
+            },
+            f,
+            indent=2,
+        )
+    print(f"\nResults written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
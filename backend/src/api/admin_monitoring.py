@@ -11,6 +11,12 @@ from sqlalchemy.orm import Session
 from ..database.session import get_session
 from ..database.models import BacktestResult, User
 from ..utils.monitoring import monitor
+from ..services.backtest_jobs import backtest_job_runner
+from ..services.strategy_sandbox import strategy_sandbox
+from ..services.candle_warmup import candle_warmup
+from ..services.bot_admission import bot_admission
+from ..services.bot_metrics import bot_metrics
+from ..indicators.memo import indicator_memo
 from ..utils.auth_dependencies import require_admin
 
 router = APIRouter(prefix="/admin/monitoring", tags=["admin", "monitoring"])
@@ -76,6 +82,91 @@ async def get_backtest_summary(
     }
 
 
+@router.get("/backtest/queue")
+async def get_backtest_queue_stats(admin_id: int = Depends(require_admin)):
+    """
+    백테스트 작업 큐 메트릭.
+
+    Returns:
+    - 대기열 깊이, 실행 중 작업 수, 워커 수
+    - 완료/실패/복구 누적 카운트
+    - 실행 시간 / 대기 시간 (avg, p95)
+    """
+    return await backtest_job_runner.get_stats()
+
+
+@router.get("/indicator-memo")
+async def get_indicator_memo_stats(admin_id: int = Depends(require_admin)):
+    """
+    사용자 간 공유 지표 메모 통계.
+
+    Returns:
+    - hits / misses / hit_rate
+    - bypassed (시각 없는 캔들 등), stale (보관 구간보다 오래된 캔들)
+    - evicted_bars, 스트림 / 항목 수
+    """
+    return indicator_memo.get_stats()
+
+
+@router.get("/strategy-sandbox")
+async def get_strategy_sandbox_stats(admin_id: int = Depends(require_admin)):
+    """
+    전략 샌드박스 워커 풀 상태.
+
+    Returns:
+    - 워커 수, 유휴 워커 수, 재시작 횟수
+    - 전략별 평가 지연 (avg / p95 / max ms), 타임아웃 / 강제 종료 / 오류 횟수
+    """
+    return strategy_sandbox.get_stats()
+
+
+@router.get("/candle-warmup")
+async def get_candle_warmup_stats(admin_id: int = Depends(require_admin)):
+    """
+    봇 캔들 윈도우 워밍업 통계.
+
+    Returns:
+    - memory_hits / coalesced (같은 심볼/타임프레임 동시 요청 합류)
+    - store_candles (로컬 캔들 저장소에서 읽은 캔들 수)
+    - api_calls / api_candles / api_errors
+    - 심볼/타임프레임별 메모리 윈도우
+    """
+    return candle_warmup.get_stats()
+
+
+@router.get("/bot-bootstrap")
+async def get_bot_bootstrap_stats(admin_id: int = Depends(require_admin)):
+    """
+    봇 시작 승인 제어 / 서버 재시작 후 봇 준비 진행률.
+
+    Returns:
+    - expected / ready / failed / progress / elapsed_seconds / complete (재시작 복구)
+    - waiting (승인 대기) / starting (시작 단계 진행 중), concurrency
+    - 단계별 소요 시간 (admission_wait, strategy, decrypt, client_init, warmup: avg / p95 / max ms)
+    """
+    return bot_admission.get_stats()
+
+
+@router.get("/bot-metrics")
+async def get_bot_metrics(admin_id: int = Depends(require_admin)):
+    """
+    봇 런타임 지표 (실행 중인 봇별 + 전체 합산).
+
+    Returns:
+    - 카운터: ticks_received / ticks_evaluated / ticks_skipped / orders / errors
+    - 지연 (count / avg / p50 / p99 / max ms): queue_wait, strategy_eval, pre_trade,
+      order_placement, post_trade, tick_to_order
+    """
+    return bot_metrics.get_stats()
+
+
+@router.get("/bot-metrics/{user_id}")
+async def get_user_bot_metrics(user_id: int, admin_id: int = Depends(require_admin)):
+    """특정 사용자 봇의 런타임 지표 (실행 중이 아니면 bot: null)"""
+    metrics = bot_metrics.get(user_id)
+    return {"bot": metrics.to_dict() if metrics else None}
+
+
 @router.get("/health")
 async def health_check(admin_id: int = Depends(require_admin)):
     """
@@ -8,12 +8,14 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
+import numpy as np
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database.db import get_session
 from ..database.models import Equity, Trade
+from ..services import performance_metrics as pm
 from ..utils.jwt_auth import get_current_user_id
 from ..utils.structured_logging import get_logger
 
@@ -183,16 +185,16 @@ async def get_risk_metrics(
             "Risk metrics calculation requested",
             user_id=user_id,
         )
-        # 거래 통계 조회
+        # 거래 손익만 조회 (ORM 객체 대신 스칼라 컬럼 → numpy 배열)
         result = await session.execute(
-            select(Trade).where(
+            select(Trade.pnl).where(
                 Trade.user_id == user_id,
                 Trade.exit_price.isnot(None),  # 청산된 거래만
             )
         )
-        trades = result.scalars().all()
+        pnl_values = result.scalars().all()
 
-        if not trades:
+        if not pnl_values:
             return {
                 "max_drawdown": 0.0,
                 "sharpe_ratio": 0.0,
@@ -202,100 +204,41 @@ async def get_risk_metrics(
                 "total_trades": 0,
             }
 
-        # 승리/패배 거래 분리 (Null 체크 강화)
-        winning_trades = [t for t in trades if t.pnl is not None and t.pnl > 0]
-        losing_trades = [t for t in trades if t.pnl is not None and t.pnl < 0]
-
-        total_trades = len(trades)
-
-        # 승률 계산
-        win_rate = (len(winning_trades) / total_trades) * 100 if total_trades > 0 else 0
-
-        # 평균 손익비 계산 (ZeroDivisionError 방지)
-        avg_win = 0.0
-        if winning_trades:
-            try:
-                avg_win = sum(float(t.pnl) for t in winning_trades) / len(
-                    winning_trades
-                )
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Error calculating avg_win: {e}")
-                avg_win = 0.0
+        total_trades = len(pnl_values)
+        pnls = np.array(
+            [float(v) for v in pnl_values if v is not None], dtype=np.float64
+        )
+        stats = pm.trade_stats(pnls)
 
-        avg_loss = 1.0  # 기본값 (나누기 0 방지)
-        if losing_trades:
-            try:
-                avg_loss = abs(
-                    sum(float(t.pnl) for t in losing_trades) / len(losing_trades)
-                )
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Error calculating avg_loss: {e}")
-                avg_loss = 1.0
+        # 승률 (손익 미기록 거래도 분모에 포함)
+        win_rate = stats.wins / total_trades * 100
 
-        profit_loss_ratio = avg_win / avg_loss if avg_loss > 0 else 0.0
+        # 평균 손익비 (손실 거래가 없으면 평균 손실 1.0 기준)
+        avg_loss = stats.avg_loss if stats.losses else 1.0
+        profit_loss_ratio = stats.avg_win / avg_loss if avg_loss > 0 else 0.0
 
         # Equity 데이터로 MDD 및 변동성 계산
         equity_result = await session.execute(
-            select(Equity)
-            .where(Equity.user_id == user_id)
+            select(Equity.value)
+            .where(Equity.user_id == user_id, Equity.value.isnot(None))
             .order_by(Equity.timestamp.asc())
         )
-        equities = equity_result.scalars().all()
+        curve = np.array(
+            [float(v) for v in equity_result.scalars().all()], dtype=np.float64
+        )
 
         max_drawdown = 0.0
         daily_volatility = 0.0
         sharpe_ratio = 0.0
 
-        if equities and len(equities) > 1:
-            try:
-                # MDD 계산 (Null 체크 강화)
-                peak = (
-                    float(equities[0].value) if equities[0].value is not None else 0.0
-                )
-                for equity in equities:
-                    if equity.value is None:
-                        continue
-
-                    equity_val = float(equity.value)
-                    if equity_val > peak:
-                        peak = equity_val
-
-                    if peak > 0:
-                        drawdown = ((equity_val - peak) / peak) * 100
-                        if drawdown < max_drawdown:
-                            max_drawdown = drawdown
-
-                # 일일 수익률 계산 (Null 및 0 체크)
-                returns = []
-                for i in range(1, len(equities)):
-                    if equities[i].value is None or equities[i - 1].value is None:
-                        continue
-
-                    prev_equity = float(equities[i - 1].value)
-                    curr_equity = float(equities[i].value)
-
-                    if prev_equity > 0:
-                        daily_return = ((curr_equity - prev_equity) / prev_equity) * 100
-                        returns.append(daily_return)
-
-                # 변동성 (표준편차)
-                if returns and len(returns) > 1:
-                    mean_return = sum(returns) / len(returns)
-                    variance = sum((r - mean_return) ** 2 for r in returns) / len(
-                        returns
-                    )
-                    daily_volatility = variance**0.5
-
-                    # 샤프 비율 (간단 계산: 평균 수익률 / 변동성)
-                    sharpe_ratio = (
-                        mean_return / daily_volatility if daily_volatility > 0 else 0.0
-                    )
+        if len(curve) > 1:
+            # 낙폭은 음수(%)로 표시
+            max_drawdown = -pm.max_drawdown(curve).max_drawdown * 100
 
-            except (ValueError, TypeError, ZeroDivisionError) as e:
-                logger.warning(f"Error calculating MDD/volatility: {e}")
-                max_drawdown = 0.0
-                daily_volatility = 0.0
-                sharpe_ratio = 0.0
+            # 일일 수익률(%) 변동성 / 샤프 비율 (비연간화)
+            returns = pm.simple_returns(curve) * 100
+            daily_volatility = pm.volatility(returns)
+            sharpe_ratio = pm.sharpe_ratio(returns, periods=1)
 
         response = {
             "max_drawdown": round(max_drawdown, 2),
@@ -1,18 +1,31 @@
+import asyncio
+import json
 import os
 import uuid
 from datetime import datetime
 from pathlib import Path
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
-from ..schemas.backtest_schema import BacktestStartRequest
+from ..schemas.backtest_schema import (
+    BacktestStartRequest,
+    BacktestSweepRequest,
+    PortfolioBacktestRequest,
+    WalkForwardRequest,
+)
 from ..schemas.backtest_response_schema import BacktestStartResponse
-from ..services.backtest_engine import BacktestEngine
-from ..services.backtest_persistence import BacktestPersistenceService
+from ..services.backtest_jobs import backtest_job_runner
+from ..services.backtest_result_cache import compute_cache_key, find_cached_result
+from ..services.backtest_sweep import ParameterGrid, RANK_METRICS, sweep_runner
+from ..services.candle_arrays import TIMEFRAME_MS
+from ..services.portfolio_backtest import run_portfolio_backtest
+from ..services.strategies.dynamic_adapter import DYNAMIC_STRATEGY_CODES
 from ..services.strategies.registry import get_strategy
+from ..services.walk_forward import run_walk_forward
 from ..database.session import get_session
-from ..database.models import BacktestResult
+from ..database.models import BacktestResult, RiskSettings
 from ..utils.jwt_auth import get_current_user_id
 from ..utils.resource_manager import resource_manager
 from ..config import BacktestConfig
@@ -74,307 +87,19 @@ def validate_csv_path(csv_path: str) -> None:
         raise HTTPException(status_code=403, detail="Invalid file path")
 
 
-def _run_backtest_background(result_id: int, request_dict: dict, user_id: int):
-    """
-    백그라운드에서 실행되는 백테스트 작업.
-    별도 DB 세션을 사용하여 실행.
-    """
-    import logging
-    import asyncio
-    from datetime import datetime
-    from ..utils.resource_manager import resource_manager
-
-    logger = logging.getLogger(__name__)
-    logger.info(f"Starting background backtest for result_id={result_id}")
-
-    from ..database.session import _get_sync_engine
-
-    SessionLocal = _get_sync_engine()
-    session = SessionLocal()
-
-    try:
-        logger.info(f"Running backtest with params: {request_dict}")
-
-        # CSV 경로가 없으면 캐시 시스템에서 과거 데이터 가져오기
-        csv_path = request_dict.get("csv_path")
-
-        if not csv_path:
-            logger.info(
-                "CSV path not provided, fetching historical data from cache/API"
-            )
-
-            # 캔들 데이터 가져오기 (캐시 우선, 없으면 API 호출)
-            symbol = request_dict.get("symbol", "BTCUSDT")
-            # Symbol 형식 변환: "BTC/USDT" -> "BTCUSDT"
-            symbol = symbol.replace("/", "")
-            timeframe = request_dict.get("timeframe", "1h")
-            start_date = request_dict.get("start_date")
-            end_date = request_dict.get("end_date")
-
-            # 기본값 설정 (없으면 최근 1년)
-            from datetime import datetime, timedelta
-
-            if not end_date:
-                end_date = datetime.now().strftime("%Y-%m-%d")
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
-
-            # 캐시 시스템 사용 (Rate Limit 문제 해결!)
-            from ..services.candle_cache import get_candle_cache
-
-            async def fetch_historical_data():
-                cache_manager = get_candle_cache()
-                # 환경변수로 제어 (기본: 오프라인 모드)
-                # Rate Limit (429) 에러 방지
-                candles = await cache_manager.get_candles(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    start_date=start_date,
-                    end_date=end_date,
-                    cache_only=BacktestConfig.CACHE_ONLY,  # 환경변수로 제어
-                )
-                return candles
-
-            historical_data = asyncio.run(fetch_historical_data())
-
-            if not historical_data:
-                # 오프라인 모드에서 더 명확한 에러 메시지
-                mode_info = (
-                    "오프라인 모드" if BacktestConfig.CACHE_ONLY else "온라인 모드"
-                )
-                raise Exception(
-                    f"📊 {mode_info}: 해당 기간의 캔들 데이터가 없습니다.\n\n"
-                    f"• 심볼: {symbol}\n"
-                    f"• 타임프레임: {timeframe}\n"
-                    f"• 기간: {start_date} ~ {end_date}\n\n"
-                    f"💡 해결 방법:\n"
-                    f"1. 다른 날짜 범위를 선택하세요\n"
-                    f"2. 관리자에게 데이터 다운로드를 요청하세요\n"
-                    f"   (python scripts/download_candle_data.py --symbols {symbol})"
-                )
-
-            # CSV 파일로 저장
-            import csv
-            import tempfile
-            from pathlib import Path
-
-            # backtest_data 디렉토리에 저장
-            backtest_data_dir = Path(__file__).parent.parent.parent / "backtest_data"
-            backtest_data_dir.mkdir(parents=True, exist_ok=True)
-
-            csv_filename = f"backtest_{result_id}_{symbol}_{timeframe}.csv"
-            csv_path = str(backtest_data_dir / csv_filename)
-
-            with open(csv_path, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(["timestamp", "open", "high", "low", "close", "volume"])
-
-                for candle in historical_data:
-                    writer.writerow(
-                        [
-                            candle["timestamp"],
-                            candle["open"],
-                            candle["high"],
-                            candle["low"],
-                            candle["close"],
-                            candle["volume"],
-                        ]
-                    )
-
-            logger.info(
-                f"Historical data saved to {csv_path} ({len(historical_data)} candles)"
-            )
-
-            # request_dict 업데이트
-            request_dict["csv_path"] = csv_path
-
-        # 전략 선택
-        strategy_code = request_dict.get("strategy_code", "openclose")
-        strategy_params = request_dict.get("strategy_params", {})
-
-        strategy = get_strategy(strategy_code, strategy_params)
-
-        # 엔진 실행 (비동기)
-        engine = BacktestEngine(strategy=strategy)
-        run_output = asyncio.run(engine.run(request_dict))
-
-        # DB 업데이트 - 성공
-        result = (
-            session.query(BacktestResult).filter(BacktestResult.id == result_id).first()
-        )
-        if result:
-            result.final_balance = run_output.get("final_balance")
-            result.equity_curve = str(run_output.get("equity_curve", []))
-            result.status = "completed"
-
-            # 거래 내역 저장 (기존 result 업데이트)
-            BacktestPersistenceService.save_result(
-                session=session,
-                run_output=run_output,
-                request_params=request_dict,
-                result_id=result_id,
-            )
-
-            # 거래가 저장되도록 flush (commit 전에 DB에 반영)
-            session.flush()
-
-            # 성능 메트릭 계산 (CRITICAL: 전략 평가를 위한 핵심 지표)
-            try:
-                import json
-                from ..database.models import BacktestTrade
-
-                initial_balance = float(request_dict["initial_balance"])
-                final_balance = float(result.final_balance)
-
-                # 총 수익률
-                total_return = (
-                    (final_balance - initial_balance) / initial_balance
-                ) * 100
-
-                # 거래 통계
-                all_trades = (
-                    session.query(BacktestTrade)
-                    .filter(BacktestTrade.result_id == result_id)
-                    .all()
-                )
-
-                total_trades = len(all_trades)
-
-                if total_trades > 0:
-                    # 승/패 거래 구분
-                    winning_trades = [t for t in all_trades if t.pnl and t.pnl > 0]
-                    losing_trades = [t for t in all_trades if t.pnl and t.pnl < 0]
-
-                    win_count = len(winning_trades)
-                    loss_count = len(losing_trades)
-                    win_rate = (
-                        (win_count / total_trades * 100) if total_trades > 0 else 0
-                    )
-
-                    # Profit Factor
-                    gross_profit = sum(float(t.pnl) for t in winning_trades)
-                    gross_loss = abs(sum(float(t.pnl) for t in losing_trades))
-                    profit_factor = (gross_profit / gross_loss) if gross_loss > 0 else 0
-
-                    # 평균 승/패
-                    avg_win = (gross_profit / win_count) if win_count > 0 else 0
-                    avg_loss = (gross_loss / loss_count) if loss_count > 0 else 0
-                else:
-                    win_rate = 0
-                    profit_factor = 0
-                    avg_win = 0
-                    avg_loss = 0
-
-                # Maximum Drawdown
-                equity_curve = (
-                    json.loads(result.equity_curve) if result.equity_curve else []
-                )
-                max_dd = 0
-                peak = equity_curve[0] if equity_curve else initial_balance
-
-                for balance in equity_curve:
-                    if balance > peak:
-                        peak = balance
-                    drawdown = ((peak - balance) / peak * 100) if peak > 0 else 0
-                    if drawdown > max_dd:
-                        max_dd = drawdown
-
-                # Sharpe Ratio (단순화된 버전 - 무위험 수익률 0% 가정)
-                if len(equity_curve) > 1:
-                    returns = []
-                    for i in range(1, len(equity_curve)):
-                        ret = (equity_curve[i] - equity_curve[i - 1]) / equity_curve[
-                            i - 1
-                        ]
-                        returns.append(ret)
-
-                    try:
-                        import numpy as np
-
-                        mean_return = np.mean(returns)
-                        std_return = np.std(returns)
-                        sharpe_ratio = (
-                            (mean_return / std_return * np.sqrt(252))
-                            if std_return > 0
-                            else 0
-                        )
-                    except ImportError:
-                        # numpy 없으면 수동 계산
-                        mean_return = sum(returns) / len(returns)
-                        variance = sum((r - mean_return) ** 2 for r in returns) / len(
-                            returns
-                        )
-                        std_return = variance**0.5
-                        sharpe_ratio = (
-                            (mean_return / std_return * (252**0.5))
-                            if std_return > 0
-                            else 0
-                        )
-                else:
-                    sharpe_ratio = 0
-
-                # 메트릭 컴파일
-                metrics = {
-                    "total_return": round(total_return, 2),
-                    "total_trades": total_trades,
-                    "win_rate": round(win_rate, 2),
-                    "profit_factor": round(profit_factor, 2),
-                    "avg_win": round(avg_win, 2),
-                    "avg_loss": round(avg_loss, 2),
-                    "sharpe_ratio": round(sharpe_ratio, 2),
-                    "max_drawdown": round(max_dd, 2),
-                }
-
-                # DB에 메트릭 저장
-                result.metrics = json.dumps(metrics)
-                session.commit()
-
-                logger.info(
-                    f"✅ Backtest metrics calculated for result {result_id}: {metrics}"
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"❌ Failed to calculate metrics for result {result_id}: {e}",
-                    exc_info=True,
-                )
-                # 메트릭 계산 실패해도 백테스트 결과는 유효함
-                result.metrics = "{}"
-                session.commit()
-
-        session.commit()
-        logger.info(f"Backtest completed successfully for result_id={result_id}")
-
-    except Exception as exc:
-        logger.error(f"Backtest failed for result_id={result_id}: {exc}", exc_info=True)
-        # DB 업데이트 - 실패
-        try:
-            result = (
-                session.query(BacktestResult)
-                .filter(BacktestResult.id == result_id)
-                .first()
-            )
-            if result:
-                result.status = "failed"
-                result.error_message = str(exc)
-            session.commit()
-        except Exception as e:
-            logger.error(f"Failed to update error status: {e}")
-    finally:
-        # 리소스 해제 (Rate Limit 해제)
-        resource_manager.finish_backtest(user_id, result_id)
-        session.close()
-
-
 @router.post("/start", response_model=BacktestStartResponse)
 async def start_backtest(
     request: BacktestStartRequest,
-    background_tasks: BackgroundTasks,
+    response: Response,
     session: Session = Depends(get_session),
     user_id: int = Depends(get_current_user_id),
 ):
     """
-    백테스트를 백그라운드에서 비동기로 실행하고 즉시 응답.
+    백테스트를 작업 큐에 등록하고 즉시 응답.
+    실행은 BacktestJobRunner가 워커 프로세스에서 처리.
+
+    같은 전략/파라미터/캔들 시리즈/기간/수수료 조건으로 완료된 결과가 있으면
+    실행 없이 기존 결과를 반환 (X-Backtest-Cache: hit, 리소스 한도 미차감).
 
     JWT 인증 필요.
     사용자별 리소스 제한 적용.
@@ -388,18 +113,13 @@ async def start_backtest(
 
     Returns:
     - result_id: 백테스트 결과 ID
-    - status: "queued" (처리 중)
+    - status: "queued" (처리 중) 또는 "completed" (캐시 적중)
 
     결과 조회: GET /backtest/result/{result_id}
     """
     from sqlalchemy import select
     from ..database.models import Strategy
 
-    # 0) 리소스 제한 확인
-    can_start, error_msg = resource_manager.can_start_backtest(user_id)
-    if not can_start:
-        raise HTTPException(status_code=429, detail=error_msg)
-
     # 1) Strategy validation - DB에서 전략 조회 (sync session)
     result = session.execute(select(Strategy).where(Strategy.id == request.strategy_id))
     strategy = result.scalars().first()
@@ -423,14 +143,49 @@ async def start_backtest(
         validate_csv_path(request.csv_path)
 
     # 4) 전략 파라미터 추출
-    import json
-
     strategy_params = json.loads(strategy.params) if strategy.params else {}
-    strategy_type = strategy_params.get("type", "openclose")
+    strategy_type = strategy_params.get("type")
+    if not strategy_type:
+        # proven_* 전략은 라이브 봇과 같은 코드(strategy.code)로 백테스트
+        strategy_type = (
+            strategy.code if strategy.code in DYNAMIC_STRATEGY_CODES else "openclose"
+        )
     symbol = strategy_params.get("symbol", "BTCUSDT")
     timeframe = strategy_params.get("timeframe", "1h")
 
-    # 5) DB에 pending 상태로 먼저 저장 (user_id 포함)
+    # 5) 워커 프로세스용 파라미터 준비
+    task_params = {
+        "strategy_id": request.strategy_id,
+        "strategy_code": strategy_type,  # Use type from params, not DB code
+        "strategy_params": strategy_params,
+        "initial_balance": request.initial_balance,
+        "start_date": request.start_date,
+        "end_date": request.end_date,
+        "csv_path": request.csv_path,
+        "symbol": symbol,
+        "timeframe": timeframe,
+        "fill_model": request.fill_model or BacktestConfig.FILL_MODEL,
+    }
+
+    # 6) 결과 캐시 확인 (캔들 시리즈가 바뀌면 키가 달라져 자동 무효화)
+    cache_key = compute_cache_key(task_params)
+    cached = find_cached_result(session, user_id, cache_key)
+    if cached is not None:
+        response.headers["X-Backtest-Cache"] = "hit"
+        return {
+            "status": "completed",
+            "result_id": cached.id,
+            "final_balance": cached.final_balance,
+            "metrics": json.loads(cached.metrics) if cached.metrics else {},
+        }
+    response.headers["X-Backtest-Cache"] = "miss"
+
+    # 리소스 제한 확인 (실제 실행되는 경우만 차감)
+    can_start, error_msg = resource_manager.can_start_backtest(user_id)
+    if not can_start:
+        raise HTTPException(status_code=429, detail=error_msg)
+
+    # 7) DB에 queued 상태로 저장 (작업 큐 = backtest_results 행)
     backtest_result = BacktestResult(
         user_id=user_id,
         pair=symbol,
@@ -439,8 +194,10 @@ async def start_backtest(
         final_balance=0.0,
         metrics="{}",
         equity_curve="[]",
-        params=str(request.dict()),
+        params=json.dumps(task_params),
         status="queued",
+        attempts=0,
+        cache_key=cache_key,
         created_at=datetime.utcnow(),
     )
     session.add(backtest_result)
@@ -449,38 +206,279 @@ async def start_backtest(
 
     result_id = backtest_result.id
 
-    # 6) 리소스 매니저에 백테스트 시작 기록
+    # 8) 리소스 매니저에 백테스트 시작 기록
     resource_manager.start_backtest(user_id, result_id)
 
-    # 7) 백그라운드 태스크용 파라미터 준비
-    task_params = {
-        "strategy_id": request.strategy_id,
-        "strategy_code": strategy_type,  # Use type from params, not DB code
-        "strategy_params": strategy_params,
-        "initial_balance": request.initial_balance,
-        "start_date": request.start_date,
-        "end_date": request.end_date,
-        "csv_path": request.csv_path,
-        "symbol": symbol,
-        "timeframe": timeframe,
-    }
-
-    # 8) 백그라운드 태스크 추가
-    background_tasks.add_task(
-        _run_backtest_background,
-        result_id=result_id,
-        request_dict=task_params,
-        user_id=user_id,
-    )
+    # 9) 디스패처 깨우기
+    backtest_job_runner.notify()
 
-    # 4) 즉시 응답
-    response = {
+    # 10) 즉시 응답
+    return {
         "status": "queued",
         "result_id": result_id,
         "final_balance": 0.0,
         "metrics": {},
     }
-    return response
+
+
+def _validate_param_grid(request: BacktestSweepRequest) -> ParameterGrid:
+    """스윕/워크포워드 공통: 전략 이름, 파라미터 그리드, 랭킹 기준 검증"""
+    try:
+        get_strategy(request.strategy_code, {})
+        grid = ParameterGrid(request.param_grid)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if request.rank_by not in RANK_METRICS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"rank_by must be one of: {', '.join(RANK_METRICS.keys())}",
+        )
+    return grid
+
+
+async def _load_sweep_candles(request: BacktestSweepRequest):
+    """스윕/워크포워드 공통: 캔들 저장소에서 구간 배열 로드"""
+    from ..services.candle_cache import get_candle_cache
+
+    symbol = request.symbol.replace("/", "")
+    candles = await get_candle_cache().get_candle_arrays(
+        symbol=symbol,
+        timeframe=request.timeframe,
+        start_date=request.start_date,
+        end_date=request.end_date,
+        cache_only=BacktestConfig.CACHE_ONLY,
+    )
+    if not len(candles):
+        raise HTTPException(
+            status_code=404,
+            detail=f"No candle data for {symbol} {request.timeframe} "
+            f"({request.start_date} ~ {request.end_date})",
+        )
+    return candles
+
+
+def _sweep_engine_params(request: BacktestSweepRequest) -> dict:
+    engine_params = {
+        "initial_balance": request.initial_balance,
+        "timeframe": request.timeframe,  # 샤프/소르티노 연간화 계수
+    }
+    if request.fee_rate is not None:
+        engine_params["fee_rate"] = request.fee_rate
+    if request.slippage is not None:
+        engine_params["slippage"] = request.slippage
+    return engine_params
+
+
+@router.post("/sweep")
+async def sweep_backtest(
+    request: BacktestSweepRequest,
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    파라미터 스윕 (그리드 서치) - NDJSON 스트리밍 응답.
+
+    JWT 인증 필요.
+    스윕 전체가 백테스트 1건으로 리소스 제한에 집계됩니다.
+
+    캔들은 한 번만 로드하여 공유 메모리에 올리고, 파라미터 조합을
+    프로세스 풀에 분산 실행합니다.
+
+    응답 (한 줄에 JSON 하나):
+    - {"type": "start", "combinations", "candles", ...}
+    - {"type": "result", "params", "final_balance", "metrics"} (조합별, 완료 순서)
+    - {"type": "ranking", "rank_by", "top": [...]}
+    - {"type": "done", "completed", "failed", "elapsed_seconds"}
+    """
+    # 0) 리소스 제한 확인
+    can_start, error_msg = resource_manager.can_start_backtest(user_id)
+    if not can_start:
+        raise HTTPException(status_code=429, detail=error_msg)
+
+    # 1) 전략 / 그리드 검증 + 2) 캔들 로드 (1회)
+    grid = _validate_param_grid(request)
+    if len(grid) > BacktestConfig.SWEEP_MAX_COMBINATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many combinations: {len(grid)} "
+            f"(max {BacktestConfig.SWEEP_MAX_COMBINATIONS})",
+        )
+    candles = await _load_sweep_candles(request)
+    engine_params = _sweep_engine_params(request)
+
+    # 3) 리소스 매니저 기록은 스트림 시작 시점에 (스트림 종료 시 해제)
+    #    응답 전송 전에 클라이언트가 끊어 제너레이터가 실행되지 않으면 슬롯도 점유하지 않음
+    sweep_id = f"sweep-{uuid.uuid4().hex[:12]}"
+
+    async def stream():
+        resource_manager.start_backtest(user_id, sweep_id)
+        try:
+            async for event in sweep_runner.sweep(
+                candles,
+                request.strategy_code,
+                grid,
+                engine_params,
+                rank_by=request.rank_by,
+                top_k=request.top_k,
+            ):
+                yield json.dumps(event, default=str) + "\n"
+        finally:
+            resource_manager.finish_backtest(user_id, sweep_id)
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@router.post("/walk-forward")
+async def walk_forward_backtest(
+    request: WalkForwardRequest,
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    워크포워드 최적화.
+
+    JWT 인증 필요.
+    실행 전체가 백테스트 1건으로 리소스 제한에 집계됩니다.
+
+    각 in-sample 구간에서 param_grid를 병렬 최적화(rank_by 기준)하고,
+    선택된 파라미터를 다음 out-of-sample 구간에서 실행합니다.
+
+    Returns:
+    - folds: fold별 구간 / 선택 파라미터 / IS·OOS 메트릭
+    - equity_curve: 이어 붙인 OOS equity 곡선
+    - metrics: OOS 전체 메트릭
+    """
+    # 0) 리소스 제한 확인
+    can_start, error_msg = resource_manager.can_start_backtest(user_id)
+    if not can_start:
+        raise HTTPException(status_code=429, detail=error_msg)
+
+    grid = _validate_param_grid(request)
+    candles = await _load_sweep_candles(request)
+
+    run_id = f"walkforward-{uuid.uuid4().hex[:12]}"
+    resource_manager.start_backtest(user_id, run_id)
+    try:
+        return await run_walk_forward(
+            candles,
+            request.strategy_code,
+            grid,
+            _sweep_engine_params(request),
+            in_sample_days=request.in_sample_days,
+            out_of_sample_days=request.out_of_sample_days,
+            step_days=request.step_days,
+            anchored=request.anchored,
+            rank_by=request.rank_by,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        resource_manager.finish_backtest(user_id, run_id)
+
+
+@router.post("/portfolio")
+async def portfolio_backtest(
+    request: PortfolioBacktestRequest,
+    session: Session = Depends(get_session),
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    멀티 심볼 포트폴리오 백테스트.
+
+    JWT 인증 필요.
+    실행 전체가 백테스트 1건으로 리소스 제한에 집계됩니다.
+
+    심볼별 전략 인스턴스가 공유 자본으로 거래하며, 동시 포지션 수는
+    max_positions (기본: 사용자 RiskSettings.max_positions)로 제한됩니다.
+    벡터화 신호(signal_vectors)를 지원하는 전략만 사용할 수 있습니다.
+
+    Returns:
+    - equity_curve / timestamps: 포트폴리오 equity (캔들 마감 시각 기준)
+    - metrics: 포트폴리오 전체 메트릭 (합산 낙폭 포함)
+    - attribution: 심볼별 거래 수 / 순손익 / 수익 기여도 / 노출
+    - trades: 전체 거래 (symbol 포함)
+    """
+    from ..services.candle_cache import get_candle_cache
+
+    # 0) 리소스 제한 확인
+    can_start, error_msg = resource_manager.can_start_backtest(user_id)
+    if not can_start:
+        raise HTTPException(status_code=429, detail=error_msg)
+
+    # 1) 요청 검증
+    if len(request.symbols) > BacktestConfig.PORTFOLIO_MAX_SYMBOLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many symbols (max {BacktestConfig.PORTFOLIO_MAX_SYMBOLS})",
+        )
+    timeframes = {
+        symbol: request.timeframes.get(symbol, request.timeframe)
+        for symbol in request.symbols
+    }
+    unsupported = sorted({tf for tf in timeframes.values() if tf not in TIMEFRAME_MS})
+    if unsupported:
+        raise HTTPException(
+            status_code=400, detail=f"Unsupported timeframe: {', '.join(unsupported)}"
+        )
+    try:
+        get_strategy(request.strategy_code, dict(request.strategy_params))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # 2) 최대 포지션 수 (사용자 리스크 설정과 동일)
+    max_positions = request.max_positions
+    if max_positions is None:
+        risk_settings = (
+            session.query(RiskSettings).filter(RiskSettings.user_id == user_id).first()
+        )
+        max_positions = risk_settings.max_positions if risk_settings else 5
+
+    # 3) 심볼별 캔들 동시 로드
+    cache = get_candle_cache()
+    arrays = await asyncio.gather(
+        *(
+            cache.get_candle_arrays(
+                symbol=symbol,
+                timeframe=timeframes[symbol],
+                start_date=request.start_date,
+                end_date=request.end_date,
+                cache_only=BacktestConfig.CACHE_ONLY,
+            )
+            for symbol in request.symbols
+        )
+    )
+    missing = [symbol for symbol, candles in zip(request.symbols, arrays) if not len(candles)]
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No candle data for {', '.join(missing)} "
+            f"({request.start_date} ~ {request.end_date})",
+        )
+    legs = [
+        (symbol, timeframes[symbol], candles)
+        for symbol, candles in zip(request.symbols, arrays)
+    ]
+
+    engine_params = {"initial_balance": request.initial_balance, "max_positions": max_positions}
+    if request.fee_rate is not None:
+        engine_params["fee_rate"] = request.fee_rate
+    if request.slippage is not None:
+        engine_params["slippage"] = request.slippage
+
+    # 4) 프로세스 풀에서 실행
+    run_id = f"portfolio-{uuid.uuid4().hex[:12]}"
+    resource_manager.start_backtest(user_id, run_id)
+    try:
+        return await sweep_runner.run_in_pool(
+            run_portfolio_backtest,
+            legs,
+            request.strategy_code,
+            request.strategy_params,
+            engine_params,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        resource_manager.finish_backtest(user_id, run_id)
 
 
 @router.get("/cache/info")
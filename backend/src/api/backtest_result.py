@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 import json
 
 from ..database.session import get_session
 from ..database.models import BacktestResult, BacktestTrade
 from ..schemas.backtest_response_schema import BacktestResultResponse
+from ..schemas.backtest_schema import MonteCarloRequest
+from ..services.backtest_persistence import (
+    decode_equity_curve,
+    downsample_equity_curve,
+)
+from ..services.monte_carlo import MC_METHODS, run_monte_carlo
 from ..utils.jwt_auth import get_current_user_id
 
 router = APIRouter(prefix="/backtest", tags=["backtest"])
@@ -13,6 +19,7 @@ router = APIRouter(prefix="/backtest", tags=["backtest"])
 @router.get("/result/{result_id}", response_model=BacktestResultResponse)
 async def get_backtest_result(
     result_id: int,
+    full_curve: bool = Query(False, description="전체 equity 곡선 반환 (기본: 다운샘플 미리보기)"),
     session: Session = Depends(get_session),
     user_id: int = Depends(get_current_user_id),
 ):
@@ -23,7 +30,7 @@ async def get_backtest_result(
 
     Returns:
     - summary metrics
-    - equity curve
+    - equity curve (기본: 미리보기, full_curve=true: 전체 곡선)
     - parameters
     - all trades with cumulative PnL
     """
@@ -72,10 +79,7 @@ async def get_backtest_result(
     except Exception:
         metrics = {}
 
-    try:
-        equity_curve = json.loads(result.equity_curve or "[]")
-    except Exception:
-        equity_curve = []
+    equity_curve, equity_curve_points = _load_equity_curve(result, full_curve)
 
     try:
         params = json.loads(result.params or "{}")
@@ -92,9 +96,120 @@ async def get_backtest_result(
         "error_message": result.error_message,  # Added error_message field
         "metrics": metrics,
         "equity_curve": equity_curve,
+        "equity_curve_points": equity_curve_points,
+        "equity_curve_full": full_curve,
         "params": params,
         "created_at": result.created_at,
         "trades": trades_list,
     }
 
     return response
+
+
+def _load_equity_curve(result: BacktestResult, full_curve: bool):
+    """
+    (곡선, 전체 포인트 수) 반환
+
+    압축 blob 저장 결과는 미리보기를 그대로 쓰고 전체 요청 시에만 blob을 풀며,
+    레거시 JSON 결과는 요청에 맞춰 다운샘플합니다.
+    """
+    if result.equity_curve_blob:
+        try:
+            curve = decode_equity_curve(result.equity_curve_blob)
+        except Exception:
+            return [], 0
+        if full_curve:
+            return curve.tolist(), len(curve)
+        if result.equity_preview:
+            return json.loads(result.equity_preview), len(curve)
+        return downsample_equity_curve(curve), len(curve)
+
+    try:
+        curve = json.loads(result.equity_curve or "[]")
+    except Exception:
+        curve = []
+    if full_curve:
+        return curve, len(curve)
+    return downsample_equity_curve(curve), len(curve)
+
+
+def _get_user_result(session: Session, result_id: int, user_id: int) -> BacktestResult:
+    result = (
+        session.query(BacktestResult)
+        .filter(BacktestResult.id == result_id)
+        .filter(BacktestResult.user_id == user_id)  # 사용자별 격리
+        .first()
+    )
+    if not result:
+        raise HTTPException(
+            status_code=404,
+            detail="Backtest result not found or access denied"
+        )
+    return result
+
+
+@router.post("/result/{result_id}/monte-carlo")
+async def run_backtest_monte_carlo(
+    result_id: int,
+    request: MonteCarloRequest,
+    session: Session = Depends(get_session),
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    완료된 백테스트 거래 목록으로 몬테카를로 분석 실행 (JWT 인증 필요).
+
+    거래 순손익(pnl - fee)을 재표본/섞기하여 n_paths개 경로를 시뮬레이션하고,
+    결과는 backtest_results.monte_carlo에 저장됩니다.
+
+    Returns:
+    - total_return / max_drawdown: 분포 (백분위수, 평균, 표준편차, %)
+    - probability_of_ruin: 자본이 ruin_threshold만큼 손실된 경로 비율 (%)
+    - probability_of_loss: 손실로 끝난 경로 비율 (%)
+    """
+    result = _get_user_result(session, result_id, user_id)
+    if result.status != "completed":
+        raise HTTPException(status_code=400, detail="Backtest is not completed")
+    if request.method not in MC_METHODS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"method must be one of: {', '.join(MC_METHODS)}",
+        )
+
+    rows = (
+        session.query(BacktestTrade.pnl, BacktestTrade.fee)
+        .filter(BacktestTrade.result_id == result_id)
+        .order_by(BacktestTrade.id.asc())
+        .all()
+    )
+    pnls = [(pnl or 0.0) - (fee or 0.0) for pnl, fee in rows]
+
+    try:
+        analysis = await run_monte_carlo(
+            pnls,
+            float(result.initial_balance),
+            n_paths=request.n_paths,
+            method=request.method,
+            seed=request.seed,
+            ruin_threshold=request.ruin_threshold,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    result.monte_carlo = json.dumps(analysis)
+    session.commit()
+    return analysis
+
+
+@router.get("/result/{result_id}/monte-carlo")
+async def get_backtest_monte_carlo(
+    result_id: int,
+    session: Session = Depends(get_session),
+    user_id: int = Depends(get_current_user_id),
+):
+    """저장된 몬테카를로 분석 결과 조회 (JWT 인증 필요)"""
+    result = _get_user_result(session, result_id, user_id)
+    if not result.monte_carlo:
+        raise HTTPException(
+            status_code=404, detail="Monte Carlo analysis has not been run"
+        )
+    return json.loads(result.monte_carlo)
@@ -5,6 +5,7 @@ Provides real-time OHLCV candle data and position markers for chart visualizatio
 """
 
 import logging
+import uuid
 from datetime import datetime, timedelta
 from typing import List, Optional
 
@@ -12,8 +13,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config import BacktestConfig, StrategySandboxConfig
 from ..database.db import get_session
-from ..database.models import Position, Trade
+from ..database.models import Position, Strategy, Trade
 from ..services.candle_generator import get_candle_generator
 from ..utils.jwt_auth import get_current_user_id
 
@@ -275,6 +277,116 @@ async def get_current_positions(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/signals/{strategy_id}")
+async def get_strategy_signals(
+    strategy_id: int,
+    start_date: str = Query(..., description="YYYY-MM-DD"),
+    end_date: str = Query(..., description="YYYY-MM-DD"),
+    symbol: Optional[str] = Query(default=None, description="기본값: 전략 파라미터 symbol"),
+    timeframe: Optional[str] = Query(default=None, description="기본값: 전략 파라미터 timeframe"),
+    session: AsyncSession = Depends(get_session),
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    Get strategy entry signal markers for chart overlay
+
+    Evaluates the strategy over cached candles of the requested range.
+    Strategies implementing generate_signals(arrays, params) are evaluated
+    in one call; others fall back to per-candle check_entry_signal calls.
+
+    The strategy code runs in the strategy sandbox workers (CPU budget,
+    memory limit, at most STRATEGY_SANDBOX_SERIES_MAX_CANDLES candles) and
+    counts as one backtest against the user's resource limits.
+
+    Returns:
+        List of signal markers with:
+        - time: Unix timestamp (seconds, same as /chart/candles)
+        - side: "long" or "short"
+        - price: Close price of the signal candle
+    """
+    import json
+
+    from ..services.candle_cache import get_candle_cache
+    from ..services.strategy_loader import uses_dynamic_executor
+    from ..services.strategy_sandbox import strategy_sandbox
+    from ..utils.resource_manager import resource_manager
+
+    result = await session.execute(
+        select(Strategy).where(
+            Strategy.id == strategy_id,
+            (Strategy.user_id == user_id) | (Strategy.user_id.is_(None)),
+        )
+    )
+    strategy = result.scalars().first()
+    if not strategy:
+        raise HTTPException(status_code=404, detail="Strategy not found")
+    if not uses_dynamic_executor(strategy.code):
+        raise HTTPException(
+            status_code=400, detail="Signal overlay is only available for dynamic strategies"
+        )
+
+    params = json.loads(strategy.params) if strategy.params else {}
+    symbol = (symbol or params.get("symbol") or "BTCUSDT").replace("/", "").upper()
+    timeframe = timeframe or params.get("timeframe") or "1h"
+
+    candles = await get_candle_cache().get_candle_arrays(
+        symbol=symbol,
+        timeframe=timeframe,
+        start_date=start_date,
+        end_date=end_date,
+        cache_only=BacktestConfig.CACHE_ONLY,
+    )
+    if not len(candles):
+        raise HTTPException(
+            status_code=404,
+            detail=f"No candle data for {symbol} {timeframe} ({start_date} ~ {end_date})",
+        )
+
+    if len(candles) > StrategySandboxConfig.SERIES_MAX_CANDLES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range too large: {len(candles)} candles "
+            f"(max {StrategySandboxConfig.SERIES_MAX_CANDLES})",
+        )
+
+    can_start, error_msg = resource_manager.can_start_backtest(user_id)
+    if not can_start:
+        raise HTTPException(status_code=429, detail=error_msg)
+
+    run_id = f"signals-{uuid.uuid4().hex[:12]}"
+    resource_manager.start_backtest(user_id, run_id)
+    try:
+        # 전략 코드는 샌드박스 워커에서 CPU/메모리 제한 안에서 실행
+        signals = await strategy_sandbox.evaluate_series(
+            strategy.code, strategy.params, candles
+        )
+    except TimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        resource_manager.finish_backtest(user_id, run_id)
+
+    markers = [
+        {
+            "time": int(candles.timestamp[i]) // 1000,
+            "side": "long" if signal > 0 else "short",
+            "price": float(candles.close[i]),
+        }
+        for i, signal in enumerate(signals)
+        if signal
+    ]
+
+    return {
+        "strategy_id": strategy_id,
+        "symbol": symbol,
+        "interval": timeframe,
+        "candles": len(candles),
+        "signals": markers,
+        "count": len(markers),
+    }
+
+
 @router.get("/status")
 async def get_chart_status(
     user_id: int = Depends(get_current_user_id),
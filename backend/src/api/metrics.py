@@ -0,0 +1,135 @@
+"""
+Prometheus 지표 엔드포인트
+
+GET /metrics - Prometheus 텍스트 형식 (monitoring/prometheus.yml의 backend 잡이 스크레이프)
+
+인증: METRICS_SCRAPE_TOKEN이 설정되어 있으면 Authorization: Bearer <token> 필수.
+운영 환경에서 토큰이 없으면 엔드포인트를 노출하지 않습니다 (404).
+
+직접 기록하는 지표:
+- HTTP 요청 수 / 지연 (middleware/metrics.py)
+- 거래소 API 호출 지연 / 에러 (bitget_rest, ccxt_price_collector)
+- 큐 길이 (market / chart 큐)
+
+스크레이프 시점에 기존 통계에서 변환하는 지표:
+- DB 커넥션 풀, WebSocket 연결 수
+- 캐시 적중률 (앱 캐시, 지표 메모, 캔들 워밍업)
+- 봇 루프 카운터 / 지연 (bot_metrics, 전체 합산)
+"""
+import secrets
+
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse, Response
+
+from ..config import MetricsConfig, RateLimitConfig
+from ..database.db import engine
+from ..indicators.memo import indicator_memo
+from ..services.bot_metrics import COUNTERS, LATENCY_BUCKETS_MS, bot_metrics
+from ..services.candle_warmup import candle_warmup
+from ..utils.cache_manager import cache_manager
+from ..utils.metrics import Counter, Gauge, Histogram, metrics
+from ..websockets import ws_server
+
+router = APIRouter(tags=["health"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+QUEUE_DEPTH = metrics.gauge("queue_depth", "Items waiting in in-process queues", ("queue",))
+
+
+def track_queue(name: str, queue):
+    """asyncio.Queue 길이를 queue_depth{queue=name}으로 노출"""
+    QUEUE_DEPTH.labels(name).set_function(queue.qsize)
+
+
+def _collect_db_pool():
+    pool = engine.pool
+    size = Gauge("db_pool_size", "Configured DB connection pool size")
+    connections = Gauge(
+        "db_pool_connections", "DB pool connections by state", ("state",)
+    )
+    if hasattr(pool, "size"):
+        size.set(pool.size())
+        connections.labels("checked_out").set(pool.checkedout())
+        connections.labels("checked_in").set(pool.checkedin())
+        connections.labels("overflow").set(max(pool.overflow(), 0))
+    return [size, connections]
+
+
+def _collect_websockets():
+    connections = Gauge("websocket_connections", "Open client WebSocket connections")
+    users = Gauge("websocket_users", "Users with at least one open WebSocket")
+    connections.set(sum(len(states) for states in ws_server.connections.values()))
+    users.set(len(ws_server.connections))
+    return [connections, users]
+
+
+def _collect_caches():
+    requests = Counter(
+        "cache_requests_total", "Cache lookups by cache and result", ("cache", "result")
+    )
+    requests.labels("app", "hit").inc(cache_manager.hits)
+    requests.labels("app", "miss").inc(cache_manager.misses)
+
+    memo = indicator_memo.get_stats()
+    requests.labels("indicator_memo", "hit").inc(memo["hits"])
+    requests.labels("indicator_memo", "miss").inc(memo["misses"])
+
+    warmup = candle_warmup.stats
+    requests.labels("candle_warmup", "hit").inc(
+        warmup["memory_hits"] + warmup["coalesced"]
+    )
+    requests.labels("candle_warmup", "miss").inc(warmup["api_calls"])
+    return [requests]
+
+
+def _collect_bots():
+    fleet = bot_metrics.fleet()
+    running = Gauge("bot_running", "Bot loops currently running")
+    running.set(len(bot_metrics.running()))
+
+    events = Counter(
+        "bot_events_total",
+        "Bot loop events (ticks received/evaluated/skipped, orders, errors)",
+        ("event",),
+    )
+    for name in COUNTERS:
+        events.labels(name).inc(fleet.counters[name])
+
+    latency = Histogram(
+        "bot_loop_duration_seconds",
+        "Bot loop stage latency across all bots",
+        ("stage",),
+        buckets=[b / 1000 for b in LATENCY_BUCKETS_MS],
+    )
+    for stage, histogram in fleet.histograms.items():
+        child = latency.labels(stage)
+        child.counts = list(histogram.counts)
+        child.sum = histogram.sum / 1000
+        child.count = histogram.count
+    return [running, events, latency]
+
+
+metrics.register_collector(_collect_db_pool)
+metrics.register_collector(_collect_websockets)
+metrics.register_collector(_collect_caches)
+metrics.register_collector(_collect_bots)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def prometheus_metrics(request: Request):
+    """Prometheus 스크레이프 엔드포인트"""
+    if not MetricsConfig.ENABLED:
+        return Response(status_code=404)
+
+    token = MetricsConfig.SCRAPE_TOKEN
+    if not token:
+        # 운영 환경에서는 토큰 없이 노출하지 않음
+        if not RateLimitConfig.IS_DEVELOPMENT:
+            return Response(status_code=404)
+    elif not secrets.compare_digest(
+        request.headers.get("Authorization", "").encode(), f"Bearer {token}".encode()
+    ):
+        return Response(status_code=401, headers={"WWW-Authenticate": "Bearer"})
+
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
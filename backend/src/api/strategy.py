@@ -7,6 +7,7 @@ import json
 from ..database.db import get_session
 from ..database.models import BotStatus, Strategy
 from ..schemas.strategy_schema import StrategyCreate, StrategySelect, StrategyUpdate
+from ..services.strategy_events import strategy_events
 from ..utils.jwt_auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
@@ -122,6 +123,9 @@ async def update_strategy(
 
     await session.commit()
     await session.refresh(strategy)
+
+    # 이 전략을 실행 중인 봇에 변경 알림 (다음 틱에서 새 전략으로 교체)
+    strategy_events.publish(strategy.id)
     return strategy
 
 
@@ -67,10 +67,104 @@ class BacktestConfig:
     DEFAULT_FEE_RATE = 0.001  # 0.1%
     DEFAULT_SLIPPAGE = 0.0005  # 0.05%
 
+    # 엔진 모드: "auto" (가능하면 벡터화) / "vector" / "loop"
+    ENGINE_MODE = os.getenv("BACKTEST_ENGINE_MODE", "auto")
+    # 체결 모델: "close" (캔들 종가 청산) / "intrabar" (손절/익절을 캔들 내부 가격에 체결,
+    # 모호한 캔들은 1분봉으로 판정)
+    FILL_MODEL = os.getenv("BACKTEST_FILL_MODEL", "close")
+
     # 제한
     MIN_INITIAL_BALANCE = 1.0
     MAX_INITIAL_BALANCE = 1000000.0
 
+    # 작업 큐 (backtest_results 기반, 프로세스 풀 실행)
+    JOB_WORKER_PROCESSES = int(os.getenv("BACKTEST_WORKER_PROCESSES", "2"))
+    JOB_LEASE_SECONDS = int(os.getenv("BACKTEST_JOB_LEASE_SECONDS", "300"))
+    JOB_POLL_INTERVAL = float(os.getenv("BACKTEST_JOB_POLL_INTERVAL", "2.0"))
+    JOB_MAX_ATTEMPTS = int(os.getenv("BACKTEST_JOB_MAX_ATTEMPTS", "3"))
+    # WebSocket 진행 상황 전송 최소 간격 (초)
+    PROGRESS_INTERVAL = float(os.getenv("BACKTEST_PROGRESS_INTERVAL", "0.5"))
+
+    # 파라미터 스윕 / 워크포워드 (공유 메모리 캔들 + 프로세스 풀)
+    SWEEP_WORKER_PROCESSES = int(
+        os.getenv("BACKTEST_SWEEP_WORKERS", str(max(1, (os.cpu_count() or 2) - 1)))
+    )
+    SWEEP_MAX_COMBINATIONS = int(os.getenv("BACKTEST_SWEEP_MAX_COMBINATIONS", "2000"))
+    SWEEP_CHUNK_SIZE = int(os.getenv("BACKTEST_SWEEP_CHUNK_SIZE", "16"))
+
+    # 포트폴리오 백테스트 최대 심볼 수
+    PORTFOLIO_MAX_SYMBOLS = int(os.getenv("BACKTEST_PORTFOLIO_MAX_SYMBOLS", "20"))
+
+    # 몬테카를로 분석 최대 경로 수
+    MONTE_CARLO_MAX_PATHS = int(os.getenv("BACKTEST_MONTE_CARLO_MAX_PATHS", "100000"))
+
+    # 결과 조회 기본 equity 미리보기 포인트 수 (전체 곡선은 압축 blob으로 저장)
+    EQUITY_PREVIEW_POINTS = int(os.getenv("BACKTEST_EQUITY_PREVIEW_POINTS", "500"))
+
+
+class IndicatorConfig:
+    """지표 계산 설정"""
+
+    # 사용자 간 공유 지표 메모 (심볼/타임프레임/마지막 확정 캔들 시각 키)
+    MEMO_ENABLED = os.getenv("INDICATOR_MEMO_ENABLED", "true").lower() == "true"
+    # 스트림별 보관할 최근 캔들 시각 수 (새 캔들이 닫히면 가장 오래된 것부터 제거)
+    MEMO_BARS_PER_STREAM = int(os.getenv("INDICATOR_MEMO_BARS_PER_STREAM", "2"))
+    # 캔들 시각 하나당 최대 항목 수 (지표 × 인자 조합)
+    MEMO_MAX_ENTRIES_PER_BAR = int(os.getenv("INDICATOR_MEMO_MAX_ENTRIES_PER_BAR", "512"))
+
+
+class StrategySandboxConfig:
+    """동적 전략 샌드박스 워커 풀 설정"""
+
+    # 활성화 시 사용자/AI 전략 코드를 API 프로세스 밖의 워커 프로세스에서 실행
+    ENABLED = os.getenv("STRATEGY_SANDBOX_ENABLED", "false").lower() == "true"
+    WORKER_PROCESSES = int(os.getenv("STRATEGY_SANDBOX_WORKERS", "2"))
+    # 호출당 CPU 시간 예산 (초) - 초과 시 hold 반환
+    CPU_BUDGET_SECONDS = float(os.getenv("STRATEGY_SANDBOX_CPU_BUDGET", "0.5"))
+    # CPU 예산으로 멈추지 않는 호출(네이티브 루프, sleep 등)을 워커 종료로 끊기까지의 여유 (초)
+    WALL_GRACE_SECONDS = float(os.getenv("STRATEGY_SANDBOX_WALL_GRACE", "1.0"))
+    # 워커 프로세스 메모리 상한 (MB, 주소 공간 기준)
+    MEMORY_LIMIT_MB = int(os.getenv("STRATEGY_SANDBOX_MEMORY_MB", "1024"))
+    # 공유 메모리로 전달하는 최대 캔들 수 (초과 시 최근 캔들만)
+    MAX_CANDLES = int(os.getenv("STRATEGY_SANDBOX_MAX_CANDLES", "1000"))
+    # 워커별 컴파일된 전략 캐시 크기
+    EXECUTOR_CACHE_SIZE = int(os.getenv("STRATEGY_SANDBOX_EXECUTOR_CACHE", "64"))
+    # 차트 신호 오버레이(전체 구간 신호 벡터) 호출당 CPU 예산 (초)과 최대 캔들 수
+    SERIES_CPU_BUDGET_SECONDS = float(os.getenv("STRATEGY_SANDBOX_SERIES_CPU_BUDGET", "10"))
+    SERIES_MAX_CANDLES = int(os.getenv("STRATEGY_SANDBOX_SERIES_MAX_CANDLES", "5000"))
+
+
+class CandleWarmupConfig:
+    """봇 시작 시 캔들 윈도우 워밍업 설정"""
+
+    # 봇 캔들 버퍼 크기
+    WINDOW_SIZE = int(os.getenv("CANDLE_WARMUP_WINDOW_SIZE", "200"))
+    # 메모리에 둔 윈도우 재사용 시간 (초, 같은 캔들 구간 안에서만)
+    MEMORY_TTL_SECONDS = float(os.getenv("CANDLE_WARMUP_MEMORY_TTL", "60"))
+    # API로 가져온 마감 캔들을 로컬 캔들 저장소(CSV)에 추가
+    PERSIST = os.getenv("CANDLE_WARMUP_PERSIST", "true").lower() == "true"
+
+
+class BotBootstrapConfig:
+    """봇 시작(서버 재시작 후 복구 포함) 승인 제어 설정"""
+
+    # 동시에 시작 단계(전략 로드, 키 복호화, 클라이언트 초기화, 캔들 워밍업)를 진행하는 봇 수
+    # (DB 커넥션 풀 pool_size=10보다 작게)
+    CONCURRENCY = int(os.getenv("BOT_BOOTSTRAP_CONCURRENCY", "8"))
+    # 서버 재시작 복구 시 봇별 시작 지연 (0 ~ JITTER_SECONDS 초 무작위)
+    JITTER_SECONDS = float(os.getenv("BOT_BOOTSTRAP_JITTER_SECONDS", "2.0"))
+
+
+class MetricsConfig:
+    """Prometheus 지표 설정 (GET /metrics)"""
+
+    # HTTP 미들웨어 기록 + /metrics 엔드포인트 활성화
+    ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+    # 스크레이프 토큰 (Authorization: Bearer <token>)
+    # 운영 환경에서는 필수: 설정하지 않으면 /metrics는 404 (개발 환경은 토큰 없이 허용)
+    SCRAPE_TOKEN = os.getenv("METRICS_SCRAPE_TOKEN", "")
+
 
 class TelegramConfig:
     """텔레그램 봇 설정"""
@@ -52,6 +52,9 @@ async def lifespan(app):
 
     # Create separate queue for chart service to avoid competition with bot
     chart_queue = asyncio.Queue(maxsize=1000)
+    from ..api.metrics import track_queue
+
+    track_queue("chart", chart_queue)
 
     # Start collector - it will feed both queues
     asyncio.create_task(ccxt_price_collector(market_queue, chart_queue))
@@ -70,6 +73,13 @@ async def lifespan(app):
     print("✅ Cache manager initialized")
     logger.info("✅ Cache manager initialized")
 
+    # Start backtest job runner (DB 기반 작업 큐 + 프로세스 풀)
+    from ..services.backtest_jobs import backtest_job_runner
+
+    await backtest_job_runner.start(AsyncSessionLocal)
+    print("✅ Backtest job runner started")
+    logger.info("✅ Backtest job runner started")
+
     # Bootstrap bot manager
     await bot_manager.bootstrap()
     print("✅ Bot manager bootstrapped")
@@ -98,6 +108,22 @@ async def lifespan(app):
         # Shutdown
         logger.info("🛑 Shutting down application...")
 
+        # Stop backtest job runner
+        from ..services.backtest_jobs import backtest_job_runner
+
+        await backtest_job_runner.shutdown()
+        logger.info("✅ Backtest job runner stopped")
+
+        # Stop sweep / walk-forward worker pool
+        from ..services.backtest_sweep import sweep_runner
+
+        sweep_runner.shutdown()
+
+        # Stop strategy sandbox workers
+        from ..services.strategy_sandbox import strategy_sandbox
+
+        strategy_sandbox.shutdown()
+
         # Close cache manager
         from ..utils.cache_manager import cache_manager
 
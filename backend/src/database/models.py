@@ -12,6 +12,7 @@ from sqlalchemy import (
     Index,
     Integer,
     JSON,
+    LargeBinary,
     Numeric,
     String,
     Text,
@@ -224,6 +225,10 @@ class BacktestResult(Base):
         Index("idx_backtest_user_created", "user_id", "created_at"),
         # 실행 중인 백테스트 조회용
         Index("idx_backtest_status", "status"),
+        # 작업 큐 디스패치용 (대기열 FIFO)
+        Index("idx_backtest_status_created", "status", "created_at"),
+        # 결과 캐시 조회용
+        Index("idx_backtest_user_cache_key", "user_id", "cache_key"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -233,12 +238,28 @@ class BacktestResult(Base):
     initial_balance = Column(Float, nullable=False)
     final_balance = Column(Float, nullable=False)
     metrics = Column(Text, nullable=True)
-    equity_curve = Column(Text, nullable=True)
+    equity_curve = Column(Text, nullable=True)  # (레거시) JSON 전체 곡선
+    # float32 델타 + zlib 압축 전체 곡선 / UI용 다운샘플 JSON
+    equity_curve_blob = Column(LargeBinary, nullable=True)
+    equity_preview = Column(Text, nullable=True)
     params = Column(Text, nullable=True)
     status = Column(String, default="queued")  # queued, running, completed, failed
     error_message = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # 작업 큐 리스 (BacktestJobRunner)
+    lease_owner = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    # 결과 캐시 키 (backtest_result_cache.compute_cache_key)
+    cache_key = Column(String, nullable=True)
+
+    # 몬테카를로 분석 결과 JSON (services/monte_carlo.py)
+    monte_carlo = Column(Text, nullable=True)
+
     user = relationship("User", backref="backtest_results")
     trades = relationship(
         "BacktestTrade", back_populates="result", cascade="all, delete-orphan"
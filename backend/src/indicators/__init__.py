@@ -0,0 +1,52 @@
+"""
+공용 기술 지표 라이브러리
+
+- batch: 전체 시리즈 numpy 계산 (백테스트, 전략 prepare/signal_vectors, 동적 전략 calculate_*)
+- streaming: 캔들 단위 증분 상태 객체 (라이브 경로)
+- memo: 사용자 간 공유 지표 메모 (라이브 동적 전략, src.indicators.memo.indicator_memo)
+
+두 구현의 워밍업 규칙과 결과는 같으며, tests/unit/test_indicator_parity.py로 검증합니다.
+"""
+
+from . import batch, streaming
+from .batch import (
+    atr,
+    bollinger_bands,
+    ema,
+    ema_from_first,
+    expanding_mean,
+    expanding_std,
+    linear_filter,
+    macd,
+    rolling_std,
+    rsi,
+    rsi_from_averages,
+    sma,
+    true_range,
+    wilder,
+)
+from .streaming import ATR, EMA, RSI, SMA, Wilder
+
+__all__ = [
+    "batch",
+    "streaming",
+    "atr",
+    "bollinger_bands",
+    "ema",
+    "ema_from_first",
+    "expanding_mean",
+    "expanding_std",
+    "linear_filter",
+    "macd",
+    "rolling_std",
+    "rsi",
+    "rsi_from_averages",
+    "sma",
+    "true_range",
+    "wilder",
+    "ATR",
+    "EMA",
+    "RSI",
+    "SMA",
+    "Wilder",
+]
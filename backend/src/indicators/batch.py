@@ -0,0 +1,212 @@
+"""
+배치(전체 시리즈) 지표 계산 - numpy
+
+워밍업 규칙 (streaming 모듈과 동일):
+- 값이 정의되지 않는 워밍업 구간은 NaN
+- EMA / Wilder: start 인덱스에서 직전 period개 SMA로 시드 후 재귀
+- RSI: 첫 값은 인덱스 period (처음 period개 변화량 평균으로 시드한 Wilder 평활)
+
+재귀 필터(EMA, Wilder)는 블록 단위 폐형식으로 계산합니다.
+블록 시작 값 기준 편차로 계산하므로 가격이 일정한 구간은 정확히 그 가격으로 수렴합니다.
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+# 블록 내 r^-k 최대 크기 (e^30 ≈ 1e13, float64 정밀도 내)
+_MAX_BLOCK_LOG = 30.0
+_MAX_BLOCK = 65_536
+
+
+def as_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64).ravel()
+
+
+def linear_filter(values, alpha: float, initial: float, start: int = 0) -> np.ndarray:
+    """
+    1차 재귀 필터 y[t] = y[t-1] + alpha * (x[t] - y[t-1])  (t >= start, y[start-1] = initial)
+
+    인덱스 start 이전은 NaN.
+    """
+    x = as_array(values)
+    n = len(x)
+    out = np.full(n, np.nan)
+    if start >= n:
+        return out
+    x = x[start:]
+    if alpha >= 1.0:
+        out[start:] = x
+        return out
+
+    r = 1.0 - alpha
+    block = int(min(_MAX_BLOCK, max(1, _MAX_BLOCK_LOG // -math.log(r))))
+    blocks = -(-len(x) // block)
+    padded = np.empty(blocks * block)
+    padded[: len(x)] = x
+    padded[len(x):] = x[-1]
+    rows = padded.reshape(blocks, block)
+
+    # 블록 시작 값 기준: w[k] = r^k * (w[0] + alpha * Σ z[j] r^-j)
+    anchor = rows[:, :1]
+    powers = r ** np.arange(1, block + 1)
+    local = alpha * powers * np.cumsum((rows - anchor) / powers, axis=1)
+
+    # 블록 간 carry (블록 수만큼 스칼라 재귀)
+    ends = (anchor[:, 0] + local[:, -1]).tolist()
+    anchors = anchor[:, 0].tolist()
+    r_block = float(powers[-1])
+    carry = np.empty(blocks)
+    prev = float(initial)
+    for b in range(blocks):
+        carry[b] = prev - anchors[b]
+        prev = ends[b] + r_block * carry[b]
+
+    filtered = anchor + local + powers * carry[:, None]
+    out[start:] = filtered.ravel()[: len(x)]
+    return out
+
+
+def ema(values, period: int, start: Optional[int] = None) -> np.ndarray:
+    """
+    지수 이동 평균 (alpha = 2 / (period + 1))
+
+    start(기본 period - 1) 인덱스에서 직전 period개 SMA로 시드.
+    """
+    x = as_array(values)
+    start = period - 1 if start is None else start
+    if period < 1 or start < period - 1 or start >= len(x):
+        return np.full(len(x), np.nan)
+    seed = float(np.mean(x[start - period + 1: start + 1]))
+    out = linear_filter(x, 2.0 / (period + 1), seed, start + 1)
+    out[start] = seed
+    return out
+
+
+def ema_from_first(values, period: int) -> np.ndarray:
+    """첫 값으로 시드한 EMA (워밍업 없음)"""
+    x = as_array(values)
+    if not len(x):
+        return x
+    out = linear_filter(x, 2.0 / (period + 1), x[0], 1)
+    out[0] = x[0]
+    return out
+
+
+def wilder(values, period: int, start: Optional[int] = None) -> np.ndarray:
+    """Wilder 평활 (alpha = 1 / period), 시드는 ema()와 동일"""
+    x = as_array(values)
+    start = period - 1 if start is None else start
+    if period < 1 or start < period - 1 or start >= len(x):
+        return np.full(len(x), np.nan)
+    seed = float(np.mean(x[start - period + 1: start + 1]))
+    out = linear_filter(x, 1.0 / period, seed, start + 1)
+    out[start] = seed
+    return out
+
+
+def sma(values, period: int) -> np.ndarray:
+    """단순 이동 평균 (인덱스 period - 1부터)"""
+    x = as_array(values)
+    out = np.full(len(x), np.nan)
+    if period < 1 or len(x) < period:
+        return out
+    # 첫 값 기준 누적합 (큰 가격의 누적 오차 방지)
+    csum = np.concatenate(([0.0], np.cumsum(x - x[0])))
+    out[period - 1:] = (csum[period:] - csum[:-period]) / period + x[0]
+    return out
+
+
+def rolling_std(values, period: int) -> np.ndarray:
+    """이동 표준편차 (모집단, ddof=0, 인덱스 period - 1부터)"""
+    x = as_array(values)
+    out = np.full(len(x), np.nan)
+    if period < 1 or len(x) < period:
+        return out
+    windows = np.lib.stride_tricks.sliding_window_view(x, period)
+    out[period - 1:] = windows.std(axis=1)
+    return out
+
+
+def expanding_mean(values) -> np.ndarray:
+    x = as_array(values)
+    if not len(x):
+        return x
+    return np.cumsum(x - x[0]) / np.arange(1, len(x) + 1) + x[0]
+
+
+def expanding_std(values) -> np.ndarray:
+    """누적 구간 표준편차 (ddof=0)"""
+    x = as_array(values)
+    if not len(x):
+        return x
+    z = x - x[0]
+    count = np.arange(1, len(x) + 1)
+    mean = np.cumsum(z) / count
+    return np.sqrt(np.maximum(np.cumsum(z * z) / count - mean * mean, 0.0))
+
+
+def rsi_from_averages(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    """평균 이익/손실 → RSI (평균 손실 0이면 100)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    out[avg_loss == 0] = 100.0
+    return out
+
+
+def rsi(closes, period: int = 14) -> np.ndarray:
+    """Wilder RSI (인덱스 period부터)"""
+    x = as_array(closes)
+    n = len(x)
+    if period < 1 or n <= period:
+        return np.full(n, np.nan)
+    change = np.diff(x)
+    # change[i - 1] = x[i] - x[i - 1] → 인덱스 i에 정렬
+    gains = np.concatenate(([np.nan], np.maximum(change, 0.0)))
+    losses = np.concatenate(([np.nan], np.maximum(-change, 0.0)))
+    avg_gain = wilder(gains, period, start=period)
+    avg_loss = wilder(losses, period, start=period)
+    return rsi_from_averages(avg_gain, avg_loss)
+
+
+def macd(
+    closes, fast: int = 12, slow: int = 26, signal: int = 9
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(macd, signal, histogram), 시그널은 MACD가 정의된 첫 인덱스부터 EMA"""
+    x = as_array(closes)
+    line = ema(x, fast) - ema(x, slow)
+    first = max(fast, slow) - 1
+    signal_line = np.full(len(x), np.nan)
+    if first < len(x):
+        signal_line[first:] = ema(line[first:], signal)
+    return line, signal_line, line - signal_line
+
+
+def bollinger_bands(
+    closes, period: int = 20, std_dev: float = 2.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(upper, middle, lower)"""
+    middle = sma(closes, period)
+    width = std_dev * rolling_std(closes, period)
+    return middle + width, middle, middle - width
+
+
+def true_range(high, low, close) -> np.ndarray:
+    """True Range (인덱스 0은 고가 - 저가)"""
+    high, low, close = as_array(high), as_array(low), as_array(close)
+    tr = high - low
+    if len(tr) > 1:
+        prev = close[:-1]
+        tr[1:] = np.maximum(
+            tr[1:], np.maximum(np.abs(high[1:] - prev), np.abs(low[1:] - prev))
+        )
+    return tr
+
+
+def atr(high, low, close, period: int = 14) -> np.ndarray:
+    """Wilder ATR (인덱스 1부터 True Range 사용, 첫 값은 인덱스 period)"""
+    tr = true_range(high, low, close)
+    if len(tr):
+        tr[0] = np.nan
+    return wilder(tr, period, start=period)
@@ -0,0 +1,199 @@
+"""
+프로세스 공용 지표 메모 (사용자 간 공유)
+
+여러 사용자의 동적 전략이 같은 심볼/타임프레임 캔들에 대해 같은 지표
+(EMA 200, RSI 14, MACD 12/26/9 등)를 매 틱마다 다시 계산하므로, 결과를
+(심볼, 타임프레임, 마지막 확정 캔들 시각, 지표, 인자) 키로 한 번만 계산해 공유합니다.
+
+라이브 봇 버퍼 전용: 마지막 원소는 진행 중 캔들(봇마다 받은 틱이 다름)입니다.
+- 지표는 진행 중 캔들을 뺀 확정 캔들 구간으로 계산하고, 진행 중 캔들 위치에는
+  마지막 확정 값을 그대로 채움 (반환 길이와 캔들 인덱스 정렬은 직접 계산과 동일)
+- 확정 구간 식별: (길이, 첫 캔들 시각, 마지막 확정 캔들 시각, 마지막 확정 종가)
+  시각은 타임프레임 단위로 내림 정렬 (진행 중 캔들의 틱 시각은 키에 쓰지 않음)
+- 스트림별로 최근 MEMO_BARS_PER_STREAM 개 캔들 시각만 보관하고, 새 캔들이
+  닫히면 가장 오래된 캔들 시각의 항목을 통째로 제거 (roll forward)
+- 보관 구간보다 오래된 캔들 요청은 계산만 하고 저장하지 않음 (stale)
+- 공유 결과는 불변 tuple로 보관하고 호출마다 list 복사본을 반환
+  (calculate_* 반환 형식 유지, 한 전략이 수정해도 다른 사용자에 영향 없음)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..config import IndicatorConfig
+from ..services.candle_arrays import TIMEFRAME_MS
+
+
+def _bar_time(candle) -> Optional[int]:
+    """캔들 시각 (ms). 라이브 버퍼는 "time", 캔들 저장소/백테스트는 "timestamp"."""
+    try:
+        value = candle.get("time") or candle.get("timestamp")
+        return int(value) if value else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _freeze(result):
+    """공유 저장용 불변 값 (list → tuple, 다중 결과는 tuple의 tuple)"""
+    if isinstance(result, tuple):
+        return tuple(tuple(part) for part in result)
+    return tuple(result)
+
+
+def _thaw(frozen, multi: bool):
+    """호출자별 list 복사본 (calculate_* 반환 형식 유지)"""
+    if multi:
+        return tuple(list(part) for part in frozen)
+    return list(frozen)
+
+
+def _carry_forward(result, multi: bool):
+    """확정 구간 결과 + 진행 중 캔들 위치(마지막 확정 값)"""
+    if multi:
+        return tuple(part + part[-1:] for part in result)
+    return result + result[-1:]
+
+
+def normalize_symbol(symbol: str) -> str:
+    """BTC/USDT, BTC-USDT, btcusdt → BTCUSDT"""
+    return symbol.replace("/", "").replace("-", "").upper()
+
+
+class SharedIndicatorMemo:
+    """(심볼, 타임프레임)별 캔들 시각 → 지표 결과 메모"""
+
+    def __init__(
+        self,
+        bars_per_stream: int = IndicatorConfig.MEMO_BARS_PER_STREAM,
+        max_entries_per_bar: int = IndicatorConfig.MEMO_MAX_ENTRIES_PER_BAR,
+        enabled: bool = IndicatorConfig.MEMO_ENABLED,
+    ):
+        self.bars_per_stream = max(1, bars_per_stream)
+        self.max_entries_per_bar = max(1, max_entries_per_bar)
+        self.enabled = enabled
+
+        # (symbol, timeframe) → OrderedDict[bar_time → OrderedDict[key → result]]
+        self._streams: Dict[Tuple[str, str], "OrderedDict[int, OrderedDict]"] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "bypassed": 0, "stale": 0, "evicted_bars": 0}
+
+    def get_or_compute(
+        self,
+        symbol: str,
+        timeframe: str,
+        name: str,
+        func: Callable,
+        candles,
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+    ):
+        """메모된 결과를 반환하거나 func(candles, *args, **kwargs)를 계산해 저장"""
+        kwargs = kwargs or {}
+        window = self._window_key(candles, TIMEFRAME_MS.get(timeframe.lower()))
+        if not self.enabled or window is None:
+            with self._lock:
+                self._stats["bypassed"] += 1
+            return func(candles, *args, **kwargs)
+
+        bar_time = window[2]
+        key = (name, args, tuple(sorted(kwargs.items())), window)
+        try:
+            hash(key)
+        except TypeError:
+            with self._lock:
+                self._stats["bypassed"] += 1
+            return func(candles, *args, **kwargs)
+        stream = (normalize_symbol(symbol), timeframe)
+
+        with self._lock:
+            bars = self._streams.get(stream)
+            entries = bars.get(bar_time) if bars else None
+            if entries is not None and key in entries:
+                self._stats["hits"] += 1
+                multi, frozen = entries[key]
+                return _carry_forward(_thaw(frozen, multi), multi)
+
+        result = func(list(candles)[:-1], *args, **kwargs)
+        multi = isinstance(result, tuple)
+        frozen = _freeze(result)
+
+        with self._lock:
+            self._stats["misses"] += 1
+            entries = self._bar_entries(stream, bar_time)
+            if entries is None:
+                self._stats["stale"] += 1
+            else:
+                entries[key] = (multi, frozen)
+                if len(entries) > self.max_entries_per_bar:
+                    entries.popitem(last=False)
+        return _carry_forward(_thaw(frozen, multi), multi)
+
+    def wrap(self, symbol: str, timeframe: str, name: str, func: Callable) -> Callable:
+        """calculate_* 함수 래퍼 (DynamicStrategyExecutor 네임스페이스용)"""
+
+        def indicator(candles, *args, **kwargs):
+            return self.get_or_compute(symbol, timeframe, name, func, candles, args, kwargs)
+
+        return indicator
+
+    def _window_key(self, candles, bar_ms: Optional[int] = None) -> Optional[tuple]:
+        """
+        확정 캔들 구간(마지막 진행 중 캔들 제외) 식별 키
+
+        확정 캔들이 없거나 시각이 없는 캔들이면 None.
+        """
+        try:
+            n = len(candles) - 1
+            if n < 1:
+                return None
+            first, last_closed = candles[0], candles[n - 1]
+            first_time, last_time = _bar_time(first), _bar_time(last_closed)
+            if first_time is None or last_time is None:
+                return None
+            if bar_ms:
+                first_time -= first_time % bar_ms
+                last_time -= last_time % bar_ms
+            return (n, first_time, last_time, float(last_closed["close"]))
+        except (KeyError, TypeError, ValueError, IndexError):
+            return None
+
+    def _bar_entries(self, stream: Tuple[str, str], bar_time: int) -> Optional[OrderedDict]:
+        """bar_time 항목 dict (새 캔들이면 생성하고 오래된 캔들 제거, stale이면 None)"""
+        bars = self._streams.get(stream)
+        if bars is None:
+            bars = self._streams[stream] = OrderedDict()
+
+        entries = bars.get(bar_time)
+        if entries is not None:
+            return entries
+
+        if len(bars) >= self.bars_per_stream and bar_time < min(bars):
+            return None
+
+        entries = bars[bar_time] = OrderedDict()
+        while len(bars) > self.bars_per_stream:
+            del bars[min(bars)]
+            self._stats["evicted_bars"] += 1
+        return entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._streams.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중률 등 메모 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["streams"] = len(self._streams)
+            stats["entries"] = sum(
+                len(entries) for bars in self._streams.values() for entries in bars.values()
+            )
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["enabled"] = self.enabled
+        return stats
+
+
+# 전역 인스턴스
+indicator_memo = SharedIndicatorMemo()
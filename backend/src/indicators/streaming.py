@@ -0,0 +1,106 @@
+"""
+스트리밍(증분) 지표 상태 객체
+
+캔들이 하나씩 들어오는 경로(라이브 봇, 전체 시리즈가 없는 전략 호출)용.
+update(value)는 새 값을 반영하고 현재 지표 값을 반환하며, 워밍업 중에는 None.
+워밍업 규칙과 결과는 batch 모듈과 같습니다 (부동소수점 오차 범위 내).
+"""
+
+from collections import deque
+from typing import Optional
+
+
+class _RecursiveFilter:
+    """SMA 시드 1차 재귀 필터 (EMA / Wilder 공통)"""
+
+    def __init__(self, period: int, alpha: float, start: Optional[int] = None):
+        self.period = period
+        self.alpha = alpha
+        self.start = period - 1 if start is None else start
+        self.count = 0
+        self.value: Optional[float] = None
+        self._window: deque = deque(maxlen=period)
+
+    def update(self, x: float) -> Optional[float]:
+        if self.value is not None:
+            self.value = self.value + self.alpha * (x - self.value)
+        else:
+            self._window.append(x)
+            if self.count == self.start:
+                self.value = sum(self._window) / self.period
+        self.count += 1
+        return self.value
+
+
+class EMA(_RecursiveFilter):
+    """지수 이동 평균 (batch.ema와 같은 시드 규칙)"""
+
+    def __init__(self, period: int, start: Optional[int] = None):
+        super().__init__(period, 2.0 / (period + 1), start)
+
+
+class Wilder(_RecursiveFilter):
+    """Wilder 평활 (batch.wilder)"""
+
+    def __init__(self, period: int, start: Optional[int] = None):
+        super().__init__(period, 1.0 / period, start)
+
+
+class SMA:
+    """단순 이동 평균 (batch.sma)"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.value: Optional[float] = None
+        self._window: deque = deque(maxlen=period)
+
+    def update(self, x: float) -> Optional[float]:
+        self._window.append(x)
+        if len(self._window) == self.period:
+            self.value = sum(self._window) / self.period
+        return self.value
+
+
+class RSI:
+    """Wilder RSI (batch.rsi)"""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.value: Optional[float] = None
+        self._prev: Optional[float] = None
+        # 변화량은 두 번째 값부터 → 시드 인덱스 period - 1 (변화량 기준)
+        self._gain = Wilder(period)
+        self._loss = Wilder(period)
+
+    def update(self, close: float) -> Optional[float]:
+        prev, self._prev = self._prev, close
+        if prev is None:
+            return None
+        change = close - prev
+        avg_gain = self._gain.update(max(change, 0.0))
+        avg_loss = self._loss.update(max(-change, 0.0))
+        if avg_gain is None or avg_loss is None:
+            return None
+        if avg_loss == 0:
+            self.value = 100.0
+        else:
+            self.value = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return self.value
+
+
+class ATR:
+    """Wilder ATR (batch.atr)"""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.value: Optional[float] = None
+        self._prev_close: Optional[float] = None
+        self._smooth = Wilder(period)
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        prev, self._prev_close = self._prev_close, close
+        if prev is None:
+            return None
+        tr = max(high - low, abs(high - prev), abs(low - prev))
+        self.value = self._smooth.update(tr)
+        return self.value
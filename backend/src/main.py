@@ -43,6 +43,7 @@ from .api import (
     upload,
     two_factor,
     telegram,
+    metrics,
 )
 from .config import settings
 from .database import db
@@ -55,7 +56,8 @@ from .middleware.rate_limit_improved import EnhancedRateLimitMiddleware
 from .middleware.error_handler import register_exception_handlers
 from .middleware.request_context import RequestContextMiddleware
 from .middleware.admin_ip_whitelist import AdminIPWhitelistMiddleware
-from .config import RateLimitConfig
+from .middleware.metrics import MetricsMiddleware
+from .config import MetricsConfig, RateLimitConfig
 
 
 def create_app() -> FastAPI:
@@ -119,6 +121,7 @@ def create_app() -> FastAPI:
     )
     app.state.market_queue = market_queue
     app.state.bot_manager = bot_manager
+    metrics.track_queue("market", market_queue)
 
     # CORS 설정 - 보안을 위해 특정 도메인만 허용
     # 개발 환경: localhost
@@ -169,11 +172,16 @@ def create_app() -> FastAPI:
     # Rate Limiting Middleware 추가 (개선된 버전)
     app.add_middleware(EnhancedRateLimitMiddleware)
 
+    # Prometheus HTTP 지표 (마지막 등록 = 가장 바깥, 레이트 리밋 응답 포함)
+    if MetricsConfig.ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
     # 전역 에러 핸들러 등록
     register_exception_handlers(app)
 
     # Routers
     app.include_router(health.router)  # Health check (먼저 등록 - 인증 불필요)
+    app.include_router(metrics.router)  # Prometheus /metrics (METRICS_SCRAPE_TOKEN Bearer 인증)
     app.include_router(auth.router)
     app.include_router(oauth.router)  # OAuth (Google, Kakao)
     app.include_router(two_factor.router)  # 2FA (NEW)
@@ -0,0 +1,53 @@
+"""
+HTTP 요청 지표 미들웨어
+라우트 템플릿(/bot/{user_id} 등)별 요청 수와 응답 시간을 Prometheus 지표로 기록
+"""
+import time
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from ..utils.metrics import metrics
+
+HTTP_REQUESTS = metrics.counter(
+    "http_requests_total",
+    "HTTP requests by route template, method and status code",
+    ("method", "route", "status"),
+)
+HTTP_LATENCY = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route"),
+)
+HTTP_IN_PROGRESS = metrics.gauge(
+    "http_requests_in_progress", "HTTP requests currently being handled"
+)
+
+
+def _route_template(request: Request) -> str:
+    """매칭된 라우트 경로 템플릿 (매칭 실패 시 고정 값으로 라벨 수 제한)"""
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    return path or "unmatched"
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """
+    HTTP 지표 미들웨어
+    - 실제 URL이 아닌 라우트 템플릿으로 집계 (사용자 ID 등으로 라벨이 늘어나지 않도록)
+    - 처리 중 예외는 status="500"으로 기록 후 다시 전달
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        start = time.perf_counter()
+        status = "500"
+        HTTP_IN_PROGRESS.inc()
+        try:
+            response = await call_next(request)
+            status = str(response.status_code)
+            return response
+        finally:
+            HTTP_IN_PROGRESS.dec()
+            route = _route_template(request)
+            HTTP_LATENCY.labels(request.method, route).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(request.method, route, status).inc()
@@ -33,7 +33,8 @@ class RateLimitStore:
         key: str,
         storage: dict,
         limit: int,
-        window: int
+        window: int,
+        now: Optional[float] = None
     ) -> Tuple[bool, int, int]:
         """
         Rate limit 체크 및 요청 기록
@@ -43,6 +44,7 @@ class RateLimitStore:
             storage: 저장소
             limit: 허용 횟수
             window: 시간 윈도우 (초)
+            now: 기록할 요청 시각 (refund()로 같은 기록을 취소할 때 사용)
 
         Returns:
             (allowed, remaining, reset_time) 튜플
@@ -50,7 +52,8 @@ class RateLimitStore:
             - remaining: 남은 요청 수
             - reset_time: Rate limit 리셋 시간 (Unix timestamp)
         """
-        now = time.time()
+        if now is None:
+            now = time.time()
         requests = storage[key]
 
         # 오래된 요청 제거 (Sliding Window)
@@ -77,6 +80,21 @@ class RateLimitStore:
 
         return True, remaining, reset_time
 
+    def refund(self, key: str, storage: dict, recorded_at: float):
+        """
+        요청 기록 1건 취소 (실제 작업이 실행되지 않은 요청)
+
+        처리 중에 같은 키로 다른 요청이 기록될 수 있으므로 마지막 기록이 아니라
+        check_and_record(now=recorded_at)로 남긴 기록을 찾아 제거합니다.
+        """
+        requests = storage.get(key)
+        if not requests:
+            return
+        try:
+            requests.remove(recorded_at)
+        except ValueError:
+            pass  # 이미 윈도우 밖으로 정리됨
+
 
 class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
     """
@@ -115,10 +133,11 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         """Rate limit 체크 및 헤더 추가"""
         client_ip = request.client.host if request.client else "unknown"
+        request_time = time.time()
 
         # 1. IP 기반 Rate Limiting (기본 보호)
         allowed, remaining, reset_time = await self._check_ip_rate_limit(
-            client_ip, request.url.path
+            client_ip, request.url.path, request_time
         )
 
         if not allowed:
@@ -135,7 +154,7 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
 
         if user_id:
             user_allowed, user_remaining, user_reset = await self._check_user_rate_limit(
-                user_id, request.url.path
+                user_id, request.url.path, request_time
             )
 
             if not user_allowed:
@@ -154,6 +173,14 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
         # 요청 처리
         response: Response = await call_next(request)
 
+        # 캐시된 백테스트 결과 반환은 한도에서 차감하지 않음
+        if response.headers.get("X-Backtest-Cache") == "hit":
+            self.store.refund(f"ip:{client_ip}:backtest", self.store.ip_requests, request_time)
+            if user_id:
+                self.store.refund(
+                    "backtest_minute", self.store.user_requests[user_id], request_time
+                )
+
         # 3. Rate Limit 헤더 추가
         response.headers["X-RateLimit-Remaining"] = str(remaining)
         response.headers["X-RateLimit-Reset"] = str(reset_time)
@@ -161,7 +188,7 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
         return response
 
     async def _check_ip_rate_limit(
-        self, ip: str, path: str
+        self, ip: str, path: str, now: Optional[float] = None
     ) -> Tuple[bool, int, int]:
         """IP 기반 Rate Limiting"""
 
@@ -171,7 +198,8 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
                 key=f"ip:{ip}:backtest",
                 storage=self.store.ip_requests,
                 limit=RateLimitConfig.IP_BACKTEST_PER_MINUTE,
-                window=RateLimitConfig.WINDOW_MINUTE
+                window=RateLimitConfig.WINDOW_MINUTE,
+                now=now
             )
 
         # 일반 API
@@ -179,11 +207,12 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
             key=f"ip:{ip}:general",
             storage=self.store.ip_requests,
             limit=RateLimitConfig.IP_GENERAL_PER_MINUTE,
-            window=RateLimitConfig.WINDOW_MINUTE
+            window=RateLimitConfig.WINDOW_MINUTE,
+            now=now
         )
 
     async def _check_user_rate_limit(
-        self, user_id: int, path: str
+        self, user_id: int, path: str, now: Optional[float] = None
     ) -> Tuple[bool, int, int]:
         """사용자별 Rate Limiting"""
 
@@ -195,7 +224,8 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
                     key=name,
                     storage=user_storage,
                     limit=limit,
-                    window=window
+                    window=window,
+                    now=now
                 )
 
         # 기본 설정
@@ -204,7 +234,8 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
             key="general",
             storage=user_storage,
             limit=RateLimitConfig.USER_GENERAL_PER_MINUTE,
-            window=RateLimitConfig.WINDOW_MINUTE
+            window=RateLimitConfig.WINDOW_MINUTE,
+            now=now
         )
 
     async def _get_user_id_from_jwt(self, request: Request) -> Optional[int]:
@@ -51,7 +51,9 @@ class BacktestResultResponse(BaseModel):
     status: str | None  # Added: backtest status (queued/running/completed/failed)
     error_message: str | None  # Added: error message if failed
     metrics: Dict[str, float]
-    equity_curve: List[float]
+    equity_curve: List[float]  # 기본: 다운샘플 미리보기 (full_curve=true: 전체)
+    equity_curve_points: int = 0  # 전체 곡선 포인트 수
+    equity_curve_full: bool = False
     params: Dict[str, Any]
     created_at: datetime
     trades: List[BacktestTradeSchema]
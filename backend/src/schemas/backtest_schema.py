@@ -1,5 +1,5 @@
 from pydantic import BaseModel, field_validator
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from ..utils.validators import (
     validate_file_path,
     validate_positive_number,
@@ -18,12 +18,21 @@ class BacktestStartRequest(BaseModel):
     - start_date: 백테스트 시작 날짜 (YYYY-MM-DD)
     - end_date: 백테스트 종료 날짜 (YYYY-MM-DD)
     - csv_path: (옵션) CSV 파일 경로 (지정하지 않으면 Bitget API에서 자동 다운로드)
+    - fill_model: (옵션) "close" | "intrabar" (손절/익절 캔들 내부 체결, 기본값은 서버 설정)
     """
     strategy_id: int
     initial_balance: float = 10000.0
     start_date: str
     end_date: str
     csv_path: Optional[str] = None
+    fill_model: Optional[str] = None
+
+    @field_validator('fill_model')
+    @classmethod
+    def validate_fill_model(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and v not in ("close", "intrabar"):
+            raise ValueError("fill_model must be 'close' or 'intrabar'")
+        return v
 
     @field_validator('csv_path')
     @classmethod
@@ -55,3 +64,180 @@ class BacktestStartRequest(BaseModel):
             return v
         except ValueError:
             raise ValueError(f"Invalid date format: {v}. Expected YYYY-MM-DD")
+
+
+class BacktestSweepRequest(BaseModel):
+    """
+    /backtest/sweep 요청 바디 스키마.
+
+    - strategy_code: 전략 이름 ("rsi", "ema", "openclose")
+    - symbol / timeframe / start_date / end_date: 캔들 저장소 데이터 구간
+    - param_grid: 파라미터별 값 목록 또는 {"start", "stop", "step"} 범위
+      예) {"length": {"start": 7, "stop": 21, "step": 1}, "oversold": [25, 30]}
+    - rank_by: 랭킹 기준 메트릭 (total_return, sharpe_ratio, profit_factor, win_rate, max_drawdown)
+    - top_k: 랭킹에 포함할 상위 결과 수
+    """
+    strategy_code: str
+    symbol: str = "BTCUSDT"
+    timeframe: str = "1h"
+    start_date: str
+    end_date: str
+    initial_balance: float = 10000.0
+    param_grid: Dict[str, Any]
+    rank_by: str = "total_return"
+    top_k: int = 20
+    fee_rate: Optional[float] = None
+    slippage: Optional[float] = None
+
+    @field_validator('initial_balance')
+    @classmethod
+    def validate_balance(cls, v: float) -> float:
+        """초기 잔고 범위 검증"""
+        return validate_positive_number(
+            v,
+            min_value=ValidationRules.BALANCE_MIN,
+            max_value=ValidationRules.BALANCE_MAX,
+            field_name="initial_balance"
+        )
+
+    @field_validator('start_date', 'end_date')
+    @classmethod
+    def validate_date_format(cls, v: str) -> str:
+        """날짜 형식 검증 (YYYY-MM-DD)"""
+        from datetime import datetime
+        try:
+            datetime.strptime(v, '%Y-%m-%d')
+            return v
+        except ValueError:
+            raise ValueError(f"Invalid date format: {v}. Expected YYYY-MM-DD")
+
+    @field_validator('top_k')
+    @classmethod
+    def validate_top_k(cls, v: int) -> int:
+        """랭킹 크기 검증"""
+        if v < 1 or v > 100:
+            raise ValueError("top_k must be between 1 and 100")
+        return v
+
+
+class WalkForwardRequest(BacktestSweepRequest):
+    """
+    /backtest/walk-forward 요청 바디 스키마.
+
+    BacktestSweepRequest 필드 + 구간 설정:
+    - in_sample_days: 최적화(IS) 구간 길이 (일)
+    - out_of_sample_days: 검증(OOS) 구간 길이 (일)
+    - step_days: 구간 이동 간격 (기본: out_of_sample_days)
+    - anchored: True면 IS 시작점 고정 (확장 윈도우), False면 롤링
+    """
+    in_sample_days: float
+    out_of_sample_days: float
+    step_days: Optional[float] = None
+    anchored: bool = False
+
+    @field_validator('in_sample_days', 'out_of_sample_days')
+    @classmethod
+    def validate_window_days(cls, v: float) -> float:
+        """구간 길이 검증"""
+        if v <= 0:
+            raise ValueError("Window length must be greater than 0 days")
+        return v
+
+
+class PortfolioBacktestRequest(BaseModel):
+    """
+    /backtest/portfolio 요청 바디 스키마.
+
+    - strategy_code / strategy_params: 심볼마다 같은 전략을 별도 인스턴스로 실행
+    - symbols: 심볼 목록
+    - timeframe: 기본 타임프레임, timeframes로 심볼별 지정 가능
+      예) {"ETHUSDT": "4h"}
+    - max_positions: 최대 동시 포지션 수 (기본: 사용자 RiskSettings.max_positions)
+    """
+    strategy_code: str
+    strategy_params: Dict[str, Any] = {}
+    symbols: List[str]
+    timeframe: str = "1h"
+    timeframes: Dict[str, str] = {}
+    start_date: str
+    end_date: str
+    initial_balance: float = 10000.0
+    max_positions: Optional[int] = None
+    fee_rate: Optional[float] = None
+    slippage: Optional[float] = None
+
+    @field_validator('symbols')
+    @classmethod
+    def validate_symbols(cls, v: List[str]) -> List[str]:
+        """심볼 목록 정규화 (중복 제거, 순서 유지)"""
+        symbols = list(dict.fromkeys(s.replace("/", "").upper() for s in v if s))
+        if not symbols:
+            raise ValueError("symbols must contain at least one symbol")
+        return symbols
+
+    @field_validator('timeframes')
+    @classmethod
+    def normalize_timeframes(cls, v: Dict[str, str]) -> Dict[str, str]:
+        return {k.replace("/", "").upper(): tf for k, tf in v.items()}
+
+    @field_validator('initial_balance')
+    @classmethod
+    def validate_balance(cls, v: float) -> float:
+        """초기 잔고 범위 검증"""
+        return validate_positive_number(
+            v,
+            min_value=ValidationRules.BALANCE_MIN,
+            max_value=ValidationRules.BALANCE_MAX,
+            field_name="initial_balance"
+        )
+
+    @field_validator('max_positions')
+    @classmethod
+    def validate_max_positions(cls, v: Optional[int]) -> Optional[int]:
+        """RiskSettings와 같은 범위 (1-50)"""
+        if v is not None and (v < 1 or v > 50):
+            raise ValueError("max_positions must be between 1 and 50")
+        return v
+
+    @field_validator('start_date', 'end_date')
+    @classmethod
+    def validate_date_format(cls, v: str) -> str:
+        """날짜 형식 검증 (YYYY-MM-DD)"""
+        from datetime import datetime
+        try:
+            datetime.strptime(v, '%Y-%m-%d')
+            return v
+        except ValueError:
+            raise ValueError(f"Invalid date format: {v}. Expected YYYY-MM-DD")
+
+
+class MonteCarloRequest(BaseModel):
+    """
+    /backtest/result/{id}/monte-carlo 요청 바디 스키마.
+
+    - n_paths: 시뮬레이션 경로 수
+    - method: "bootstrap" (복원 재표본) 또는 "shuffle" (거래 순서 섞기)
+    - seed: 재현용 시드 (선택)
+    - ruin_threshold: 파산 기준 손실 비율 (0.5 → 초기 자본의 50% 손실)
+    """
+    n_paths: int = 10000
+    method: str = "bootstrap"
+    seed: Optional[int] = None
+    ruin_threshold: float = 0.5
+
+    @field_validator('n_paths')
+    @classmethod
+    def validate_n_paths(cls, v: int) -> int:
+        from ..config import BacktestConfig
+        if v < 100 or v > BacktestConfig.MONTE_CARLO_MAX_PATHS:
+            raise ValueError(
+                f"n_paths must be between 100 and {BacktestConfig.MONTE_CARLO_MAX_PATHS}"
+            )
+        return v
+
+    @field_validator('ruin_threshold')
+    @classmethod
+    def validate_ruin_threshold(cls, v: float) -> float:
+        if v <= 0 or v > 1:
+            raise ValueError("ruin_threshold must be in (0, 1]")
+        return v
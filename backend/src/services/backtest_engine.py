@@ -1,27 +1,52 @@
 import csv
+import logging
 import os
 from io import StringIO
 
 import aiofiles
+import numpy as np
 
 from ..config import BacktestConfig
 from .backtest_trade_recorder import BacktestTradeRecorder
 from .backtest_metrics import BacktestMetricsCalculator
+from .candle_arrays import CandleArrays
+from .intrabar_fills import IntrabarIndex, check_intrabar_exit
+from .strategies.base import StrategyBase
 from .strategies.simple_open_close import SimpleOpenCloseStrategy
 
+logger = logging.getLogger(__name__)
+
+# 시뮬레이션 결과에 영향을 주는 변경 시 올릴 것 (백테스트 결과 캐시 키에 포함)
+ENGINE_VERSION = "3"
+
+# 루프 모드 진행 콜백 호출 간격 (캔들 수)
+PROGRESS_EVERY = 1024
+
 
 class BacktestEngine:
     """
     BacktestEngine (Phase G – 정확도 강화 버전)
 
     주요 특징:
-    - CSV 캔들 로딩
+    - 캔들 입력: CandleArrays(메모리 직접 전달) / 캔들 저장소 참조 / 업로드 CSV
     - 단일 포지션(long/short) 지원
     - 전략 클래스(StrategyBase)를 이용한 신호 생성
     - 슬리피지/수수료 방향을 일관되게 처리
     - 각 캔들마다 equity(잔고 + 미실현 손익) 기록
     - 마지막에 포지션이 열려 있으면 자동 청산
     - MetricsCalculator로 total_return / max_drawdown / win_rate 계산
+    - 벡터화 모드: signal_vectors()를 지원하는 전략은 전체 신호 배열로
+      이벤트(진입/청산) 사이를 건너뛰며 시뮬레이션 (루프 모드와 비트 단위 동일)
+
+    params["mode"]:
+    - "auto" (기본): 벡터화 가능하면 벡터화, 아니면 루프
+    - "vector": 벡터화 요청 (불가능하면 루프로 대체)
+    - "loop": 항상 캔들별 루프
+
+    params["fill_model"] (전략이 exit_levels()로 손절/익절 가격을 제공할 때만 적용):
+    - "close" (기본): 전략 신호로 캔들 종가에 청산
+    - "intrabar": 손절/익절을 캔들 고가/저가 기준으로 해당 가격에 체결 (루프 모드),
+      손절/익절이 모두 닿은 캔들만 1분봉(intrabar_candles)으로 선후 판정
 
     run() 반환값 구조:
     {
@@ -37,7 +62,7 @@ class BacktestEngine:
 
     async def load_candles(self, path: str):
         """
-        CSV에서 캔들 데이터 비동기 로드
+        CSV에서 캔들 데이터 비동기 로드 (사용자 업로드 CSV 전용)
 
         비동기 파일 I/O를 사용하여 이벤트 루프 블로킹을 방지합니다.
         대용량 CSV 파일 (100MB+)도 효율적으로 처리 가능합니다.
@@ -71,6 +96,84 @@ class BacktestEngine:
 
         return candles
 
+    async def resolve_candles(self, params: dict) -> CandleArrays:
+        """
+        params에서 캔들 소스를 결정하여 CandleArrays로 반환
+
+        우선순위:
+        1. candles: CandleArrays 또는 캔들 dict 리스트 (직렬화 없이 그대로 사용)
+        2. candle_source: {"symbol", "timeframe", "start_date", "end_date"} 캔들 저장소 참조
+        3. csv_path: 사용자 업로드 CSV
+        """
+        candles = params.get("candles")
+        if candles is not None:
+            if isinstance(candles, CandleArrays):
+                return candles
+            return CandleArrays.from_dicts(candles)
+
+        source = params.get("candle_source")
+        if source:
+            from .candle_cache import get_candle_cache
+
+            return await get_candle_cache().get_candle_arrays(
+                symbol=source["symbol"],
+                timeframe=source["timeframe"],
+                start_date=source["start_date"],
+                end_date=source["end_date"],
+                cache_only=source.get("cache_only", BacktestConfig.CACHE_ONLY),
+            )
+
+        csv_path = params.get("csv_path")
+        if csv_path:
+            return CandleArrays.from_dicts(await self.load_candles(csv_path))
+
+        raise ValueError(
+            "candles, candle_source or csv_path is required for backtesting"
+        )
+
+    def uses_intrabar_fills(self, params: dict) -> bool:
+        """intrabar 체결 모델 적용 여부 (손절/익절 가격을 제공하는 전략만)"""
+        if params.get("fill_model", BacktestConfig.FILL_MODEL) != "intrabar":
+            return False
+        return type(self.strategy).exit_levels is not StrategyBase.exit_levels
+
+    async def resolve_intrabar_candles(self, params: dict):
+        """
+        intrabar 체결 모델용 1분봉 (캔들 저장소)
+
+        params["intrabar_candles"]가 있으면 그대로 사용하고, 없으면 candle_source
+        (또는 symbol/start_date/end_date)로 1분봉을 로드합니다.
+        1분봉이 없으면 None → 모호한 캔들은 손절 우선으로 처리.
+        """
+        if not self.uses_intrabar_fills(params):
+            return None
+
+        minute = params.get("intrabar_candles")
+        if minute is not None:
+            if isinstance(minute, CandleArrays):
+                return minute
+            return CandleArrays.from_dicts(minute)
+
+        source = params.get("candle_source")
+        if not source and params.get("start_date") and not params.get("csv_path"):
+            source = params
+        if not source:
+            return None
+
+        from .candle_cache import get_candle_cache
+
+        try:
+            return await get_candle_cache().get_candle_arrays(
+                symbol=(source.get("symbol") or "BTCUSDT").replace("/", ""),
+                timeframe="1m",
+                start_date=source["start_date"],
+                end_date=source["end_date"],
+                cache_only=source.get("cache_only", BacktestConfig.CACHE_ONLY),
+            )
+        except Exception as e:
+            logger.warning(f"1m candles unavailable for intrabar fills: {e}")
+            return None
+
     def _compute_equity(self, balance: float, position: dict | None, price: float) -> float:
         if position is None:
             return float(balance)
@@ -82,21 +185,59 @@ class BacktestEngine:
             unrealized = (entry_price - price) * 1.0
         return float(balance + unrealized)
 
-    async def run(self, params: dict):
+    async def run(self, params: dict, progress=None):
         """
         백테스트 실행 (비동기)
 
-        비동기 파일 I/O를 사용하여 CSV 로드 중에도 다른 요청 처리 가능
+        캔들 로드만 비동기로 처리하고, 시뮬레이션은 run_on_candles()에 위임합니다.
         """
-        csv_path = params.get("csv_path")
-        if not csv_path:
-            raise ValueError("csv_path is required for backtesting")
+        candles = await self.resolve_candles(params)
+        intrabar_candles = await self.resolve_intrabar_candles(params)
+        return self.run_on_candles(candles, params, progress, intrabar_candles)
 
-        # 비동기 CSV 로드
-        candles = await self.load_candles(csv_path)
+    def run_on_candles(
+        self, candles: CandleArrays, params: dict, progress=None, intrabar_candles=None
+    ):
+        """
+        메모리에 있는 캔들 배열로 백테스트 실행 (동기)
+
+        이벤트 루프가 없는 워커 스레드/프로세스에서도 그대로 호출할 수 있습니다.
+
+        Args:
+            progress: (bars_processed, equity, trades) 진행 콜백 (선택).
+                      PROGRESS_EVERY 캔들마다 / 벡터화 모드는 청산 시점마다 호출
+            intrabar_candles: intrabar 체결 모델용 1분봉 (resolve_intrabar_candles())
+        """
+        if not isinstance(candles, CandleArrays):
+            candles = CandleArrays.from_dicts(candles)
+
+        intrabar = self.uses_intrabar_fills(params)
+        intrabar_index = None
+        fill_stats = None
+        if intrabar:
+            if intrabar_candles is None:
+                intrabar_candles = params.get("intrabar_candles")
+            if intrabar_candles is not None and not isinstance(intrabar_candles, CandleArrays):
+                intrabar_candles = CandleArrays.from_dicts(intrabar_candles)
+            timeframe = params.get("timeframe") or (params.get("candle_source") or {}).get(
+                "timeframe"
+            )
+            intrabar_index = IntrabarIndex.build(candles, timeframe, intrabar_candles)
+            fill_stats = {"intrabar_exits": 0, "refined_bars": 0, "unresolved_bars": 0}
+
+        mode = params.get("mode", BacktestConfig.ENGINE_MODE)
+        if mode != "loop" and not intrabar:
+            signals = self._vector_signals(candles)
+            if signals is not None:
+                return self._run_vectorized(candles, signals, params, progress)
 
         recorder = BacktestTradeRecorder()
 
+        # 전체 시리즈 사전 계산 훅 (지표 1회 계산 등)
+        prepare = getattr(self.strategy, "prepare", None)
+        if prepare is not None:
+            prepare(candles)
+
         # 설정에서 기본값 가져오기
         initial_balance = float(
             params.get("initial_balance", BacktestConfig.DEFAULT_INITIAL_BALANCE)
@@ -109,17 +250,51 @@ class BacktestEngine:
         position: dict | None = None
         last_price = None
 
-        for candle in candles:
-            o = candle["open"]
-            c = candle["close"]
-            ts = candle["timestamp"]
+        columns = (
+            candles.timestamp.tolist(),
+            candles.open.tolist(),
+            candles.high.tolist(),
+            candles.low.tolist(),
+            candles.close.tolist(),
+            candles.volume.tolist(),
+        )
+
+        for index, (ts, o, h, l, c, v) in enumerate(zip(*columns)):
+            if progress is not None and not index % PROGRESS_EVERY and index:
+                progress(index, recorder.equity_curve[-1], len(recorder.trades))
+
+            candle = {
+                "timestamp": ts,
+                "open": o,
+                "high": h,
+                "low": l,
+                "close": c,
+                "volume": v,
+            }
 
             if c <= 0:
                 equity = self._compute_equity(balance, position, last_price) if last_price else balance
                 recorder.record_equity(equity)
+                if position is not None:
+                    recorder.bars_in_position += 1
                 continue
 
             last_price = c
+            exited_intrabar = False
+
+            # 손절/익절 캔들 내부 체결 (체결 후에도 전략은 이 캔들 종가에서 재진입 가능)
+            if intrabar and position is not None:
+                stop_loss, take_profit = self.strategy.exit_levels(position)
+                fill = check_intrabar_exit(
+                    position["direction"], o, h, l, stop_loss, take_profit,
+                    index, intrabar_index, fill_stats,
+                )
+                if fill is not None:
+                    balance = self._close_at(
+                        recorder, balance, position, fill[0], ts, fee_rate, slippage
+                    )
+                    position = None
+                    exited_intrabar = True
 
             signal = self.strategy.on_candle(candle, position)
 
@@ -186,9 +361,12 @@ class BacktestEngine:
 
             equity = self._compute_equity(balance, position, last_price)
             recorder.record_equity(equity)
+            # 캔들 내부 청산 후 같은 캔들에서 재진입해도 보유 캔들은 한 번만 집계
+            if position is not None or exited_intrabar:
+                recorder.bars_in_position += 1
 
         if position is not None and last_price is not None:
-            ts = candles[-1]["timestamp"] if candles else None
+            ts = columns[0][-1] if len(candles) else None
             c = last_price
 
             if position["direction"] == "long":
@@ -228,9 +406,51 @@ class BacktestEngine:
             equity = self._compute_equity(balance, None, c)
             recorder.record_equity(equity)
 
+        return self._build_output(recorder, balance, initial_balance, params, fill_stats)
+
+    @staticmethod
+    def _close_at(
+        recorder, balance: float, position: dict, price: float, ts, fee_rate: float, slippage: float
+    ) -> float:
+        """지정 가격(손절/익절)으로 포지션 청산 후 잔고 반환"""
+        if position["direction"] == "long":
+            exit_price = price * (1 - slippage)
+            pnl = (exit_price - position["entry_price"]) * 1.0
+        else:
+            exit_price = price * (1 + slippage)
+            pnl = (position["entry_price"] - exit_price) * 1.0
+        exit_fee = exit_price * fee_rate
+
+        recorder.record_trade(
+            side="exit",
+            direction=position["direction"],
+            entry=position["entry_price"],
+            exit=exit_price,
+            fee=position["entry_fee"] + exit_fee,
+            pnl=pnl,
+            timestamp=ts,
+        )
+        return balance + pnl - exit_fee
+
+    def _build_output(
+        self,
+        recorder,
+        balance: float,
+        initial_balance: float,
+        params: dict,
+        fill_stats: dict | None = None,
+    ) -> dict:
         metrics = BacktestMetricsCalculator()
-        metrics.compute(recorder.trades, recorder.equity_curve, initial_balance)
+        metrics.compute(
+            recorder.trades,
+            recorder.equity_curve,
+            initial_balance,
+            timeframe=params.get("timeframe"),
+            bars_in_position=recorder.bars_in_position,
+        )
         summary = metrics.summary()
+        if fill_stats is not None:
+            summary.update(fill_stats)
 
         return {
             "final_balance": float(balance),
@@ -238,3 +458,126 @@ class BacktestEngine:
             "equity_curve": recorder.equity_curve,
             "metrics": summary,
         }
+
+    def _vector_signals(self, candles: CandleArrays):
+        """
+        벡터화 모드 사용 가능 여부 확인 후 (flat, long, short) 신호 반환
+
+        close <= 0 (또는 NaN) 캔들이 있으면 루프 모드가 해당 캔들을 건너뛰며
+        전략 상태가 달라지므로 None (루프 모드로 대체).
+        """
+        signal_vectors = getattr(self.strategy, "signal_vectors", None)
+        if signal_vectors is None or not len(candles):
+            return None
+        if not bool(np.all(candles.close > 0)):
+            return None
+        return signal_vectors(candles)
+
+    @staticmethod
+    def _next_index(mask: np.ndarray) -> np.ndarray:
+        """
+        next[i] = i 이상에서 mask가 True인 첫 인덱스 (없으면 len(mask))
+
+        길이 n+1 (next[n] = n) 이므로 경계 검사 없이 next[i + 1] 조회 가능.
+        """
+        n = mask.shape[0]
+        index = np.full(n + 1, n, dtype=np.int64)
+        index[:n][mask] = np.arange(n, dtype=np.int64)[mask]
+        return np.minimum.accumulate(index[::-1])[::-1]
+
+    def _run_vectorized(
+        self, candles: CandleArrays, signals, params: dict, progress=None
+    ) -> dict:
+        """
+        벡터화 포지션/체결/수수료/슬리피지 시뮬레이터
+
+        포지션 상태별 다음 이벤트 인덱스 배열로 진입/청산 지점만 방문하고,
+        구간 equity는 배열 연산으로 채웁니다. 체결 가격/수수료/잔고 계산은
+        run_on_candles()와 같은 순서의 스칼라 연산이므로 결과가 비트 단위로 같습니다.
+        """
+        flat_signal, long_signal, short_signal = signals
+
+        recorder = BacktestTradeRecorder()
+
+        initial_balance = float(
+            params.get("initial_balance", BacktestConfig.DEFAULT_INITIAL_BALANCE)
+        )
+        balance = initial_balance
+
+        fee_rate = float(params.get("fee_rate", BacktestConfig.DEFAULT_FEE_RATE))
+        slippage = float(params.get("slippage", BacktestConfig.DEFAULT_SLIPPAGE))
+
+        close = candles.close
+        closes = close.tolist()
+        timestamps = candles.timestamp.tolist()
+        n = len(closes)
+
+        next_entry = self._next_index(flat_signal != 0)
+        next_long_exit = self._next_index(long_signal < 0)
+        next_short_exit = self._next_index(short_signal > 0)
+        flat_signal = flat_signal.tolist()
+
+        equity = np.empty(n + 1, dtype=np.float64)
+        i = 0
+
+        while i < n:
+            # 포지션 없는 구간: equity = balance
+            entry_index = int(next_entry[i])
+            equity[i:entry_index] = balance
+            if entry_index >= n:
+                break
+
+            c = closes[entry_index]
+            if flat_signal[entry_index] > 0:
+                direction = "long"
+                entry_price = c * (1 + slippage)
+                exit_index = int(next_long_exit[entry_index + 1])
+            else:
+                direction = "short"
+                entry_price = c * (1 - slippage)
+                exit_index = int(next_short_exit[entry_index + 1])
+            entry_fee = entry_price * fee_rate
+            balance -= entry_fee
+
+            # 포지션 보유 구간: equity = balance + 미실현 손익
+            held = close[entry_index:exit_index]
+            recorder.bars_in_position += len(held)
+            if direction == "long":
+                equity[entry_index:exit_index] = balance + (held - entry_price) * 1.0
+            else:
+                equity[entry_index:exit_index] = balance + (entry_price - held) * 1.0
+
+            # 청산 (시리즈 끝까지 신호가 없으면 마지막 종가로 자동 청산)
+            is_final_close = exit_index >= n
+            c = closes[exit_index] if not is_final_close else closes[-1]
+            ts = timestamps[exit_index] if not is_final_close else timestamps[-1]
+
+            if direction == "long":
+                exit_price = c * (1 - slippage)
+                pnl = (exit_price - entry_price) * 1.0
+            else:
+                exit_price = c * (1 + slippage)
+                pnl = (entry_price - exit_price) * 1.0
+            exit_fee = exit_price * fee_rate
+            balance += pnl - exit_fee
+
+            recorder.record_trade(
+                side="exit",
+                direction=direction,
+                entry=entry_price,
+                exit=exit_price,
+                fee=entry_fee + exit_fee,
+                pnl=pnl,
+                timestamp=ts,
+            )
+
+            equity[exit_index] = balance
+            i = exit_index + 1
+
+            if progress is not None:
+                progress(min(i, n), balance, len(recorder.trades))
+
+        # equity[n]은 자동 청산 시에만 기록
+        recorder.equity_curve = equity[: n + 1 if i > n else n].tolist()
+
+        return self._build_output(recorder, balance, initial_balance, params)
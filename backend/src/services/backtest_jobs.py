@@ -0,0 +1,638 @@
+"""
+백테스트 작업 큐 (backtest_results 테이블 기반)
+
+/backtest/start는 status="queued" 행만 만들고, BacktestJobRunner가
+행을 리스(lease)로 점유한 뒤 별도 프로세스 풀에서 실행합니다.
+
+- 영구 큐: 대기열은 DB의 queued 행 그 자체 → 서버 재시작 후에도 유지
+- 리스: running 행은 lease_owner / lease_expires_at 으로 소유권 표시,
+  실행 중에는 주기적으로 연장 → 프로세스가 죽으면 만료되어 자동 복구
+- 프로세스 풀: CPU 바운드 시뮬레이션이 API 이벤트 루프/스레드풀과 경쟁하지 않음
+- resource_manager 제한(사용자별/전체 동시 실행 수)을 디스패처에서 적용
+- 워커 비정상 종료(OOM/segfault)로 풀이 깨지면 새 풀로 교체하고
+  실행 중이던 작업은 즉시 queued로 되돌림 (재시도 한도 초과 시 failed)
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Set
+
+from sqlalchemy import func, select, update
+
+from ..config import BacktestConfig
+from ..database.models import BacktestResult
+from ..utils.monitoring import monitor
+from .backtest_progress import (
+    BacktestProgressRelay,
+    ProgressReporter,
+    init_progress_worker,
+    publish_backtest_finished,
+)
+from ..utils.resource_manager import resource_manager
+
+logger = logging.getLogger(__name__)
+
+
+def run_backtest_job(result_id: int) -> str:
+    """
+    워커 프로세스에서 실행되는 백테스트 작업.
+
+    작업 파라미터는 backtest_results.params(JSON)에서 읽고,
+    별도 동기 DB 세션으로 결과를 저장합니다.
+
+    Returns:
+        최종 상태 ("completed" / "failed")
+    """
+    from ..database.session import _get_sync_engine
+    from ..services.backtest_engine import BacktestEngine
+    from ..services.backtest_persistence import BacktestPersistenceService
+    from ..services.strategies.registry import get_strategy
+
+    logger.info(f"Starting backtest job for result_id={result_id}")
+
+    SessionLocal = _get_sync_engine()
+    session = SessionLocal()
+
+    try:
+        result = (
+            session.query(BacktestResult).filter(BacktestResult.id == result_id).first()
+        )
+        if not result:
+            raise ValueError(f"BacktestResult with id={result_id} not found")
+
+        request_dict = json.loads(result.params or "{}")
+        logger.info(f"Running backtest with params: {request_dict}")
+
+        # 전략 선택
+        strategy_code = request_dict.get("strategy_code", "openclose")
+        strategy_params = request_dict.get("strategy_params", {})
+
+        strategy = get_strategy(strategy_code, strategy_params)
+        engine = BacktestEngine(strategy=strategy)
+
+        # CSV 경로가 없으면 캐시 시스템의 캔들 배열을 메모리로 직접 전달
+        # (사용자 업로드 CSV만 파일에서 로드)
+        csv_path = request_dict.get("csv_path")
+
+        if not csv_path:
+            logger.info(
+                "CSV path not provided, loading historical data from cache/API"
+            )
+
+            # 캔들 데이터 가져오기 (캐시 우선, 없으면 API 호출)
+            symbol = request_dict.get("symbol", "BTCUSDT")
+            # Symbol 형식 변환: "BTC/USDT" -> "BTCUSDT"
+            symbol = symbol.replace("/", "")
+            timeframe = request_dict.get("timeframe", "1h")
+            start_date = request_dict.get("start_date")
+            end_date = request_dict.get("end_date")
+
+            # 기본값 설정 (없으면 최근 1년)
+            if not end_date:
+                end_date = datetime.now().strftime("%Y-%m-%d")
+            if not start_date:
+                start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+
+            # 캐시 시스템 사용 (Rate Limit 문제 해결!)
+            from ..services.candle_cache import get_candle_cache
+
+            historical_data = asyncio.run(
+                get_candle_cache().get_candle_arrays(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    start_date=start_date,
+                    end_date=end_date,
+                    cache_only=BacktestConfig.CACHE_ONLY,  # 환경변수로 제어
+                )
+            )
+
+            if not len(historical_data):
+                # 오프라인 모드에서 더 명확한 에러 메시지
+                mode_info = (
+                    "오프라인 모드" if BacktestConfig.CACHE_ONLY else "온라인 모드"
+                )
+                raise Exception(
+                    f"📊 {mode_info}: 해당 기간의 캔들 데이터가 없습니다.\n\n"
+                    f"• 심볼: {symbol}\n"
+                    f"• 타임프레임: {timeframe}\n"
+                    f"• 기간: {start_date} ~ {end_date}\n\n"
+                    f"💡 해결 방법:\n"
+                    f"1. 다른 날짜 범위를 선택하세요\n"
+                    f"2. 관리자에게 데이터 다운로드를 요청하세요\n"
+                    f"   (python scripts/download_candle_data.py --symbols {symbol})"
+                )
+
+            logger.info(
+                f"Historical data loaded in memory ({len(historical_data)} candles)"
+            )
+
+        else:
+            # 업로드 CSV (비동기 파일 로드)
+            historical_data = asyncio.run(engine.resolve_candles(request_dict))
+
+        # intrabar 체결 모델: 손절/익절이 모두 닿은 캔들 판정용 1분봉 (캔들 저장소)
+        intrabar_candles = None
+        if not csv_path and engine.uses_intrabar_fills(request_dict):
+            intrabar_candles = asyncio.run(
+                engine.resolve_intrabar_candles(
+                    {
+                        **request_dict,
+                        "candle_source": {
+                            "symbol": symbol,
+                            "timeframe": timeframe,
+                            "start_date": start_date,
+                            "end_date": end_date,
+                        },
+                    }
+                )
+            )
+
+        # 엔진 실행 (직렬화 없이 배열 그대로 전달, 진행 상황은 WebSocket으로 전송)
+        progress = ProgressReporter(result_id, result.user_id, len(historical_data))
+        run_output = engine.run_on_candles(
+            historical_data, request_dict, progress, intrabar_candles
+        )
+
+        # DB 업데이트 - 성공
+        result.final_balance = run_output.get("final_balance")
+        result.status = "completed"
+        result.finished_at = datetime.utcnow()
+        result.lease_owner = None
+        result.lease_expires_at = None
+
+        # 거래 내역 / equity 곡선 저장 (기존 result 업데이트)
+        BacktestPersistenceService.save_result(
+            session=session,
+            run_output=run_output,
+            request_params=request_dict,
+            result_id=result_id,
+        )
+
+        # 성능 메트릭: 엔진이 performance_metrics로 계산한 값을 그대로 저장
+        # (거래 재조회 / 재계산 없음)
+        metrics = run_output.get("metrics", {})
+        result.metrics = json.dumps(metrics)
+        logger.info(f"✅ Backtest metrics for result {result_id}: {metrics}")
+
+        session.commit()
+        logger.info(f"Backtest completed successfully for result_id={result_id}")
+        publish_backtest_finished(
+            result_id,
+            result.user_id,
+            "completed",
+            final_balance=result.final_balance,
+            metrics=metrics,
+        )
+        return "completed"
+
+    except Exception as exc:
+        logger.error(f"Backtest failed for result_id={result_id}: {exc}", exc_info=True)
+        session.rollback()
+        # DB 업데이트 - 실패
+        try:
+            result = (
+                session.query(BacktestResult)
+                .filter(BacktestResult.id == result_id)
+                .first()
+            )
+            if result:
+                result.status = "failed"
+                result.error_message = str(exc)
+                result.finished_at = datetime.utcnow()
+                result.lease_owner = None
+                result.lease_expires_at = None
+            session.commit()
+            if result:
+                publish_backtest_finished(
+                    result_id, result.user_id, "failed", error=str(exc)
+                )
+        except Exception as e:
+            logger.error(f"Failed to update error status: {e}")
+        return "failed"
+    finally:
+        session.close()
+
+
+class BacktestJobRunner:
+    """
+    backtest_results 기반 작업 디스패처
+
+    API 프로세스의 이벤트 루프에서 동작하며, queued 행을 점유하여
+    ProcessPoolExecutor에 제출하고, 실행 중인 작업의 리스를 연장합니다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or BacktestConfig.JOB_WORKER_PROCESSES
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._progress_queue = None
+        self._progress_relay: Optional[BacktestProgressRelay] = None
+        self._session_factory = None
+        self._dispatch_task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+        # result_id -> (user_id, 시작 시각)
+        self._inflight: Dict[int, tuple] = {}
+        # 크래시된 작업 재큐잉 태스크 (GC 방지용 참조)
+        self._requeue_tasks: Set[asyncio.Task] = set()
+
+        # 메트릭
+        self._run_times = deque(maxlen=200)
+        self._wait_times = deque(maxlen=200)
+        self._completed_total = 0
+        self._failed_total = 0
+        self._recovered_total = 0
+        self._pool_restarts = 0
+
+    @property
+    def capacity(self) -> int:
+        """동시 실행 한도 (워커 수와 resource_manager 전체 한도 중 작은 값)"""
+        return min(
+            self.max_workers,
+            resource_manager.limits["max_total_concurrent_backtests"],
+        )
+
+    async def start(self, session_factory):
+        """풀 생성, 중단된 작업 복구, 디스패처 시작"""
+        if self._dispatch_task is not None:
+            return
+
+        self._session_factory = session_factory
+        self._wakeup = asyncio.Event()
+        self._progress_queue = multiprocessing.get_context("spawn").Queue(maxsize=1000)
+        self._pool = self._create_pool()
+        self._progress_relay = BacktestProgressRelay(self._progress_queue)
+        self._progress_relay.start()
+
+        await self.recover(startup=True)
+        self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+        logger.info(
+            f"Backtest job runner started: owner={self.owner_id}, "
+            f"workers={self.max_workers}, capacity={self.capacity}"
+        )
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_progress_worker,
+            initargs=(self._progress_queue,),
+        )
+
+    def _replace_broken_pool(self, broken: ProcessPoolExecutor):
+        """
+        깨진 풀을 새 풀로 교체
+
+        같은 크래시로 여러 작업의 콜백이 동시에 도착하므로
+        현재 풀이 깨진 풀일 때만 한 번 교체합니다.
+        """
+        if broken is None or self._pool is not broken:
+            return
+        broken.shutdown(wait=False, cancel_futures=True)
+        self._pool = self._create_pool()
+        self._pool_restarts += 1
+        logger.error(
+            f"Backtest process pool broken (worker died); "
+            f"replaced with a new pool (restarts={self._pool_restarts})"
+        )
+
+    async def shutdown(self):
+        """디스패처 중지 (실행 중인 작업은 리스 만료 후 다음 기동 시 복구)"""
+        if self._dispatch_task:
+            self._dispatch_task.cancel()
+            try:
+                await self._dispatch_task
+            except asyncio.CancelledError:
+                pass
+            self._dispatch_task = None
+
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+        for task in list(self._requeue_tasks):
+            task.cancel()
+
+        if self._progress_relay:
+            await self._progress_relay.stop()
+            self._progress_relay = None
+
+    def notify(self):
+        """새 작업이 큐에 들어왔음을 디스패처에 알림"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def recover(self, startup: bool = False) -> int:
+        """
+        리스가 만료된 running 작업을 복구
+
+        - 재시도 횟수가 남았으면 queued로 되돌림
+        - 초과했으면 failed 처리
+        - 기동 시에는 남아 있는 queued/running 작업을 resource_manager에 다시 등록
+        """
+        now = datetime.utcnow()
+        recovered = 0
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(BacktestResult).where(
+                    BacktestResult.status == "running",
+                    (BacktestResult.lease_expires_at.is_(None))
+                    | (BacktestResult.lease_expires_at < now),
+                )
+            )
+            for job in result.scalars():
+                if job.id in self._inflight:
+                    continue
+                if (job.attempts or 0) >= BacktestConfig.JOB_MAX_ATTEMPTS:
+                    job.status = "failed"
+                    job.error_message = "Backtest interrupted too many times"
+                    job.finished_at = now
+                    resource_manager.finish_backtest(job.user_id, job.id)
+                else:
+                    job.status = "queued"
+                job.lease_owner = None
+                job.lease_expires_at = None
+                recovered += 1
+
+            if startup:
+                result = await session.execute(
+                    select(BacktestResult.user_id, BacktestResult.id).where(
+                        BacktestResult.status.in_(["queued", "running"])
+                    )
+                )
+                for user_id, job_id in result.all():
+                    resource_manager.restore_backtest(user_id, job_id)
+
+            await session.commit()
+
+        if recovered:
+            self._recovered_total += recovered
+            logger.warning(f"Recovered {recovered} interrupted backtest job(s)")
+        return recovered
+
+    async def _dispatch_loop(self):
+        last_recovery = time.monotonic()
+        last_heartbeat = time.monotonic()
+
+        while True:
+            try:
+                await self._dispatch_once()
+
+                now = time.monotonic()
+                if now - last_heartbeat >= BacktestConfig.JOB_LEASE_SECONDS / 3:
+                    await self._renew_leases()
+                    last_heartbeat = now
+                if now - last_recovery >= BacktestConfig.JOB_LEASE_SECONDS:
+                    await self.recover()
+                    last_recovery = now
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Backtest dispatcher error: {e}", exc_info=True)
+
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=BacktestConfig.JOB_POLL_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _dispatch_once(self):
+        """빈 슬롯만큼 queued 작업을 점유하여 풀에 제출"""
+        free = self.capacity - len(self._inflight)
+        if free <= 0:
+            return
+
+        per_user_limit = resource_manager.limits["max_concurrent_backtests_per_user"]
+        running_per_user: Dict[int, int] = {}
+        for user_id, _ in self._inflight.values():
+            running_per_user[user_id] = running_per_user.get(user_id, 0) + 1
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(BacktestResult.id, BacktestResult.user_id, BacktestResult.created_at)
+                .where(BacktestResult.status == "queued")
+                .order_by(BacktestResult.created_at.asc(), BacktestResult.id.asc())
+                .limit(free * 4)
+            )
+            candidates = result.all()
+
+            for job_id, user_id, created_at in candidates:
+                if free <= 0:
+                    break
+                if running_per_user.get(user_id, 0) >= per_user_limit:
+                    continue
+
+                now = datetime.utcnow()
+                claimed = await session.execute(
+                    update(BacktestResult)
+                    .where(
+                        BacktestResult.id == job_id,
+                        BacktestResult.status == "queued",
+                    )
+                    .values(
+                        status="running",
+                        lease_owner=self.owner_id,
+                        lease_expires_at=now
+                        + timedelta(seconds=BacktestConfig.JOB_LEASE_SECONDS),
+                        attempts=func.coalesce(BacktestResult.attempts, 0) + 1,
+                        started_at=now,
+                    )
+                )
+                await session.commit()
+                if claimed.rowcount != 1:
+                    continue  # 다른 러너가 먼저 점유
+
+                if created_at:
+                    self._wait_times.append((now - created_at).total_seconds())
+                if not self._submit(job_id, user_id):
+                    # 새 풀에도 제출 실패 → 점유를 풀고 다음 주기에 재시도
+                    await self._requeue_crashed(job_id, user_id, count_attempt=False)
+                    continue
+                running_per_user[user_id] = running_per_user.get(user_id, 0) + 1
+                free -= 1
+
+    def _submit(self, job_id: int, user_id: int) -> bool:
+        """
+        작업을 풀에 제출
+
+        깨진 풀은 제출 시점에 BrokenProcessPool을 던지므로 풀을 교체해 한 번
+        재시도합니다. _inflight는 제출에 성공한 뒤에만 등록합니다
+        (등록된 작업은 리스가 계속 연장되므로).
+        """
+        loop = asyncio.get_running_loop()
+        for _ in range(2):
+            pool = self._pool
+            try:
+                future = loop.run_in_executor(pool, run_backtest_job, job_id)
+            except BrokenProcessPool:
+                self._replace_broken_pool(pool)
+                continue
+
+            self._inflight[job_id] = (user_id, time.monotonic())
+            monitor.update_backtest_stats("running")
+            future.add_done_callback(lambda f, p=pool: self._on_done(job_id, p, f))
+            return True
+        return False
+
+    def _on_done(self, job_id: int, pool: ProcessPoolExecutor, future):
+        user_id, started = self._inflight.pop(job_id, (None, time.monotonic()))
+        self._run_times.append(time.monotonic() - started)
+        monitor.update_backtest_stats("running", -1)
+
+        try:
+            status = future.result()
+        except BrokenProcessPool as e:
+            # 워커 프로세스 비정상 종료 → 풀 교체 후 작업을 즉시 재큐잉
+            # (같은 풀의 다른 실행 중 작업도 모두 이 경로로 들어옴)
+            logger.error(f"Backtest worker died for result_id={job_id}: {e}")
+            self._replace_broken_pool(pool)
+            if user_id is not None:
+                task = asyncio.get_running_loop().create_task(
+                    self._requeue_crashed(job_id, user_id)
+                )
+                self._requeue_tasks.add(task)
+                task.add_done_callback(self._requeue_tasks.discard)
+            return
+        except Exception as e:
+            # 워커 프로세스 비정상 종료 등 → 리스 만료 후 recover()가 처리
+            logger.error(f"Backtest worker crashed for result_id={job_id}: {e}")
+            status = "failed"
+
+        if status == "completed":
+            self._completed_total += 1
+        else:
+            self._failed_total += 1
+        monitor.update_backtest_stats(status)
+
+        if user_id is not None:
+            resource_manager.finish_backtest(user_id, job_id)
+        self.notify()
+
+    async def _requeue_crashed(
+        self, job_id: int, user_id: int, count_attempt: bool = True
+    ):
+        """
+        이 러너가 점유한 running 작업을 queued로 되돌림
+
+        크래시로 인한 재큐잉(count_attempt=True)은 재시도 횟수를 소모하며,
+        한도를 넘으면 failed로 마감합니다 (같은 작업이 매번 워커를 죽이는 경우).
+        제출 자체에 실패한 경우(count_attempt=False)는 점유 시 올린 횟수를 되돌립니다.
+        """
+        now = datetime.utcnow()
+        try:
+            async with self._session_factory() as session:
+                job = await session.get(BacktestResult, job_id)
+                if (
+                    job is None
+                    or job.status != "running"
+                    or job.lease_owner != self.owner_id
+                ):
+                    return
+
+                if not count_attempt:
+                    job.attempts = max((job.attempts or 1) - 1, 0)
+                    job.status = "queued"
+                elif (job.attempts or 0) >= BacktestConfig.JOB_MAX_ATTEMPTS:
+                    job.status = "failed"
+                    job.error_message = "Backtest worker crashed too many times"
+                    job.finished_at = now
+                else:
+                    job.status = "queued"
+                job.lease_owner = None
+                job.lease_expires_at = None
+                status = job.status
+                await session.commit()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # DB 오류 시에는 리스 만료 후 recover()가 처리
+            logger.error(f"Failed to requeue crashed backtest {job_id}: {e}")
+            return
+
+        if status == "failed":
+            self._failed_total += 1
+            monitor.update_backtest_stats("failed")
+            resource_manager.finish_backtest(user_id, job_id)
+        else:
+            self._recovered_total += 1
+        self.notify()
+
+    async def _renew_leases(self):
+        if not self._inflight:
+            return
+        async with self._session_factory() as session:
+            await session.execute(
+                update(BacktestResult)
+                .where(
+                    BacktestResult.id.in_(list(self._inflight.keys())),
+                    BacktestResult.lease_owner == self.owner_id,
+                    BacktestResult.status == "running",
+                )
+                .values(
+                    lease_expires_at=datetime.utcnow()
+                    + timedelta(seconds=BacktestConfig.JOB_LEASE_SECONDS)
+                )
+            )
+            await session.commit()
+
+    async def get_stats(self) -> dict:
+        """큐 깊이 및 실행 시간 메트릭"""
+        queue_depth = 0
+        if self._session_factory is not None:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    select(func.count(BacktestResult.id)).where(
+                        BacktestResult.status == "queued"
+                    )
+                )
+                queue_depth = result.scalar() or 0
+
+        run_times = sorted(self._run_times)
+        wait_times = sorted(self._wait_times)
+
+        def _percentile(values, q):
+            if not values:
+                return 0.0
+            return round(values[min(len(values) - 1, int(len(values) * q))], 3)
+
+        return {
+            "owner_id": self.owner_id,
+            "workers": self.max_workers,
+            "capacity": self.capacity,
+            "queue_depth": queue_depth,
+            "running": len(self._inflight),
+            "completed_total": self._completed_total,
+            "failed_total": self._failed_total,
+            "recovered_total": self._recovered_total,
+            "pool_restarts": self._pool_restarts,
+            "run_seconds": {
+                "avg": round(sum(run_times) / len(run_times), 3) if run_times else 0.0,
+                "p50": _percentile(run_times, 0.5),
+                "p95": _percentile(run_times, 0.95),
+            },
+            "queue_wait_seconds": {
+                "avg": round(sum(wait_times) / len(wait_times), 3)
+                if wait_times
+                else 0.0,
+                "p95": _percentile(wait_times, 0.95),
+            },
+        }
+
+
+# 전역 작업 러너
+backtest_job_runner = BacktestJobRunner()
@@ -1,15 +1,79 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from datetime import datetime
+from typing import List, Optional, Sequence
 import json
+import zlib
 
+import numpy as np
+
+from ..config import BacktestConfig
 from ..database.models import BacktestResult, BacktestTrade
 
+# equity blob 포맷: 매직 + zlib(float32 비트 패턴의 uint32 델타, little-endian)
+EQUITY_BLOB_MAGIC = b"EQ1"
+
+
+def encode_equity_curve(values: Sequence[float]) -> bytes:
+    """
+    equity 곡선 → 압축 blob
+
+    float32로 변환한 값의 비트 패턴을 uint32 델타로 인코딩합니다.
+    (float32 기준 무손실, 연속된 같은 값/작은 변화는 0 또는 작은 정수가 되어 압축률이 높음)
+    """
+    bits = np.asarray(values, dtype=np.float64).astype("<f4").view("<u4")
+    deltas = np.diff(bits, prepend=np.uint32(0))
+    return EQUITY_BLOB_MAGIC + zlib.compress(deltas.astype("<u4").tobytes(), 6)
+
+
+def decode_equity_curve(blob: bytes) -> np.ndarray:
+    """압축 blob → float32 equity 배열"""
+    if not blob.startswith(EQUITY_BLOB_MAGIC):
+        raise ValueError("Unknown equity curve blob format")
+    deltas = np.frombuffer(zlib.decompress(blob[len(EQUITY_BLOB_MAGIC):]), dtype="<u4")
+    return np.cumsum(deltas, dtype=np.uint32).view(np.float32)
+
+
+def downsample_equity_curve(values: Sequence[float], max_points: Optional[int] = None) -> List[float]:
+    """
+    UI 미리보기용 다운샘플
+
+    구간별 최솟값/최댓값을 시간 순서대로 남겨 고점/저점(낙폭)이 사라지지 않도록 하고,
+    마지막 값은 항상 포함합니다.
+    """
+    max_points = max_points or BacktestConfig.EQUITY_PREVIEW_POINTS
+    curve = np.asarray(values, dtype=np.float64)
+    n = len(curve)
+    if n <= max_points:
+        return curve.tolist()
+
+    buckets = max(1, (max_points - 1) // 2)
+    edges = np.linspace(0, n - 1, buckets + 1).astype(np.int64)
+    points: List[float] = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        segment = curve[start:end]
+        if not len(segment):
+            continue
+        lo = int(np.argmin(segment))
+        hi = int(np.argmax(segment))
+        for index in sorted({lo, hi}):
+            points.append(float(segment[index]))
+    points.append(float(curve[-1]))
+    return points
+
 
 class BacktestPersistenceService:
     """
     Handles saving backtest results (summary, trades, equity) into DB.
     """
 
+    @staticmethod
+    def apply_equity_curve(result: BacktestResult, equity_curve: Sequence[float]):
+        """전체 곡선은 압축 blob, UI용 미리보기는 한 번만 계산해 JSON으로 저장"""
+        result.equity_curve = None
+        result.equity_curve_blob = encode_equity_curve(equity_curve)
+        result.equity_preview = json.dumps(downsample_equity_curve(equity_curve))
+
     @staticmethod
     def save_result(session: Session, run_output: dict, request_params: dict, result_id: int = None) -> int:
         """
@@ -39,7 +103,6 @@ class BacktestPersistenceService:
                 initial_balance=request_params.get("initial_balance", 1000.0),
                 final_balance=run_output.get("final_balance"),
                 metrics=json.dumps(run_output.get("metrics", {})),
-                equity_curve=json.dumps(run_output.get("equity_curve", [])),
                 params=json.dumps(request_params),
                 created_at=datetime.utcnow(),
             )
@@ -47,20 +110,26 @@ class BacktestPersistenceService:
             session.flush()   # result.id 확보
             result_id = result.id
 
-        # 2) Trade 저장
-        trades = run_output.get("trades", [])
-        for t in trades:
-            trade = BacktestTrade(
-                result_id=result_id,
-                timestamp=t.get("timestamp"),
-                side=t.get("side"),
-                direction=t.get("direction"),
-                entry_price=t.get("entry_price"),
-                exit_price=t.get("exit_price"),
-                qty=t.get("qty"),
-                fee=t.get("fee"),
-                pnl=t.get("pnl"),
-            )
-            session.add(trade)
+        BacktestPersistenceService.apply_equity_curve(
+            result, run_output.get("equity_curve", [])
+        )
+
+        # 2) Trade 저장 (단일 bulk insert)
+        rows = [
+            {
+                "result_id": result_id,
+                "timestamp": t.get("timestamp"),
+                "side": t.get("side"),
+                "direction": t.get("direction"),
+                "entry_price": t.get("entry_price"),
+                "exit_price": t.get("exit_price"),
+                "qty": t.get("qty"),
+                "fee": t.get("fee"),
+                "pnl": t.get("pnl"),
+            }
+            for t in run_output.get("trades", [])
+        ]
+        if rows:
+            session.execute(insert(BacktestTrade), rows)
 
         return result_id
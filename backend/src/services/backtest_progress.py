@@ -0,0 +1,213 @@
+"""
+백테스트 진행 상황 스트리밍
+
+워커 프로세스(run_backtest_job) → multiprocessing 큐 → API 프로세스 릴레이 →
+사용자 WebSocket(/ws/user/{user_id})의 "backtest" 채널
+
+- 워커: ProgressReporter가 시간 간격(BACKTEST_PROGRESS_INTERVAL)으로 제한하여
+  진행 프레임을 큐에 넣음 (큐가 가득 차면 진행 프레임은 버림)
+- API: BacktestProgressRelay가 큐를 비우면서 작업별 최신 진행 프레임만 전송,
+  완료/실패 프레임은 항상 전송
+
+서버 메시지:
+- {"type": "backtest_progress", "channel": "backtest", "data": {
+      "result_id", "bars_processed", "total_bars", "progress", "eta_seconds",
+      "equity", "trades"}, "timestamp"}
+- {"type": "backtest_completed" | "backtest_failed", "channel": "backtest",
+   "data": {"result_id", "status", "final_balance", "metrics", "error"}, "timestamp"}
+"""
+
+import asyncio
+import logging
+import queue
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..config import BacktestConfig
+
+logger = logging.getLogger(__name__)
+
+BACKTEST_CHANNEL = "backtest"
+
+# 워커 프로세스 전역 큐 (ProcessPoolExecutor initializer로 설정)
+_worker_queue = None
+
+
+def init_progress_worker(progress_queue):
+    """워커 프로세스 초기화: 진행 상황 큐 등록"""
+    global _worker_queue
+    _worker_queue = progress_queue
+
+
+def _frame(frame_type: str, user_id: int, data: Dict[str, Any]) -> dict:
+    return {
+        "type": frame_type,
+        "channel": BACKTEST_CHANNEL,
+        "user_id": user_id,
+        "data": data,
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+    }
+
+
+def _publish(frame: dict, block: bool = False):
+    if _worker_queue is None:
+        return
+    try:
+        if block:
+            _worker_queue.put(frame, timeout=1.0)
+        else:
+            _worker_queue.put_nowait(frame)
+    except queue.Full:
+        pass
+    except Exception as e:
+        logger.debug(f"Failed to publish backtest progress: {e}")
+
+
+class ProgressReporter:
+    """
+    엔진 진행 콜백 (워커 프로세스)
+
+    엔진은 일정 캔들마다 호출하고, 실제 전송은 min_interval 초에 한 번으로 제한합니다.
+    """
+
+    def __init__(
+        self,
+        result_id: int,
+        user_id: int,
+        total_bars: int,
+        min_interval: Optional[float] = None,
+    ):
+        self.result_id = result_id
+        self.user_id = user_id
+        self.total_bars = total_bars
+        self.min_interval = (
+            BacktestConfig.PROGRESS_INTERVAL if min_interval is None else min_interval
+        )
+        self._started = time.monotonic()
+        self._last_sent = 0.0
+
+    def __call__(self, bars_processed: int, equity: float, trades: int):
+        now = time.monotonic()
+        if now - self._last_sent < self.min_interval:
+            return
+        self._last_sent = now
+
+        elapsed = now - self._started
+        remaining = max(0, self.total_bars - bars_processed)
+        eta = elapsed / bars_processed * remaining if bars_processed > 0 else None
+
+        _publish(
+            _frame(
+                "backtest_progress",
+                self.user_id,
+                {
+                    "result_id": self.result_id,
+                    "bars_processed": bars_processed,
+                    "total_bars": self.total_bars,
+                    "progress": round(bars_processed / self.total_bars * 100, 1)
+                    if self.total_bars
+                    else 0.0,
+                    "eta_seconds": round(eta, 1) if eta is not None else None,
+                    "equity": round(float(equity), 4),
+                    "trades": trades,
+                },
+            )
+        )
+
+
+def publish_backtest_finished(
+    result_id: int,
+    user_id: int,
+    status: str,
+    final_balance: Optional[float] = None,
+    metrics: Optional[dict] = None,
+    error: Optional[str] = None,
+):
+    """최종 요약 프레임 (워커 프로세스, 버리지 않도록 블로킹 전송)"""
+    _publish(
+        _frame(
+            f"backtest_{status}",
+            user_id,
+            {
+                "result_id": result_id,
+                "status": status,
+                "final_balance": final_balance,
+                "metrics": metrics or {},
+                "error": error,
+            },
+        ),
+        block=True,
+    )
+
+
+class BacktestProgressRelay:
+    """API 프로세스: 진행 큐 → WebSocket 전달"""
+
+    def __init__(self, progress_queue, interval: Optional[float] = None):
+        self.queue = progress_queue
+        self.interval = interval or min(BacktestConfig.PROGRESS_INTERVAL, 0.25)
+        self._task: Optional[asyncio.Task] = None
+        self.frames_sent = 0
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # 남은 프레임(완료 알림 등) 전송
+        await self._flush()
+
+    def _drain(self) -> list:
+        frames = []
+        latest_progress: Dict[int, int] = {}
+        while True:
+            try:
+                frame = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            except Exception:
+                break
+            if frame["type"] == "backtest_progress":
+                # 같은 작업의 진행 프레임은 최신 것만 유지
+                result_id = frame["data"]["result_id"]
+                index = latest_progress.get(result_id)
+                if index is not None:
+                    frames[index] = frame
+                    continue
+                latest_progress[result_id] = len(frames)
+            else:
+                latest_progress.pop(frame["data"]["result_id"], None)
+            frames.append(frame)
+        return frames
+
+    async def _flush(self):
+        # 워커 프로세스가 ws_server(FastAPI 등)를 import하지 않도록 지연 import
+        from ..websockets.ws_server import broadcast_to_user, subscriptions
+
+        for frame in self._drain():
+            user_id = frame.pop("user_id")
+            if BACKTEST_CHANNEL not in subscriptions.get(user_id, set()):
+                continue
+            try:
+                await broadcast_to_user(user_id, frame)
+                self.frames_sent += 1
+            except Exception as e:
+                logger.debug(f"Failed to relay backtest progress: {e}")
+
+    async def _run(self):
+        while True:
+            try:
+                await self._flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Backtest progress relay error: {e}")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,150 @@
+"""
+백테스트 결과 캐시 (content-addressed)
+
+동일한 (전략 코드, 전략/지표 모듈 소스 해시, 정규화된 파라미터, 캔들 시리즈 버전,
+기간, 수수료/슬리피지, 엔진 버전) 요청은 같은 cache_key를 가지며, 사용자의 완료된 BacktestResult가
+있으면 재실행 없이 그대로 반환합니다.
+
+캔들 캐시 파일이 다시 쓰이면 시리즈 버전이 바뀌어 키가 달라지므로
+기존 결과는 자연스럽게 무효화됩니다. 봇 워밍업의 끝부분 append는
+요청 종료일 이후 데이터만 늘리므로 과거 구간의 키는 바뀌지 않습니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from ..config import BacktestConfig
+from ..database.models import BacktestResult
+from .backtest_engine import ENGINE_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(value: Any) -> Any:
+    """키 정규화: dict 키 정렬은 json.dumps가 처리, 정수 값의 float은 int로 통일"""
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+# 엔진이 디스패치할 수 있는 전략 모듈 + 전략이 사용하는 지표 구현
+# (registry 전략, proven_* 전략 파일, DynamicStrategyExecutor, src/indicators)
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STRATEGY_SOURCE_DIRS = (
+    os.path.join(_SRC_DIR, "services", "strategies"),
+    os.path.join(_SRC_DIR, "strategies"),
+    os.path.join(_SRC_DIR, "indicators"),
+)
+
+
+def _strategy_fingerprint() -> str:
+    """
+    전략/지표 모듈 소스 전체의 해시
+
+    어느 전략이 어떤 모듈을 거치는지(별칭, 어댑터, 공통 지표 함수) 따라가지 않고
+    전체를 해시하므로, 전략 코드가 바뀌면 모든 전략의 캐시 키가 함께 바뀝니다.
+    """
+    digest = hashlib.sha256()
+    for directory in STRATEGY_SOURCE_DIRS:
+        try:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            continue
+        for name in names:
+            if not name.endswith(".py"):
+                continue
+            try:
+                with open(os.path.join(directory, name), "rb") as f:
+                    content = f.read()
+            except OSError:
+                continue
+            digest.update(f"{os.path.basename(directory)}/{name}".encode("utf-8"))
+            digest.update(hashlib.sha256(content).digest())
+    return digest.hexdigest()
+
+
+def _series_version(task_params: Dict[str, Any]) -> Optional[str]:
+    csv_path = task_params.get("csv_path")
+    if csv_path:
+        try:
+            stat = os.stat(csv_path)
+        except OSError:
+            return None
+        return f"csv:{os.path.abspath(csv_path)}:{stat.st_mtime_ns}-{stat.st_size}"
+
+    from .candle_cache import get_candle_cache
+
+    symbol = (task_params.get("symbol") or "BTCUSDT").replace("/", "")
+    timeframe = task_params.get("timeframe") or "1h"
+    version = get_candle_cache().get_series_version(
+        symbol, timeframe, task_params.get("end_date")
+    )
+    if version is None:
+        return None
+    return f"cache:{symbol}:{timeframe}:{version}"
+
+
+def _intrabar_version(task_params: Dict[str, Any]) -> Optional[str]:
+    """intrabar 체결 모델은 1분봉 시리즈도 결과에 영향"""
+    if task_params.get("fill_model", BacktestConfig.FILL_MODEL) != "intrabar":
+        return None
+    return _series_version({**task_params, "timeframe": "1m"}) or "missing"
+
+
+def compute_cache_key(task_params: Dict[str, Any]) -> Optional[str]:
+    """
+    백테스트 작업 파라미터(/backtest/start task_params)의 캐시 키
+
+    시리즈 버전을 알 수 없으면 (캐시 파일 없음 등) None → 캐시하지 않음.
+    """
+    series_version = _series_version(task_params)
+    if series_version is None:
+        return None
+
+    strategy_code = (task_params.get("strategy_code") or "openclose").strip().lower()
+    payload = {
+        "engine_version": ENGINE_VERSION,
+        "strategy_code": strategy_code,
+        "strategy_fingerprint": _strategy_fingerprint(),
+        "strategy_params": task_params.get("strategy_params") or {},
+        "series": series_version,
+        "start_date": task_params.get("start_date"),
+        "end_date": task_params.get("end_date"),
+        "initial_balance": task_params.get("initial_balance"),
+        "fee_rate": task_params.get("fee_rate", BacktestConfig.DEFAULT_FEE_RATE),
+        "slippage": task_params.get("slippage", BacktestConfig.DEFAULT_SLIPPAGE),
+        "cache_only": BacktestConfig.CACHE_ONLY,
+        "fill_model": task_params.get("fill_model", BacktestConfig.FILL_MODEL),
+        "intrabar_series": _intrabar_version(task_params),
+    }
+    canonical = json.dumps(
+        _normalize(payload), sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def find_cached_result(
+    session: Session, user_id: int, cache_key: Optional[str]
+) -> Optional[BacktestResult]:
+    """사용자의 완료된 결과 중 같은 cache_key를 가진 최신 결과"""
+    if not cache_key:
+        return None
+    return (
+        session.query(BacktestResult)
+        .filter(
+            BacktestResult.user_id == user_id,
+            BacktestResult.cache_key == cache_key,
+            BacktestResult.status == "completed",
+        )
+        .order_by(BacktestResult.id.desc())
+        .first()
+    )
@@ -0,0 +1,364 @@
+"""
+파라미터 스윕 (그리드 서치)
+
+하나의 전략/데이터 구간에 대해 파라미터 조합을 병렬로 백테스트합니다.
+
+- 캔들은 한 번만 로드하여 SharedCandleBlock(공유 메모리)에 올리고
+  워커 프로세스는 이름만 받아 복사 없이 참조
+- 파라미터 그리드는 itertools.product로 지연 생성, 풀에는 청크 단위로
+  제한된 개수만 제출 → 메모리 사용량이 조합 수에 비례하지 않음
+- 상위 K개만 힙으로 유지하여 랭킹 계산
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..config import BacktestConfig
+from .backtest_engine import BacktestEngine
+from .candle_arrays import CandleArrays, SharedCandleBlock, attach_shared_candles
+from .strategies.registry import get_strategy
+
+logger = logging.getLogger(__name__)
+
+# 랭킹 기준 메트릭 → 방향 (1: 클수록 좋음, -1: 작을수록 좋음)
+RANK_METRICS = {
+    "total_return": 1,
+    "sharpe_ratio": 1,
+    "profit_factor": 1,
+    "win_rate": 1,
+    "max_drawdown": -1,
+}
+
+
+def expand_param_values(name: str, spec: Any) -> List[Any]:
+    """
+    단일 파라미터 값 목록 생성
+
+    - [7, 14, 21]: 그대로 사용
+    - {"start": 7, "stop": 21, "step": 7}: stop 포함 등차 수열
+    - 14: 고정값
+    """
+    if isinstance(spec, dict):
+        try:
+            start = spec["start"]
+            stop = spec["stop"]
+        except KeyError:
+            raise ValueError(f"Range for '{name}' needs 'start' and 'stop'")
+        step = spec.get("step", 1)
+        if step <= 0:
+            raise ValueError(f"Range step for '{name}' must be positive")
+        if stop < start:
+            raise ValueError(f"Range for '{name}' has stop < start")
+
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        if all(isinstance(v, int) for v in (start, stop, step)):
+            return [start + i * step for i in range(count)]
+        # 부동소수점 누적 오차 방지: 인덱스 기반 계산 후 반올림
+        return [round(start + i * step, 10) for i in range(count)]
+
+    if isinstance(spec, (list, tuple)):
+        if not spec:
+            raise ValueError(f"Empty value list for '{name}'")
+        return list(spec)
+
+    return [spec]
+
+
+class ParameterGrid:
+    """
+    파라미터 그리드 (지연 생성)
+
+    각 파라미터의 값 목록만 보관하고, 조합은 순회 시점에 하나씩 생성합니다.
+    """
+
+    def __init__(self, grid: Dict[str, Any]):
+        if not grid:
+            raise ValueError("param_grid must contain at least one parameter")
+        self.names = list(grid.keys())
+        self.values = [expand_param_values(name, grid[name]) for name in self.names]
+
+    def __len__(self) -> int:
+        return math.prod(len(v) for v in self.values)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for combo in itertools.product(*self.values):
+            yield dict(zip(self.names, combo))
+
+
+class TopK:
+    """상위 K개 결과 유지 (min-heap)"""
+
+    def __init__(self, rank_by: str, k: int):
+        if rank_by not in RANK_METRICS:
+            raise ValueError(
+                f"rank_by must be one of: {', '.join(RANK_METRICS.keys())}"
+            )
+        self.rank_by = rank_by
+        self.k = k
+        self._direction = RANK_METRICS[rank_by]
+        self._heap: List[Tuple[float, int, dict]] = []
+        self._seq = 0
+
+    def push(self, row: dict):
+        value = row.get("metrics", {}).get(self.rank_by)
+        if value is None:
+            return
+        item = (self._direction * float(value), -self._seq, row)
+        self._seq += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+
+    def ranked(self) -> List[dict]:
+        ordered = sorted(self._heap, key=lambda item: item[:2], reverse=True)
+        return [{"rank": i + 1, **row} for i, (_, _, row) in enumerate(ordered)]
+
+
+def evaluate_param_chunk(
+    descriptor: Tuple[str, int],
+    strategy_code: str,
+    param_sets: List[Dict[str, Any]],
+    engine_params: Dict[str, Any],
+    window: Optional[Tuple[int, int]] = None,
+    include_curve: bool = False,
+) -> List[dict]:
+    """
+    워커 프로세스: 공유 메모리 캔들로 파라미터 조합 묶음을 백테스트
+
+    Args:
+        descriptor: SharedCandleBlock.descriptor
+        window: 캔들 인덱스 구간 [start, end) (None이면 전체)
+        include_curve: equity_curve / trades 포함 여부 (워크포워드 OOS 구간용)
+    """
+    candles = attach_shared_candles(descriptor)
+    if window is not None:
+        candles = candles.slice(*window)
+
+    rows = []
+    for params in param_sets:
+        try:
+            strategy = get_strategy(strategy_code, params)
+            output = BacktestEngine(strategy=strategy).run_on_candles(
+                candles, engine_params
+            )
+        except Exception as e:
+            rows.append({"params": params, "error": str(e)})
+            continue
+
+        row = {
+            "params": params,
+            "final_balance": output["final_balance"],
+            "metrics": output["metrics"],
+        }
+        if include_curve:
+            row["equity_curve"] = output["equity_curve"]
+            row["trades"] = output["trades"]
+        rows.append(row)
+    return rows
+
+
+def iter_chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class BacktestSweepRunner:
+    """
+    스윕/워크포워드 공용 프로세스 풀
+
+    풀은 첫 사용 시 생성되며 애플리케이션 종료 시 shutdown()으로 정리합니다.
+    워커가 비정상 종료(OOM/segfault)되어 풀이 깨지면 해당 요청은 실패로 끝나고
+    풀은 폐기되어 다음 사용 시 새로 생성됩니다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or BacktestConfig.SWEEP_WORKER_PROCESSES
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    def _discard_broken_pool(self, pool: ProcessPoolExecutor):
+        """깨진 풀 폐기 (이미 교체된 경우 무시)"""
+        if self._pool is not pool:
+            return
+        self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        logger.error("Sweep process pool broken (worker died); recreating on next use")
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def run_in_pool(self, func, *args):
+        """단일 작업을 풀에서 실행 (포트폴리오 백테스트 등, 인자는 pickle로 전달)"""
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            self._discard_broken_pool(pool)
+            raise
+
+    async def run_tasks(
+        self,
+        descriptor: Tuple[str, int],
+        strategy_code: str,
+        tasks: Iterable[Tuple[Any, Optional[Tuple[int, int]], List[Dict[str, Any]]]],
+        engine_params: Dict[str, Any],
+        include_curve: bool = False,
+    ) -> AsyncIterator[Tuple[Any, List[dict]]]:
+        """
+        (tag, window, 파라미터 묶음) 작업을 풀에 제출하고 완료 순서대로 (tag, rows) 반환
+
+        작업은 지연 소비되며 동시에 제출되는 작업은 워커 수 × 2개로 제한됩니다.
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        tasks = iter(tasks)
+        max_inflight = self.max_workers * 2
+        pending = {}
+
+        try:
+            while True:
+                while len(pending) < max_inflight:
+                    task = next(tasks, None)
+                    if task is None:
+                        break
+                    tag, window, param_sets = task
+                    future = loop.run_in_executor(
+                        pool,
+                        evaluate_param_chunk,
+                        descriptor,
+                        strategy_code,
+                        param_sets,
+                        engine_params,
+                        window,
+                        include_curve,
+                    )
+                    pending[future] = tag
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(
+                    pending.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    tag = pending.pop(future)
+                    yield tag, future.result()
+        except BrokenProcessPool:
+            self._discard_broken_pool(pool)
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def run_chunks(
+        self,
+        descriptor: Tuple[str, int],
+        strategy_code: str,
+        param_sets: Iterable[Dict[str, Any]],
+        engine_params: Dict[str, Any],
+        window: Optional[Tuple[int, int]] = None,
+        include_curve: bool = False,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        """파라미터 조합을 청크로 나눠 실행하고 완료 순서대로 결과 반환"""
+        chunks = iter_chunks(param_sets, chunk_size or BacktestConfig.SWEEP_CHUNK_SIZE)
+        tasks = ((None, window, chunk) for chunk in chunks)
+        async for _, rows in self.run_tasks(
+            descriptor, strategy_code, tasks, engine_params, include_curve
+        ):
+            for row in rows:
+                yield row
+
+    async def sweep(
+        self,
+        candles: CandleArrays,
+        strategy_code: str,
+        grid: ParameterGrid,
+        engine_params: Dict[str, Any],
+        rank_by: str = "total_return",
+        top_k: int = 20,
+    ) -> AsyncIterator[dict]:
+        """
+        그리드 서치 실행 (NDJSON 스트리밍용 이벤트 생성)
+
+        이벤트:
+        - {"type": "start", ...}
+        - {"type": "result", "params", "final_balance", "metrics"} (또는 "error")
+        - {"type": "ranking", "rank_by", "top": [...]}
+        - {"type": "done", "completed", "failed", "elapsed_seconds"}
+        """
+        ranking = TopK(rank_by, top_k)
+        total = len(grid)
+        started = time.monotonic()
+
+        # 조합 수가 적으면 청크를 줄여 워커에 고르게 분배
+        chunk_size = max(
+            1,
+            min(
+                BacktestConfig.SWEEP_CHUNK_SIZE,
+                math.ceil(total / (self.max_workers * 4)),
+            ),
+        )
+
+        block = SharedCandleBlock.create(candles)
+        try:
+            yield {
+                "type": "start",
+                "strategy": strategy_code,
+                "combinations": total,
+                "candles": len(candles),
+                "rank_by": rank_by,
+                "workers": self.max_workers,
+            }
+
+            completed = 0
+            failed = 0
+            async for row in self.run_chunks(
+                block.descriptor,
+                strategy_code,
+                grid,
+                engine_params,
+                chunk_size=chunk_size,
+            ):
+                if "error" in row:
+                    failed += 1
+                else:
+                    completed += 1
+                    ranking.push(row)
+                yield {"type": "result", **row}
+
+            yield {"type": "ranking", "rank_by": rank_by, "top": ranking.ranked()}
+            yield {
+                "type": "done",
+                "completed": completed,
+                "failed": failed,
+                "elapsed_seconds": round(time.monotonic() - started, 3),
+            }
+        finally:
+            block.close()
+
+
+# 전역 스윕 러너
+sweep_runner = BacktestSweepRunner()
@@ -4,11 +4,13 @@ class BacktestTradeRecorder:
     Records:
     - trades (entry/exit with fees and pnl)
     - equity curve (balance + unrealized pnl at each step)
+    - bars_in_position (exposure 계산용)
     """
 
     def __init__(self):
         self.trades = []
         self.equity_curve = []
+        self.bars_in_position = 0
 
     def record_trade(self, side, direction, entry, exit, fee, pnl, timestamp):
         """
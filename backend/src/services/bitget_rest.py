@@ -22,9 +22,22 @@ from ..utils.bitget_exceptions import (
     BitgetTimeoutError,
     classify_bitget_error,
 )
+from ..utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
+# 거래소 API 지표 (재시도마다 1회 기록, endpoint는 쿼리 제외 경로)
+EXCHANGE_LATENCY = metrics.histogram(
+    "exchange_request_duration_seconds",
+    "Exchange API request latency per attempt",
+    ("client", "endpoint"),
+)
+EXCHANGE_ERRORS = metrics.counter(
+    "exchange_request_errors_total",
+    "Exchange API request errors per attempt",
+    ("client", "endpoint", "error"),
+)
+
 
 class OrderSide(str, Enum):
     """주문 방향"""
@@ -158,8 +171,10 @@ class BitgetRestClient:
             }
 
         last_exception = None
+        latency = EXCHANGE_LATENCY.labels("bitget", endpoint)
 
         for attempt in range(max_retries):
+            started = time.perf_counter()
             try:
                 async with self.session.request(
                     method=method,
@@ -170,6 +185,7 @@ class BitgetRestClient:
                 ) as response:
                     # Read response text first to avoid ChunkedIteratorResult issues
                     text = await response.text()
+                    latency.observe(time.perf_counter() - started)
                     result = json.loads(text) if text else {}
 
                     # Bitget API 응답 형식: {"code": "00000", "msg": "success", "data": {...}}
@@ -191,6 +207,9 @@ class BitgetRestClient:
 
                         # 에러 분류
                         exception = classify_bitget_error(error_code, error_msg)
+                        EXCHANGE_ERRORS.labels(
+                            "bitget", endpoint, type(exception).__name__
+                        ).inc()
 
                         # Rate Limit 에러는 재시도
                         if isinstance(exception, BitgetRateLimitError):
@@ -221,6 +240,8 @@ class BitgetRestClient:
                             raise exception
 
             except asyncio.TimeoutError as e:
+                latency.observe(time.perf_counter() - started)
+                EXCHANGE_ERRORS.labels("bitget", endpoint, "timeout").inc()
                 logger.error(f"Request timeout: {url}")
                 last_exception = BitgetTimeoutError(
                     f"요청 시간이 초과되었습니다: {endpoint}"
@@ -233,6 +254,7 @@ class BitgetRestClient:
                     continue
 
             except aiohttp.ClientError as e:
+                EXCHANGE_ERRORS.labels("bitget", endpoint, "network").inc()
                 logger.error(f"HTTP request failed: {e}")
                 last_exception = BitgetNetworkError(f"네트워크 에러: {str(e)}")
                 if attempt < max_retries - 1:
@@ -243,6 +265,7 @@ class BitgetRestClient:
                     continue
 
             except json.JSONDecodeError as e:
+                EXCHANGE_ERRORS.labels("bitget", endpoint, "parse").inc()
                 logger.error(f"Failed to parse JSON response: {e}")
                 last_exception = BitgetAPIError(f"응답 파싱 실패: {str(e)}")
                 if attempt < max_retries - 1:
@@ -250,6 +273,7 @@ class BitgetRestClient:
                     continue
 
             except Exception as e:
+                EXCHANGE_ERRORS.labels("bitget", endpoint, "unexpected").inc()
                 logger.error(f"Unexpected error: {e}", exc_info=True)
                 last_exception = BitgetAPIError(f"예상치 못한 에러: {str(e)}")
                 if attempt < max_retries - 1:
@@ -7,6 +7,7 @@ Bitget WebSocket 데이터 수집기
 import asyncio
 import json
 import logging
+import time
 from typing import Optional
 
 import websockets
@@ -90,6 +91,7 @@ class BitgetWebSocketCollector:
                         "high": float(ticker_data.get("high24h", 0)),
                         "low": float(ticker_data.get("low24h", 0)),
                         "open": float(ticker_data.get("open24h", 0)),
+                        "queued_at": time.monotonic(),  # 봇 큐 대기 시간 측정용
                     }
 
                     # Market queue에 전달
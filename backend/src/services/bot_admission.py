@@ -0,0 +1,200 @@
+"""
+봇 시작 승인 제어
+
+봇 시작 단계(전략 로드 → 키 복호화 → 클라이언트 초기화 → 캔들 워밍업)는 DB 커넥션과
+거래소 API를 사용하므로, 서버 재시작 후 수백 개 봇이 한꺼번에 시작하면 DB 풀과 거래소에 몰립니다.
+
+- 동시에 시작 단계를 진행하는 봇 수를 CONCURRENCY로 제한 (나머지는 대기)
+- 서버 재시작 복구 시 봇별 무작위 지연(jitter)으로 시작 시각 분산
+- 단계별 소요 시간과 전체 봇 준비 진행률 집계 (GET /admin/monitoring/bot-bootstrap)
+
+사용 (BotRunner._run_loop):
+    startup = bot_admission.begin(user_id, bootstrap)
+    await startup.admit(jitter)      # 승인 대기
+    ...
+    startup.mark("decrypt")          # 직전 mark 이후 소요 시간 = 해당 단계 시간
+    ...
+    startup.ready()                  # 시작 완료 → 슬롯 반환
+    startup.release()                # finally: ready() 전에 끝나면 실패로 집계
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from ..config import BotBootstrapConfig
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("admission_wait", "strategy", "decrypt", "client_init", "warmup")
+STAGE_SAMPLES = 1000
+
+
+class BotStartup:
+    """봇 하나의 시작 과정"""
+
+    def __init__(self, controller: "BotAdmissionController", user_id: int, bootstrap: bool):
+        self.controller = controller
+        self.user_id = user_id
+        self.bootstrap = bootstrap
+        self.stage = "waiting"  # 마지막으로 끝난 단계
+        self.started_at = time.monotonic()
+        self._mark_at = self.started_at
+        self._admitted = False
+        self._done = False
+
+    async def admit(self, jitter: float = 0.0):
+        if jitter > 0:
+            await asyncio.sleep(random.uniform(0, jitter))
+        self._mark_at = time.monotonic()
+        await self.controller._semaphore.acquire()
+        self._admitted = True
+        self.mark("admission_wait")
+
+    def mark(self, stage: str):
+        now = time.monotonic()
+        self.controller._record(stage, (now - self._mark_at) * 1000)
+        self._mark_at = now
+        self.stage = stage
+
+    def ready(self):
+        self._finish(ok=True)
+
+    def release(self):
+        self._finish(ok=False)
+
+    def _finish(self, ok: bool):
+        if self._done:
+            return
+        self._done = True
+        if self._admitted:
+            self.controller._semaphore.release()
+        self.controller._finished(self, ok)
+
+
+class BotAdmissionController:
+    def __init__(self, concurrency: int = BotBootstrapConfig.CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._startups: Dict[int, BotStartup] = {}
+        self._stage_samples: Dict[str, deque] = {
+            stage: deque(maxlen=STAGE_SAMPLES) for stage in STAGES
+        }
+
+        # 전체 시작 결과
+        self.started_total = 0
+        self.failed_total = 0
+
+        # 서버 재시작 복구 진행률
+        self.expected = 0
+        self.bootstrap_started_at: Optional[float] = None
+        self.bootstrap_finished_at: Optional[float] = None
+        self.ready_count = 0
+        self.failed_count = 0
+
+    def begin_bootstrap(self, expected: int):
+        self.expected = expected
+        self.bootstrap_started_at = time.time()
+        self.bootstrap_finished_at = None
+        self.ready_count = 0
+        self.failed_count = 0
+
+    def begin(self, user_id: int, bootstrap: bool = False) -> BotStartup:
+        startup = BotStartup(self, user_id, bootstrap)
+        self._startups[user_id] = startup
+        return startup
+
+    def _record(self, stage: str, elapsed_ms: float):
+        samples = self._stage_samples.get(stage)
+        if samples is not None:
+            samples.append(elapsed_ms)
+
+    def _finished(self, startup: BotStartup, ok: bool):
+        if self._startups.get(startup.user_id) is startup:
+            del self._startups[startup.user_id]
+        if ok:
+            self.started_total += 1
+        else:
+            self.failed_total += 1
+        if not startup.bootstrap:
+            return
+        if ok:
+            self.ready_count += 1
+        else:
+            self.failed_count += 1
+        self._check_bootstrap_finished()
+
+    def bootstrap_failed(self):
+        """복구 대상 봇이 시작 단계에 들어가기 전에 실패 (runner.start 예외)"""
+        self.failed_total += 1
+        self.failed_count += 1
+        self._check_bootstrap_finished()
+
+    def bootstrap_skipped(self):
+        """복구 대상 봇이 이미 실행 중이라 건너뜀 → 진행률 기대 수에서 제외"""
+        self.expected = max(0, self.expected - 1)
+        self._check_bootstrap_finished()
+
+    def _check_bootstrap_finished(self):
+        if (
+            self.bootstrap_started_at is not None
+            and self.bootstrap_finished_at is None
+            and self.ready_count + self.failed_count >= self.expected
+        ):
+            self.bootstrap_finished_at = time.time()
+            logger.info(
+                f"Bot fleet ready: {self.ready_count} ready, {self.failed_count} failed "
+                f"in {self.bootstrap_finished_at - self.bootstrap_started_at:.1f}s"
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        waiting = sum(1 for s in self._startups.values() if s.stage == "waiting")
+        finished = self.ready_count + self.failed_count
+        if self.bootstrap_started_at is None:
+            elapsed = None
+        else:
+            end = self.bootstrap_finished_at or time.time()
+            elapsed = round(end - self.bootstrap_started_at, 1)
+
+        stages = {}
+        for stage, samples in self._stage_samples.items():
+            values = np.asarray(samples) if samples else np.zeros(1)
+            stages[stage] = {
+                "count": len(samples),
+                "avg_ms": round(float(values.mean()), 2),
+                "p95_ms": round(float(np.percentile(values, 95)), 2),
+                "max_ms": round(float(values.max()), 2),
+            }
+
+        return {
+            "concurrency": self.concurrency,
+            "started_total": self.started_total,
+            "failed_total": self.failed_total,
+            "expected": self.expected,
+            "ready": self.ready_count,
+            "failed": self.failed_count,
+            "waiting": waiting,
+            "starting": len(self._startups) - waiting,
+            "progress": round(finished / self.expected, 4) if self.expected else None,
+            "elapsed_seconds": elapsed,
+            "complete": self.bootstrap_finished_at is not None,
+            "stages": stages,
+            "in_progress": [
+                {
+                    "user_id": s.user_id,
+                    "last_stage": s.stage,
+                    "elapsed_seconds": round(now - s.started_at, 1),
+                }
+                for s in list(self._startups.values())[:50]
+            ],
+        }
+
+
+# 전역 인스턴스
+bot_admission = BotAdmissionController()
@@ -0,0 +1,179 @@
+"""
+봇 런타임 지표
+
+봇 루프(BotRunner._run_loop)별 카운터와 지연 히스토그램.
+
+카운터:
+- ticks_received: 큐에서 받은 마켓 데이터
+- ticks_evaluated: 전략을 실행한 틱
+- ticks_skipped: 전략을 실행하지 않은 틱 (다른 심볼, 잘못된 가격, 청산 트리거 미도달)
+- orders: 거래소에 보낸 주문 (진입 + 청산)
+- errors: 전략/주문/루프 오류
+
+히스토그램 (ms):
+- queue_wait: 수집기가 큐에 넣은 뒤 봇이 꺼낼 때까지
+- strategy_eval: 전략 평가
+- pre_trade: 신호 이후 주문 직전까지 (주문 크기 계산, 리스크 체크, 레버리지 설정)
+- order_placement: 시장가 주문 API
+- post_trade: 주문 이후 거래 기록, 알림
+- tick_to_order: 틱 수신부터 주문 응답까지
+
+히스토그램은 고정 버킷이므로 봇 간 합산(전체 p50/p99)과 Prometheus 노출에 그대로 사용합니다.
+중지된 봇의 값은 retired에 합산되어 전체 카운터는 줄어들지 않습니다.
+"""
+
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional
+
+# 히스토그램 버킷 상한 (ms), 마지막 버킷은 +Inf
+LATENCY_BUCKETS_MS = (
+    0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000,
+)
+
+COUNTERS = ("ticks_received", "ticks_evaluated", "ticks_skipped", "orders", "errors")
+HISTOGRAMS = (
+    "queue_wait",
+    "strategy_eval",
+    "pre_trade",
+    "order_placement",
+    "post_trade",
+    "tick_to_order",
+)
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 히스토그램 (ms)"""
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value_ms: float):
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.sum += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def merge(self, other: "LatencyHistogram"):
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """버킷 내 선형 보간 분위수 (관측 없으면 None)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = LATENCY_BUCKETS_MS[i - 1] if i else 0.0
+                upper = LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / n, self.max)
+            seen += n
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        def rounded(value):
+            return None if value is None else round(value, 2)
+
+        return {
+            "count": self.count,
+            "avg_ms": rounded(self.sum / self.count) if self.count else None,
+            "p50_ms": rounded(self.quantile(0.5)),
+            "p99_ms": rounded(self.quantile(0.99)),
+            "max_ms": rounded(self.max),
+        }
+
+
+class BotMetrics:
+    """봇 하나의 카운터 + 히스토그램"""
+
+    __slots__ = ("user_id", "counters", "histograms", "started_at", "last_tick_at")
+
+    def __init__(self, user_id: Optional[int] = None):
+        self.user_id = user_id
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.histograms = {name: LatencyHistogram() for name in HISTOGRAMS}
+        self.started_at = time.time()
+        self.last_tick_at: Optional[float] = None
+
+    def inc(self, name: str, amount: int = 1):
+        self.counters[name] += amount
+
+    def observe(self, name: str, value_ms: float):
+        self.histograms[name].observe(value_ms)
+
+    def merge(self, other: "BotMetrics"):
+        for name, value in other.counters.items():
+            self.counters[name] += value
+        for name, histogram in other.histograms.items():
+            self.histograms[name].merge(histogram)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "user_id": self.user_id,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "last_tick_at": self.last_tick_at,
+            **self.counters,
+            "latency": {name: h.to_dict() for name, h in self.histograms.items()},
+        }
+
+
+class BotMetricsRegistry:
+    def __init__(self):
+        self._bots: Dict[int, BotMetrics] = {}
+        self.retired = BotMetrics()  # 중지된 봇 누적
+
+    def start(self, user_id: int) -> BotMetrics:
+        """봇 루프 시작 시 지표 생성 (이전 값은 retired로)"""
+        self.stop(user_id)
+        metrics = self._bots[user_id] = BotMetrics(user_id)
+        return metrics
+
+    def stop(self, user_id: int):
+        metrics = self._bots.pop(user_id, None)
+        if metrics is not None:
+            self.retired.merge(metrics)
+
+    def get(self, user_id: int) -> Optional[BotMetrics]:
+        return self._bots.get(user_id)
+
+    def running(self) -> List[BotMetrics]:
+        return list(self._bots.values())
+
+    def fleet(self) -> BotMetrics:
+        """전체 합산 (실행 중 + 중지된 봇)"""
+        total = BotMetrics()
+        total.merge(self.retired)
+        for metrics in self.running():
+            total.merge(metrics)
+        return total
+
+    def get_stats(self, user_ids: Optional[Iterable[int]] = None) -> Dict[str, Any]:
+        bots = self.running()
+        if user_ids is not None:
+            wanted = set(user_ids)
+            bots = [m for m in bots if m.user_id in wanted]
+        fleet = self.fleet().to_dict()
+        fleet.pop("user_id")
+        fleet.pop("uptime_seconds")
+        fleet.pop("last_tick_at")
+        return {
+            "running_bots": len(self._bots),
+            "buckets_ms": list(LATENCY_BUCKETS_MS),
+            "fleet": fleet,
+            "bots": [m.to_dict() for m in bots],
+        }
+
+
+# 전역 인스턴스
+bot_metrics = BotMetricsRegistry()
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import json
+import time
 from collections import deque
 from datetime import datetime
 from decimal import Decimal
@@ -18,9 +19,17 @@ from ..database.models import (
     ApiKey,
     RiskSettings,
 )
+from ..services.strategy_engine import reset_stream as reset_legacy_stream
 from ..services.strategy_engine import run as run_strategy
-from ..services.strategy_loader import generate_signal_with_strategy
+from ..services.strategy_loader import generate_signal_async, load_live_strategy
+from ..services.strategy_events import strategy_events
+from ..services.candle_arrays import TIMEFRAME_MS
+from ..strategies.exit_triggers import ExitTriggers
 from ..services.equity_service import record_equity
+from ..services.candle_warmup import candle_warmup
+from ..services.bot_admission import bot_admission
+from ..services.bot_metrics import bot_metrics
+from ..config import BotBootstrapConfig
 from ..services.trade_executor import (
     InvalidApiKeyError,
     ensure_client,
@@ -292,14 +301,24 @@ class BotRunner:
         else:
             logger.warning(f"Bot for user {user_id} is not running")
 
-    async def start(self, session_factory, user_id: int):
+    async def start(self, session_factory, user_id: int, bootstrap: bool = False):
+        """
+        봇 시작 (태스크 생성)
+
+        Args:
+            bootstrap: 서버 재시작 후 복구 시작 여부 (시작 지연 jitter 적용, 준비 진행률 집계)
+
+        Returns:
+            태스크를 새로 만들었으면 True, 이미 실행 중이면 False
+        """
         if self.is_running(user_id):
-            return
+            return False
 
-        task = asyncio.create_task(self._run_loop(session_factory, user_id))
+        task = asyncio.create_task(self._run_loop(session_factory, user_id, bootstrap))
         self.tasks[user_id] = task
+        return True
 
-    async def _run_loop(self, session_factory, user_id: int):
+    async def _run_loop(self, session_factory, user_id: int, bootstrap: bool = False):
         """
         봇 실행 메인 루프 (개선된 에러 핸들링)
 
@@ -309,14 +328,24 @@ class BotRunner:
         - 전략 실행 에러 격리
         - 주문 실행 에러 격리
         - Graceful shutdown
+        - 시작 단계(전략 로드 ~ 캔들 워밍업)는 bot_admission 승인 후 진행 (동시 시작 수 제한)
         """
         logger.info(f"Starting bot loop for user {user_id}")
 
+        # 봇 식별자 (레거시 전략 스트림 상태 / 샌드박스 지연 통계 키)
+        strategy_key = f"bot:{user_id}"
+        subscription = None
+        startup = bot_admission.begin(user_id, bootstrap)
+        metrics = bot_metrics.start(user_id)
+
         try:
+            await startup.admit(BotBootstrapConfig.JITTER_SECONDS if bootstrap else 0.0)
+
             async with session_factory() as session:
                 # 1. 전략 로드
                 try:
                     strategy = await self._get_user_strategy(session, user_id)
+                    startup.mark("strategy")
                     code_preview = strategy.code[:100] if strategy.code else "None"
                     logger.info(
                         f"Loaded strategy '{strategy.name}' for user {user_id}, code length: {len(strategy.code) if strategy.code else 0}, preview: {code_preview}..."
@@ -356,6 +385,8 @@ class BotRunner:
                         else ""
                     )
 
+                    startup.mark("decrypt")
+
                     if not all([api_key, api_secret, passphrase]):
                         raise InvalidApiKeyError(
                             "Invalid or incomplete API credentials"
@@ -363,6 +394,7 @@ class BotRunner:
 
                     # Bitget REST 클라이언트 생성
                     bitget_client = get_bitget_rest(api_key, api_secret, passphrase)
+                    startup.mark("client_init")
                     logger.info(f"Bitget API client initialized for user {user_id}")
 
                 except InvalidApiKeyError as e:
@@ -392,50 +424,28 @@ class BotRunner:
                     return
 
                 # 3. 과거 캔들 데이터 로드 (CRITICAL: 전략 정확도 향상)
-                candle_buffer = deque(maxlen=200)
-
-                # 전략 파라미터에서 심볼과 타임프레임 미리 가져오기 (try 블록 밖에서 정의)
-                strategy_params = json.loads(strategy.params) if strategy.params else {}
-                symbol = strategy_params.get("symbol", "BTC/USDT").replace(
-                    "/", ""
-                )  # "BTCUSDT"
-                timeframe = strategy_params.get("timeframe", "1h")
-
-                try:
-                    # Bitget API에서 과거 200개 캔들 가져오기
-                    historical = await bitget_client.get_historical_candles(
-                        symbol=symbol, interval=timeframe, limit=200
-                    )
-
-                    # 캔들 버퍼에 추가
-                    for candle in historical:
-                        candle_buffer.append(
-                            {
-                                "open": float(candle.get("open", 0)),
-                                "high": float(candle.get("high", 0)),
-                                "low": float(candle.get("low", 0)),
-                                "close": float(candle.get("close", 0)),
-                                "volume": float(candle.get("volume", 0)),
-                                "time": candle.get("timestamp", 0),
-                            }
-                        )
+                # 전략 파라미터에서 심볼과 타임프레임 미리 가져오기
+                symbol, timeframe = self._strategy_market(strategy.params)
+                candle_buffer = await self._load_candle_buffer(
+                    symbol, timeframe, user_id
+                )
 
-                    logger.info(
-                        f"✅ Loaded {len(candle_buffer)} historical candles for {symbol} {timeframe} (user {user_id})"
-                    )
-
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load historical candles for user {user_id}: {e}"
-                    )
-                    logger.info(
-                        f"Continuing with empty candle buffer (strategies may have reduced accuracy)"
-                    )
+                # 봇이 보유하는 전략 (전략 변경 이벤트 수신 시 교체)
+                strategy_code = strategy.code
+                params_json = strategy.params
+                live_strategy = load_live_strategy(strategy_code, params_json)
+                subscription = strategy_events.subscribe(strategy.id)
+                reload_deferred = False
+                startup.mark("warmup")
+                startup.ready()
 
                 # 4. 메인 트레이딩 루프
                 consecutive_errors = 0
                 max_consecutive_errors = 10
                 current_position = None  # 현재 포지션 추적
+                # 포지션 보유 중 청산 트리거 (바가 바뀌거나 임계값을 넘을 때만 전략 재평가)
+                exit_triggers = None
+                bar_ms = TIMEFRAME_MS.get(timeframe.lower())
 
                 while True:
                     try:
@@ -458,6 +468,60 @@ class BotRunner:
                             )
                             continue
 
+                        # 틱 수신 (지표: 큐 대기 시간, 틱 → 주문 지연 기준 시각)
+                        tick_started = time.perf_counter()
+                        metrics.inc("ticks_received")
+                        metrics.last_tick_at = time.time()
+                        queued_at = market.get("queued_at")
+                        if queued_at is not None:
+                            metrics.observe(
+                                "queue_wait", (time.monotonic() - queued_at) * 1000
+                            )
+
+                        # 전략 변경 이벤트: 새 전략으로 교체 (심볼/타임프레임이 같으면 캔들 버퍼 유지)
+                        if subscription.pop() or (reload_deferred and not current_position):
+                            reload_deferred = False
+                            try:
+                                await session.refresh(strategy)
+                                new_symbol, new_timeframe = self._strategy_market(
+                                    strategy.params
+                                )
+                                if current_position and new_symbol != symbol:
+                                    # 기존 심볼 포지션이 청산된 뒤 적용
+                                    reload_deferred = True
+                                    logger.info(
+                                        f"Strategy reload deferred until {symbol} position is closed (user {user_id})"
+                                    )
+                                else:
+                                    strategy_code = strategy.code
+                                    params_json = strategy.params
+                                    live_strategy = load_live_strategy(
+                                        strategy_code, params_json
+                                    )
+                                    exit_triggers = None
+                                    if (new_symbol, new_timeframe) != (symbol, timeframe):
+                                        symbol, timeframe = new_symbol, new_timeframe
+                                        bar_ms = TIMEFRAME_MS.get(timeframe.lower())
+                                        candle_buffer = await self._load_candle_buffer(
+                                            symbol, timeframe, user_id
+                                        )
+                                    logger.info(
+                                        f"♻️ Reloaded strategy '{strategy.name}' for user {user_id} ({symbol} {timeframe})"
+                                    )
+                                    await broadcast_to_user(
+                                        user_id,
+                                        {
+                                            "event": "bot_status",
+                                            "status": "running",
+                                            "message": "STRATEGY_RELOADED",
+                                        },
+                                    )
+                            except Exception as e:
+                                logger.error(
+                                    f"Failed to reload strategy for user {user_id}: {e}",
+                                    exc_info=True,
+                                )
+
                         price = float(market.get("price", 0))
                         market_symbol = market.get("symbol", "BTCUSDT")
 
@@ -482,6 +546,7 @@ class BotRunner:
                                     )
                             else:
                                 self._skip_log_count = 1
+                            metrics.inc("ticks_skipped")
                             continue  # Skip this market data
 
                         logger.info(
@@ -490,20 +555,21 @@ class BotRunner:
 
                         if price <= 0:
                             logger.warning(f"Invalid price received: {price}")
+                            metrics.inc("ticks_skipped")
                             continue
 
-                        # 캔들 데이터 준비 - market 데이터를 캔들 형식으로 변환
-                        new_candle = {
-                            "open": market.get("open", price),
-                            "high": market.get("high", price),
-                            "low": market.get("low", price),
-                            "close": market.get("close", price),
-                            "volume": market.get("volume", 0),
-                            "time": market.get("time", 0),
-                        }
-
-                        # 새 캔들을 버퍼에 추가 (롤링 윈도우)
-                        candle_buffer.append(new_candle)
+                        # 틱을 진행 중 캔들에 반영 (버퍼는 바 단위: 확정 캔들 + 진행 중 캔들 1개)
+                        if not self._apply_tick(candle_buffer, market, price, bar_ms):
+                            # 새 바: 확정 캔들은 같은 심볼/타임프레임 봇과 공유하는 윈도우로 교체
+                            # (봇마다 받은 틱이 달라 틱으로 만든 캔들은 봇마다 다름 → 지표 메모 공유 불가)
+                            refreshed = await self._load_candle_buffer(
+                                symbol, timeframe, user_id
+                            )
+                            if refreshed:
+                                candle_buffer = refreshed
+                            self._apply_tick(
+                                candle_buffer, market, price, bar_ms, new_bar=True
+                            )
 
                         # 전체 캔들 버퍼를 전략에 전달 (1개가 아닌 전체!)
                         candles = list(candle_buffer)
@@ -511,13 +577,50 @@ class BotRunner:
                         # 새로운 전략 로더 사용 (포지션 정보 포함)
                         try:
                             # 실제 모드: 현재 포지션 상태를 전략에 전달
-                            signal_result = generate_signal_with_strategy(
-                                strategy_code=strategy.code,
-                                current_price=price,
-                                candles=candles,
-                                params_json=strategy.params,
-                                current_position=current_position,  # 실제 포지션 상태 전달
-                            )
+                            # (샌드박스 활성화 시 동적 전략은 워커 프로세스에서 평가)
+                            # 같은 바 안에서 청산 트리거(가격 / 현재 버퍼 RSI)에 닿지 않았으면 전략 평가 생략
+                            bar = int(time.time() * 1000) // bar_ms if bar_ms else None
+                            if (
+                                current_position
+                                and exit_triggers is not None
+                                and exit_triggers.holds(
+                                    price,
+                                    bar,
+                                    [c["close"] for c in candles]
+                                    if exit_triggers.rsi_zones
+                                    else None,
+                                )
+                            ):
+                                signal_result = {
+                                    "action": "hold",
+                                    "confidence": 0.5,
+                                    "reason": "Exit triggers not reached",
+                                    "stop_loss": None,
+                                    "take_profit": None,
+                                    "size": 0,
+                                }
+                                metrics.inc("ticks_skipped")
+                            else:
+                                eval_started = time.perf_counter()
+                                signal_result = await generate_signal_async(
+                                    strategy_code=strategy_code,
+                                    current_price=price,
+                                    candles=candles,
+                                    params_json=params_json,
+                                    current_position=current_position,  # 실제 포지션 상태 전달
+                                    strategy_key=strategy_key,
+                                    strategy=live_strategy,
+                                )
+                                metrics.observe(
+                                    "strategy_eval",
+                                    (time.perf_counter() - eval_started) * 1000,
+                                )
+                                metrics.inc("ticks_evaluated")
+                                exit_triggers = ExitTriggers.from_dict(
+                                    signal_result.get("exit_triggers"), bar
+                                )
+                            # 주문 전 단계(주문 크기 계산, 리스크 체크) 시작
+                            pre_trade_started = time.perf_counter()
 
                             signal_action = signal_result.get("action", "hold")
                             signal_confidence = signal_result.get("confidence", 0)
@@ -596,6 +699,8 @@ class BotRunner:
                             )
 
                         except Exception as e:
+                            metrics.inc("errors")
+                            pre_trade_started = time.perf_counter()
                             logger.error(
                                 f"Strategy execution error for user {user_id}: {e}",
                                 exc_info=True,
@@ -624,6 +729,11 @@ class BotRunner:
                                     f"Closing position for user {user_id}: {current_position['side']}"
                                 )
 
+                                order_started = time.perf_counter()
+                                metrics.observe(
+                                    "pre_trade", (order_started - pre_trade_started) * 1000
+                                )
+                                metrics.inc("orders")
                                 order_result = await bitget_client.place_market_order(
                                     symbol=symbol,
                                     side=close_side,
@@ -631,6 +741,15 @@ class BotRunner:
                                     margin_coin="USDT",
                                     reduce_only=True,
                                 )
+                                post_trade_started = time.perf_counter()
+                                metrics.observe(
+                                    "order_placement",
+                                    (post_trade_started - order_started) * 1000,
+                                )
+                                metrics.observe(
+                                    "tick_to_order",
+                                    (post_trade_started - tick_started) * 1000,
+                                )
 
                                 # 포지션 초기화
                                 current_position = None
@@ -666,8 +785,13 @@ class BotRunner:
                                         )
                                 except Exception as e:
                                     logger.warning(f"텔레그램 청산 알림 전송 실패: {e}")
+                                metrics.observe(
+                                    "post_trade",
+                                    (time.perf_counter() - post_trade_started) * 1000,
+                                )
 
                             except Exception as e:
+                                metrics.inc("errors")
                                 logger.error(
                                     f"Position close error for user {user_id}: {e}",
                                     exc_info=True,
@@ -706,6 +830,10 @@ class BotRunner:
                                         "blocked_action": signal_action,
                                     },
                                 )
+                                metrics.observe(
+                                    "pre_trade",
+                                    (time.perf_counter() - pre_trade_started) * 1000,
+                                )
                                 # 거래를 건너뛰고 다음 시그널 대기
                                 continue
 
@@ -734,14 +862,18 @@ class BotRunner:
                                         "blocked_action": signal_action,
                                     },
                                 )
+                                metrics.observe(
+                                    "pre_trade",
+                                    (time.perf_counter() - pre_trade_started) * 1000,
+                                )
                                 # 거래를 건너뛰고 다음 시그널 대기
                                 continue
 
                             try:
                                 # ⚠️ 레버리지 제한 체크 (거래는 진행하되 레버리지만 제한)
                                 strategy_params = (
-                                    json.loads(strategy.params)
-                                    if strategy.params
+                                    json.loads(params_json)
+                                    if params_json
                                     else {}
                                 )
                                 requested_leverage = strategy_params.get("leverage", 10)
@@ -797,6 +929,11 @@ class BotRunner:
                                     logger.warning(f"Failed to set leverage: {lev_err}")
 
                                 # Bitget 시장가 주문 실행
+                                order_started = time.perf_counter()
+                                metrics.observe(
+                                    "pre_trade", (order_started - pre_trade_started) * 1000
+                                )
+                                metrics.inc("orders")
                                 order_result = await bitget_client.place_market_order(
                                     symbol=symbol,
                                     side=order_side,
@@ -804,6 +941,15 @@ class BotRunner:
                                     margin_coin="USDT",
                                     reduce_only=False,
                                 )
+                                post_trade_started = time.perf_counter()
+                                metrics.observe(
+                                    "order_placement",
+                                    (post_trade_started - order_started) * 1000,
+                                )
+                                metrics.observe(
+                                    "tick_to_order",
+                                    (post_trade_started - tick_started) * 1000,
+                                )
 
                                 # 포지션 추적 시작
                                 current_position = {
@@ -869,8 +1015,13 @@ class BotRunner:
                                         )
                                 except Exception as e:
                                     logger.warning(f"텔레그램 진입 알림 전송 실패: {e}")
+                                metrics.observe(
+                                    "post_trade",
+                                    (time.perf_counter() - post_trade_started) * 1000,
+                                )
 
                             except Exception as e:
+                                metrics.inc("errors")
                                 logger.error(
                                     f"Order execution error for user {user_id}: {e}",
                                     exc_info=True,
@@ -916,6 +1067,7 @@ class BotRunner:
 
                     except Exception as e:
                         consecutive_errors += 1
+                        metrics.inc("errors")
                         logger.error(
                             f"Error in bot loop for user {user_id} (consecutive: {consecutive_errors}/{max_consecutive_errors}): {e}",
                             exc_info=True,
@@ -980,10 +1132,110 @@ class BotRunner:
             )
             if user_id in self.tasks:
                 del self.tasks[user_id]
+            startup.release()
+            bot_metrics.stop(user_id)
+            reset_legacy_stream(strategy_key)
+            if subscription is not None:
+                strategy_events.unsubscribe(subscription)
             # 주의: DB 상태는 여기서 업데이트하지 않음!
             # - 사용자가 stop_bot 호출 시: CancelledError 핸들러에서 DB 업데이트
             # - 에러로 종료 시: DB는 is_running=True 유지하여 새로고침 시 자동 재시작
 
+    @staticmethod
+    def _strategy_market(params_json: Optional[str]) -> tuple:
+        """전략 파라미터 → (심볼 "BTCUSDT", 타임프레임)"""
+        strategy_params = json.loads(params_json) if params_json else {}
+        symbol = strategy_params.get("symbol", "BTC/USDT").replace("/", "")
+        return symbol, strategy_params.get("timeframe", "1h")
+
+    @staticmethod
+    def _apply_tick(
+        candle_buffer: deque,
+        market: dict,
+        price: float,
+        bar_ms: Optional[int],
+        new_bar: bool = False,
+    ) -> bool:
+        """
+        틱을 캔들 버퍼의 진행 중 캔들에 반영
+
+        틱 시각은 수집기마다 다르므로(ms / 초 / 없음) 밀리초로 맞춘 뒤 바 시작 시각으로 내림.
+        틱이 버퍼에 없는 새 바에 속하면 new_bar=False일 때 False를 반환하고 버퍼를 바꾸지
+        않습니다 (호출 측이 확정 캔들을 다시 불러온 뒤 new_bar=True로 재호출).
+        타임프레임을 모르면 틱을 그대로 캔들로 추가합니다.
+        """
+        tick_ms = market.get("time") or 0
+        if tick_ms <= 0:
+            tick_ms = time.time() * 1000
+        elif tick_ms < 1e12:
+            tick_ms *= 1000  # 초 단위 (ccxt 수집기)
+        tick_ms = int(tick_ms)
+
+        if not bar_ms:
+            candle_buffer.append(
+                {
+                    "open": price,
+                    "high": price,
+                    "low": price,
+                    "close": price,
+                    "volume": 0.0,
+                    "time": tick_ms,
+                }
+            )
+            return True
+
+        bar_open = tick_ms - tick_ms % bar_ms
+        last = candle_buffer[-1] if candle_buffer else None
+        last_open = None
+        if last is not None and last.get("time"):
+            last_open = int(last["time"]) - int(last["time"]) % bar_ms
+
+        if last_open is not None and bar_open <= last_open:
+            # 진행 중 캔들 갱신 (늦게 도착한 이전 바의 틱도 현재 캔들 가격으로 반영)
+            last["close"] = price
+            last["high"] = max(last["high"], price)
+            last["low"] = min(last["low"], price)
+            return True
+
+        if not new_bar and last is not None:
+            return False
+
+        candle_buffer.append(
+            {
+                "open": price,
+                "high": price,
+                "low": price,
+                "close": price,
+                "volume": 0.0,
+                "time": bar_open,
+            }
+        )
+        return True
+
+    async def _load_candle_buffer(self, symbol: str, timeframe: str, user_id: int) -> deque:
+        """
+        최근 200개 캔들로 캔들 버퍼 생성 (실패 시 빈 버퍼)
+
+        로컬 캔들 저장소 / 메모리 윈도우를 먼저 사용하고 모자란 최근 구간만 API로 조회
+        (같은 심볼/타임프레임 봇끼리 공유)
+        """
+        candle_buffer = deque(maxlen=200)
+        try:
+            candle_buffer.extend(
+                await candle_warmup.get_window(symbol, timeframe, candle_buffer.maxlen)
+            )
+            logger.info(
+                f"✅ Loaded {len(candle_buffer)} historical candles for {symbol} {timeframe} (user {user_id})"
+            )
+
+        except Exception as e:
+            logger.warning(f"Failed to load historical candles for user {user_id}: {e}")
+        if not candle_buffer:
+            logger.info(
+                f"Continuing with empty candle buffer (strategies may have reduced accuracy)"
+            )
+        return candle_buffer
+
     async def _get_user_strategy(self, session: AsyncSession, user_id: int) -> Strategy:
         """사용자의 bot_status에서 선택된 전략 가져오기"""
         from ..database.models import BotStatus
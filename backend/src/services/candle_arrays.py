@@ -0,0 +1,202 @@
+"""
+컬럼 기반 캔들 컨테이너
+
+CandleCacheManager → BacktestEngine 간 데이터 전달용.
+캔들을 dict 리스트 대신 numpy 배열(timestamp/open/high/low/close/volume)로 보관하여
+CSV 직렬화 왕복 없이 그대로 엔진에 넘길 수 있습니다.
+
+SharedCandleBlock은 같은 배열을 공유 메모리에 올려 워커 프로세스들이
+복사 없이 참조하도록 합니다 (파라미터 스윕 / 워크포워드).
+"""
+
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+CANDLE_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+PRICE_FIELDS = CANDLE_FIELDS[1:]
+
+# 타임프레임별 캔들 간격 (밀리초)
+TIMEFRAME_MS = {
+    "1m": 60_000,
+    "3m": 180_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "30m": 1_800_000,
+    "1h": 3_600_000,
+    "2h": 7_200_000,
+    "4h": 14_400_000,
+    "6h": 21_600_000,
+    "12h": 43_200_000,
+    "1d": 86_400_000,
+    "1w": 604_800_000,
+}
+
+
+def timeframe_ms(timeframe: str) -> int:
+    """타임프레임 문자열 → 캔들 간격 (밀리초, 대소문자 무시)"""
+    try:
+        return TIMEFRAME_MS[timeframe.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+
+
+class CandleArrays:
+    """
+    OHLCV 컬럼 배열 묶음
+
+    - timestamp: int64 (밀리초) 또는 업로드 CSV의 경우 문자열 배열
+    - open/high/low/close/volume: float64
+
+    slice()/between()은 복사 없이 view를 반환하므로
+    같은 시리즈를 여러 백테스트가 공유해도 메모리가 늘어나지 않습니다.
+    """
+
+    __slots__ = CANDLE_FIELDS
+
+    def __init__(self, timestamp, open, high, low, close, volume):
+        self.timestamp = np.asarray(timestamp)
+        self.open = np.asarray(open, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.volume = np.asarray(volume, dtype=np.float64)
+
+    @classmethod
+    def from_dicts(cls, candles: Iterable[Dict[str, Any]]) -> "CandleArrays":
+        """dict 리스트(get_candles/load_candles 결과)에서 생성"""
+        candles = list(candles)
+        timestamps = [c["timestamp"] for c in candles]
+        if timestamps and all(isinstance(t, (int, np.integer)) for t in timestamps):
+            ts = np.asarray(timestamps, dtype=np.int64)
+        else:
+            ts = np.asarray(timestamps)
+        return cls(
+            ts,
+            [c["open"] for c in candles],
+            [c["high"] for c in candles],
+            [c["low"] for c in candles],
+            [c["close"] for c in candles],
+            [c["volume"] for c in candles],
+        )
+
+    @classmethod
+    def empty(cls) -> "CandleArrays":
+        return cls(np.empty(0, dtype=np.int64), [], [], [], [], [])
+
+    def __len__(self) -> int:
+        return int(self.close.shape[0])
+
+    def slice(self, start: int, end: Optional[int] = None) -> "CandleArrays":
+        """인덱스 구간 [start, end) view"""
+        return CandleArrays(*(getattr(self, f)[start:end] for f in CANDLE_FIELDS))
+
+    def between(self, start_ts: int, end_ts: int) -> "CandleArrays":
+        """타임스탬프 구간 [start_ts, end_ts] view (timestamp 오름차순 가정)"""
+        lo = int(np.searchsorted(self.timestamp, start_ts, side="left"))
+        hi = int(np.searchsorted(self.timestamp, end_ts, side="right"))
+        return self.slice(lo, hi)
+
+    def candle(self, index: int) -> Dict[str, Any]:
+        """단일 캔들을 dict로 반환 (전략 호환용)"""
+        return {f: getattr(self, f)[index].item() for f in CANDLE_FIELDS}
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        columns = [getattr(self, f).tolist() for f in CANDLE_FIELDS]
+        return [dict(zip(CANDLE_FIELDS, row)) for row in zip(*columns)]
+
+
+class SharedCandleBlock:
+    """
+    공유 메모리 위의 캔들 배열
+
+    레이아웃: [timestamp int64 × n][open float64 × n]...[volume float64 × n]
+
+    부모 프로세스가 create()로 생성하고 close()로 해제하며,
+    워커는 descriptor만 받아 attach_shared_candles()로 view를 얻습니다.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, length: int):
+        self._shm = shm
+        self.length = length
+
+    @classmethod
+    def create(cls, candles: CandleArrays) -> "SharedCandleBlock":
+        if len(candles) and candles.timestamp.dtype.kind not in "iu":
+            raise ValueError("SharedCandleBlock requires integer (ms) timestamps")
+
+        n = len(candles)
+        shm = shared_memory.SharedMemory(create=True, size=max(n, 1) * 8 * len(CANDLE_FIELDS))
+        block = cls(shm, n)
+        arrays = _view_block(shm, n)
+        for field in CANDLE_FIELDS:
+            getattr(arrays, field)[:] = getattr(candles, field)
+        return block
+
+    @property
+    def descriptor(self) -> Tuple[str, int]:
+        """워커 프로세스로 전달할 (이름, 길이)"""
+        return self._shm.name, self.length
+
+    @property
+    def nbytes(self) -> int:
+        return self._shm.size
+
+    def arrays(self) -> CandleArrays:
+        """부모 프로세스에서 사용할 view"""
+        return _view_block(self._shm, self.length)
+
+    def close(self):
+        try:
+            self._shm.close()
+        except BufferError:
+            # 부모 쪽 view가 남아 있으면 매핑은 GC 시 해제 (unlink는 즉시)
+            pass
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _view_block(shm: shared_memory.SharedMemory, n: int) -> CandleArrays:
+    columns = [np.ndarray((n,), dtype=np.int64, buffer=shm.buf, offset=0)]
+    for i, _ in enumerate(PRICE_FIELDS, start=1):
+        columns.append(np.ndarray((n,), dtype=np.float64, buffer=shm.buf, offset=i * n * 8))
+    return CandleArrays(*columns)
+
+
+# 워커 프로세스별 attach 캐시 (같은 블록에 대한 반복 작업에서 재사용)
+_ATTACHED: "OrderedDict[str, Tuple[shared_memory.SharedMemory, CandleArrays]]" = OrderedDict()
+_ATTACHED_MAX = 2
+
+
+def attach_shared_candles(descriptor: Tuple[str, int]) -> CandleArrays:
+    """
+    워커 프로세스에서 SharedCandleBlock에 연결하여 읽기 전용 view 반환
+
+    블록의 수명(unlink)은 생성한 부모가 관리합니다. spawn 워커는 부모의
+    resource_tracker를 공유하므로 attach 시 등록은 그대로 둡니다.
+    """
+    name, n = descriptor
+    cached = _ATTACHED.get(name)
+    if cached is not None:
+        _ATTACHED.move_to_end(name)
+        return cached[1]
+
+    shm = shared_memory.SharedMemory(name=name)
+    arrays = _view_block(shm, n)
+    for field in CANDLE_FIELDS:
+        getattr(arrays, field).flags.writeable = False
+    _ATTACHED[name] = (shm, arrays)
+
+    while len(_ATTACHED) > _ATTACHED_MAX:
+        _, (old_shm, _) = _ATTACHED.popitem(last=False)
+        try:
+            old_shm.close()
+        except BufferError:
+            # 아직 참조 중인 view가 있으면 프로세스 종료 시 해제
+            pass
+
+    return arrays
@@ -21,6 +21,10 @@ from typing import Dict, List, Optional, Any, Tuple
 import json
 import time
 
+import numpy as np
+
+from .candle_arrays import CandleArrays
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,6 +70,9 @@ class CandleCacheManager:
         self._memory_cache_timestamps: Dict[str, float] = {}
         self._memory_cache_max_age = 300  # 5분
 
+        # 배열 캐시 (백테스트용 전체 시리즈, 파일 mtime 기준으로 무효화)
+        self._array_cache: Dict[str, Tuple[int, CandleArrays]] = {}
+
         # Rate Limit 관리
         self._api_queue = asyncio.Queue()
         self._rate_limit_lock = asyncio.Lock()
@@ -226,6 +233,224 @@ class CandleCacheManager:
 
         return candles
 
+    async def get_candle_arrays(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: str,
+        end_date: str,
+        cache_only: bool = False,
+    ) -> CandleArrays:
+        """
+        캔들 데이터를 CandleArrays로 조회 (백테스트 엔진 직접 전달용)
+
+        파일 캐시 전체를 numpy 배열로 한 번만 파싱해 메모리에 유지하고,
+        요청 기간은 searchsorted로 잘라낸 view를 반환합니다.
+        캐시가 요청 기간을 덮지 못하면 get_candles()로 누락분을 채운 뒤 변환합니다.
+        """
+        symbol = symbol.upper().replace("/", "")
+        start_ts, end_ts = self._date_range_ms(start_date, end_date)
+
+        arrays = self._get_file_arrays(symbol, timeframe)
+        if arrays is not None and len(arrays):
+            covered = (
+                arrays.timestamp[0] <= start_ts and arrays.timestamp[-1] >= end_ts
+            )
+            if covered or cache_only:
+                window = arrays.between(start_ts, end_ts)
+                if len(window):
+                    logger.info(f"   ✅ Array cache hit: {len(window)} candles")
+                    return window
+                if cache_only:
+                    logger.warning(f"   ⚠️ Cache only mode: no data in requested range")
+                    return arrays  # 전체 캐시 반환 (get_candles와 동일)
+        elif cache_only:
+            logger.warning(
+                f"   ⚠️ Cache only mode: no cache available for {symbol} {timeframe}"
+            )
+            return CandleArrays.empty()
+
+        candles = await self.get_candles(
+            symbol, timeframe, start_date, end_date, cache_only=cache_only
+        )
+        return CandleArrays.from_dicts(candles)
+
+    def get_series_version(
+        self, symbol: str, timeframe: str, end_date: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        캔들 시리즈 버전 (백테스트 결과 캐시 무효화용)
+
+        - 파일 전체를 다시 쓰면(또는 외부에서 수정되면) 리비전이 바뀜
+        - append_candles()로 끝에 추가된 캔들은 리비전을 바꾸지 않고,
+          end_date 이전까지의 데이터 끝 시각만 버전에 반영
+          → 과거 구간 결과는 워밍업 append에도 유지, 최신 구간 결과만 무효화
+
+        파일이 없으면 None.
+        """
+        symbol = symbol.upper().replace("/", "")
+        cache_file = self._get_cache_file(symbol, timeframe)
+        try:
+            file_version = self._file_version(cache_file)
+        except FileNotFoundError:
+            return None
+
+        meta = self._tracked_meta(symbol, timeframe, file_version)
+        if meta is None:
+            return file_version
+
+        data_end = int(meta["end"])
+        if end_date:
+            data_end = min(data_end, self._date_range_ms(end_date, end_date)[1])
+        return f"{meta['revision']}:{data_end}"
+
+    @staticmethod
+    def _file_version(cache_file: Path) -> str:
+        stat = cache_file.stat()
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    def _tracked_meta(
+        self, symbol: str, timeframe: str, file_version: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        현재 파일 상태와 일치하는 메타데이터 (리비전 추적 중인 경우)
+
+        다른 프로세스(봇 워커)가 append했을 수 있으므로 불일치 시 디스크에서 다시 읽고,
+        그래도 다르면 외부에서 수정된 파일로 보고 None.
+        """
+        cache_key = self._get_cache_key(symbol, timeframe)
+        meta = self._metadata["caches"].get(cache_key)
+        if not meta or meta.get("file_version") != file_version:
+            self._metadata = self._load_metadata()
+            meta = self._metadata["caches"].get(cache_key)
+        if (
+            not meta
+            or meta.get("file_version") != file_version
+            or not meta.get("revision")
+            or meta.get("end") is None
+        ):
+            return None
+        return meta
+
+    def get_latest_candles(
+        self, symbol: str, timeframe: str, limit: int
+    ) -> List[Dict[str, Any]]:
+        """파일 캐시의 최근 limit개 캔들 (봇 워밍업용, API 호출 없음)"""
+        symbol = symbol.upper().replace("/", "")
+        arrays = self._get_file_arrays(symbol, timeframe)
+        if arrays is None or not len(arrays):
+            return []
+        return arrays.slice(max(len(arrays) - limit, 0)).to_dicts()
+
+    def append_candles(self, symbol: str, timeframe: str, candles: List[Dict]):
+        """
+        마감된 캔들을 파일 캐시 끝에 추가 (파일의 마지막 캔들 이후 것만)
+
+        전체 파일을 다시 쓰지 않으므로 라이브 경로에서 최근 구간을 보충할 때 사용합니다.
+        추가분이 파일 끝과 이어지지 않으면(중간 구간 누락) 저장하지 않습니다.
+        get_candle_arrays()는 처음/끝 시각만으로 구간 포함 여부를 판단하므로
+        구멍이 생기면 이후 백테스트가 누락 구간을 다시 받지 않기 때문입니다.
+        """
+        symbol = symbol.upper().replace("/", "")
+        cache_file = self._get_cache_file(symbol, timeframe)
+        arrays = self._get_file_arrays(symbol, timeframe)
+        if arrays is None or not len(arrays):
+            self._save_to_file_cache(symbol, timeframe, candles)
+            return
+
+        last_ts = int(arrays.timestamp[-1])
+        new_candles = sorted(
+            (c for c in candles if c["timestamp"] > last_ts),
+            key=lambda x: x["timestamp"],
+        )
+        if not new_candles:
+            return
+
+        bar_ms = self.TIMEFRAME_MS.get(timeframe)
+        gap = new_candles[0]["timestamp"] - last_ts
+        if (bar_ms and gap > bar_ms) or (
+            not bar_ms and min(c["timestamp"] for c in candles) > last_ts
+        ):
+            logger.info(
+                "Skip appending %d candles to %s: gap after last stored candle",
+                len(new_candles),
+                cache_file.name,
+            )
+            return
+
+        try:
+            prev_version = self._file_version(cache_file)
+            prev_meta = self._tracked_meta(symbol, timeframe, prev_version)
+            with open(cache_file, "a", newline="") as f:
+                writer = csv.DictWriter(
+                    f,
+                    fieldnames=["timestamp", "open", "high", "low", "close", "volume"],
+                    extrasaction="ignore",
+                )
+                writer.writerows(new_candles)
+
+            cache_key = self._get_cache_key(symbol, timeframe)
+            self._array_cache.pop(cache_key, None)
+            meta = self._metadata["caches"].setdefault(
+                cache_key,
+                {"symbol": symbol, "timeframe": timeframe, "start": int(arrays.timestamp[0])},
+            )
+            meta["count"] = len(arrays) + len(new_candles)
+            meta["end"] = new_candles[-1]["timestamp"]
+            meta["updated_at"] = datetime.now().isoformat()
+            # append는 기존 캔들을 바꾸지 않으므로 리비전 유지
+            # (추적 중이 아니던 파일은 append 직전 상태를 리비전으로 삼음)
+            if prev_meta is None:
+                meta["revision"] = prev_version
+            meta["file_version"] = self._file_version(cache_file)
+            self._save_metadata()
+
+            logger.debug("Appended %d candles to %s", len(new_candles), cache_file.name)
+
+        except Exception as e:
+            logger.error(f"Failed to append cache file {cache_file}: {e}")
+
+    def _date_range_ms(self, start_date: str, end_date: str) -> Tuple[int, int]:
+        """YYYY-MM-DD 기간을 밀리초 타임스탬프 구간으로 변환 (종료일 포함)"""
+        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+        end_dt = datetime.strptime(end_date, "%Y-%m-%d").replace(
+            hour=23, minute=59, second=59
+        )
+        return int(start_dt.timestamp() * 1000), int(end_dt.timestamp() * 1000)
+
+    def _get_file_arrays(self, symbol: str, timeframe: str) -> Optional[CandleArrays]:
+        """파일 캐시를 CandleArrays로 로드 (mtime이 바뀌지 않았으면 메모리 재사용)"""
+        cache_file = self._get_cache_file(symbol, timeframe)
+        if not cache_file.exists():
+            return None
+
+        cache_key = self._get_cache_key(symbol, timeframe)
+        mtime_ns = cache_file.stat().st_mtime_ns
+        cached = self._array_cache.get(cache_key)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            data = np.loadtxt(cache_file, delimiter=",", skiprows=1, ndmin=2)
+        except Exception as e:
+            logger.error(f"Failed to read cache file {cache_file}: {e}")
+            return None
+
+        if data.size == 0:
+            arrays = CandleArrays.empty()
+        else:
+            arrays = CandleArrays(
+                data[:, 0].astype(np.int64),
+                data[:, 1],
+                data[:, 2],
+                data[:, 3],
+                data[:, 4],
+                data[:, 5],
+            )
+        self._array_cache[cache_key] = (mtime_ns, arrays)
+        logger.debug("Loaded %d candles (arrays) from %s", len(arrays), cache_file)
+        return arrays
+
     def _get_from_memory_cache(
         self, cache_key: str, start_date: str, end_date: str
     ) -> Optional[List[Dict]]:
@@ -310,6 +535,8 @@ class CandleCacheManager:
 
             # 메타데이터 업데이트
             cache_key = self._get_cache_key(symbol, timeframe)
+            self._array_cache.pop(cache_key, None)
+            file_version = self._file_version(cache_file)
             self._metadata["caches"][cache_key] = {
                 "symbol": symbol,
                 "timeframe": timeframe,
@@ -317,6 +544,9 @@ class CandleCacheManager:
                 "start": min(c["timestamp"] for c in candles),
                 "end": max(c["timestamp"] for c in candles),
                 "updated_at": datetime.now().isoformat(),
+                # 전체 재작성 → 새 리비전 (append_candles는 유지)
+                "revision": file_version,
+                "file_version": file_version,
             }
             self._save_metadata()
 
@@ -493,6 +723,7 @@ class CandleCacheManager:
             cache_key = self._get_cache_key(symbol, timeframe)
             if cache_key in self._memory_cache:
                 del self._memory_cache[cache_key]
+            self._array_cache.pop(cache_key, None)
             if cache_key in self._metadata["caches"]:
                 del self._metadata["caches"][cache_key]
                 self._save_metadata()
@@ -503,6 +734,7 @@ class CandleCacheManager:
 
             self._memory_cache.clear()
             self._memory_cache_timestamps.clear()
+            self._array_cache.clear()
             self._metadata["caches"] = {}
             self._save_metadata()
 
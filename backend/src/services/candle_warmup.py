@@ -0,0 +1,188 @@
+"""
+봇 캔들 윈도우 워밍업
+
+봇 시작 시 최근 캔들 윈도우(기본 200개)를 심볼/타임프레임별로 한 번만 준비해 공유합니다.
+
+1. 메모리: 같은 캔들 구간 안에서 MEMORY_TTL_SECONDS 이내에 준비한 윈도우는 그대로 재사용
+2. 로컬 캔들 저장소: candle_cache 파일(CSV)의 최근 캔들
+3. Bitget 공개 API: 저장소 이후 모자란 최근 구간만 조회
+   (마감된 캔들은 저장소 끝과 이어질 때만 저장소에 추가)
+
+같은 (심볼, 타임프레임)의 동시 요청은 키별 락으로 합쳐지므로,
+배포 후 수백 개 봇이 한꺼번에 시작해도 API 호출은 심볼/타임프레임당 한 번입니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import CandleWarmupConfig
+from .candle_cache import get_candle_cache
+from .candle_arrays import TIMEFRAME_MS
+
+logger = logging.getLogger(__name__)
+
+# Bitget 캔들 API 1회 최대 조회 수
+MAX_FETCH_LIMIT = 1000
+
+
+class CandleWarmup:
+    def __init__(self):
+        # (symbol, timeframe) → (준비 시각, 캔들 구간 시작, 캔들 리스트)
+        self._windows: Dict[Tuple[str, str], Tuple[float, Optional[int], List[Dict]]] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._client = None
+        self.stats = {
+            "memory_hits": 0,
+            "coalesced": 0,
+            "store_candles": 0,
+            "api_calls": 0,
+            "api_candles": 0,
+            "api_errors": 0,
+        }
+
+    async def get_window(
+        self, symbol: str, timeframe: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        봇 캔들 버퍼용 최근 캔들 (오래된 것부터, 마지막은 진행 중 캔들)
+
+        Returns:
+            [{"open", "high", "low", "close", "volume", "time"}, ...] - 호출마다 새 dict
+        """
+        limit = limit or CandleWarmupConfig.WINDOW_SIZE
+        key = (symbol.upper().replace("/", ""), timeframe)
+
+        candles = self._cached(key, limit)
+        if candles is not None:
+            self.stats["memory_hits"] += 1
+            return _to_buffer(candles[-limit:])
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # 앞선 요청이 같은 윈도우를 준비했으면 재사용 (요청 합류)
+            candles = self._cached(key, limit)
+            if candles is not None:
+                self.stats["coalesced"] += 1
+            else:
+                candles = await self._load(key, limit)
+        return _to_buffer(candles[-limit:])
+
+    def _cached(self, key: Tuple[str, str], limit: int) -> Optional[List[Dict]]:
+        entry = self._windows.get(key)
+        if entry is None:
+            return None
+        prepared_at, bar_start, candles = entry
+        if (
+            len(candles) < limit
+            or time.time() - prepared_at > CandleWarmupConfig.MEMORY_TTL_SECONDS
+            or bar_start != _bar_start(key[1])
+        ):
+            return None
+        return candles
+
+    async def _load(self, key: Tuple[str, str], limit: int) -> List[Dict]:
+        symbol, timeframe = key
+        bar_ms = TIMEFRAME_MS.get(timeframe.lower())
+        bar_start = _bar_start(timeframe)
+
+        # 로컬 저장소 (마감된 캔들만 사용, 진행 중 캔들은 항상 API에서)
+        cache = get_candle_cache()
+        stored = cache.get_latest_candles(symbol, timeframe, limit)
+        if bar_start is not None:
+            stored = [c for c in stored if c["timestamp"] < bar_start]
+        else:
+            stored = []
+        self.stats["store_candles"] += len(stored)
+
+        # 모자란 최근 구간 (마지막 저장 캔들과 1개 겹쳐서 조회)
+        if stored and bar_ms:
+            missing = (bar_start - stored[-1]["timestamp"]) // bar_ms + 1
+            fetch_limit = min(missing, limit)
+        else:
+            fetch_limit = limit
+
+        try:
+            fetched = await self._fetch(symbol, timeframe, fetch_limit)
+        except Exception as e:
+            self.stats["api_errors"] += 1
+            logger.warning(f"Failed to fetch recent candles for {symbol} {timeframe}: {e}")
+            # 저장소 캔들만으로 시작 (기존처럼 실패 시 빈 버퍼 가능)
+            return stored
+
+        merged = {c["timestamp"]: c for c in stored}
+        merged.update((c["timestamp"], c) for c in fetched)
+        candles = [merged[ts] for ts in sorted(merged)][-limit:]
+
+        if CandleWarmupConfig.PERSIST and bar_start is not None:
+            # 마지막 캔들은 진행 중일 수 있으므로 제외
+            closed = [c for c in fetched[:-1] if c["timestamp"] < bar_start]
+            # 저장소가 limit개 이상 뒤처져 있으면 조회분이 저장소 끝과 겹치지 않음
+            # → 중간 구간이 빠진 채 저장되지 않도록 겹칠 때만 추가
+            overlaps = not stored or (
+                closed and closed[0]["timestamp"] <= stored[-1]["timestamp"]
+            )
+            if closed and overlaps:
+                cache.append_candles(symbol, timeframe, closed)
+
+        self._windows[key] = (time.time(), bar_start, candles)
+        logger.info(
+            f"✅ Warmed {len(candles)} candles for {symbol} {timeframe} "
+            f"(store {len(stored)}, api {len(fetched)})"
+        )
+        return candles
+
+    async def _fetch(self, symbol: str, timeframe: str, limit: int) -> List[Dict]:
+        from .bitget_rest import BitgetRestClient
+
+        if self._client is None:
+            self._client = BitgetRestClient()  # 캔들 조회는 공개 API
+        self.stats["api_calls"] += 1
+        candles = await self._client.get_historical_candles(
+            symbol=symbol, interval=timeframe, limit=min(limit, MAX_FETCH_LIMIT)
+        )
+        self.stats["api_candles"] += len(candles)
+        return candles
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "windows": [
+                {
+                    "symbol": symbol,
+                    "timeframe": timeframe,
+                    "candles": len(candles),
+                    "age_seconds": round(time.time() - prepared_at, 1),
+                }
+                for (symbol, timeframe), (prepared_at, _, candles) in self._windows.items()
+            ],
+        }
+
+
+def _bar_start(timeframe: str) -> Optional[int]:
+    """현재 진행 중인 캔들의 시작 시각 (ms), 알 수 없는 타임프레임은 None"""
+    bar_ms = TIMEFRAME_MS.get(timeframe.lower())
+    if not bar_ms:
+        return None
+    now_ms = int(time.time() * 1000)
+    return now_ms - now_ms % bar_ms
+
+
+def _to_buffer(candles: List[Dict]) -> List[Dict[str, Any]]:
+    """저장소/API 캔들 → 봇 캔들 버퍼 형식"""
+    return [
+        {
+            "open": float(c.get("open", 0)),
+            "high": float(c.get("high", 0)),
+            "low": float(c.get("low", 0)),
+            "close": float(c.get("close", 0)),
+            "volume": float(c.get("volume", 0)),
+            "time": c.get("timestamp", 0),
+        }
+        for c in candles
+    ]
+
+
+# 전역 인스턴스
+candle_warmup = CandleWarmup()
@@ -5,10 +5,25 @@ Bitget WebSocket 문제 해결을 위한 안정적인 대체 방안
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
 
+from ..utils.metrics import metrics
+
 logger = logging.getLogger(__name__)
 
+# 거래소 API 지표 (bitget_rest와 같은 지표, client="ccxt")
+EXCHANGE_LATENCY = metrics.histogram(
+    "exchange_request_duration_seconds",
+    "Exchange API request latency per attempt",
+    ("client", "endpoint"),
+)
+EXCHANGE_ERRORS = metrics.counter(
+    "exchange_request_errors_total",
+    "Exchange API request errors per attempt",
+    ("client", "endpoint", "error"),
+)
+
 
 async def ccxt_price_collector(market_queue: asyncio.Queue, chart_queue: asyncio.Queue = None):
     """
@@ -50,7 +65,11 @@ async def ccxt_price_collector(market_queue: asyncio.Queue, chart_queue: asyncio
                 for symbol in symbols:
                     try:
                         # Fetch ticker (REST API, but reliable)
+                        started = time.perf_counter()
                         ticker = await exchange.fetch_ticker(symbol)
+                        EXCHANGE_LATENCY.labels("ccxt", "fetch_ticker").observe(
+                            time.perf_counter() - started
+                        )
 
                         # Convert symbol: BTC/USDT:USDT -> BTCUSDT
                         simple_symbol = symbol.split('/')[0] + 'USDT'
@@ -68,6 +87,7 @@ async def ccxt_price_collector(market_queue: asyncio.Queue, chart_queue: asyncio
                             "open": float(ticker.get('open', ticker.get('last', 0))),
                             "close": float(ticker.get('last', 0)),  # current price as close
                             "time": int(now),
+                            "queued_at": time.monotonic(),  # 봇 큐 대기 시간 측정용
                         }
 
                         # Put to market queue (for bot)
@@ -99,6 +119,9 @@ async def ccxt_price_collector(market_queue: asyncio.Queue, chart_queue: asyncio
                             )
 
                     except Exception as e:
+                        EXCHANGE_ERRORS.labels(
+                            "ccxt", "fetch_ticker", type(e).__name__
+                        ).inc()
                         logger.warning(f"Error fetching ticker for {symbol}: {e}")
                         continue
 
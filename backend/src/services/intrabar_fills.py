@@ -0,0 +1,140 @@
+"""
+손절/익절 캔들 내부(intrabar) 체결 모델
+
+기본 엔진은 캔들 종가에서만 청산하지만, proven_* 전략의 손절/익절은 라이브에서
+캔들 도중에 체결됩니다. fill_model="intrabar"이면 포지션 보유 중인 캔들마다
+고가/저가로 손절·익절 도달 여부를 확인하고 해당 가격에 청산합니다.
+
+- 한쪽만 도달: 그 가격으로 체결 (시가가 이미 넘어선 갭이면 시가로 체결)
+- 양쪽 모두 도달 (어느 쪽이 먼저인지 모호한 캔들): 1분봉 구간을 조회해 먼저 닿은 쪽 선택
+- 1분봉이 없거나 같은 1분봉 안에서 둘 다 닿으면 손절 우선 (보수적)
+
+IntrabarIndex는 상위 타임프레임 캔들 i → 1분봉 [start[i], end[i]) 구간을
+searchsorted로 한 번에 계산해 두므로 모호한 캔들 조회는 O(1) 슬라이스입니다.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .candle_arrays import CandleArrays, timeframe_ms
+
+FILL_MODELS = ("close", "intrabar")
+
+# 체결 결과: (청산 가격(슬리피지 적용 전), 사유 "stop_loss" | "take_profit")
+IntrabarFill = Tuple[float, str]
+
+
+class IntrabarIndex:
+    """상위 타임프레임 캔들 → 1분봉 구간 인덱스"""
+
+    def __init__(self, bar_timestamps: np.ndarray, timeframe: str, minute: CandleArrays):
+        opens = np.asarray(bar_timestamps, dtype=np.int64)
+        minute_ts = np.asarray(minute.timestamp, dtype=np.int64)
+        self.minute = minute
+        self.start = np.searchsorted(minute_ts, opens, side="left")
+        self.end = np.searchsorted(minute_ts, opens + timeframe_ms(timeframe), side="left")
+
+    @classmethod
+    def build(
+        cls, candles: CandleArrays, timeframe: Optional[str], minute: Optional[CandleArrays]
+    ) -> Optional["IntrabarIndex"]:
+        """밀리초 타임스탬프 시리즈 + 1분봉이 있을 때만 인덱스 생성"""
+        if minute is None or not len(minute) or not timeframe:
+            return None
+        if not np.issubdtype(candles.timestamp.dtype, np.integer):
+            return None  # 업로드 CSV (문자열 타임스탬프)
+        if not np.issubdtype(minute.timestamp.dtype, np.integer):
+            return None
+        return cls(candles.timestamp, timeframe, minute)
+
+    def first_hit(
+        self, bar: int, direction: str, stop_loss: float, take_profit: float
+    ) -> Optional[IntrabarFill]:
+        """1분봉으로 손절/익절 중 먼저 도달한 쪽 결정 (구간이 없으면 None)"""
+        start, end = int(self.start[bar]), int(self.end[bar])
+        if start >= end:
+            return None
+
+        high = self.minute.high[start:end]
+        low = self.minute.low[start:end]
+        if direction == "long":
+            sl_hits = low <= stop_loss
+            tp_hits = high >= take_profit
+        else:
+            sl_hits = high >= stop_loss
+            tp_hits = low <= take_profit
+
+        n = end - start
+        sl_at = int(np.argmax(sl_hits)) if sl_hits.any() else n
+        tp_at = int(np.argmax(tp_hits)) if tp_hits.any() else n
+        if sl_at == n and tp_at == n:
+            return None
+
+        # 같은 1분봉이면 손절 우선
+        if sl_at <= tp_at:
+            return _gap_fill(direction, float(self.minute.open[start + sl_at]), stop_loss, "stop_loss")
+        return _gap_fill(direction, float(self.minute.open[start + tp_at]), take_profit, "take_profit")
+
+
+def _gapped(direction: str, open_price: float, level: float, reason: str) -> bool:
+    """시가가 이미 손절/익절 가격을 넘어섰는지"""
+    if (reason == "stop_loss") == (direction == "long"):
+        return open_price <= level
+    return open_price >= level
+
+
+def _gap_fill(direction: str, open_price: float, level: float, reason: str) -> IntrabarFill:
+    """시가가 이미 가격을 넘어섰으면 시가로 체결"""
+    return (open_price if _gapped(direction, open_price, level, reason) else level), reason
+
+
+def check_intrabar_exit(
+    direction: str,
+    o: float,
+    h: float,
+    l: float,
+    stop_loss: Optional[float],
+    take_profit: Optional[float],
+    bar: int,
+    index: Optional[IntrabarIndex] = None,
+    stats: Optional[dict] = None,
+) -> Optional[IntrabarFill]:
+    """
+    캔들 하나의 손절/익절 체결 여부
+
+    Args:
+        stats: {"intrabar_exits", "refined_bars", "unresolved_bars"} 집계용 (선택)
+    """
+    if direction == "long":
+        sl_hit = stop_loss is not None and l <= stop_loss
+        tp_hit = take_profit is not None and h >= take_profit
+    else:
+        sl_hit = stop_loss is not None and h >= stop_loss
+        tp_hit = take_profit is not None and l <= take_profit
+
+    if not sl_hit and not tp_hit:
+        return None
+
+    if sl_hit and tp_hit:
+        fill = None
+        # 시가 갭으로 이미 넘어선 쪽이 있으면 모호하지 않음
+        if _gapped(direction, o, stop_loss, "stop_loss"):
+            fill = (o, "stop_loss")
+        elif _gapped(direction, o, take_profit, "take_profit"):
+            fill = (o, "take_profit")
+        else:
+            if index is not None:
+                fill = index.first_hit(bar, direction, stop_loss, take_profit)
+            if stats is not None:
+                stats["refined_bars" if fill is not None else "unresolved_bars"] += 1
+        if fill is None:
+            fill = _gap_fill(direction, o, stop_loss, "stop_loss")
+    elif sl_hit:
+        fill = _gap_fill(direction, o, stop_loss, "stop_loss")
+    else:
+        fill = _gap_fill(direction, o, take_profit, "take_profit")
+
+    if stats is not None:
+        stats["intrabar_exits"] += 1
+    return fill
@@ -0,0 +1,151 @@
+"""
+백테스트 거래 목록 몬테카를로 분석
+
+완료된 백테스트의 거래 순손익(pnl - fee)을 재표본(bootstrap) 또는 순서 섞기(shuffle)로
+수천 개의 경로를 만들어 수익률 / 최대 낙폭 분포와 파산 확률을 계산합니다.
+
+- 경로 묶음은 (경로 × 거래) 행렬 누적합으로 한 번에 계산 (numpy)
+- 전체 경로는 워커 수만큼 청크로 나눠 sweep_runner 프로세스 풀에서 병렬 실행
+- 청크별 시드는 SeedSequence.spawn()으로 분리 → seed 지정 시 재현 가능
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+MC_METHODS = ("bootstrap", "shuffle")
+PERCENTILES = (1, 5, 10, 25, 50, 75, 90, 95, 99)
+
+# 한 번에 만드는 (경로 × 거래) 행렬 원소 수 상한 (메모리 제한)
+_BLOCK_ELEMENTS = 2_000_000
+
+
+def simulate_paths(
+    pnls: np.ndarray,
+    initial_balance: float,
+    n_paths: int,
+    method: str = "bootstrap",
+    seed: Any = None,
+    ruin_level: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    경로 시뮬레이션 (워커 프로세스에서 호출)
+
+    Args:
+        pnls: 거래별 순손익
+        ruin_level: equity가 이 값 이하로 내려가면 파산으로 간주
+
+    Returns:
+        (total_return %, max_drawdown %, ruined bool) 경로별 배열
+    """
+    if method not in MC_METHODS:
+        raise ValueError(f"method must be one of: {', '.join(MC_METHODS)}")
+
+    pnls = np.asarray(pnls, dtype=np.float64)
+    n_trades = len(pnls)
+    rng = np.random.default_rng(seed)
+
+    total_return = np.empty(n_paths, dtype=np.float64)
+    max_drawdown = np.empty(n_paths, dtype=np.float64)
+    ruined = np.empty(n_paths, dtype=bool)
+
+    block = max(1, _BLOCK_ELEMENTS // max(n_trades, 1))
+    for start in range(0, n_paths, block):
+        rows = min(block, n_paths - start)
+        if method == "bootstrap":
+            sampled = pnls[rng.integers(0, n_trades, size=(rows, n_trades))]
+        else:
+            sampled = rng.permuted(np.broadcast_to(pnls, (rows, n_trades)), axis=1)
+
+        equity = np.cumsum(sampled, axis=1)
+        equity += initial_balance
+        peaks = np.maximum(np.maximum.accumulate(equity, axis=1), initial_balance)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdown = np.where(peaks > 0, (peaks - equity) / peaks, 0.0)
+
+        end = start + rows
+        total_return[start:end] = (equity[:, -1] - initial_balance) / initial_balance * 100
+        max_drawdown[start:end] = drawdown.max(axis=1) * 100
+        ruined[start:end] = equity.min(axis=1) <= ruin_level
+
+    return total_return, max_drawdown, ruined
+
+
+def _distribution(values: np.ndarray) -> Dict[str, float]:
+    percentiles = np.percentile(values, PERCENTILES)
+    summary = {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, percentiles)}
+    summary["mean"] = round(float(values.mean()), 2)
+    summary["std"] = round(float(values.std()), 2)
+    summary["min"] = round(float(values.min()), 2)
+    summary["max"] = round(float(values.max()), 2)
+    return summary
+
+
+async def run_monte_carlo(
+    pnls: Sequence[float],
+    initial_balance: float,
+    n_paths: int = 10_000,
+    method: str = "bootstrap",
+    seed: Optional[int] = None,
+    ruin_threshold: float = 0.5,
+) -> Dict[str, Any]:
+    """
+    몬테카를로 분석 실행
+
+    Args:
+        ruin_threshold: 초기 자본 대비 손실 비율 (0.5 → 자본 50% 이하로 떨어지면 파산)
+
+    Returns:
+        {
+            "paths", "method", "trades", "seed",
+            "total_return": 분포 (%), "max_drawdown": 분포 (%),
+            "probability_of_ruin", "probability_of_loss", "elapsed_seconds",
+        }
+    """
+    from .backtest_sweep import sweep_runner
+
+    started = time.monotonic()
+    if method not in MC_METHODS:
+        raise ValueError(f"method must be one of: {', '.join(MC_METHODS)}")
+    if not 0 < ruin_threshold <= 1:
+        raise ValueError("ruin_threshold must be in (0, 1]")
+
+    pnls = np.asarray(pnls, dtype=np.float64)
+    if len(pnls) < 2:
+        raise ValueError("At least 2 trades are required for Monte Carlo analysis")
+
+    ruin_level = initial_balance * (1 - ruin_threshold)
+
+    # 워커 수만큼 청크 분할, 청크별 독립 시드
+    chunks = min(sweep_runner.max_workers, n_paths)
+    sizes = [n_paths // chunks + (1 if i < n_paths % chunks else 0) for i in range(chunks)]
+    seed_seq = np.random.SeedSequence(seed)
+    child_seeds = seed_seq.spawn(chunks)
+
+    results = await asyncio.gather(
+        *(
+            sweep_runner.run_in_pool(
+                simulate_paths, pnls, initial_balance, size, method, child, ruin_level
+            )
+            for size, child in zip(sizes, child_seeds)
+        )
+    )
+
+    total_return = np.concatenate([r[0] for r in results])
+    max_drawdown = np.concatenate([r[1] for r in results])
+    ruined = np.concatenate([r[2] for r in results])
+
+    return {
+        "paths": int(n_paths),
+        "method": method,
+        "trades": int(len(pnls)),
+        "seed": seed_seq.entropy if seed is None else seed,
+        "ruin_threshold": ruin_threshold,
+        "total_return": _distribution(total_return),
+        "max_drawdown": _distribution(max_drawdown),
+        "probability_of_ruin": round(float(ruined.mean()) * 100, 2),
+        "probability_of_loss": round(float((total_return < 0).mean()) * 100, 2),
+        "elapsed_seconds": round(time.monotonic() - started, 3),
+    }
@@ -0,0 +1,259 @@
+"""
+성과 지표 계산 (numpy 배열 기반)
+
+백테스트(BacktestMetricsCalculator), 백테스트 작업 결과, 실거래 분석
+(/analytics/risk-metrics)이 모두 이 모듈을 사용하여 같은 공식으로 계산합니다.
+
+- 입력은 equity 곡선 / 손익 배열 (list 또는 np.ndarray)
+- 파이썬 루프 없이 누적 연산(np.maximum.accumulate 등)으로 계산
+- 수익률 관련 값은 비율(0.05 = 5%)로 반환, 표시용 % 변환은 호출 측에서 처리
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+# 연간화 기본값 (주기를 알 수 없을 때)
+DEFAULT_PERIODS_PER_YEAR = 252
+
+# 타임프레임 → 연간 캔들 수 (암호화폐 24/7 기준)
+TIMEFRAME_PERIODS_PER_YEAR = {
+    "1m": 525_600,
+    "3m": 175_200,
+    "5m": 105_120,
+    "15m": 35_040,
+    "30m": 17_520,
+    "1h": 8_760,
+    "2h": 4_380,
+    "4h": 2_190,
+    "6h": 1_460,
+    "12h": 730,
+    "1d": 365,
+    "1w": 52,
+}
+
+
+def periods_per_year(timeframe: Optional[str]) -> int:
+    """타임프레임별 연간화 계수 (알 수 없으면 DEFAULT_PERIODS_PER_YEAR)"""
+    if not timeframe:
+        return DEFAULT_PERIODS_PER_YEAR
+    return TIMEFRAME_PERIODS_PER_YEAR.get(timeframe.lower(), DEFAULT_PERIODS_PER_YEAR)
+
+
+def _as_array(values: Sequence[float]) -> np.ndarray:
+    array = np.asarray(values, dtype=np.float64).ravel()
+    return array[np.isfinite(array)]
+
+
+def simple_returns(equity: Sequence[float]) -> np.ndarray:
+    """기간 수익률 (이전 값이 0 이하인 구간은 제외)"""
+    curve = _as_array(equity)
+    if len(curve) < 2:
+        return np.empty(0, dtype=np.float64)
+    prev = curve[:-1]
+    valid = prev > 0
+    return (curve[1:][valid] - prev[valid]) / prev[valid]
+
+
+def drawdown_series(equity: Sequence[float], initial: Optional[float] = None) -> np.ndarray:
+    """각 시점의 낙폭 비율 (고점 대비, 0 이상)"""
+    curve = _as_array(equity)
+    if not len(curve):
+        return np.empty(0, dtype=np.float64)
+    peaks = np.maximum.accumulate(curve)
+    if initial is not None:
+        peaks = np.maximum(peaks, float(initial))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = np.where(peaks > 0, (peaks - curve) / peaks, 0.0)
+    return drawdown
+
+
+@dataclass
+class DrawdownStats:
+    max_drawdown: float = 0.0  # 최대 낙폭 비율
+    peak_index: int = 0  # 최대 낙폭 직전 고점 인덱스
+    trough_index: int = 0  # 최대 낙폭 저점 인덱스
+    max_duration: int = 0  # 가장 긴 수중(고점 미회복) 구간 길이 (캔들 수)
+
+
+def max_drawdown(equity: Sequence[float], initial: Optional[float] = None) -> DrawdownStats:
+    """최대 낙폭과 기간"""
+    drawdown = drawdown_series(equity, initial)
+    if not len(drawdown) or not drawdown.any():
+        return DrawdownStats()
+
+    trough = int(np.argmax(drawdown))
+    # 저점 이전 마지막 무낙폭 시점 = 고점
+    at_peak = np.flatnonzero(drawdown[: trough + 1] == 0)
+    peak = int(at_peak[-1]) if len(at_peak) else 0
+
+    # 수중 구간 길이: 낙폭 > 0 연속 구간의 최대 길이
+    underwater = np.concatenate(([0], (drawdown > 0).astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(underwater))
+    duration = int((edges[1::2] - edges[::2]).max()) if len(edges) else 0
+
+    return DrawdownStats(
+        max_drawdown=float(drawdown[trough]),
+        peak_index=peak,
+        trough_index=trough,
+        max_duration=duration,
+    )
+
+
+def volatility(returns: Sequence[float], periods: int = 1) -> float:
+    """수익률 표준편차 (periods > 1이면 연간화)"""
+    r = _as_array(returns)
+    if len(r) < 2:
+        return 0.0
+    return float(np.std(r) * np.sqrt(periods))
+
+
+def sharpe_ratio(returns: Sequence[float], periods: int = DEFAULT_PERIODS_PER_YEAR) -> float:
+    """연간화 샤프 비율 (무위험 수익률 0)"""
+    r = _as_array(returns)
+    if len(r) < 2:
+        return 0.0
+    std = np.std(r)
+    if std == 0:
+        return 0.0
+    return float(np.mean(r) / std * np.sqrt(periods))
+
+
+def sortino_ratio(returns: Sequence[float], periods: int = DEFAULT_PERIODS_PER_YEAR) -> float:
+    """연간화 소르티노 비율 (하방 편차 기준)"""
+    r = _as_array(returns)
+    if len(r) < 2:
+        return 0.0
+    downside = np.sqrt(np.mean(np.minimum(r, 0.0) ** 2))
+    if downside == 0:
+        return 0.0
+    return float(np.mean(r) / downside * np.sqrt(periods))
+
+
+def annualized_return(equity: Sequence[float], periods: int = DEFAULT_PERIODS_PER_YEAR) -> float:
+    """
+    연 환산 수익률 (기하)
+
+    1년 미만 구간은 외삽하지 않고 구간 수익률 그대로 반환합니다.
+    (짧은 구간을 복리로 연간화하면 값이 비현실적으로 커짐)
+    """
+    curve = _as_array(equity)
+    if len(curve) < 2 or curve[0] <= 0 or curve[-1] <= 0:
+        return 0.0
+    years = max((len(curve) - 1) / periods, 1.0)
+    return float((curve[-1] / curve[0]) ** (1 / years) - 1)
+
+
+def calmar_ratio(
+    equity: Sequence[float],
+    periods: int = DEFAULT_PERIODS_PER_YEAR,
+    drawdown: Optional[DrawdownStats] = None,
+) -> float:
+    """칼마 비율 (연 환산 수익률 / 최대 낙폭)"""
+    drawdown = drawdown or max_drawdown(equity)
+    if drawdown.max_drawdown == 0:
+        return 0.0
+    return annualized_return(equity, periods) / drawdown.max_drawdown
+
+
+@dataclass
+class TradeStats:
+    total_trades: int = 0  # 손익이 0이 아닌 거래 수
+    wins: int = 0
+    losses: int = 0
+    win_rate: float = 0.0  # 비율
+    total_profit: float = 0.0
+    total_loss: float = 0.0  # 양수
+    profit_factor: float = 0.0
+    avg_win: float = 0.0
+    avg_loss: float = 0.0  # 양수
+
+
+def trade_stats(pnls: Sequence[float]) -> TradeStats:
+    """거래 손익 배열 통계"""
+    pnl = _as_array(pnls)
+    gains = pnl[pnl > 0]
+    drops = -pnl[pnl < 0]
+    wins, losses = len(gains), len(drops)
+    total = wins + losses
+    total_profit = float(gains.sum())
+    total_loss = float(drops.sum())
+
+    if total_loss > 0:
+        profit_factor = total_profit / total_loss
+    else:
+        profit_factor = total_profit if total_profit > 0 else 0.0
+
+    return TradeStats(
+        total_trades=total,
+        wins=wins,
+        losses=losses,
+        win_rate=wins / total if total else 0.0,
+        total_profit=total_profit,
+        total_loss=total_loss,
+        profit_factor=profit_factor,
+        avg_win=total_profit / wins if wins else 0.0,
+        avg_loss=total_loss / losses if losses else 0.0,
+    )
+
+
+def exposure(bars_in_position: int, total_bars: int) -> float:
+    """포지션 보유 캔들 비율"""
+    return bars_in_position / total_bars if total_bars > 0 else 0.0
+
+
+def rolling_sharpe(
+    returns: Sequence[float], window: int, periods: int = DEFAULT_PERIODS_PER_YEAR
+) -> np.ndarray:
+    """
+    롤링 샤프 비율 (길이 len(returns) - window + 1)
+
+    누적합으로 구간 평균/분산을 O(n)에 계산합니다.
+    """
+    r = _as_array(returns)
+    if window < 2 or len(r) < window:
+        return np.empty(0, dtype=np.float64)
+    csum = np.concatenate(([0.0], np.cumsum(r)))
+    csum_sq = np.concatenate(([0.0], np.cumsum(r * r)))
+    mean = (csum[window:] - csum[:-window]) / window
+    var = np.maximum((csum_sq[window:] - csum_sq[:-window]) / window - mean * mean, 0.0)
+    std = np.sqrt(var)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(std > 1e-12, mean / std * np.sqrt(periods), 0.0)
+    return ratio
+
+
+def rolling_volatility(
+    returns: Sequence[float], window: int, periods: int = 1
+) -> np.ndarray:
+    """롤링 변동성 (길이 len(returns) - window + 1)"""
+    r = _as_array(returns)
+    if window < 2 or len(r) < window:
+        return np.empty(0, dtype=np.float64)
+    csum = np.concatenate(([0.0], np.cumsum(r)))
+    csum_sq = np.concatenate(([0.0], np.cumsum(r * r)))
+    mean = (csum[window:] - csum[:-window]) / window
+    var = np.maximum((csum_sq[window:] - csum_sq[:-window]) / window - mean * mean, 0.0)
+    return np.sqrt(var) * np.sqrt(periods)
+
+
+def rolling_max_drawdown(equity: Sequence[float], window: int) -> np.ndarray:
+    """
+    롤링 최대 낙폭 비율 (각 윈도우 내부 고점 기준, 길이 len(equity) - window + 1)
+
+    윈도우 view를 행 블록 단위로 처리하여 메모리를 window × 블록 크기로 제한합니다.
+    """
+    curve = _as_array(equity)
+    if window < 2 or len(curve) < window:
+        return np.empty(0, dtype=np.float64)
+    windows = np.lib.stride_tricks.sliding_window_view(curve, window)
+    result = np.empty(len(windows), dtype=np.float64)
+    block = max(1, 1_000_000 // window)
+    for start in range(0, len(windows), block):
+        chunk = windows[start:start + block]
+        peaks = np.maximum.accumulate(chunk, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdown = np.where(peaks > 0, (peaks - chunk) / peaks, 0.0)
+        result[start:start + block] = drawdown.max(axis=1)
+    return result
@@ -0,0 +1,309 @@
+"""
+멀티 심볼 포트폴리오 백테스트
+
+여러 (symbol, timeframe) 캔들 배열을 하나의 시계열(clock)로 정렬하고,
+심볼별 전략 인스턴스가 공유 자본과 최대 동시 포지션 수(RiskSettings.max_positions)
+제약 아래에서 거래하는 포트폴리오를 시뮬레이션합니다.
+
+- 정렬: 각 캔들은 마감 시각(timestamp + 타임프레임)에 확정되므로 마감 시각의
+  합집합을 clock으로 사용 (상위 타임프레임 캔들이 미래 정보를 미리 쓰지 않음)
+- 신호: 전략의 signal_vectors() (벡터화 엔진과 같은 flat/long/short 신호 배열)
+- 시뮬레이션: 신호가 있는 (clock, 심볼) 이벤트만 순서대로 방문하고,
+  equity 곡선은 포지션 보유 구간별 배열 연산으로 채움
+- 같은 시각에는 청산을 먼저 처리한 뒤 진입 (청산으로 확보한 자본/슬롯 재사용)
+- 포지션 크기: 진입 시점 포트폴리오 equity / max_positions (가용 현금 한도 내)
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config import BacktestConfig
+from .backtest_metrics import BacktestMetricsCalculator
+from .candle_arrays import CandleArrays, timeframe_ms
+from .strategies.registry import get_strategy
+
+logger = logging.getLogger(__name__)
+
+# (symbol, timeframe, candles)
+PortfolioLeg = Tuple[str, str, CandleArrays]
+
+
+def align_legs(legs: Sequence[PortfolioLeg]) -> Tuple[np.ndarray, List[np.ndarray], List[np.ndarray]]:
+    """
+    캔들 마감 시각 기준 clock 생성
+
+    Returns:
+        (clock, bar_at, close_at)
+        - clock: 정렬된 마감 시각(ms) 배열
+        - bar_at[k]: clock 각 시점에 심볼 k의 마지막 확정 캔들 인덱스 (없으면 -1)
+        - close_at[k]: 심볼 k 캔들 i가 확정되는 clock 인덱스
+    """
+    close_times = [
+        candles.timestamp.astype(np.int64) + timeframe_ms(timeframe)
+        for _, timeframe, candles in legs
+    ]
+    clock = np.unique(np.concatenate(close_times)) if close_times else np.empty(0, np.int64)
+
+    bar_at = [np.searchsorted(ct, clock, side="right") - 1 for ct in close_times]
+    close_at = [np.searchsorted(clock, ct) for ct in close_times]
+    return clock, bar_at, close_at
+
+
+def _leg_signals(strategy_code: str, strategy_params: Dict[str, Any], candles: CandleArrays):
+    strategy = get_strategy(strategy_code, dict(strategy_params))
+    signals = strategy.signal_vectors(candles) if len(candles) else None
+    if signals is None:
+        raise ValueError(
+            f"Strategy '{strategy_code}' does not support vectorized signals "
+            "required for portfolio backtests"
+        )
+    flat, long_, short = (np.asarray(s, dtype=np.int8).copy() for s in signals)
+
+    # 루프 엔진과 동일하게 close <= 0 캔들은 거래하지 않음
+    invalid = ~(candles.close > 0)
+    flat[invalid] = 0
+    long_[invalid] = 0
+    short[invalid] = 0
+    return flat, long_, short
+
+
+def run_portfolio_backtest(
+    legs: Sequence[PortfolioLeg],
+    strategy_code: str,
+    strategy_params: Optional[Dict[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    포트폴리오 백테스트 실행 (동기, 워커 프로세스에서 호출 가능)
+
+    params:
+        initial_balance, fee_rate, slippage, max_positions
+
+    Returns:
+        {
+            "final_balance", "equity_curve", "timestamps" (clock, ms),
+            "trades" (symbol 포함), "metrics", "attribution" {symbol: {...}},
+            "max_positions", "max_concurrent_positions", "elapsed_seconds",
+        }
+    """
+    started = time.monotonic()
+    params = params or {}
+    strategy_params = strategy_params or {}
+    if not legs:
+        raise ValueError("At least one symbol is required")
+
+    initial_balance = float(
+        params.get("initial_balance", BacktestConfig.DEFAULT_INITIAL_BALANCE)
+    )
+    fee_rate = float(params.get("fee_rate", BacktestConfig.DEFAULT_FEE_RATE))
+    slippage = float(params.get("slippage", BacktestConfig.DEFAULT_SLIPPAGE))
+    max_positions = int(params.get("max_positions", 5))
+    if max_positions < 1:
+        raise ValueError("max_positions must be at least 1")
+
+    symbols = [symbol for symbol, _, _ in legs]
+    clock, bar_at, close_at = align_legs(legs)
+    n_ticks = len(clock)
+
+    # 심볼별 신호 / 종가 (이벤트 루프에서는 파이썬 리스트로 접근)
+    closes = [candles.close.tolist() for _, _, candles in legs]
+    bar_timestamps = [candles.timestamp.tolist() for _, _, candles in legs]
+    signals = []
+    event_ticks = []
+    event_legs = []
+    for k, (_, _, candles) in enumerate(legs):
+        flat, long_, short = _leg_signals(strategy_code, strategy_params, candles)
+        signals.append((flat.tolist(), long_.tolist(), short.tolist()))
+        bars = np.flatnonzero((flat != 0) | (long_ < 0) | (short > 0))
+        event_ticks.append(close_at[k][bars])
+        event_legs.append(np.full(len(bars), k, dtype=np.int64))
+
+    ticks = np.concatenate(event_ticks) if event_ticks else np.empty(0, np.int64)
+    leg_ids = np.concatenate(event_legs) if event_legs else np.empty(0, np.int64)
+    order = np.lexsort((leg_ids, ticks))
+    ticks = ticks[order].tolist()
+    leg_ids = leg_ids[order].tolist()
+
+    bar_at_lists = [b.tolist() for b in bar_at]
+
+    # 상태
+    cash = initial_balance
+    positions: Dict[int, dict] = {}  # leg -> 포지션
+    spans: List[Tuple[int, int, int, str, float, float]] = []  # (leg, a, b, dir, qty, entry)
+    cash_ticks: List[int] = []
+    cash_values: List[float] = []
+    trades: List[dict] = []
+
+    def mark_value(position: dict, price: float) -> float:
+        if position["direction"] == "long":
+            return position["qty"] * price
+        return position["qty"] * (2 * position["entry_price"] - price)
+
+    def close_position(k: int, bar: int, price: float, exit_tick: int):
+        nonlocal cash
+        position = positions.pop(k)
+        qty = position["qty"]
+        entry_price = position["entry_price"]
+        if position["direction"] == "long":
+            exit_price = price * (1 - slippage)
+            pnl = (exit_price - entry_price) * qty
+        else:
+            exit_price = price * (1 + slippage)
+            pnl = (entry_price - exit_price) * qty
+        exit_fee = exit_price * qty * fee_rate
+        cash += qty * entry_price + pnl - exit_fee
+
+        spans.append((k, position["tick"], exit_tick, position["direction"], qty, entry_price))
+        trades.append(
+            {
+                "symbol": symbols[k],
+                "timestamp": bar_timestamps[k][bar],
+                "side": "exit",
+                "direction": position["direction"],
+                "entry_price": entry_price,
+                "exit_price": exit_price,
+                "qty": qty,
+                "fee": position["entry_fee"] + exit_fee,
+                "pnl": pnl,
+            }
+        )
+
+    i = 0
+    n_events = len(ticks)
+    while i < n_events:
+        tick = ticks[i]
+        j = i
+        while j < n_events and ticks[j] == tick:
+            j += 1
+        group = leg_ids[i:j]
+        i = j
+
+        # 1) 청산
+        exited = set()
+        for k in group:
+            position = positions.get(k)
+            if position is None:
+                continue
+            bar = bar_at_lists[k][tick]
+            _, long_sig, short_sig = signals[k]
+            if (position["direction"] == "long" and long_sig[bar] < 0) or (
+                position["direction"] == "short" and short_sig[bar] > 0
+            ):
+                close_position(k, bar, closes[k][bar], tick)
+                exited.add(k)
+
+        # 2) 진입 (슬롯 / 현금 한도)
+        for k in group:
+            if k in positions or k in exited or len(positions) >= max_positions:
+                continue
+            bar = bar_at_lists[k][tick]
+            flat_sig = signals[k][0][bar]
+            if flat_sig == 0:
+                continue
+
+            equity = cash
+            for other, position in positions.items():
+                equity += mark_value(position, closes[other][bar_at_lists[other][tick]])
+            c = closes[k][bar]
+            entry_price = c * (1 + slippage) if flat_sig > 0 else c * (1 - slippage)
+            allocation = min(equity / max_positions, cash)
+            qty = allocation / (entry_price * (1 + fee_rate))
+            if qty <= 0:
+                continue
+
+            entry_fee = entry_price * qty * fee_rate
+            cash -= qty * entry_price + entry_fee
+            positions[k] = {
+                "direction": "long" if flat_sig > 0 else "short",
+                "qty": qty,
+                "entry_price": entry_price,
+                "entry_fee": entry_fee,
+                "tick": tick,
+            }
+
+        cash_ticks.append(tick)
+        cash_values.append(cash)
+
+    # 3) 남은 포지션은 각 심볼 마지막 종가로 자동 청산 (equity 마지막 점 추가)
+    auto_closed = bool(positions)
+    for k in list(positions):
+        bar = len(closes[k]) - 1
+        close_position(k, bar, closes[k][bar], n_ticks)
+
+    # 4) equity 곡선: 현금(계단 함수) + 보유 구간별 평가액
+    cash_curve = np.full(n_ticks, initial_balance, dtype=np.float64)
+    if cash_ticks:
+        change_ticks = np.asarray(cash_ticks, dtype=np.int64)
+        index = np.searchsorted(change_ticks, np.arange(n_ticks), side="right") - 1
+        has_change = index >= 0
+        cash_curve[has_change] = np.asarray(cash_values)[index[has_change]]
+
+    equity_curve = cash_curve
+    open_count = np.zeros(n_ticks + 1, dtype=np.int64)
+    leg_ticks_held = np.zeros(len(legs), dtype=np.int64)
+    prices_on_clock: Dict[int, np.ndarray] = {}
+
+    for k, a, b, direction, qty, entry_price in spans:
+        prices = prices_on_clock.get(k)
+        if prices is None:
+            prices = legs[k][2].close[np.maximum(bar_at[k], 0)]
+            prices_on_clock[k] = prices
+        held = prices[a:b]
+        if direction == "long":
+            equity_curve[a:b] += qty * held
+        else:
+            equity_curve[a:b] += qty * (2 * entry_price - held)
+        open_count[a] += 1
+        open_count[b] -= 1
+        leg_ticks_held[k] += b - a
+
+    open_count = np.cumsum(open_count[:n_ticks])
+    equity_list = equity_curve.tolist()
+    if auto_closed:
+        equity_list.append(cash)
+
+    # 5) 메트릭 / 심볼별 기여도
+    timeframes = {timeframe for _, timeframe, _ in legs}
+    calculator = BacktestMetricsCalculator()
+    calculator.compute(
+        trades,
+        equity_list,
+        initial_balance,
+        timeframe=timeframes.pop() if len(timeframes) == 1 else None,
+        bars_in_position=int(np.count_nonzero(open_count)),
+    )
+
+    attribution = {}
+    for k, symbol in enumerate(symbols):
+        leg_trades = [t for t in trades if t["symbol"] == symbol]
+        pnl = sum(t["pnl"] for t in leg_trades)
+        fees = sum(t["fee"] for t in leg_trades)
+        wins = sum(1 for t in leg_trades if t["pnl"] > 0)
+        attribution[symbol] = {
+            "timeframe": legs[k][1],
+            "candles": len(legs[k][2]),
+            "trades": len(leg_trades),
+            "win_rate": round(wins / len(leg_trades) * 100, 2) if leg_trades else 0.0,
+            "gross_pnl": round(pnl, 4),
+            "fees": round(fees, 4),
+            "net_pnl": round(pnl - fees, 4),
+            # 초기 자본 대비 기여 수익률 (합계 = 포트폴리오 총 수익률)
+            "return_contribution": round((pnl - fees) / initial_balance * 100, 2),
+            "exposure": round(int(leg_ticks_held[k]) / n_ticks * 100, 2) if n_ticks else 0.0,
+        }
+
+    return {
+        "symbols": symbols,
+        "final_balance": float(cash),
+        "equity_curve": equity_list,
+        "timestamps": clock.tolist(),
+        "trades": trades,
+        "metrics": calculator.summary(),
+        "attribution": attribution,
+        "max_positions": max_positions,
+        "max_concurrent_positions": int(open_count.max()) if n_ticks else 0,
+        "elapsed_seconds": round(time.monotonic() - started, 3),
+    }
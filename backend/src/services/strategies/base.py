@@ -1,3 +1,16 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+# 벡터화 모드 신호 값 (int8)
+SIGNAL_BUY = 1
+SIGNAL_SELL = -1
+SIGNAL_HOLD = 0
+
+# (flat, long, short) 포지션 상태별 신호 벡터
+SignalVectors = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
 class StrategyBase:
     """
     Base strategy interface.
@@ -7,7 +20,41 @@ class StrategyBase:
         - "buy"
         - "sell"
         - "hold"
+
+    Strategies whose signal depends on the position only through its
+    direction may also implement signal_vectors() for the vectorized
+    BacktestEngine mode.
     """
 
+    def prepare(self, candles) -> None:
+        """
+        Optional hook called once by the loop engine before the first
+        on_candle(), with the full CandleArrays series. Strategies can
+        precompute full-series indicators here and index them per bar.
+        """
+        return None
+
     def on_candle(self, candle: dict, position: dict | None) -> str:
         raise NotImplementedError("Strategy must implement on_candle()")
+
+    def exit_levels(self, position: dict) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Optional: (stop_loss, take_profit) prices of the open position.
+
+        Used by the "intrabar" fill model of BacktestEngine, which fills
+        these levels inside the bar (high/low, refined with 1m candles)
+        instead of waiting for a close-based exit signal.
+        """
+        return None, None
+
+    def signal_vectors(self, candles) -> Optional[SignalVectors]:
+        """
+        Optional: full-series signals for the vectorized engine mode.
+
+        Returns (flat, long, short) int8 arrays, one value per candle,
+        holding what on_candle() would return on that bar when flat /
+        in a long / in a short position (SIGNAL_BUY, SIGNAL_SELL,
+        SIGNAL_HOLD). Must be computed from a fresh strategy state and
+        must not mutate the strategy. Return None to use the loop engine.
+        """
+        return None
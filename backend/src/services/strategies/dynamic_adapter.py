@@ -0,0 +1,227 @@
+"""
+DynamicStrategyExecutor 전략(proven_*) 백테스트 어댑터
+
+라이브 봇이 실행하는 동적 전략 코드를 BacktestEngine에서 그대로 돌립니다.
+
+- 매 캔들마다 check_entry_signal()에 전체 리스트를 새로 만들어 넘기면
+  O(n × window)이므로, 캔들 배열 위의 슬라이딩 윈도우 view(CandleWindow)를 전달
+- 전략 코드가 호출하는 calculate_* 지표 함수는 전체 시리즈에 대해 한 번만
+  계산하고, 각 캔들에서는 해당 윈도우 구간만 잘라서 반환
+- 라이브 봇과 같은 크기(200개)의 윈도우를 사용하므로 길이 조건/거래량 평균 등
+  윈도우 기반 로직은 동일하게 동작 (지표는 전체 시리즈 기준 값 → 시드 구간 차이 없음)
+- 전략이 generate_signals(arrays, params)를 구현했으면 진입 신호는 prepare()에서
+  전체 시리즈로 한 번에 계산하고, 캔들마다 check_entry_signal을 호출하지 않음
+"""
+
+import json
+import logging
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from ..candle_arrays import CANDLE_FIELDS, CandleArrays
+from .base import StrategyBase
+
+logger = logging.getLogger(__name__)
+
+# bot_runner 캔들 버퍼 크기와 동일
+DEFAULT_WINDOW_SIZE = 200
+
+# 지표 함수 → 결과 길이 보정 (calculate_rsi는 len(candles) - 1 개 반환)
+INDICATOR_OFFSETS = {
+    "calculate_rsi": 1,
+    "calculate_ema": 0,
+    "calculate_sma": 0,
+    "calculate_macd": 0,
+    "calculate_bollinger_bands": 0,
+    "calculate_atr": 0,
+    "calculate_adx": 0,
+}
+
+# generate_signals 벡터 코드 → check_entry_signal 반환값
+_ENTRY_SIGNALS = {1: "LONG", -1: "SHORT", 0: None}
+
+DYNAMIC_STRATEGY_CODES = ("proven_conservative", "proven_balanced", "proven_aggressive")
+
+
+class CandleWindow:
+    """
+    캔들 컬럼 리스트 위의 [start, end) 구간 view
+
+    전략 코드가 사용하는 list 연산(len, 음수 인덱스, 슬라이스, 순회)을 지원하며
+    개별 캔들은 접근 시점에 dict로 만들어 반환합니다.
+    """
+
+    __slots__ = ("columns", "start", "end")
+
+    def __init__(self, columns: tuple, start: int, end: int):
+        self.columns = columns
+        self.start = start
+        self.end = end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def _candle(self, index: int) -> Dict[str, Any]:
+        return {field: column[index] for field, column in zip(CANDLE_FIELDS, self.columns)}
+
+    def __getitem__(self, key):
+        length = self.end - self.start
+        if isinstance(key, slice):
+            start, stop, step = key.indices(length)
+            if step != 1:
+                return [self._candle(self.start + i) for i in range(start, stop, step)]
+            return CandleWindow(self.columns, self.start + start, self.start + max(start, stop))
+
+        if key < 0:
+            key += length
+        if key < 0 or key >= length:
+            raise IndexError("candle window index out of range")
+        return self._candle(self.start + key)
+
+    def __iter__(self):
+        for i in range(self.start, self.end):
+            yield self._candle(i)
+
+    def column(self, field: str) -> np.ndarray:
+        """한 컬럼을 float 배열로 (지표 함수 입력용)"""
+        values = self.columns[CANDLE_FIELDS.index(field)]
+        return np.asarray(values[self.start:self.end], dtype=np.float64)
+
+
+class IndicatorSeriesMemo:
+    """
+    calculate_* 함수 래퍼: 전체 시리즈 결과를 (함수, 인자)별로 캐시하고
+    CandleWindow 구간에 해당하는 부분만 잘라서 반환
+    """
+
+    def __init__(self, series: CandleWindow):
+        self.series = series
+        self._cache: Dict[tuple, Any] = {}
+
+    def wrap(self, name: str, func):
+        offset = INDICATOR_OFFSETS[name]
+
+        def indicator(candles, *args, **kwargs):
+            if not isinstance(candles, CandleWindow) or candles.columns is not self.series.columns:
+                return func(candles, *args, **kwargs)
+
+            key = (name, args, tuple(sorted(kwargs.items())))
+            full = self._cache.get(key)
+            if full is None:
+                full = func(self.series, *args, **kwargs)
+                if isinstance(full, tuple):
+                    full = tuple(np.asarray(part, dtype=np.float64) for part in full)
+                else:
+                    full = np.asarray(full, dtype=np.float64)
+                self._cache[key] = full
+
+            start = candles.start
+            end = max(start, candles.end - offset)
+            if isinstance(full, tuple):
+                return tuple(part[start:end] for part in full)
+            return full[start:end]
+
+        return indicator
+
+
+class DynamicStrategyAdapter(StrategyBase):
+    """
+    DynamicStrategyExecutor → StrategyBase 어댑터
+
+    - 진입: check_entry_signal LONG/SHORT → buy/sell
+      (generate_signals 구현 시 prepare()에서 계산한 진입 신호 벡터 사용)
+      (손절/익절 가격은 진입 시점 신호에서 받아 보관)
+    - 청산: 손절/익절/should_partial_exit 충족 시 반대 방향 신호로 청산
+      (fill_model="intrabar"이면 손절/익절은 exit_levels()로 엔진이 캔들 내부 체결)
+    """
+
+    def __init__(
+        self,
+        strategy_code: str,
+        params: Optional[Dict[str, Any]] = None,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+    ):
+        from ..strategy_loader import load_strategy_class
+
+        self.strategy_code = strategy_code
+        self.params = params or {}
+        self.window_size = window_size
+
+        self.executor = load_strategy_class(strategy_code, json.dumps(self.params))
+        if self.executor is None:
+            raise ValueError(f"Unknown strategy: {strategy_code}")
+
+        self._series: Optional[CandleWindow] = None
+        self._entry_signals: Optional[list] = None
+        self._bar_index = None
+        self._step = 0
+        self._stop_loss = None
+        self._take_profit = None
+
+    def prepare(self, candles: CandleArrays) -> None:
+        """전체 시리즈 등록 및 지표 함수 교체"""
+        columns = tuple(getattr(candles, field).tolist() for field in CANDLE_FIELDS)
+        self._series = CandleWindow(columns, 0, len(candles))
+
+        # 엔진 루프는 close <= 0 캔들만 건너뛰므로(NaN 종가는 on_candle 호출) 실제 호출 순서 → 캔들 인덱스 매핑
+        self._bar_index = np.flatnonzero(~(candles.close <= 0)).tolist()
+        self._step = 0
+        self._stop_loss = None
+        self._take_profit = None
+
+        memo = IndicatorSeriesMemo(self._series)
+        namespace = self.executor.namespace
+        for name in INDICATOR_OFFSETS:
+            func = getattr(self.executor, f"_{name}")
+            namespace[name] = memo.wrap(name, func)
+
+        entries = self.executor.batch_signals(candles)
+        self._entry_signals = (
+            [_ENTRY_SIGNALS[code] for code in entries.tolist()] if entries is not None else None
+        )
+
+    def on_candle(self, candle: dict, position: dict | None) -> str:
+        if self._series is None:
+            raise RuntimeError("DynamicStrategyAdapter.prepare() must be called first")
+
+        index = self._bar_index[self._step]
+        self._step += 1
+
+        window = CandleWindow(
+            self._series.columns, max(0, index + 1 - self.window_size), index + 1
+        )
+        price = candle["close"]
+
+        if position is None:
+            self._stop_loss = None
+            self._take_profit = None
+            if self._entry_signals is not None:
+                signal = self.executor.resolve_signal(self._entry_signals[index], price, window)
+            else:
+                signal = self.executor.generate_signal(price, window, None)
+            action = signal.get("action")
+            if action in ("buy", "sell"):
+                self._stop_loss = signal.get("stop_loss")
+                self._take_profit = signal.get("take_profit")
+                return action
+            return "hold"
+
+        side = "LONG" if position["direction"] == "long" else "SHORT"
+        executor_position = {
+            "side": side,
+            "entry_price": position["entry_price"],
+            "stop_loss": self._stop_loss,
+            "take_profit": self._take_profit,
+        }
+        if self._entry_signals is not None:
+            signal = self.executor.resolve_signal(None, price, window, executor_position)
+        else:
+            signal = self.executor.generate_signal(price, window, executor_position)
+        if signal.get("action") == "close":
+            return "sell" if side == "LONG" else "buy"
+        return "hold"
+
+    def exit_levels(self, position: dict):
+        """진입 신호에서 받은 손절/익절 가격"""
+        return self._stop_loss, self._take_profit
@@ -1,4 +1,7 @@
-from .base import StrategyBase
+import numpy as np
+
+from ... import indicators
+from .base import SIGNAL_BUY, SIGNAL_SELL, StrategyBase
 
 
 class EmaStrategy(StrategyBase):
@@ -25,43 +28,54 @@ class EmaStrategy(StrategyBase):
         self.fast_length = fast_length
         self.slow_length = slow_length
 
-        self.closes: list[float] = []
         self.fast_ema: float | None = None
         self.slow_ema: float | None = None
         self.prev_fast_ema: float | None = None
         self.prev_slow_ema: float | None = None
 
-        # EMA multiplier: 2 / (period + 1)
-        self.fast_multiplier = 2.0 / (fast_length + 1)
-        self.slow_multiplier = 2.0 / (slow_length + 1)
+        # 스트리밍 상태 (둘 다 slow_length번째 캔들에서 SMA로 시드)
+        self._fast = indicators.EMA(fast_length, start=slow_length - 1)
+        self._slow = indicators.EMA(slow_length)
+
+        # prepare()로 계산한 전체 시리즈 (fast, slow)
+        self._series: tuple[list, list] | None = None
+        self._step = 0
+
+    def _emas(self, closes) -> tuple[np.ndarray, np.ndarray]:
+        """전체 시리즈 (fast, slow) EMA, 워밍업 구간은 NaN"""
+        fast = indicators.ema(closes, self.fast_length, start=self.slow_length - 1)
+        slow = indicators.ema(closes, self.slow_length)
+        return fast, slow
+
+    def prepare(self, candles) -> None:
+        # 엔진 루프는 close <= 0 캔들을 건너뛰므로 실제 호출되는 캔들만으로 계산
+        closes = candles.close[~(candles.close <= 0)]
+        fast, slow = self._emas(closes)
+        self._series = (fast.tolist(), slow.tolist())
+        self._step = 0
 
     def _update_ema(self, close: float) -> tuple[float | None, float | None]:
         """
         Update both EMAs and return (fast_ema, slow_ema).
         Returns (None, None) if not enough data yet.
         """
-        self.closes.append(close)
+        if self._series is not None:
+            fast = self._series[0][self._step]
+            slow = self._series[1][self._step]
+            if fast != fast or slow != slow:  # NaN (워밍업)
+                fast = slow = None
+        else:
+            fast = self._fast.update(close)
+            slow = self._slow.update(close)
+        self._step += 1
 
-        # Need at least slow_length data points to start
-        if len(self.closes) < self.slow_length:
+        if fast is None or slow is None:
             return None, None
 
-        # Initialize EMAs with SMA on first calculation
-        if self.fast_ema is None or self.slow_ema is None:
-            # Fast EMA initialization
-            fast_sma = sum(self.closes[-self.fast_length:]) / self.fast_length
-            self.fast_ema = fast_sma
-
-            # Slow EMA initialization
-            slow_sma = sum(self.closes[-self.slow_length:]) / self.slow_length
-            self.slow_ema = slow_sma
-        else:
-            # Update EMAs: EMA = (Close - EMA_prev) * multiplier + EMA_prev
-            self.prev_fast_ema = self.fast_ema
-            self.prev_slow_ema = self.slow_ema
-
-            self.fast_ema = (close - self.fast_ema) * self.fast_multiplier + self.fast_ema
-            self.slow_ema = (close - self.slow_ema) * self.slow_multiplier + self.slow_ema
+        self.prev_fast_ema = self.fast_ema
+        self.prev_slow_ema = self.slow_ema
+        self.fast_ema = fast
+        self.slow_ema = slow
 
         return self.fast_ema, self.slow_ema
 
@@ -124,3 +138,37 @@ class EmaStrategy(StrategyBase):
                 return "buy"  # Exit short
 
         return "hold"
+
+    def signal_vectors(self, candles):
+        """
+        Full-series signals for the vectorized engine mode (flat, long, short).
+
+        EMAs come from the same indicators.ema() call as prepare(), so the
+        loop engine sees identical values; crossover detection is done on arrays.
+        """
+        if self._step:
+            return None
+
+        n = len(candles)
+        fast, slow = self._emas(candles.close)
+
+        prev_fast = np.full(n, np.nan)
+        prev_slow = np.full(n, np.nan)
+        prev_fast[1:] = fast[:-1]
+        prev_slow[1:] = slow[:-1]
+
+        # NaN comparisons are False → no crossover during warm-up
+        bullish = (prev_fast <= prev_slow) & (fast > slow)
+        bearish = (prev_fast >= prev_slow) & (fast < slow)
+
+        flat = np.zeros(n, dtype=np.int8)
+        flat[bullish] = SIGNAL_BUY
+        flat[bearish] = SIGNAL_SELL
+
+        long = np.zeros(n, dtype=np.int8)
+        long[bearish] = SIGNAL_SELL
+
+        short = np.zeros(n, dtype=np.int8)
+        short[bullish] = SIGNAL_BUY
+
+        return flat, long, short
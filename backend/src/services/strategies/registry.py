@@ -4,6 +4,7 @@ from .base import StrategyBase
 from .simple_open_close import SimpleOpenCloseStrategy
 from .rsi_strategy import RsiStrategy
 from .ema_strategy import EmaStrategy
+from .dynamic_adapter import DYNAMIC_STRATEGY_CODES, DynamicStrategyAdapter
 
 
 def get_strategy(name: Optional[str], params: Optional[Dict[str, Any]] = None) -> StrategyBase:
@@ -25,6 +26,10 @@ def get_strategy(name: Optional[str], params: Optional[Dict[str, Any]] = None) -
     3. ema (ema_crossover)
        - fast_length: fast EMA period (default 12)
        - slow_length: slow EMA period (default 26)
+
+    4. proven_conservative / proven_balanced / proven_aggressive
+       - 라이브 봇과 동일한 DynamicStrategyExecutor 전략 코드
+       - params는 전략 파라미터 그대로 전달 (window_size: 윈도우 크기, 기본 200)
     """
     if not name:
         name = "openclose"
@@ -46,4 +51,9 @@ def get_strategy(name: Optional[str], params: Optional[Dict[str, Any]] = None) -
         slow_length = int(params.get("slow_length", 26))
         return EmaStrategy(fast_length=fast_length, slow_length=slow_length)
 
+    if normalized in DYNAMIC_STRATEGY_CODES:
+        params = dict(params)
+        window_size = int(params.pop("window_size", 200))
+        return DynamicStrategyAdapter(normalized, params, window_size=window_size)
+
     raise ValueError(f"Unknown strategy: {name}")
@@ -1,4 +1,7 @@
-from .base import StrategyBase
+import numpy as np
+
+from ... import indicators
+from .base import SIGNAL_BUY, SIGNAL_SELL, StrategyBase
 
 
 class RsiStrategy(StrategyBase):
@@ -23,44 +26,25 @@ class RsiStrategy(StrategyBase):
         self.overbought = overbought
         self.oversold = oversold
 
-        self.closes: list[float] = []
-        self.avg_gain: float | None = None
-        self.avg_loss: float | None = None
-
-    def _update_rsi(self, close: float) -> float | None:
-        self.closes.append(close)
+        # 스트리밍 상태 / prepare()로 계산한 전체 시리즈
+        self._rsi = indicators.RSI(length)
+        self._series: list | None = None
+        self._step = 0
 
-        if len(self.closes) < 2:
-            return None
+    def prepare(self, candles) -> None:
+        # 엔진 루프는 close <= 0 캔들을 건너뛰므로 실제 호출되는 캔들만으로 계산
+        closes = candles.close[~(candles.close <= 0)]
+        self._series = indicators.rsi(closes, self.length).tolist()
+        self._step = 0
 
-        change = self.closes[-1] - self.closes[-2]
-        gain = max(change, 0.0)
-        loss = max(-change, 0.0)
-
-        if self.avg_gain is None or self.avg_loss is None:
-            if len(self.closes) <= self.length:
-                return None
-
-            gains = []
-            losses = []
-            for i in range(len(self.closes) - self.length, len(self.closes)):
-                if i <= 0:
-                    continue
-                diff = self.closes[i] - self.closes[i - 1]
-                gains.append(max(diff, 0.0))
-                losses.append(max(-diff, 0.0))
-
-            self.avg_gain = sum(gains) / len(gains) if gains else 0.0
-            self.avg_loss = sum(losses) / len(losses) if losses else 0.0
+    def _update_rsi(self, close: float) -> float | None:
+        if self._series is not None:
+            rsi = self._series[self._step]
+            if rsi != rsi:  # NaN (워밍업)
+                rsi = None
         else:
-            self.avg_gain = (self.avg_gain * (self.length - 1) + gain) / self.length
-            self.avg_loss = (self.avg_loss * (self.length - 1) + loss) / self.length
-
-        if self.avg_loss == 0:
-            return 100.0
-
-        rs = self.avg_gain / self.avg_loss
-        rsi = 100.0 - (100.0 / (1.0 + rs))
+            rsi = self._rsi.update(close)
+        self._step += 1
         return rsi
 
     def on_candle(self, candle: dict, position: dict | None) -> str:
@@ -85,3 +69,29 @@ class RsiStrategy(StrategyBase):
                 return "buy"
 
         return "hold"
+
+    def signal_vectors(self, candles):
+        """
+        벡터화 모드용 신호 벡터 (flat, long, short)
+
+        RSI는 prepare()와 같은 indicators.rsi() 결과를 사용하므로 루프 모드와 값이 같고,
+        신호 판정은 배열 연산으로 처리합니다.
+        """
+        if self._step or self.length < 1:
+            return None
+
+        n = len(candles)
+        rsi = indicators.rsi(candles.close, self.length)
+
+        # NaN(워밍업 구간) 비교는 모두 False → hold
+        flat = np.zeros(n, dtype=np.int8)
+        flat[rsi < self.oversold] = SIGNAL_BUY
+        flat[(rsi >= self.oversold) & (rsi > self.overbought)] = SIGNAL_SELL
+
+        long = np.zeros(n, dtype=np.int8)
+        long[rsi > 50.0] = SIGNAL_SELL
+
+        short = np.zeros(n, dtype=np.int8)
+        short[rsi < 50.0] = SIGNAL_BUY
+
+        return flat, long, short
@@ -1,4 +1,6 @@
-from .base import StrategyBase
+import numpy as np
+
+from .base import SIGNAL_BUY, SIGNAL_SELL, StrategyBase
 
 
 class SimpleOpenCloseStrategy(StrategyBase):
@@ -18,3 +20,10 @@ class SimpleOpenCloseStrategy(StrategyBase):
         elif c < o:
             return "sell"
         return "hold"
+
+    def signal_vectors(self, candles):
+        """포지션과 무관: 세 상태 모두 같은 신호 벡터"""
+        signal = np.zeros(len(candles), dtype=np.int8)
+        signal[candles.close > candles.open] = SIGNAL_BUY
+        signal[candles.close < candles.open] = SIGNAL_SELL
+        return signal, signal, signal
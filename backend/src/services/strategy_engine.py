@@ -1,51 +1,232 @@
-from collections import deque
+"""
+레거시 전략 엔진 (rsi_reversal / ema_cross / breakout)
+
+봇(스트림)별 상태 객체가 캔들을 하나씩 받아 지표를 증분 갱신하므로 호출당 O(1)입니다.
+
+- 윈도우 EMA: 최근 period개 종가를 첫 값으로 시드한 EMA (기존 _ema(closes[-period:]) 값)
+- RSI: 최근 length개 종가 변화의 상승/하락 합 (기존 rsi_reversal 정의)
+- breakout: 최근 lookback개 캔들 고가/저가 최대/최소 (단조 deque)
+
+각 지표는 기존 구현과 같이 최근 BUFFER_SIZE개 캔들 범위만 봅니다.
+"""
+
+from collections import OrderedDict, deque
 import json
-from typing import Deque, List
+from typing import Deque, List, Optional
 
 BUFFER_SIZE = 200
-_candle_buffers: dict[str, Deque[dict]] = {}
 
+# 스트림(봇)별 상태 보관 최대 수 (LRU)
+MAX_STREAMS = 1000
 
-def _ensure_buffer(symbol: str) -> Deque[dict]:
-    if symbol not in _candle_buffers:
-        _candle_buffers[symbol] = deque(maxlen=BUFFER_SIZE)
-    return _candle_buffers[symbol]
 
+class _WindowedEMA:
+    """
+    최근 period개 값에 대한 EMA (구간 첫 값으로 시드)
 
-def _ema(values: List[float], period: int) -> float:
-    if not values or len(values) < period:
-        return values[-1] if values else 0.0
-    k = 2 / (period + 1)
-    ema = values[0]
-    for price in values[1:]:
-        ema = price * k + ema * (1 - k)
-    return ema
+    e = (1-k)^(p-1)·v0 + Σ k(1-k)^(p-1-j)·vj 를
+    S = Σ k(1-k)^(p-1-j)·vj (j = 0..p-1) 롤링 합으로 유지: e = S + (1-k)^p·v0
+    """
 
+    __slots__ = ("period", "k", "decay", "window", "weighted")
 
-def rsi_reversal(price: float, candles: list, params: dict | None = None) -> str:
-    params = params or {}
-    length = int(params.get("rsi_length", 14))
-    closes = [c["close"] for c in candles[-length - 1 :]]
-    gains = sum(max(0, closes[i + 1] - closes[i]) for i in range(len(closes) - 1))
-    losses = sum(max(0, closes[i] - closes[i + 1]) for i in range(len(closes) - 1))
-    if losses == 0:
-        return "buy" if price > closes[-1] else "hold"
-    rs = gains / losses
-    rsi = 100 - (100 / (1 + rs))
-    if rsi < 30:
+    def __init__(self, period: int):
+        self.period = period
+        self.k = 2 / (period + 1)
+        self.decay = (1 - self.k) ** period
+        self.window: Deque[float] = deque()
+        self.weighted = 0.0
+
+    def push(self, x: float):
+        self.weighted = (1 - self.k) * self.weighted + self.k * x
+        self.window.append(x)
+        if len(self.window) > self.period:
+            self.weighted -= self.k * self.decay * self.window.popleft()
+
+    @property
+    def value(self) -> Optional[float]:
+        """period개가 모이기 전에는 None"""
+        if len(self.window) < self.period:
+            return None
+        return self.weighted + self.decay * self.window[0]
+
+
+class _RollingRSI:
+    """최근 length개 종가 변화의 상승/하락 합"""
+
+    __slots__ = ("length", "changes", "gains", "losses", "gain_count", "loss_count")
+
+    def __init__(self, length: int):
+        self.length = length
+        self.changes: Deque[float] = deque()
+        self.gains = 0.0
+        self.losses = 0.0
+        self.gain_count = 0
+        self.loss_count = 0
+
+    def push(self, change: float):
+        self._add(change, 1)
+        self.changes.append(change)
+        if len(self.changes) > self.length:
+            self._add(self.changes.popleft(), -1)
+
+    def _add(self, change: float, sign: int):
+        if change > 0:
+            self.gain_count += sign
+            self.gains = self.gains + sign * change if self.gain_count else 0.0
+        elif change < 0:
+            self.loss_count += sign
+            self.losses = self.losses - sign * change if self.loss_count else 0.0
+
+
+class _RollingExtremes:
+    """최근 lookback개 고가 최대 / 저가 최소 (단조 deque)"""
+
+    __slots__ = ("lookback", "count", "highs", "lows")
+
+    def __init__(self, lookback: int):
+        self.lookback = lookback
+        self.count = 0
+        self.highs: Deque[tuple] = deque()  # (index, high) 내림차순
+        self.lows: Deque[tuple] = deque()  # (index, low) 오름차순
+
+    def push(self, high: float, low: float):
+        index = self.count
+        self.count += 1
+        while self.highs and self.highs[-1][1] <= high:
+            self.highs.pop()
+        self.highs.append((index, high))
+        while self.lows and self.lows[-1][1] >= low:
+            self.lows.pop()
+        self.lows.append((index, low))
+
+        oldest = index - self.lookback
+        if self.highs[0][0] <= oldest:
+            self.highs.popleft()
+        if self.lows[0][0] <= oldest:
+            self.lows.popleft()
+
+    @property
+    def high(self) -> float:
+        return self.highs[0][1]
+
+    @property
+    def low(self) -> float:
+        return self.lows[0][1]
+
+
+class LegacyStrategyState:
+    """
+    봇 하나의 레거시 전략 상태
+
+    update(candles)에 봇의 캔들 윈도우를 넘기면 마지막으로 본 캔들 이후의
+    새 캔들만 반영합니다 (보통 1개). 윈도우가 바뀌어 이어지지 않으면 윈도우 전체로 재구성.
+    """
+
+    def __init__(self, strategy_type: str, params: dict):
+        self.strategy_type = strategy_type
+        self.params = params
+        self.last_candle = None
+        self.last_close: Optional[float] = None
+        self._reset()
+
+    def _reset(self):
+        params = self.params
+        self.count = 0
+        self.last_candle = None
+        self.last_close = None
+
+        self.rsi = None
+        self.cross = None
+        self.extremes = None
+        if self.strategy_type == "rsi":
+            length = int(params.get("rsi_length", 14))
+            self.rsi = _RollingRSI(min(length, BUFFER_SIZE - 1))
+        elif self.strategy_type == "breakout":
+            lookback = int(params.get("lookback", 20))
+            self.extremes = _RollingExtremes(min(lookback, BUFFER_SIZE))
+        elif self.strategy_type != "ai":
+            self.cross = (
+                _WindowedEMA(int(params.get("ema_fast", 9))),
+                _WindowedEMA(int(params.get("ema_slow", 21))),
+            )
+
+        # run()의 신호 평활 필터
+        self.filter = (
+            _WindowedEMA(int(params.get("ema_fast", 3))),
+            _WindowedEMA(int(params.get("ema_slow", 7))),
+        )
+
+    def update(self, candles: List[dict]) -> "LegacyStrategyState":
+        if not candles:
+            return self
+
+        start = 0
+        if self.last_candle is not None:
+            for back in range(1, len(candles) + 1):
+                if candles[-back] is self.last_candle:
+                    start = len(candles) - back + 1
+                    break
+            else:
+                self._reset()
+
+        for candle in candles[max(start, len(candles) - BUFFER_SIZE):]:
+            self._push(candle)
+        self.last_candle = candles[-1]
+        return self
+
+    def _push(self, candle: dict):
+        close = candle["close"]
+        if self.rsi is not None and self.last_close is not None:
+            self.rsi.push(close - self.last_close)
+        if self.cross is not None:
+            for ema in self.cross:
+                ema.push(close)
+        if self.extremes is not None:
+            self.extremes.push(candle["high"], candle["low"])
+        for ema in self.filter:
+            ema.push(close)
+        self.last_close = close
+        self.count += 1
+
+    def signal(self, price: float) -> str:
+        if self.count == 0:
+            return "hold"
+        if self.strategy_type == "rsi":
+            return _rsi_signal(price, self.rsi, self.last_close)
+        if self.strategy_type == "breakout":
+            return _breakout_signal(price, self.extremes)
+        if self.strategy_type == "ai":
+            return ai_signal(price, [], self.params)
+        return _cross_signal(self.cross, self.last_close)
+
+    def smoothed_signal(self, price: float) -> str:
+        """signal() + 빠른/느린 EMA 차이가 가격의 0.1% 미만이면 hold"""
+        signal = self.signal(price)
+        fast, slow = (ema.value for ema in self.filter)
+        fast_ema = price if fast is None else fast
+        slow_ema = price if slow is None else slow
+        if abs(fast_ema - slow_ema) < price * 0.001:
+            return "hold"
+        return signal
+
+
+def _rsi_signal(price: float, rsi: _RollingRSI, last_close: float) -> str:
+    if rsi.loss_count == 0:
+        return "buy" if price > last_close else "hold"
+    rs = rsi.gains / rsi.losses
+    value = 100 - (100 / (1 + rs))
+    if value < 30:
         return "buy"
-    if rsi > 70:
+    if value > 70:
         return "sell"
     return "hold"
 
 
-def ema_cross(price: float, candles: list, params: dict | None = None) -> str:
-    params = params or {}
-    fast = int(params.get("ema_fast", 9))
-    slow = int(params.get("ema_slow", 21))
-    closes = [c["close"] for c in candles]
-    fast_ema = _ema(closes[-fast:], fast) if len(closes) >= fast else closes[-1]
-    slow_ema = _ema(closes[-slow:], slow) if len(closes) >= slow else closes[-1]
+def _cross_signal(cross: tuple, last_close: float) -> str:
+    fast, slow = (ema.value for ema in cross)
+    fast_ema = last_close if fast is None else fast
+    slow_ema = last_close if slow is None else slow
     if fast_ema > slow_ema:
         return "buy"
     if fast_ema < slow_ema:
@@ -53,38 +234,46 @@ def ema_cross(price: float, candles: list, params: dict | None = None) -> str:
     return "hold"
 
 
-def breakout(price: float, candles: list, params: dict | None = None) -> str:
-    params = params or {}
-    lookback = int(params.get("lookback", 20))
-    window = candles[-lookback:] if len(candles) >= lookback else candles
-    highs = [c["high"] for c in window]
-    lows = [c["low"] for c in window]
-    if not highs or not lows:
-        return "hold"
-    if price > max(highs):
+def _breakout_signal(price: float, extremes: _RollingExtremes) -> str:
+    if price > extremes.high:
         return "buy"
-    if price < min(lows):
+    if price < extremes.low:
         return "sell"
     return "hold"
 
 
+# ===== 캔들 리스트 기반 단발 호출 (상태 없이 윈도우 전체로 계산) =====
+
+
+def rsi_reversal(price: float, candles: list, params: dict | None = None) -> str:
+    return LegacyStrategyState("rsi", params or {}).update(candles).signal(price)
+
+
+def ema_cross(price: float, candles: list, params: dict | None = None) -> str:
+    return LegacyStrategyState("ema", params or {}).update(candles).signal(price)
+
+
+def breakout(price: float, candles: list, params: dict | None = None) -> str:
+    return LegacyStrategyState("breakout", params or {}).update(candles).signal(price)
+
+
 def ai_signal(price: float, candles: list, params: dict | None = None) -> str:
     # placeholder
     return "buy" if price % 2 == 0 else "sell"
 
 
-def run(
-    strategy_code: str,
-    price: float,
-    candles: list,
-    params_json: str | None = None,
-    symbol: str = "",
-) -> str:
-    buffer = _ensure_buffer(symbol or "global")
-    buffer.extend(candles[-BUFFER_SIZE:])
+# ===== 스트림별 상태 =====
+
+_stream_states: "OrderedDict[tuple, LegacyStrategyState]" = OrderedDict()
+
+
+def reset_stream(stream_key: str):
+    """봇 중지/전략 변경 시 해당 스트림 상태 제거"""
+    for key in [key for key in _stream_states if key[0] == stream_key]:
+        del _stream_states[key]
 
-    params = json.loads(params_json) if params_json else {}
 
+def _resolve_strategy_type(strategy_code: str, params: dict) -> str:
     # strategy_code 또는 params의 type으로 전략 결정
     # strategy_code가 있으면 우선 사용, 없으면 params의 type 사용
     strategy_type = params.get("type", "")
@@ -104,26 +293,42 @@ def run(
     elif not strategy_type:
         strategy_type = "ema"  # 기본값
 
-    # 전략 실행
-    if strategy_type == "rsi":
-        signal = rsi_reversal(price, list(buffer), params)
-    elif strategy_type == "ema":
-        signal = ema_cross(price, list(buffer), params)
-    elif strategy_type == "breakout":
-        signal = breakout(price, list(buffer), params)
-    elif strategy_type == "ai":
-        signal = ai_signal(price, list(buffer), params)
+    # 알 수 없는 타입은 EMA 크로스 기반
+    if strategy_type not in ("rsi", "ema", "breakout", "ai"):
+        strategy_type = "ema"
+    return strategy_type
+
+
+def run(
+    strategy_code: str,
+    price: float,
+    candles: list,
+    params_json: str | None = None,
+    symbol: str = "",
+    stream_key: Optional[str] = None,
+) -> str:
+    """
+    레거시 전략 신호
+
+    Args:
+        candles: 봇의 캔들 윈도우 (마지막 캔들이 최신)
+        stream_key: 봇/전략 식별자. 주어지면 상태를 유지하고 새 캔들만 반영 (O(1)),
+            없으면 전달된 윈도우만으로 계산
+    """
+    params = json.loads(params_json) if params_json else {}
+    strategy_type = _resolve_strategy_type(strategy_code, params)
+
+    if stream_key is None:
+        state = LegacyStrategyState(strategy_type, params)
     else:
-        # 기본 전략: EMA 크로스 기반
-        signal = ema_cross(price, list(buffer), params)
-
-    # smoothing via simple filter
-    fast = params.get("ema_fast", 3)
-    slow = params.get("ema_slow", 7)
-    closes = [c["close"] for c in buffer]
-    fast_ema = _ema(closes[-fast:], fast) if len(closes) >= fast else price
-    slow_ema = _ema(closes[-slow:], slow) if len(closes) >= slow else price
-    if abs(fast_ema - slow_ema) < price * 0.001:
-        return "hold"
-
-    return signal
+        key = (stream_key, symbol, strategy_code, params_json)
+        state = _stream_states.get(key)
+        if state is None:
+            reset_stream(stream_key)  # 파라미터/전략이 바뀐 이전 상태 제거
+            state = _stream_states[key] = LegacyStrategyState(strategy_type, params)
+            while len(_stream_states) > MAX_STREAMS:
+                _stream_states.popitem(last=False)
+        else:
+            _stream_states.move_to_end(key)
+
+    return state.update(candles).smoothed_signal(price)
@@ -0,0 +1,63 @@
+"""
+전략 변경 이벤트 (전략 API → 실행 중인 봇 루프)
+
+전략 코드/파라미터를 수정하면 API가 publish(strategy_id)로 이벤트를 발행하고,
+해당 전략을 실행 중인 봇 루프는 다음 틱에서 새 전략으로 교체합니다 (봇 재시작 불필요).
+봇 루프와 API는 같은 프로세스에서 실행되므로 프로세스 내 구독 객체로 전달합니다.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Dict, Set
+
+logger = logging.getLogger(__name__)
+
+
+class StrategySubscription:
+    """봇 루프 하나의 전략 변경 구독"""
+
+    __slots__ = ("strategy_id", "pending")
+
+    def __init__(self, strategy_id: int):
+        self.strategy_id = strategy_id
+        self.pending = False
+
+    def pop(self) -> bool:
+        """마지막 확인 이후 변경 이벤트가 있었으면 True (확인 후 초기화)"""
+        pending, self.pending = self.pending, False
+        return pending
+
+
+class StrategyChangeEvents:
+    def __init__(self):
+        self._subscribers: Dict[int, Set[StrategySubscription]] = defaultdict(set)
+        self.published = 0
+
+    def subscribe(self, strategy_id: int) -> StrategySubscription:
+        subscription = StrategySubscription(strategy_id)
+        self._subscribers[strategy_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: StrategySubscription):
+        subscribers = self._subscribers.get(subscription.strategy_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.strategy_id]
+
+    def publish(self, strategy_id: int) -> int:
+        """전략 변경 알림, 알림 받은 봇 수 반환"""
+        subscribers = self._subscribers.get(strategy_id, ())
+        for subscription in subscribers:
+            subscription.pending = True
+        self.published += 1
+        if subscribers:
+            logger.info(
+                f"Strategy {strategy_id} changed, reloading {len(subscribers)} running bot(s)"
+            )
+        return len(subscribers)
+
+
+# 전역 인스턴스
+strategy_events = StrategyChangeEvents()
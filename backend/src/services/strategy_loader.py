@@ -12,12 +12,21 @@ import logging
 import os
 from typing import Dict, Optional
 
+from .strategies.dynamic_adapter import DYNAMIC_STRATEGY_CODES
+
 logger = logging.getLogger(__name__)
 
 # 전략 파일 경로
 STRATEGIES_PATH = os.path.join(os.path.dirname(__file__), "../strategies")
 
 
+def uses_dynamic_executor(strategy_code: Optional[str]) -> bool:
+    """load_strategy_class()가 DynamicStrategyExecutor를 반환하는 전략인지"""
+    if not strategy_code:
+        return False
+    return strategy_code in DYNAMIC_STRATEGY_CODES or len(strategy_code.strip()) > 100
+
+
 def load_strategy_class(strategy_code: str, params_json: Optional[str] = None):
     """
     전략 코드에 따라 적절한 전략 인스턴스 반환
@@ -93,10 +102,14 @@ def generate_signal_with_strategy(
     candles: list,
     params_json: Optional[str] = None,
     current_position: Optional[Dict] = None,
+    strategy_key: Optional[str] = None,
 ) -> Dict:
     """
     전략을 사용하여 시그널 생성
 
+    Args:
+        strategy_key: 봇/전략 식별자 (레거시 전략 엔진의 스트림별 증분 상태 키)
+
     Returns:
         {
             "action": "buy" | "sell" | "hold" | "close",
@@ -122,6 +135,7 @@ def generate_signal_with_strategy(
             candles=candles,
             params_json=params_json,
             symbol="",
+            stream_key=strategy_key,
         )
 
         logger.info(
@@ -138,6 +152,12 @@ def generate_signal_with_strategy(
         }
 
     # 새로운 전략 클래스 사용
+    return _strategy_signal(strategy, current_price, candles, current_position)
+
+
+def _strategy_signal(
+    strategy, current_price: float, candles: list, current_position: Optional[Dict]
+) -> Dict:
     try:
         result = strategy.generate_signal(
             current_price=current_price,
@@ -156,3 +176,62 @@ def generate_signal_with_strategy(
             "take_profit": None,
             "size": 0,
         }
+
+
+def load_live_strategy(strategy_code: Optional[str], params_json: Optional[str] = None):
+    """
+    봇 루프가 보유할 전략 인스턴스 (봇 시작 / 전략 변경 시 한 번 컴파일)
+
+    샌드박스에서 평가하는 동적 전략과 레거시 전략 엔진은 None
+    (generate_signal_async가 호출마다 해당 경로로 평가)
+    """
+    from .strategy_sandbox import strategy_sandbox
+
+    if strategy_sandbox.enabled and uses_dynamic_executor(strategy_code):
+        return None
+    return load_strategy_class(strategy_code, params_json)
+
+
+async def generate_signal_async(
+    strategy_code: Optional[str],
+    current_price: float,
+    candles: list,
+    params_json: Optional[str] = None,
+    current_position: Optional[Dict] = None,
+    strategy_key: Optional[str] = None,
+    strategy=None,
+) -> Dict:
+    """
+    generate_signal_with_strategy()의 비동기 버전 (라이브 봇용)
+
+    샌드박스가 활성화되어 있으면 동적 전략(proven_*, 사용자/AI 코드)은 워커 프로세스에서
+    평가하고, 레거시 전략 엔진은 기존처럼 현재 프로세스에서 실행합니다.
+
+    Args:
+        strategy_key: 봇/전략 식별자 (샌드박스 지연 통계 단위, 레거시 전략 엔진의
+            스트림별 상태 키). 샌드박스 동시 실행 제한은 코드+파라미터 단위로 적용
+        strategy: load_live_strategy()로 미리 컴파일한 전략 인스턴스 (없으면 호출마다 로드)
+    """
+    from .strategy_sandbox import strategy_sandbox
+
+    if strategy_sandbox.enabled and uses_dynamic_executor(strategy_code):
+        return await strategy_sandbox.evaluate(
+            strategy_code,
+            params_json,
+            current_price,
+            candles,
+            current_position,
+            key=strategy_key,
+        )
+
+    if strategy is not None:
+        return _strategy_signal(strategy, current_price, candles, current_position)
+
+    return generate_signal_with_strategy(
+        strategy_code=strategy_code,
+        current_price=current_price,
+        candles=candles,
+        params_json=params_json,
+        current_position=current_position,
+        strategy_key=strategy_key,
+    )
@@ -0,0 +1,539 @@
+"""
+동적 전략 샌드박스 워커 풀
+
+DynamicStrategyExecutor는 사용자/AI 전략 코드를 exec()로 실행하므로, API 프로세스의
+이벤트 루프에서 돌리면 무거운 전략 하나가 모든 봇/HTTP/WebSocket을 멈춥니다.
+StrategySandboxConfig.ENABLED이면 전략 평가를 별도 워커 프로세스에서 실행합니다.
+
+- 워커마다 전용 공유 메모리 슬롯을 두고 캔들 윈도우를 컬럼 배열로 기록 (pickle 없음)
+- 워커 내부: 호출당 CPU 시간 예산 (ITIMER_PROF), 주소 공간 상한 (RLIMIT_AS)
+- CPU 예산으로 멈추지 않는 호출은 부모가 wall-clock 타임아웃 후 워커를 종료/재생성
+- 예산 초과 / 종료 / 오류 시 hold 반환
+- 같은 전략(코드+파라미터)의 호출은 한 번에 하나만 실행되므로 느린 전략은 여러 봇이
+  사용하더라도 워커 하나만 점유하고, 다른 전략은 나머지 워커에서 계속 처리됨
+- 호출자 key(봇)별 평가 지연(avg / p95 / max)과 타임아웃 횟수 집계
+- 차트 신호 오버레이(전체 구간 신호 벡터)도 ENABLED와 관계없이 같은 워커에서
+  별도 CPU 예산과 캔들 수 상한으로 실행하며, 라이브 평가용 워커를 최소 하나 남겨 둠
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..config import StrategySandboxConfig
+from .candle_arrays import CANDLE_FIELDS, CandleArrays, _view_block
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# 전략별 지연 시간 샘플 수 (p95 계산용)
+LATENCY_SAMPLES = 500
+
+
+def hold_signal(reason: str) -> Dict[str, Any]:
+    """샌드박스 실패 시 반환하는 hold 신호 (generate_signal_with_strategy 오류 응답과 같은 형식)"""
+    return {
+        "action": "hold",
+        "confidence": 0.0,
+        "reason": reason,
+        "stop_loss": None,
+        "take_profit": None,
+        "size": 0,
+    }
+
+
+# ===== 워커 프로세스 =====
+
+
+class _CpuBudgetExceeded(BaseException):
+    """호출당 CPU 예산 초과 (전략 코드의 except Exception에 잡히지 않도록 BaseException)"""
+
+
+def _on_cpu_budget(signum, frame):
+    raise _CpuBudgetExceeded()
+
+
+def _apply_memory_limit(memory_mb: int):
+    if resource is None or memory_mb <= 0:
+        return
+    limit = memory_mb * 1024 * 1024
+    try:
+        soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError) as e:
+        logger.warning(f"Strategy sandbox memory limit not applied: {e}")
+
+
+def _window_candles(columns: List[np.ndarray], n: int) -> List[Dict[str, Any]]:
+    """공유 메모리 컬럼 → 라이브 봇 캔들 버퍼와 같은 dict 리스트"""
+    timestamp, open_, high, low, close, volume = (column[:n].tolist() for column in columns)
+    return [
+        {"open": o, "high": h, "low": l, "close": c, "volume": v, "time": t}
+        for t, o, h, l, c, v in zip(timestamp, open_, high, low, close, volume)
+    ]
+
+
+def _sandbox_worker(
+    conn,
+    shm_name: str,
+    capacity: int,
+    cpu_budget: float,
+    series_cpu_budget: float,
+    memory_mb: int,
+    cache_size: int,
+):
+    """
+    워커 프로세스 메인 루프
+
+    - ("signal", code, params_json, n, (price, position)) → (status, signal dict, cpu_seconds)
+    - ("series", code, params_json, n, None) → (status, 신호 리스트 또는 hold dict, cpu_seconds)
+    """
+    from .strategy_loader import load_strategy_class
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    arrays = _view_block(shm, capacity)
+    columns = [getattr(arrays, field) for field in CANDLE_FIELDS]
+    executors: "OrderedDict[tuple, Any]" = OrderedDict()
+
+    use_timer = hasattr(signal, "setitimer") and cpu_budget > 0
+    if use_timer:
+        signal.signal(signal.SIGPROF, _on_cpu_budget)
+    _apply_memory_limit(memory_mb)
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        kind, strategy_code, params_json, n, payload = message
+        budget = series_cpu_budget if kind == "series" else cpu_budget
+        started = time.process_time()
+        try:
+            if use_timer:
+                signal.setitimer(signal.ITIMER_PROF, budget)
+            try:
+                key = (strategy_code, params_json)
+                executor = executors.get(key)
+                if executor is None:
+                    executor = load_strategy_class(strategy_code, params_json)
+                    if executor is None:
+                        raise ValueError("strategy is not a dynamic strategy")
+                    executors[key] = executor
+                    while len(executors) > cache_size:
+                        executors.popitem(last=False)
+                else:
+                    executors.move_to_end(key)
+
+                if kind == "series":
+                    series = executor.generate_signal_series(arrays.slice(0, n))
+                    result = ("ok", series.tolist())
+                else:
+                    price, position = payload
+                    candles = _window_candles(columns, n)
+                    result = ("ok", executor.generate_signal(price, candles, position))
+            finally:
+                if use_timer:
+                    signal.setitimer(signal.ITIMER_PROF, 0)
+        except _CpuBudgetExceeded:
+            result = ("timeout", hold_signal(f"CPU budget exceeded ({budget}s)"))
+        except MemoryError:
+            executors.clear()
+            result = ("error", hold_signal("Memory limit exceeded"))
+        except Exception as e:
+            result = ("error", hold_signal(f"Error: {e}"))
+
+        try:
+            conn.send((*result, time.process_time() - started))
+        except (EOFError, OSError):
+            break
+
+    del arrays, columns
+    try:
+        shm.close()
+    except BufferError:
+        pass
+
+
+# ===== 부모 프로세스 =====
+
+
+def _strategy_digest(strategy_code: str, params_json: Optional[str]) -> str:
+    """코드+파라미터 해시 (동시 실행 제한 단위)"""
+    return hashlib.sha1(f"{strategy_code}\0{params_json}".encode()).hexdigest()[:12]
+
+
+class _LatencyStats:
+    """전략 하나의 평가 지연 통계"""
+
+    __slots__ = ("calls", "timeouts", "killed", "errors", "samples", "last_ms")
+
+    def __init__(self):
+        self.calls = 0
+        self.timeouts = 0
+        self.killed = 0
+        self.errors = 0
+        self.samples: deque = deque(maxlen=LATENCY_SAMPLES)
+        self.last_ms = 0.0
+
+    def record(self, status: str, elapsed_ms: float):
+        self.calls += 1
+        self.last_ms = elapsed_ms
+        self.samples.append(elapsed_ms)
+        if status == "timeout":
+            self.timeouts += 1
+        elif status == "killed":
+            self.killed += 1
+        elif status != "ok":
+            self.errors += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        samples = np.asarray(self.samples) if self.samples else np.zeros(1)
+        return {
+            "calls": self.calls,
+            "timeouts": self.timeouts,
+            "killed": self.killed,
+            "errors": self.errors,
+            "last_ms": round(self.last_ms, 2),
+            "avg_ms": round(float(samples.mean()), 2),
+            "p95_ms": round(float(np.percentile(samples, 95)), 2),
+            "max_ms": round(float(samples.max()), 2),
+        }
+
+
+class _SandboxWorker:
+    """워커 프로세스 + 파이프 + 캔들 공유 메모리 슬롯"""
+
+    def __init__(self, index: int, window: int, capacity: int):
+        self.index = index
+        self.window = window  # 라이브 평가에 전달하는 최근 캔들 수
+        self.capacity = capacity  # 슬롯 크기 (신호 시리즈 상한 포함)
+        self.shm = shared_memory.SharedMemory(
+            create=True, size=capacity * 8 * len(CANDLE_FIELDS)
+        )
+        arrays = _view_block(self.shm, capacity)
+        self.columns = [getattr(arrays, field) for field in CANDLE_FIELDS]
+        self.process = None
+        self.conn = None
+        self.restarts = 0
+
+    def start(self):
+        ctx = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_sandbox_worker,
+            args=(
+                child_conn,
+                self.shm.name,
+                self.capacity,
+                StrategySandboxConfig.CPU_BUDGET_SECONDS,
+                StrategySandboxConfig.SERIES_CPU_BUDGET_SECONDS,
+                StrategySandboxConfig.MEMORY_LIMIT_MB,
+                StrategySandboxConfig.EXECUTOR_CACHE_SIZE,
+            ),
+            name=f"strategy-sandbox-{self.index}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+
+    def kill(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        if self.process is not None and self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=5)
+        self.process = None
+
+    def restart(self):
+        self.kill()
+        self.restarts += 1
+        self.start()
+
+    def write_candles(self, candles: List[Dict[str, Any]]) -> int:
+        """캔들 윈도우(최근 window개)를 공유 메모리 슬롯에 기록하고 길이 반환"""
+        window = candles[-self.window:]
+        n = len(window)
+        timestamp, open_, high, low, close, volume = self.columns
+        for i, candle in enumerate(window):
+            try:
+                timestamp[i] = int(candle.get("time") or candle.get("timestamp") or 0)
+            except (TypeError, ValueError):
+                timestamp[i] = 0
+            open_[i] = float(candle.get("open", 0))
+            high[i] = float(candle.get("high", 0))
+            low[i] = float(candle.get("low", 0))
+            close[i] = float(candle.get("close", 0))
+            volume[i] = float(candle.get("volume", 0))
+        return n
+
+    def write_arrays(self, candles: CandleArrays) -> int:
+        """캔들 배열 전체를 공유 메모리 슬롯에 기록하고 길이 반환 (capacity 이하)"""
+        n = len(candles)
+        if n > self.capacity:
+            raise ValueError(f"Too many candles: {n} (max {self.capacity})")
+        for column, field in zip(self.columns, CANDLE_FIELDS):
+            column[:n] = getattr(candles, field)
+        return n
+
+    def close(self):
+        if self.conn is not None:
+            try:
+                self.conn.send(None)
+            except (OSError, ValueError):
+                pass
+        if self.process is not None:
+            self.process.join(timeout=2)
+        self.kill()
+        self.columns = []
+        try:
+            self.shm.close()
+        except BufferError:
+            pass
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class StrategySandboxPool:
+    """
+    전략 평가 워커 풀
+
+    워커는 첫 evaluate() 시 생성되며 애플리케이션 종료 시 shutdown()으로 정리합니다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max(1, max_workers or StrategySandboxConfig.WORKER_PROCESSES)
+        self._workers: List[_SandboxWorker] = []
+        self._idle: Optional[asyncio.Queue] = None
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._start_lock = asyncio.Lock()
+        # 신호 시리즈는 워커를 최소 하나 남겨 라이브 평가가 막히지 않도록 제한
+        self._series_slots = asyncio.Semaphore(max(1, self.max_workers - 1))
+        self._key_locks: Dict[str, asyncio.Lock] = {}
+        self._latency: Dict[str, _LatencyStats] = {}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return StrategySandboxConfig.ENABLED
+
+    async def _ensure_started(self):
+        if self._idle is not None:
+            return
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+            loop = asyncio.get_running_loop()
+            idle: asyncio.Queue = asyncio.Queue()
+            for index in range(self.max_workers):
+                worker = _SandboxWorker(
+                    index,
+                    StrategySandboxConfig.MAX_CANDLES,
+                    max(
+                        StrategySandboxConfig.MAX_CANDLES,
+                        StrategySandboxConfig.SERIES_MAX_CANDLES,
+                    ),
+                )
+                await loop.run_in_executor(None, worker.start)
+                self._workers.append(worker)
+                idle.put_nowait(worker)
+            self._threads = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="strategy-sandbox"
+            )
+            self._idle = idle
+            logger.info(f"Strategy sandbox started with {self.max_workers} workers")
+
+    def _roundtrip(
+        self,
+        worker: _SandboxWorker,
+        kind: str,
+        strategy_code: str,
+        params_json: Optional[str],
+        candles,
+        payload,
+    ) -> tuple:
+        """워커 하나로 평가 요청 (스레드에서 실행, 타임아웃 시 워커 재생성)"""
+        budget = (
+            StrategySandboxConfig.SERIES_CPU_BUDGET_SECONDS
+            if kind == "series"
+            else StrategySandboxConfig.CPU_BUDGET_SECONDS
+        )
+        timeout = budget + StrategySandboxConfig.WALL_GRACE_SECONDS
+        try:
+            if kind == "series":
+                n = worker.write_arrays(candles)
+            else:
+                n = worker.write_candles(candles)
+            worker.conn.send((kind, strategy_code, params_json, n, payload))
+            if worker.conn.poll(timeout):
+                status, result, _ = worker.conn.recv()
+                return status, result
+            logger.warning(
+                f"Strategy sandbox worker {worker.index} exceeded {timeout}s, restarting"
+            )
+            worker.restart()
+            return "killed", hold_signal(f"Strategy evaluation timed out ({timeout}s)")
+        except (EOFError, OSError, AttributeError) as e:
+            # 워커 비정상 종료 (메모리 상한 등)
+            logger.warning(f"Strategy sandbox worker {worker.index} crashed: {e}, restarting")
+            worker.restart()
+            return "crashed", hold_signal("Strategy worker crashed")
+
+    @staticmethod
+    def _release(loop, idle: asyncio.Queue, worker: _SandboxWorker):
+        """왕복이 끝난 워커를 유휴 큐에 반납 (스레드에서 호출될 수 있음)"""
+        try:
+            loop.call_soon_threadsafe(idle.put_nowait, worker)
+        except RuntimeError:
+            pass  # 이벤트 루프 종료 (shutdown)
+
+    async def evaluate(
+        self,
+        strategy_code: str,
+        params_json: Optional[str],
+        current_price: float,
+        candles: List[Dict[str, Any]],
+        current_position: Optional[Dict] = None,
+        key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        워커에서 전략 신호 생성
+
+        Args:
+            key: 지연 통계 단위 (봇 등, 기본값은 전략 키).
+                동시 실행 제한은 항상 코드+파라미터 해시 단위로 적용
+        """
+        strategy_key = f"code:{_strategy_digest(strategy_code, params_json)}"
+        status, result = await self._run(
+            strategy_key,
+            key or strategy_key,
+            "signal",
+            strategy_code,
+            params_json,
+            candles,
+            (current_price, current_position),
+        )
+        return result
+
+    async def evaluate_series(
+        self, strategy_code: str, params_json: Optional[str], candles: CandleArrays
+    ) -> List[int]:
+        """
+        전체 구간 진입 신호 (차트 신호 오버레이용)
+
+        SERIES_CPU_BUDGET_SECONDS / 메모리 상한 안에서 워커가 실행하며,
+        동시에 max_workers - 1개(최소 1개)까지만 워커를 사용합니다.
+
+        Returns:
+            캔들별 1 (LONG) / -1 (SHORT) / 0 리스트
+
+        Raises:
+            ValueError: 캔들 수 초과, 전략 오류
+            TimeoutError: CPU 예산 / 실행 시간 초과
+        """
+        if len(candles) > StrategySandboxConfig.SERIES_MAX_CANDLES:
+            raise ValueError(
+                f"Too many candles: {len(candles)} "
+                f"(max {StrategySandboxConfig.SERIES_MAX_CANDLES})"
+            )
+        series_key = f"series:{_strategy_digest(strategy_code, params_json)}"
+        async with self._series_slots:
+            status, result = await self._run(
+                series_key, series_key, "series", strategy_code, params_json, candles, None
+            )
+        if status in ("timeout", "killed"):
+            raise TimeoutError(result.get("reason"))
+        if status != "ok":
+            raise ValueError(result.get("reason"))
+        return result
+
+    async def _run(
+        self,
+        lock_key: str,
+        stats_key: str,
+        kind: str,
+        strategy_code: str,
+        params_json: Optional[str],
+        candles,
+        payload,
+    ) -> tuple:
+        """lock_key 단위로 직렬화하여 유휴 워커 하나로 왕복하고 (status, result) 반환"""
+        await self._ensure_started()
+        loop = asyncio.get_running_loop()
+        key_lock = self._key_locks.setdefault(lock_key, asyncio.Lock())
+        async with key_lock:
+            worker = await self._idle.get()
+            started = time.perf_counter()
+            future = self._threads.submit(
+                self._roundtrip,
+                worker,
+                kind,
+                strategy_code,
+                params_json,
+                candles,
+                payload,
+            )
+            # 워커 반납은 왕복 스레드가 끝난 뒤에만: 대기 태스크가 취소돼도(봇 중지,
+            # 핫 리로드) 스레드는 아직 이 워커의 파이프/공유 메모리 슬롯을 쓰고 있으므로
+            # 먼저 반납하면 다음 호출이 캔들을 덮어쓰고 이전 요청의 응답을 받게 됨
+            idle = self._idle
+            future.add_done_callback(lambda _: self._release(loop, idle, worker))
+            status, result = await asyncio.wrap_future(future, loop=loop)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            self._latency.setdefault(stats_key, _LatencyStats()).record(status, elapsed_ms)
+        if status != "ok":
+            logger.warning(f"Strategy sandbox {status} for {stats_key}: {result.get('reason')}")
+        return status, result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """워커 상태와 전략별 평가 지연"""
+        with self._stats_lock:
+            strategies = {key: stats.to_dict() for key, stats in self._latency.items()}
+        return {
+            "enabled": self.enabled,
+            "workers": self.max_workers,
+            "started": self._idle is not None,
+            "idle_workers": self._idle.qsize() if self._idle is not None else 0,
+            "restarts": sum(worker.restarts for worker in self._workers),
+            "cpu_budget_seconds": StrategySandboxConfig.CPU_BUDGET_SECONDS,
+            "series_cpu_budget_seconds": StrategySandboxConfig.SERIES_CPU_BUDGET_SECONDS,
+            "memory_limit_mb": StrategySandboxConfig.MEMORY_LIMIT_MB,
+            "strategies": strategies,
+        }
+
+    def shutdown(self):
+        for worker in self._workers:
+            worker.close()
+        self._workers = []
+        self._idle = None
+        if self._threads is not None:
+            self._threads.shutdown(wait=False)
+            self._threads = None
+
+
+# 전역 인스턴스
+strategy_sandbox = StrategySandboxPool()
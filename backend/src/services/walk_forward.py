@@ -0,0 +1,249 @@
+"""
+워크포워드 최적화
+
+in-sample(IS) 구간에서 파라미터를 최적화하고, 바로 다음 out-of-sample(OOS)
+구간에서 선택된 파라미터를 검증하는 과정을 구간을 이동하며 반복합니다.
+
+- rolling: IS 시작점도 함께 이동 / anchored: IS 시작점 고정 (확장 윈도우)
+- 모든 fold는 하나의 SharedCandleBlock을 공유하고, (fold × 파라미터 청크)
+  작업을 sweep_runner 프로세스 풀에 함께 제출하여 코어 전체에서 동시에 실행
+- OOS equity 곡선은 fold 순서대로 이어 붙임 (엔진 수량이 고정(1.0)이므로
+  초기 잔고 차이만큼 평행 이동하면 연속 실행과 동일)
+"""
+
+import logging
+import math
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..config import BacktestConfig
+from .backtest_metrics import BacktestMetricsCalculator
+from .backtest_sweep import ParameterGrid, TopK, iter_chunks, sweep_runner
+from .candle_arrays import CandleArrays, SharedCandleBlock
+
+logger = logging.getLogger(__name__)
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+# (is_start, is_end, oos_start, oos_end) 캔들 인덱스, 각 구간은 [start, end)
+Fold = Tuple[int, int, int, int]
+
+
+def build_folds(
+    timestamps: np.ndarray,
+    in_sample_days: float,
+    out_of_sample_days: float,
+    step_days: Optional[float] = None,
+    anchored: bool = False,
+) -> List[Fold]:
+    """
+    타임스탬프(ms) 기준으로 IS/OOS 구간 인덱스 생성
+
+    step_days 기본값은 out_of_sample_days (OOS 구간이 겹치지 않음).
+    끝까지 채우지 못하는 마지막 OOS 구간은 제외합니다.
+    """
+    if in_sample_days <= 0 or out_of_sample_days <= 0:
+        raise ValueError("in_sample_days and out_of_sample_days must be positive")
+    step_days = step_days or out_of_sample_days
+    if step_days <= 0:
+        raise ValueError("step_days must be positive")
+    if len(timestamps) == 0:
+        return []
+
+    first = int(timestamps[0])
+    # 마지막 캔들은 [last, last + 봉 길이) 구간을 포함
+    bar_ms = int(timestamps[-1] - timestamps[-2]) if len(timestamps) > 1 else 1
+    data_end = int(timestamps[-1]) + bar_ms
+    in_sample_ms = int(in_sample_days * DAY_MS)
+    out_of_sample_ms = int(out_of_sample_days * DAY_MS)
+    step_ms = int(step_days * DAY_MS)
+
+    folds: List[Fold] = []
+    offset = 0
+    while True:
+        is_start_ts = first if anchored else first + offset
+        is_end_ts = first + offset + in_sample_ms
+        oos_end_ts = is_end_ts + out_of_sample_ms
+        if oos_end_ts > data_end:
+            break
+
+        is_start, is_end, oos_end = (
+            int(i)
+            for i in np.searchsorted(
+                timestamps, [is_start_ts, is_end_ts, oos_end_ts], side="left"
+            )
+        )
+        if is_end > is_start and oos_end > is_end:
+            folds.append((is_start, is_end, is_end, oos_end))
+        offset += step_ms
+
+    return folds
+
+
+def _iso(timestamps: np.ndarray, index: int) -> Optional[str]:
+    if index >= len(timestamps):
+        return None
+    return datetime.utcfromtimestamp(int(timestamps[index]) / 1000).isoformat()
+
+
+async def run_walk_forward(
+    candles: CandleArrays,
+    strategy_code: str,
+    grid: ParameterGrid,
+    engine_params: Dict[str, Any],
+    in_sample_days: float,
+    out_of_sample_days: float,
+    step_days: Optional[float] = None,
+    anchored: bool = False,
+    rank_by: str = "total_return",
+) -> Dict[str, Any]:
+    """
+    워크포워드 실행
+
+    Returns:
+        {
+            "folds": [fold별 구간 / 선택 파라미터 / IS·OOS 메트릭],
+            "equity_curve": 이어 붙인 OOS equity,
+            "trades": 전체 OOS 거래,
+            "final_balance": float,
+            "metrics": OOS 전체 메트릭,
+        }
+    """
+    started = time.monotonic()
+    folds = build_folds(
+        candles.timestamp, in_sample_days, out_of_sample_days, step_days, anchored
+    )
+    if not folds:
+        raise ValueError("Data range is too short for the requested windows")
+
+    total_runs = len(folds) * len(grid)
+    if total_runs > BacktestConfig.SWEEP_MAX_COMBINATIONS:
+        raise ValueError(
+            f"Too many runs: {len(folds)} folds x {len(grid)} combinations "
+            f"(max {BacktestConfig.SWEEP_MAX_COMBINATIONS})"
+        )
+
+    initial_balance = float(
+        engine_params.get("initial_balance", BacktestConfig.DEFAULT_INITIAL_BALANCE)
+    )
+    chunk_size = max(
+        1,
+        min(
+            BacktestConfig.SWEEP_CHUNK_SIZE,
+            math.ceil(total_runs / (sweep_runner.max_workers * 4)),
+        ),
+    )
+
+    block = SharedCandleBlock.create(candles)
+    try:
+        # 1) IS 최적화: 모든 fold의 파라미터 청크를 하나의 작업 스트림으로 제출
+        best = [TopK(rank_by, 1) for _ in folds]
+        failed = 0
+
+        def optimize_tasks():
+            for fold_index, (is_start, is_end, _, _) in enumerate(folds):
+                for chunk in iter_chunks(grid, chunk_size):
+                    yield fold_index, (is_start, is_end), chunk
+
+        async for fold_index, rows in sweep_runner.run_tasks(
+            block.descriptor, strategy_code, optimize_tasks(), engine_params
+        ):
+            for row in rows:
+                if "error" in row:
+                    failed += 1
+                else:
+                    best[fold_index].push(row)
+
+        # 2) OOS 검증: fold별 선택 파라미터를 동시에 실행
+        chosen: List[Optional[dict]] = [
+            (ranked[0] if ranked else None)
+            for ranked in (b.ranked() for b in best)
+        ]
+        oos_tasks = [
+            (fold_index, (oos_start, oos_end), [chosen[fold_index]["params"]])
+            for fold_index, (_, _, oos_start, oos_end) in enumerate(folds)
+            if chosen[fold_index] is not None
+        ]
+        oos_rows: Dict[int, dict] = {}
+        async for fold_index, rows in sweep_runner.run_tasks(
+            block.descriptor,
+            strategy_code,
+            oos_tasks,
+            engine_params,
+            include_curve=True,
+        ):
+            oos_rows[fold_index] = rows[0]
+    finally:
+        block.close()
+
+    # 3) OOS 결과 연결
+    timestamps = candles.timestamp
+    equity_curve: List[float] = []
+    trades: List[dict] = []
+    balance = initial_balance
+    bars_in_position = 0
+    fold_results = []
+
+    for fold_index, (is_start, is_end, oos_start, oos_end) in enumerate(folds):
+        fold_info = {
+            "fold": fold_index + 1,
+            "in_sample": {
+                "start": _iso(timestamps, is_start),
+                "end": _iso(timestamps, is_end - 1),
+                "candles": is_end - is_start,
+            },
+            "out_of_sample": {
+                "start": _iso(timestamps, oos_start),
+                "end": _iso(timestamps, oos_end - 1),
+                "candles": oos_end - oos_start,
+            },
+            "best_params": None,
+            "in_sample_metrics": None,
+            "out_of_sample_metrics": None,
+        }
+
+        selection = chosen[fold_index]
+        oos = oos_rows.get(fold_index)
+        if selection is not None:
+            fold_info["best_params"] = selection["params"]
+            fold_info["in_sample_metrics"] = selection["metrics"]
+
+        if oos is not None and "error" not in oos:
+            shift = balance - initial_balance
+            equity_curve.extend(value + shift for value in oos["equity_curve"])
+            trades.extend(oos["trades"])
+            balance = oos["final_balance"] + shift
+            bars_in_position += round(
+                oos["metrics"].get("exposure", 0.0) / 100 * len(oos["equity_curve"])
+            )
+            fold_info["out_of_sample_metrics"] = oos["metrics"]
+        elif oos is not None:
+            fold_info["error"] = oos["error"]
+
+        fold_results.append(fold_info)
+
+    calculator = BacktestMetricsCalculator()
+    calculator.compute(
+        trades,
+        equity_curve,
+        initial_balance,
+        timeframe=engine_params.get("timeframe"),
+        bars_in_position=bars_in_position,
+    )
+
+    return {
+        "strategy": strategy_code,
+        "rank_by": rank_by,
+        "anchored": anchored,
+        "combinations": len(grid),
+        "failed_runs": failed,
+        "folds": fold_results,
+        "equity_curve": equity_curve,
+        "trades": trades,
+        "final_balance": float(balance),
+        "metrics": calculator.summary(),
+        "elapsed_seconds": round(time.monotonic() - started, 3),
+    }
@@ -7,8 +7,20 @@ import logging
 from typing import Dict, List, Optional
 import numpy as np
 
+from .. import indicators
+from ..indicators.memo import indicator_memo
+from ..services.candle_arrays import CANDLE_FIELDS, CandleArrays
+from .exit_triggers import ExitTriggers
+
 logger = logging.getLogger(__name__)
 
+# 전체 시리즈 신호 계산 시 캔들별 호출 윈도우 크기 (bot_runner 캔들 버퍼와 동일)
+SIGNAL_WINDOW_SIZE = 200
+
+# 진입 신호 ↔ int8 코드
+_SIGNAL_CODES = {"LONG": 1, "SHORT": -1, "BUY": 1, "SELL": -1, None: 0}
+_SIGNAL_NAMES = {1: "LONG", -1: "SHORT", 0: None}
+
 
 class DynamicStrategyExecutor:
     """동적으로 전략 코드를 실행하는 클래스"""
@@ -48,17 +60,26 @@ class DynamicStrategyExecutor:
         )
 
         # 기술적 지표 계산 함수들
-        self.namespace.update(
-            {
-                "calculate_rsi": self._calculate_rsi,
-                "calculate_ema": self._calculate_ema,
-                "calculate_sma": self._calculate_sma,
-                "calculate_macd": self._calculate_macd,
-                "calculate_bollinger_bands": self._calculate_bollinger_bands,
-                "calculate_atr": self._calculate_atr,
-                "calculate_adx": self._calculate_adx,
+        functions = {
+            "calculate_rsi": self._calculate_rsi,
+            "calculate_ema": self._calculate_ema,
+            "calculate_sma": self._calculate_sma,
+            "calculate_macd": self._calculate_macd,
+            "calculate_bollinger_bands": self._calculate_bollinger_bands,
+            "calculate_atr": self._calculate_atr,
+            "calculate_adx": self._calculate_adx,
+        }
+
+        # 심볼/타임프레임이 있으면 같은 캔들의 지표 결과를 다른 사용자와 공유
+        symbol = self.params.get("symbol")
+        timeframe = self.params.get("timeframe")
+        if symbol and timeframe:
+            functions = {
+                name: indicator_memo.wrap(symbol, timeframe, name, func)
+                for name, func in functions.items()
             }
-        )
+
+        self.namespace.update(functions)
 
     def _compile_strategy(self):
         """전략 코드 컴파일"""
@@ -85,47 +106,160 @@ class DynamicStrategyExecutor:
                 "reason": str,
                 "stop_loss": float,
                 "take_profit": float,
-                "size": float
+                "size": float,
+                "exit_triggers": {"lower", "upper", "zones", "rsi_zones"}  # 포지션 보유 중 hold일 때 (선택)
             }
         """
         try:
-            # 전략 함수 확인
-            if "check_entry_signal" not in self.namespace:
+            # 포지션이 있으면 진입 신호는 쓰이지 않으므로 청산 조건만 확인
+            if current_position:
+                result = self.resolve_signal(None, current_price, candles, current_position)
+                if result["action"] == "hold":
+                    triggers = self.exit_triggers(current_position, candles)
+                    if triggers is not None:
+                        result["exit_triggers"] = triggers.to_dict()
+                return result
+
+            # 전략 함수 확인 (generate_signals만 구현한 전략은 마지막 캔들 값 사용)
+            if "check_entry_signal" in self.namespace:
+                signal = self.namespace["check_entry_signal"](candles, self.params)
+            elif self.has_batch_signals:
+                signal = self._last_batch_signal(candles)
+            else:
                 logger.warning("check_entry_signal function not found in strategy code")
                 return self._default_hold_signal()
 
-            # 진입 시그널 확인
-            signal = self.namespace["check_entry_signal"](candles, self.params)
-
-            # 포지션이 없으면 진입 시그널 확인 (None 또는 빈 딕셔너리)
-            if not current_position:  # None, {}, [] 모두 False
-                if signal == "LONG":
-                    logger.info(f"🟢 LONG signal detected, creating buy signal")
-                    return self._create_buy_signal(current_price, candles)
-                elif signal == "SHORT":
-                    logger.info(f"🔴 SHORT signal detected, creating sell signal")
-                    return self._create_sell_signal(current_price, candles)
-                else:
-                    return self._default_hold_signal()
-
-            # 포지션이 있으면 청산 조건 확인
-            else:
-                if self._should_exit_position(current_position, current_price, candles):
-                    return {
-                        "action": "close",
-                        "confidence": 0.8,
-                        "reason": "Exit condition met",
-                        "stop_loss": None,
-                        "take_profit": None,
-                        "size": current_position.get("quantity", 0),
-                    }
-                else:
-                    return self._default_hold_signal()
+            return self.resolve_signal(signal, current_price, candles, current_position)
 
         except Exception as e:
             logger.error(f"Error generating signal: {e}", exc_info=True)
             return self._default_hold_signal()
 
+    def resolve_signal(
+        self,
+        entry_signal: Optional[str],
+        current_price: float,
+        candles: List[Dict],
+        current_position: Optional[Dict] = None,
+    ) -> Dict:
+        """
+        진입 신호("LONG" | "SHORT" | None) → 주문 시그널
+
+        포지션이 없으면 진입 신호로 매수/매도 시그널을 만들고,
+        포지션이 있으면 진입 신호와 무관하게 청산 조건만 확인합니다.
+        """
+        # 포지션이 없으면 진입 시그널 확인 (None 또는 빈 딕셔너리)
+        if not current_position:  # None, {}, [] 모두 False
+            if entry_signal == "LONG":
+                logger.info(f"🟢 LONG signal detected, creating buy signal")
+                return self._create_buy_signal(current_price, candles)
+            elif entry_signal == "SHORT":
+                logger.info(f"🔴 SHORT signal detected, creating sell signal")
+                return self._create_sell_signal(current_price, candles)
+            else:
+                return self._default_hold_signal()
+
+        # 포지션이 있으면 청산 조건 확인
+        if self._should_exit_position(current_position, current_price, candles):
+            return {
+                "action": "close",
+                "confidence": 0.8,
+                "reason": "Exit condition met",
+                "stop_loss": None,
+                "take_profit": None,
+                "size": current_position.get("quantity", 0),
+            }
+        return self._default_hold_signal()
+
+    # ===== 전체 시리즈 신호 (generate_signals 계약) =====
+
+    @property
+    def has_batch_signals(self) -> bool:
+        """
+        전략 코드가 generate_signals(arrays, params)를 구현했는지
+
+        generate_signals는 CandleArrays(timestamp/open/high/low/close/volume numpy 배열)를 받아
+        캔들마다 진입 신호 하나씩, 길이가 같은 시퀀스를 반환합니다.
+        값: "LONG" / "SHORT" / None 또는 1 / -1 / 0
+        i번째 값은 check_entry_signal(candles[:i + 1], params)와 같은 의미입니다.
+        """
+        return callable(self.namespace.get("generate_signals"))
+
+    def batch_signals(self, candles: CandleArrays) -> Optional[np.ndarray]:
+        """
+        generate_signals 결과를 int8 벡터(1 LONG, -1 SHORT, 0 없음)로 반환
+
+        전략이 구현하지 않았거나 실패/형식 오류이면 None (호출자는 캔들별 호출로 대체).
+        """
+        if not self.has_batch_signals:
+            return None
+        try:
+            result = self.namespace["generate_signals"](candles, self.params)
+            return _signal_vector(result, len(candles))
+        except Exception as e:
+            logger.warning(f"generate_signals failed, falling back to per-bar signals: {e}")
+            return None
+
+    def generate_signal_series(
+        self, candles: CandleArrays, window_size: int = SIGNAL_WINDOW_SIZE
+    ) -> np.ndarray:
+        """
+        전체 시리즈 진입 신호 벡터 (백테스트 / 차트 신호 오버레이용)
+
+        generate_signals가 있으면 한 번에 계산하고, 없으면 캔들마다
+        check_entry_signal을 최근 window_size개 캔들(라이브 봇 버퍼 크기)로 호출합니다.
+        """
+        vector = self.batch_signals(candles)
+        if vector is not None:
+            return vector
+        return self._per_bar_signals(candles, window_size)
+
+    def _per_bar_signals(self, candles: CandleArrays, window_size: int) -> np.ndarray:
+        """check_entry_signal 캔들별 호출 (지표는 전체 시리즈 기준으로 한 번만 계산)"""
+        from ..services.strategies.dynamic_adapter import (
+            INDICATOR_OFFSETS,
+            CandleWindow,
+            IndicatorSeriesMemo,
+        )
+
+        n = len(candles)
+        signals = np.zeros(n, dtype=np.int8)
+        check_entry_signal = self.namespace.get("check_entry_signal")
+        if check_entry_signal is None or n == 0:
+            return signals
+
+        columns = tuple(getattr(candles, field).tolist() for field in CANDLE_FIELDS)
+        memo = IndicatorSeriesMemo(CandleWindow(columns, 0, n))
+        saved = {name: self.namespace[name] for name in INDICATOR_OFFSETS}
+        for name in INDICATOR_OFFSETS:
+            self.namespace[name] = memo.wrap(name, getattr(self, f"_{name}"))
+
+        try:
+            for i in range(n):
+                window = CandleWindow(columns, max(0, i + 1 - window_size), i + 1)
+                try:
+                    signal = check_entry_signal(window, self.params)
+                except Exception as e:
+                    logger.debug(f"check_entry_signal failed at bar {i}: {e}")
+                    continue
+                signals[i] = _SIGNAL_CODES.get(signal, 0)
+        finally:
+            self.namespace.update(saved)
+        return signals
+
+    def _last_batch_signal(self, candles: List[Dict]) -> Optional[str]:
+        """라이브 캔들 윈도우에서 generate_signals 마지막 값"""
+        if not len(candles):
+            return None
+        arrays = CandleArrays(
+            [int(c.get("timestamp") or c.get("time") or 0) for c in candles],
+            *(_column(candles, field) for field in CANDLE_FIELDS[1:]),
+        )
+        vector = self.batch_signals(arrays)
+        if vector is None:
+            return None
+        return _SIGNAL_NAMES[int(vector[-1])]
+
     def _create_buy_signal(self, current_price: float, candles: List[Dict]) -> Dict:
         """매수 시그널 생성"""
         # 손절/익절 계산
@@ -275,6 +409,45 @@ class DynamicStrategyExecutor:
             logger.error(f"Error checking exit condition: {e}", exc_info=True)
             return False
 
+    def exit_triggers(
+        self, position: Dict, candles: List[Dict]
+    ) -> Optional[ExitTriggers]:
+        """
+        보유 포지션의 청산 트리거 가격 (_should_exit_position과 같은 조건)
+
+        손절/익절 가격에 전략의 exit_thresholds(position, candles, params)가 돌려준
+        {"lower", "upper", "zones", "rsi_zones"}를 합칩니다. should_partial_exit가 있는데
+        exit_thresholds가 없거나 None을 반환하면 가격만으로 판단할 수 없으므로 None (매 틱 평가).
+        """
+        try:
+            triggers = ExitTriggers()
+            stop_loss = position.get("stop_loss") or None
+            take_profit = position.get("take_profit") or None
+            if position.get("side", "LONG") == "LONG":
+                triggers.merge(lower=stop_loss, upper=take_profit)
+            else:  # SHORT
+                triggers.merge(lower=take_profit, upper=stop_loss)
+
+            if "should_partial_exit" in self.namespace:
+                if "exit_thresholds" not in self.namespace:
+                    return None
+                thresholds = self.namespace["exit_thresholds"](
+                    position, candles, self.params
+                )
+                if thresholds is None:
+                    return None
+                triggers.merge(
+                    lower=thresholds.get("lower"),
+                    upper=thresholds.get("upper"),
+                    zones=thresholds.get("zones"),
+                    rsi_zones=thresholds.get("rsi_zones"),
+                )
+            return triggers
+
+        except Exception as e:
+            logger.error(f"Error computing exit triggers: {e}", exc_info=True)
+            return None
+
     def _default_hold_signal(self) -> Dict:
         """기본 홀드 시그널"""
         return {
@@ -289,129 +462,75 @@ class DynamicStrategyExecutor:
     # ===== 기술적 지표 계산 함수들 =====
 
     def _calculate_rsi(self, candles: List[Dict], period: int = 14) -> List[float]:
-        """RSI 계산"""
-        closes = [c["close"] for c in candles]
+        """RSI 계산 (길이 len(candles) - 1, 처음 period개는 50)"""
+        closes = _column(candles, "close")
         if len(closes) < period + 1:
             return [50.0] * len(closes)
 
-        deltas = np.diff(closes)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-
-        avg_gain = np.mean(gains[:period])
-        avg_loss = np.mean(losses[:period])
-
-        rsi_values = [50.0] * period
-
-        for i in range(period, len(deltas)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-
-            if avg_loss == 0:
-                rsi_values.append(100.0)
-            else:
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
-                rsi_values.append(rsi)
-
-        return rsi_values
+        rsi_values = indicators.rsi(closes, period)[1:]
+        rsi_values[:period] = 50.0
+        return rsi_values.tolist()
 
     def _calculate_ema(self, candles: List[Dict], period: int) -> List[float]:
         """EMA 계산"""
-        closes = [c["close"] for c in candles]
-        if len(closes) < period:
-            return [closes[0]] * len(closes)
-
-        ema_values = [np.mean(closes[:period])]
-        multiplier = 2 / (period + 1)
-
-        for i in range(period, len(closes)):
-            ema = (closes[i] - ema_values[-1]) * multiplier + ema_values[-1]
-            ema_values.append(ema)
-
-        # 앞부분 패딩
-        return [ema_values[0]] * (period - 1) + ema_values
+        return _padded_ema(_column(candles, "close"), period).tolist()
 
     def _calculate_sma(self, candles: List[Dict], period: int) -> List[float]:
-        """SMA 계산"""
-        closes = [c["close"] for c in candles]
+        """SMA 계산 (period 미만 구간은 누적 평균)"""
+        closes = _column(candles, "close")
         if len(closes) < period:
-            return [closes[0]] * len(closes)
-
-        sma_values = []
-        for i in range(len(closes)):
-            if i < period - 1:
-                sma_values.append(np.mean(closes[: i + 1]))
-            else:
-                sma_values.append(np.mean(closes[i - period + 1 : i + 1]))
+            return [closes[0]] * len(closes) if len(closes) else []
 
-        return sma_values
+        sma_values = indicators.sma(closes, period)
+        sma_values[: period - 1] = indicators.expanding_mean(closes[: period - 1])
+        return sma_values.tolist()
 
     def _calculate_macd(
         self, candles: List[Dict], fast: int = 12, slow: int = 26, signal: int = 9
     ) -> tuple:
         """MACD 계산"""
-        ema_fast = self._calculate_ema(candles, fast)
-        ema_slow = self._calculate_ema(candles, slow)
-
-        macd_line = [f - s for f, s in zip(ema_fast, ema_slow)]
+        closes = _column(candles, "close")
+        macd_line = _padded_ema(closes, fast) - _padded_ema(closes, slow)
 
         # Signal line (MACD의 EMA)
-        macd_candles = [{"close": m} for m in macd_line]
-        signal_line = self._calculate_ema(macd_candles, signal)
+        signal_line = _padded_ema(macd_line, signal)
 
-        histogram = [m - s for m, s in zip(macd_line, signal_line)]
+        histogram = macd_line - signal_line
 
-        return macd_line, signal_line, histogram
+        return macd_line.tolist(), signal_line.tolist(), histogram.tolist()
 
     def _calculate_bollinger_bands(
         self, candles: List[Dict], period: int = 20, std_dev: float = 2.0
     ) -> tuple:
-        """볼린저 밴드 계산"""
-        closes = [c["close"] for c in candles]
+        """볼린저 밴드 계산 (period 미만 구간은 누적 평균/표준편차)"""
+        closes = _column(candles, "close")
         if len(closes) < period:
             avg = np.mean(closes)
             return [avg] * len(closes), [avg] * len(closes), [avg] * len(closes)
 
-        middle_band = self._calculate_sma(candles, period)
-        upper_band = []
-        lower_band = []
+        middle_band = np.asarray(self._calculate_sma(candles, period))
+        std = indicators.rolling_std(closes, period)
+        std[: period - 1] = indicators.expanding_std(closes[: period - 1])
 
-        for i in range(len(closes)):
-            if i < period - 1:
-                std = np.std(closes[: i + 1])
-            else:
-                std = np.std(closes[i - period + 1 : i + 1])
+        upper_band = middle_band + std_dev * std
+        lower_band = middle_band - std_dev * std
 
-            upper_band.append(middle_band[i] + std_dev * std)
-            lower_band.append(middle_band[i] - std_dev * std)
-
-        return upper_band, middle_band, lower_band
+        return upper_band.tolist(), middle_band.tolist(), lower_band.tolist()
 
     def _calculate_atr(self, candles: List[Dict], period: int = 14) -> List[float]:
-        """ATR 계산"""
+        """ATR 계산 (period 미만 구간은 True Range 누적 평균)"""
         if len(candles) < 2:
             return [0.0] * len(candles)
 
-        true_ranges = []
-        for i in range(1, len(candles)):
-            high = candles[i]["high"]
-            low = candles[i]["low"]
-            prev_close = candles[i - 1]["close"]
-
-            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-            true_ranges.append(tr)
+        true_ranges = indicators.true_range(
+            _column(candles, "high"), _column(candles, "low"), _column(candles, "close")
+        )[1:]
 
-        atr_values = [true_ranges[0]] if true_ranges else [0.0]
-
-        for i in range(1, len(true_ranges)):
-            if i < period:
-                atr = np.mean(true_ranges[: i + 1])
-            else:
-                atr = (atr_values[-1] * (period - 1) + true_ranges[i]) / period
-            atr_values.append(atr)
+        warmup = min(period - 1, len(true_ranges))
+        atr_values = indicators.wilder(true_ranges, period)
+        atr_values[:warmup] = indicators.expanding_mean(true_ranges[:warmup])
 
-        return [atr_values[0]] + atr_values
+        return [float(atr_values[0])] + atr_values.tolist()
 
     def _calculate_adx(self, candles: List[Dict], period: int = 14) -> List[float]:
         """ADX 계산 (간단한 버전)"""
@@ -419,5 +538,43 @@ class DynamicStrategyExecutor:
             return [25.0] * len(candles)
 
         # 간단한 ADX 근사값 (실제 ADX는 더 복잡함)
-        atr = self._calculate_atr(candles, period)
-        return [min(100, max(0, a * 2)) for a in atr]
+        atr = np.asarray(self._calculate_atr(candles, period))
+        return np.clip(atr * 2, 0, 100).tolist()
+
+
+def _column(candles, field: str) -> np.ndarray:
+    """캔들 리스트(또는 CandleWindow)의 한 컬럼을 배열로"""
+    column = getattr(candles, "column", None)
+    if column is not None:
+        return column(field)
+    return np.array([c[field] for c in candles], dtype=np.float64)
+
+
+def _padded_ema(values: np.ndarray, period: int) -> np.ndarray:
+    """EMA (워밍업 구간은 시드 값으로 채움, period보다 짧으면 첫 값)"""
+    if len(values) < period:
+        return np.full(len(values), values[0] if len(values) else 0.0)
+    ema = indicators.ema(values, period)
+    ema[: period - 1] = ema[period - 1]
+    return ema
+
+
+def _signal_vector(values, n: int) -> np.ndarray:
+    """generate_signals 결과 → int8 벡터 (길이 n 검증)"""
+    if len(values) != n:
+        raise ValueError(f"generate_signals returned {len(values)} values for {n} candles")
+
+    array = np.asarray(values)
+    if array.dtype.kind in "biuf":
+        return np.sign(np.nan_to_num(array.astype(np.float64))).astype(np.int8)
+
+    vector = np.zeros(n, dtype=np.int8)
+    for i, value in enumerate(values):
+        if isinstance(value, str):
+            value = value.upper()
+        elif value is not None:
+            value = _SIGNAL_NAMES.get(int(np.sign(value)))
+        if value not in _SIGNAL_CODES:
+            raise ValueError(f"invalid signal value at index {i}: {value!r}")
+        vector[i] = _SIGNAL_CODES[value]
+    return vector
@@ -0,0 +1,118 @@
+"""
+보유 포지션 청산 트리거 (가격 임계값)
+
+포지션이 있는 봇은 매 틱마다 전략의 청산 판단(_should_exit_position, should_partial_exit)을
+다시 실행할 필요가 없습니다. 바 마감(또는 전체 평가) 시점에 청산 조건을 가격 구간으로
+등록해 두고, 틱에서는 가격 비교만 한 뒤 임계값을 넘거나 바가 바뀌면 전체 평가를 실행합니다.
+
+- lower: 가격 <= lower 이면 평가 (LONG 손절, SHORT 익절 등)
+- upper: 가격 >= upper 이면 평가 (LONG 익절, SHORT 손절 등)
+- zones: lo <= 가격 <= hi 이면 평가
+- rsi_zones: (period, lo, hi) - 현재 캔들 버퍼의 RSI가 lo~hi이면 평가
+  (예: RSI 중립구간 부분 익절)
+
+라이브 봇은 틱마다 진행 중 캔들의 종가를 갱신하므로 지표 값은 바 안에서도 틱마다 바뀝니다.
+지표 조건은 가격 구간으로 미리 바꿔 둘 수 없으므로(한 틱 뒤의 종가에만 유효)
+rsi_zones는 틱마다 현재 버퍼로 지표를 다시 계산해 전략과 같은 값을 비교합니다.
+공유 지표 메모를 쓰는 전략은 확정 캔들 기준 값을 보므로, 진행 중 캔들을 포함한 값과
+뺀 값 중 하나라도 구간에 닿으면 평가합니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .. import indicators
+
+# 임계값 경계의 부동소수점 오차 여유 (상대값, 평가 쪽으로 넓힘)
+TRIGGER_MARGIN = 1e-6
+# RSI 구간 경계 여유 (RSI 단위)
+RSI_MARGIN = 1e-9
+
+
+@dataclass
+class ExitTriggers:
+    lower: Optional[float] = None
+    upper: Optional[float] = None
+    zones: List[Tuple[float, float]] = field(default_factory=list)
+    rsi_zones: List[Tuple[int, float, float]] = field(default_factory=list)
+    bar: Optional[int] = None  # 트리거를 계산한 바 (타임프레임 구간 인덱스)
+
+    def merge(self, lower=None, upper=None, zones=None, rsi_zones=None) -> "ExitTriggers":
+        """다른 청산 조건 추가 (먼저 닿는 경계가 우선)"""
+        if lower is not None:
+            self.lower = lower if self.lower is None else max(self.lower, lower)
+        if upper is not None:
+            self.upper = upper if self.upper is None else min(self.upper, upper)
+        for lo, hi in zones or ():
+            self.zones.append((min(lo, hi), max(lo, hi)))
+        for period, lo, hi in rsi_zones or ():
+            self.rsi_zones.append((int(period), min(lo, hi), max(lo, hi)))
+        return self
+
+    def requires_evaluation(
+        self, price: float, closes: Optional[Sequence[float]] = None
+    ) -> bool:
+        """
+        가격(또는 현재 버퍼의 지표)이 청산 조건 구간에 닿았는지 (전체 전략 평가 필요 여부)
+
+        rsi_zones가 있는데 closes가 없으면 판단할 수 없으므로 True.
+        """
+        margin = abs(price) * TRIGGER_MARGIN
+        if self.lower is not None and price <= self.lower + margin:
+            return True
+        if self.upper is not None and price >= self.upper - margin:
+            return True
+        if any(lo - margin <= price <= hi + margin for lo, hi in self.zones):
+            return True
+        if self.rsi_zones:
+            if closes is None:
+                return True
+            windows = (closes, closes[:-1]) if len(closes) > 1 else (closes,)
+            for period, lo, hi in self.rsi_zones:
+                for window in windows:
+                    value = last_rsi(window, period)
+                    # NaN(계산 불가)은 비교가 모두 False → not (...)로 평가 쪽
+                    if not (value < lo - RSI_MARGIN or value > hi + RSI_MARGIN):
+                        return True
+        return False
+
+    def holds(
+        self, price: float, bar: Optional[int], closes: Optional[Sequence[float]] = None
+    ) -> bool:
+        """같은 바 안에서 청산 조건에 닿지 않았으면 True (평가 생략 가능)"""
+        return (
+            bar is not None
+            and bar == self.bar
+            and not self.requires_evaluation(price, closes)
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "lower": self.lower,
+            "upper": self.upper,
+            "zones": [list(zone) for zone in self.zones],
+            "rsi_zones": [list(zone) for zone in self.rsi_zones],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict], bar: Optional[int] = None) -> Optional["ExitTriggers"]:
+        """시그널 결과의 exit_triggers → ExitTriggers (없으면 None = 매 틱 평가)"""
+        if not data:
+            return None
+        return cls(bar=bar).merge(
+            lower=data.get("lower"),
+            upper=data.get("upper"),
+            zones=data.get("zones"),
+            rsi_zones=data.get("rsi_zones"),
+        )
+
+
+def last_rsi(closes: Sequence[float], period: int) -> float:
+    """
+    마지막 캔들의 RSI (전략 calculate_rsi(candles, period)[-1]과 같은 값)
+
+    calculate_rsi는 처음 period개를 50으로 채우므로 캔들이 period + 1개 이하이면 50.
+    """
+    if len(closes) <= period + 1:
+        return 50.0
+    return float(indicators.rsi(closes, period)[-1])
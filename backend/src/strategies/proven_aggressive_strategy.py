@@ -128,3 +128,14 @@ def should_partial_exit(position, current_price, candles, params):
 
     except:
         return False, 0
+
+
+def exit_thresholds(position, candles, params):
+    """부분 익절 가격 (3% 수익, 틱에서는 이 가격에 닿을 때만 should_partial_exit 평가)"""
+    entry_price = position.get('entry_price', 0)
+    if not entry_price:
+        return {}
+
+    if position.get('side', 'LONG') == 'LONG':
+        return {'upper': entry_price * 1.03}
+    return {'lower': entry_price * 0.97}
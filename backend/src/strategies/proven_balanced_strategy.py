@@ -117,3 +117,8 @@ def should_partial_exit(position, current_price, candles, params):
         return False, 0
     except:
         return False, 0
+
+
+def exit_thresholds(position, candles, params):
+    """RSI 중립구간(45-55) 트리거 (틱마다 현재 캔들 버퍼의 RSI로 비교)"""
+    return {'rsi_zones': [(14, 45, 55)]}
@@ -102,6 +102,9 @@ class CacheManager:
         self.memory_cache = InMemoryCache(max_size=1000)
         self.use_redis = False
         self._initialized = False
+        # 조회 결과 (Prometheus cache_requests_total)
+        self.hits = 0
+        self.misses = 0
 
     async def initialize(self):
         """캐시 매니저 초기화"""
@@ -145,14 +148,21 @@ class CacheManager:
             if self.use_redis and self.redis_client:
                 value = await self.redis_client.get(key)
                 if value:
+                    self.hits += 1
                     # JSON 역직렬화
                     try:
                         return json.loads(value)
                     except json.JSONDecodeError:
                         return value
+                self.misses += 1
                 return None
             else:
-                return await self.memory_cache.get(key)
+                value = await self.memory_cache.get(key)
+                if value is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                return value
         except Exception as e:
             logger.error(f"Cache get error for key '{key}': {e}")
             return None
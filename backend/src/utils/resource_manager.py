@@ -67,6 +67,10 @@ class UserResourceManager:
         """백테스트 완료 기록"""
         self.active_backtests[user_id].discard(backtest_id)
 
+    def restore_backtest(self, user_id: int, backtest_id: int):
+        """서버 재시작 후 DB에 남아 있는 대기/실행 백테스트 재등록 (일일 카운트 제외)"""
+        self.active_backtests[user_id].add(backtest_id)
+
     def can_start_bot(self, user_id: int) -> tuple[bool, Optional[str]]:
         """
         봇 시작 가능 여부 확인.
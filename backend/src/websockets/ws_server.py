@@ -408,7 +408,7 @@ async def user_socket(websocket: WebSocket, user_id: int, token: str = Query(...
     WebSocket 연결 엔드포인트 (JWT 인증 필요)
 
     클라이언트 메시지 형식:
-    - {"action": "subscribe", "channels": ["price", "position", "order", "balance"]}
+    - {"action": "subscribe", "channels": ["price", "position", "order", "balance", "backtest"]}
     - {"action": "unsubscribe", "channels": ["price"]}
     - {"action": "ping"}
 
@@ -418,6 +418,9 @@ async def user_socket(websocket: WebSocket, user_id: int, token: str = Query(...
     - {"type": "order_update", "data": {...}, "timestamp": "..."}
     - {"type": "balance_update", "data": {...}, "timestamp": "..."}
     - {"type": "alert", "level": "ERROR", "message": "...", "timestamp": "..."}
+    - {"type": "backtest_progress", "channel": "backtest", "data": {...}, "timestamp": "..."}
+    - {"type": "backtest_completed" | "backtest_failed", "channel": "backtest", "data": {...}, ...}
+      (services/backtest_progress.py 참고)
     """
     # JWT 토큰 검증
     try:
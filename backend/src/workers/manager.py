@@ -3,6 +3,7 @@ import logging
 from sqlalchemy import select
 
 from ..database.models import BotStatus
+from ..services.bot_admission import bot_admission
 from ..services.bot_runner import BotRunner
 
 logger = logging.getLogger(__name__)
@@ -18,9 +19,11 @@ class BotManager:
         """
         서버 시작 시 DB에서 is_running=True인 봇들을 복구합니다.
         개별 봇 시작 실패 시에도 다른 봇들의 복구는 계속 진행됩니다.
+        실제 시작 단계는 bot_admission이 동시 실행 수와 시작 시각을 분산합니다.
         """
         started_count = 0
         failed_count = 0
+        skipped_count = 0
 
         async with self.session_factory() as session:
             result = await session.execute(
@@ -34,20 +37,33 @@ class BotManager:
 
             logger.info(f"Found {len(bot_statuses)} bot(s) to restore from database")
 
+            # 봇 태스크는 바로 생성하되 시작 단계는 승인 제어(동시 시작 수 제한 + jitter)를 거침
+            # 진행률: GET /admin/monitoring/bot-bootstrap
+            bot_admission.begin_bootstrap(len(bot_statuses))
+            # 시작 태스크가 없는 봇(예외 / 이미 실행 중)도 진행률에 반영해야 complete가 됨
             for status in bot_statuses:
                 try:
-                    await self.runner.start(self.session_factory, status.user_id)
-                    started_count += 1
-                    logger.info(f"✅ Bot restored for user {status.user_id}")
+                    created = await self.runner.start(
+                        self.session_factory, status.user_id, bootstrap=True
+                    )
                 except Exception as e:
                     failed_count += 1
+                    bot_admission.bootstrap_failed()
                     logger.error(
                         f"❌ Failed to restore bot for user {status.user_id}: {e}"
                     )
+                    continue
+
+                if created:
+                    started_count += 1
+                else:
+                    skipped_count += 1
+                    bot_admission.bootstrap_skipped()
 
             logger.info(
-                f"Bot bootstrap complete: {started_count} started, {failed_count} failed "
-                f"(out of {len(bot_statuses)} total)"
+                f"Bot bootstrap scheduled: {started_count} queued, {failed_count} failed, "
+                f"{skipped_count} already running "
+                f"(out of {len(bot_statuses)} total, concurrency {bot_admission.concurrency})"
             )
 
     async def start_bot(self, user_id: int):
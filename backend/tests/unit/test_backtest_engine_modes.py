@@ -0,0 +1,46 @@
+"""
+BacktestEngine 루프 / 벡터화 모드 결과 일치, 캔들 내부 체결 집계 테스트
+"""
+import pytest
+
+from benchmarks.data import synthetic_candles
+from src.services.backtest_engine import BacktestEngine
+from src.services.strategies.base import StrategyBase
+from src.services.strategies.registry import get_strategy
+
+PARAMS = {"initial_balance": 10_000, "fee_rate": 0.0004, "slippage": 0.0002}
+
+
+@pytest.fixture(scope="module")
+def candles():
+    return synthetic_candles(5_000, seed=42)
+
+
+@pytest.mark.parametrize("name", ["openclose", "ema", "rsi"])
+def test_loop_and_vector_modes_match(candles, name):
+    loop = BacktestEngine(get_strategy(name)).run_on_candles(candles, {**PARAMS, "mode": "loop"})
+    vector = BacktestEngine(get_strategy(name)).run_on_candles(candles, {**PARAMS, "mode": "vector"})
+
+    assert loop["trades"]
+    assert vector["trades"] == loop["trades"]
+    assert vector["equity_curve"] == pytest.approx(loop["equity_curve"], rel=1e-12)
+    assert vector["final_balance"] == pytest.approx(loop["final_balance"], rel=1e-12)
+
+
+class AlwaysLongWithTightStop(StrategyBase):
+    """매 캔들 롱 진입, 진입가 바로 아래 손절 → 다음 캔들에서 손절 후 같은 캔들 재진입"""
+
+    def on_candle(self, candle, position):
+        return "buy" if position is None else "hold"
+
+    def exit_levels(self, position):
+        return position["entry_price"] * 0.9999, None
+
+
+def test_intrabar_reentry_counts_each_bar_once(candles):
+    result = BacktestEngine(AlwaysLongWithTightStop()).run_on_candles(
+        candles, {**PARAMS, "fill_model": "intrabar", "mode": "loop"}
+    )
+
+    assert result["metrics"]["intrabar_exits"] > 0
+    assert result["metrics"]["exposure"] <= 100.0
@@ -0,0 +1,124 @@
+"""
+BacktestJobRunner 프로세스 풀 장애 처리 테스트
+"""
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import BacktestConfig
+from src.database.models import BacktestResult
+from src.services.backtest_jobs import BacktestJobRunner
+
+
+class BrokenPool:
+    """이미 깨진 풀: submit 시점에 BrokenProcessPool"""
+
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, fn, *args):
+        raise BrokenProcessPool("A child process terminated abruptly")
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+class PendingPool:
+    """제출은 받지만 실행하지 않는 풀 (반환 future를 테스트에서 직접 완료)"""
+
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+@pytest.fixture
+def session_factory(async_engine):
+    return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def make_runner(pool, replacement=None, session_factory=None) -> BacktestJobRunner:
+    runner = BacktestJobRunner(max_workers=2)
+    runner._pool = pool
+    runner._session_factory = session_factory
+    runner._create_pool = lambda: replacement
+    return runner
+
+
+async def insert_running_job(session_factory, owner_id: str, attempts: int) -> int:
+    async with session_factory() as session:
+        job = BacktestResult(
+            user_id=1,
+            initial_balance=1000.0,
+            final_balance=0.0,
+            status="running",
+            lease_owner=owner_id,
+            lease_expires_at=datetime.utcnow() + timedelta(minutes=5),
+            attempts=attempts,
+        )
+        session.add(job)
+        await session.commit()
+        return job.id
+
+
+class TestSubmit:
+    async def test_broken_pool_is_replaced_before_registering(self):
+        broken = BrokenPool()
+        replacement = PendingPool()
+        runner = make_runner(broken, replacement)
+
+        assert runner._submit(7, 1) is True
+        assert runner._pool is replacement
+        assert broken.shut_down
+        assert list(runner._inflight) == [7]
+        assert len(replacement.futures) == 1
+
+    async def test_failed_submit_does_not_hold_a_slot(self):
+        runner = make_runner(BrokenPool(), BrokenPool())
+
+        assert runner._submit(7, 1) is False
+        assert runner._inflight == {}
+
+
+class TestWorkerCrash:
+    async def test_crashed_job_is_requeued_and_pool_replaced(self, session_factory):
+        pool = PendingPool()
+        replacement = PendingPool()
+        runner = make_runner(pool, replacement, session_factory)
+        runner._wakeup = asyncio.Event()
+        job_id = await insert_running_job(session_factory, runner.owner_id, attempts=1)
+
+        assert runner._submit(job_id, 1)
+        pool.futures[0].set_exception(BrokenProcessPool("worker died"))
+        await asyncio.sleep(0.05)
+        await asyncio.gather(*runner._requeue_tasks)
+
+        assert runner._inflight == {}
+        assert runner._pool is replacement
+        async with session_factory() as session:
+            job = await session.get(BacktestResult, job_id)
+            assert job.status == "queued"
+            assert job.lease_owner is None
+
+    async def test_crash_after_max_attempts_fails_job(self, session_factory):
+        runner = make_runner(PendingPool(), PendingPool(), session_factory)
+        job_id = await insert_running_job(
+            session_factory, runner.owner_id, attempts=BacktestConfig.JOB_MAX_ATTEMPTS
+        )
+
+        await runner._requeue_crashed(job_id, 1)
+
+        async with session_factory() as session:
+            job = await session.get(BacktestResult, job_id)
+            assert job.status == "failed"
+            assert job.finished_at is not None
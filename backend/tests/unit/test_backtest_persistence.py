@@ -0,0 +1,52 @@
+"""
+equity 곡선 blob 인코딩 / 미리보기 다운샘플 테스트
+"""
+import numpy as np
+import pytest
+
+from src.services.backtest_persistence import (
+    decode_equity_curve,
+    downsample_equity_curve,
+    encode_equity_curve,
+)
+
+
+class TestEquityCurveBlob:
+    def test_round_trip_is_lossless_at_float32(self):
+        rng = np.random.default_rng(0)
+        curve = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.01, 50_000)))
+        curve[1000:2000] = curve[999]  # 포지션 없는 구간
+
+        decoded = decode_equity_curve(encode_equity_curve(curve))
+
+        assert decoded.dtype == np.float32
+        np.testing.assert_array_equal(decoded, curve.astype(np.float32))
+
+    def test_round_trip_of_decreasing_and_empty_curves(self):
+        curve = [1000.0, 900.0, 950.0, 0.0, 1e-3]
+        np.testing.assert_array_equal(
+            decode_equity_curve(encode_equity_curve(curve)), np.float32(curve)
+        )
+        assert len(decode_equity_curve(encode_equity_curve([]))) == 0
+
+    def test_flat_curve_compresses_well(self):
+        blob = encode_equity_curve([1000.0] * 100_000)
+
+        assert len(blob) < 1_000
+
+    def test_unknown_format_is_rejected(self):
+        with pytest.raises(ValueError):
+            decode_equity_curve(b"XX" + encode_equity_curve([1.0]))
+
+
+def test_downsample_keeps_extremes_and_last_point():
+    curve = np.linspace(1000, 2000, 10_000)
+    curve[3_333] = 50.0
+    curve[6_666] = 5_000.0
+
+    preview = downsample_equity_curve(curve, max_points=101)
+
+    assert len(preview) <= 101
+    assert min(preview) == 50.0
+    assert max(preview) == 5_000.0
+    assert preview[-1] == curve[-1]
@@ -0,0 +1,91 @@
+"""
+백테스트 결과 캐시 키 테스트
+"""
+import os
+
+import pytest
+
+from benchmarks.data import synthetic_candles, write_csv
+from src.services import backtest_result_cache
+from src.services.backtest_result_cache import compute_cache_key
+
+
+@pytest.fixture
+def task_params(tmp_path):
+    csv_path = write_csv(synthetic_candles(500, seed=1), tmp_path / "candles.csv")
+    return {
+        "csv_path": str(csv_path),
+        "strategy_code": "rsi",
+        "strategy_params": {"period": 14, "overbought": 70},
+        "initial_balance": 1000,
+        "fee_rate": 0.0004,
+        "slippage": 0.0002,
+    }
+
+
+class TestComputeCacheKey:
+    def test_equivalent_requests_share_a_key(self, task_params):
+        reordered = {
+            **task_params,
+            "strategy_code": " RSI ",
+            "strategy_params": {"overbought": 70.0, "period": 14.0},
+            "initial_balance": 1000.0,
+        }
+
+        assert compute_cache_key(reordered) == compute_cache_key(task_params)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"strategy_params": {"period": 21, "overbought": 70}},
+            {"strategy_code": "ema"},
+            {"fee_rate": 0.001},
+            {"slippage": 0.0},
+            {"initial_balance": 2000},
+            {"start_date": "2024-01-01"},
+        ],
+    )
+    def test_inputs_change_the_key(self, task_params, change):
+        assert compute_cache_key({**task_params, **change}) != compute_cache_key(task_params)
+
+    def test_rewritten_series_invalidates_the_key(self, task_params):
+        before = compute_cache_key(task_params)
+        write_csv(synthetic_candles(501, seed=1), task_params["csv_path"])
+
+        assert compute_cache_key(task_params) != before
+
+    def test_unknown_series_is_not_cached(self, task_params):
+        os.remove(task_params["csv_path"])
+
+        assert compute_cache_key(task_params) is None
+
+    @pytest.mark.parametrize("strategy_code", ["openclose", "rsi", "ema", "proven_balanced"])
+    def test_strategy_module_change_invalidates_the_key(
+        self, task_params, tmp_path, monkeypatch, strategy_code
+    ):
+        modules = tmp_path / "strategies"
+        modules.mkdir()
+        (modules / "rsi_strategy.py").write_text("LENGTH = 14\n")
+        monkeypatch.setattr(backtest_result_cache, "STRATEGY_SOURCE_DIRS", (str(modules),))
+        params = {**task_params, "strategy_code": strategy_code}
+        before = compute_cache_key(params)
+
+        (modules / "rsi_strategy.py").write_text("LENGTH = 21\n")
+        assert compute_cache_key(params) != before
+
+    def test_fingerprint_covers_registry_strategies(self):
+        files = {
+            name
+            for directory in backtest_result_cache.STRATEGY_SOURCE_DIRS
+            for name in os.listdir(directory)
+        }
+
+        assert {
+            "simple_open_close.py",
+            "rsi_strategy.py",
+            "ema_strategy.py",
+            "dynamic_adapter.py",
+            "dynamic_strategy_executor.py",
+            "proven_balanced_strategy.py",
+            "batch.py",
+        } <= files
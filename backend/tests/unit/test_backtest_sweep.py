@@ -0,0 +1,136 @@
+"""
+파라미터 스윕 그리드 / 상위 K개 랭킹 / 스트리밍 리소스 점유 테스트
+"""
+import types
+
+import pytest
+
+from src.api import backtest as backtest_api
+from src.schemas.backtest_schema import BacktestSweepRequest
+from src.services.backtest_sweep import ParameterGrid, TopK, expand_param_values
+from src.utils.resource_manager import UserResourceManager
+
+
+class TestExpandParamValues:
+    def test_int_range_includes_stop(self):
+        assert expand_param_values("period", {"start": 7, "stop": 21, "step": 7}) == [7, 14, 21]
+
+    def test_float_range_has_no_accumulated_error(self):
+        values = expand_param_values("threshold", {"start": 0.1, "stop": 0.5, "step": 0.1})
+        assert values == [0.1, 0.2, 0.3, 0.4, 0.5]
+
+    def test_list_and_scalar(self):
+        assert expand_param_values("period", [9, 14]) == [9, 14]
+        assert expand_param_values("period", 14) == [14]
+
+    @pytest.mark.parametrize(
+        "spec",
+        [{"start": 1}, {"start": 5, "stop": 1}, {"start": 1, "stop": 5, "step": 0}, []],
+    )
+    def test_invalid_specs(self, spec):
+        with pytest.raises(ValueError):
+            expand_param_values("period", spec)
+
+
+class TestParameterGrid:
+    def test_combinations_are_generated_lazily(self):
+        grid = ParameterGrid(
+            {"a": {"start": 1, "stop": 1000}, "b": {"start": 1, "stop": 1000}, "c": [1, 2]}
+        )
+
+        assert len(grid) == 2_000_000
+        combos = iter(grid)
+        assert isinstance(combos, types.GeneratorType)
+        assert next(combos) == {"a": 1, "b": 1, "c": 1}
+        assert next(combos) == {"a": 1, "b": 1, "c": 2}
+
+    def test_empty_grid_is_rejected(self):
+        with pytest.raises(ValueError):
+            ParameterGrid({})
+
+
+def row(params_id: int, **metrics) -> dict:
+    return {"params": {"id": params_id}, "metrics": metrics}
+
+
+class TestTopK:
+    def test_keeps_best_k_in_order(self):
+        top = TopK("total_return", 3)
+        for i, value in enumerate([5.0, -2.0, 12.0, 7.0, 1.0, 9.0]):
+            top.push(row(i, total_return=value))
+
+        ranked = top.ranked()
+        assert [r["metrics"]["total_return"] for r in ranked] == [12.0, 9.0, 7.0]
+        assert [r["rank"] for r in ranked] == [1, 2, 3]
+
+    def test_lower_is_better_for_drawdown(self):
+        top = TopK("max_drawdown", 2)
+        for i, value in enumerate([30.0, 5.0, 12.0, 8.0]):
+            top.push(row(i, max_drawdown=value))
+
+        assert [r["metrics"]["max_drawdown"] for r in top.ranked()] == [5.0, 8.0]
+
+    def test_ties_keep_the_earlier_row(self):
+        top = TopK("sharpe_ratio", 1)
+        top.push(row(0, sharpe_ratio=1.5))
+        top.push(row(1, sharpe_ratio=1.5))
+
+        assert top.ranked()[0]["params"] == {"id": 0}
+
+    def test_rows_without_metric_are_skipped(self):
+        top = TopK("win_rate", 5)
+        top.push(row(0))
+        top.push({"error": "failed"})
+
+        assert top.ranked() == []
+
+    def test_unknown_metric(self):
+        with pytest.raises(ValueError):
+            TopK("calmar", 5)
+
+
+class TestSweepStreamSlot:
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        manager = UserResourceManager()
+        monkeypatch.setattr(backtest_api, "resource_manager", manager)
+
+        async def load_candles(request):
+            return object()
+
+        async def sweep(*args, **kwargs):
+            yield {"type": "start"}
+            yield {"type": "done"}
+
+        monkeypatch.setattr(backtest_api, "_load_sweep_candles", load_candles)
+        monkeypatch.setattr(backtest_api.sweep_runner, "sweep", sweep)
+        return manager
+
+    @staticmethod
+    def request() -> BacktestSweepRequest:
+        return BacktestSweepRequest(
+            strategy_code="rsi",
+            start_date="2024-01-01",
+            end_date="2024-02-01",
+            param_grid={"length": [14]},
+        )
+
+    async def test_unstarted_stream_holds_no_slot(self, manager):
+        """응답 전송 전에 연결이 끊겨 스트림이 실행되지 않아도 슬롯이 남지 않음"""
+        response = await backtest_api.sweep_backtest(self.request(), user_id=1)
+
+        assert manager.active_backtests[1] == set()
+        await response.body_iterator.aclose()
+        assert manager.active_backtests[1] == set()
+
+    async def test_slot_is_held_while_streaming(self, manager):
+        response = await backtest_api.sweep_backtest(self.request(), user_id=1)
+
+        body = response.body_iterator
+        first = await body.__anext__()
+        assert '"start"' in first
+        assert len(manager.active_backtests[1]) == 1
+        assert manager.daily_backtest_count[1] == 1
+
+        await body.aclose()
+        assert manager.active_backtests[1] == set()
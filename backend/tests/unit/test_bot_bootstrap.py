@@ -0,0 +1,61 @@
+"""
+서버 재시작 봇 복구 진행률 테스트 (봇 태스크 없이)
+"""
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.models import BotStatus
+from src.services.bot_admission import BotAdmissionController
+from src.workers import manager as manager_module
+from src.workers.manager import BotManager
+
+
+class FakeRunner:
+    """user 1: 시작 예외, user 2: 이미 실행 중, 나머지: 태스크 생성 후 바로 준비 완료"""
+
+    def __init__(self, admission: BotAdmissionController):
+        self.admission = admission
+
+    async def start(self, session_factory, user_id: int, bootstrap: bool = False):
+        if user_id == 1:
+            raise RuntimeError("strategy missing")
+        if user_id == 2:
+            return False
+        self.admission.begin(user_id, bootstrap).ready()
+        return True
+
+
+@pytest.fixture
+def admission(monkeypatch):
+    controller = BotAdmissionController(concurrency=2)
+    monkeypatch.setattr(manager_module, "bot_admission", controller)
+    return controller
+
+
+async def test_failed_and_skipped_bots_complete_the_bootstrap(async_engine, admission):
+    session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add_all(BotStatus(user_id=user_id, is_running=True) for user_id in (1, 2, 3, 4))
+        await session.commit()
+
+    bot_manager = BotManager(asyncio.Queue(), session_factory)
+    bot_manager.runner = FakeRunner(admission)
+    await bot_manager.bootstrap()
+
+    stats = admission.get_stats()
+    assert stats["expected"] == 3
+    assert stats["ready"] == 2
+    assert stats["failed"] == 1
+    assert stats["progress"] == 1.0
+    assert stats["complete"]
+
+
+def test_all_bots_skipped_completes_immediately():
+    controller = BotAdmissionController()
+    controller.begin_bootstrap(2)
+    controller.bootstrap_skipped()
+    controller.bootstrap_skipped()
+
+    assert controller.get_stats()["complete"]
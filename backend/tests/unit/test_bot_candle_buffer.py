@@ -0,0 +1,53 @@
+"""
+봇 캔들 버퍼 틱 반영 테스트 (확정 캔들 + 진행 중 캔들 1개)
+"""
+import time
+from collections import deque
+
+from src.services.bot_runner import BotRunner
+
+HOUR_MS = 3_600_000
+BAR_OPEN = 1_700_002_800_000  # 1h 정렬
+
+
+def make_buffer():
+    return deque(
+        [
+            {"open": 99.0, "high": 101.0, "low": 98.0, "close": 100.0, "volume": 5.0, "time": BAR_OPEN - HOUR_MS},
+            {"open": 100.0, "high": 100.5, "low": 99.5, "close": 100.2, "volume": 1.0, "time": BAR_OPEN},
+        ],
+        maxlen=200,
+    )
+
+
+class TestApplyTick:
+    def test_tick_updates_in_progress_candle(self):
+        buffer = make_buffer()
+
+        assert BotRunner._apply_tick(buffer, {"time": BAR_OPEN + 60_000}, 101.0, HOUR_MS)
+        assert BotRunner._apply_tick(buffer, {"time": (BAR_OPEN + 120_000) // 1000}, 99.0, HOUR_MS)
+
+        assert len(buffer) == 2
+        assert buffer[-1] == {
+            "open": 100.0, "high": 101.0, "low": 99.0, "close": 99.0, "volume": 1.0, "time": BAR_OPEN,
+        }
+        assert buffer[0]["close"] == 100.0  # 확정 캔들은 그대로
+
+    def test_tick_of_a_new_bar_asks_for_reload(self):
+        buffer = make_buffer()
+        market = {"time": BAR_OPEN + HOUR_MS + 5_000}
+
+        assert not BotRunner._apply_tick(buffer, market, 102.0, HOUR_MS)
+        assert len(buffer) == 2
+
+        assert BotRunner._apply_tick(buffer, market, 102.0, HOUR_MS, new_bar=True)
+        assert buffer[-1]["time"] == BAR_OPEN + HOUR_MS
+        assert buffer[-1]["close"] == 102.0
+
+    def test_tick_without_time_uses_wall_clock(self, monkeypatch):
+        monkeypatch.setattr(time, "time", lambda: (BAR_OPEN + 30_000) / 1000)
+        buffer = make_buffer()
+
+        assert BotRunner._apply_tick(buffer, {"time": 0}, 101.5, HOUR_MS)
+        assert len(buffer) == 2
+        assert buffer[-1]["close"] == 101.5
@@ -0,0 +1,77 @@
+"""
+CandleCacheManager 파일 캐시 append / 시리즈 버전 테스트
+"""
+from datetime import datetime
+
+import pytest
+
+from src.services.candle_cache import CandleCacheManager
+
+HOUR_MS = 60 * 60 * 1000
+START_MS = int(datetime(2024, 1, 1).timestamp() * 1000)
+
+
+def make_candles(start_index: int, count: int):
+    return [
+        {
+            "timestamp": START_MS + i * HOUR_MS,
+            "open": 100.0 + i,
+            "high": 101.0 + i,
+            "low": 99.0 + i,
+            "close": 100.5 + i,
+            "volume": 10.0,
+        }
+        for i in range(start_index, start_index + count)
+    ]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    manager = CandleCacheManager(cache_dir=str(tmp_path))
+    manager._save_to_file_cache("BTCUSDT", "1h", make_candles(0, 48))
+    return manager
+
+
+class TestAppendCandles:
+    def test_contiguous_candles_are_appended(self, cache):
+        cache.append_candles("BTCUSDT", "1h", make_candles(47, 5))
+
+        latest = cache.get_latest_candles("BTCUSDT", "1h", 100)
+        assert len(latest) == 52
+        assert latest[-1]["timestamp"] == START_MS + 51 * HOUR_MS
+
+    def test_candles_after_a_gap_are_not_appended(self, cache):
+        cache.append_candles("BTCUSDT", "1h", make_candles(60, 5))
+
+        latest = cache.get_latest_candles("BTCUSDT", "1h", 100)
+        assert len(latest) == 48
+        assert latest[-1]["timestamp"] == START_MS + 47 * HOUR_MS
+
+
+class TestSeriesVersion:
+    def test_append_keeps_version_of_historical_range(self, cache):
+        before = cache.get_series_version("BTCUSDT", "1h", "2024-01-01")
+        cache.append_candles("BTCUSDT", "1h", make_candles(48, 5))
+
+        assert cache.get_series_version("BTCUSDT", "1h", "2024-01-01") == before
+
+    def test_append_changes_version_of_open_range(self, cache):
+        before = cache.get_series_version("BTCUSDT", "1h")
+        cache.append_candles("BTCUSDT", "1h", make_candles(48, 5))
+
+        assert cache.get_series_version("BTCUSDT", "1h") != before
+
+    def test_rewrite_changes_version_of_historical_range(self, cache):
+        before = cache.get_series_version("BTCUSDT", "1h", "2024-01-01")
+        candles = make_candles(0, 48)
+        candles[0]["close"] = 1.0
+        cache._save_to_file_cache("BTCUSDT", "1h", candles)
+
+        assert cache.get_series_version("BTCUSDT", "1h", "2024-01-01") != before
+
+    def test_version_survives_metadata_reload(self, cache, tmp_path):
+        cache.append_candles("BTCUSDT", "1h", make_candles(48, 5))
+        version = cache.get_series_version("BTCUSDT", "1h", "2024-01-01")
+
+        other_process = CandleCacheManager(cache_dir=str(tmp_path))
+        assert other_process.get_series_version("BTCUSDT", "1h", "2024-01-01") == version
@@ -0,0 +1,126 @@
+"""
+DynamicStrategyAdapter (proven_* 전략 백테스트 어댑터) 테스트
+"""
+import numpy as np
+import pytest
+
+from benchmarks.data import synthetic_candles
+from src.services.backtest_engine import BacktestEngine
+from src.services.candle_arrays import CANDLE_FIELDS
+from src.services.strategies.dynamic_adapter import (
+    INDICATOR_OFFSETS,
+    CandleWindow,
+    IndicatorSeriesMemo,
+)
+from src.services.strategies.registry import get_strategy
+
+HOUR_MS = 3_600_000
+
+
+@pytest.fixture(scope="module")
+def candles():
+    return synthetic_candles(2_000, seed=0, step_ms=HOUR_MS)
+
+
+def series_window(candles, start=0, end=None):
+    columns = tuple(getattr(candles, field).tolist() for field in CANDLE_FIELDS)
+    return CandleWindow(columns, start, len(candles) if end is None else end)
+
+
+class TestCandleWindow:
+    def test_list_operations(self, candles):
+        window = series_window(candles, 100, 300)
+
+        assert len(window) == 200
+        assert window[0]["timestamp"] == candles.timestamp[100]
+        assert window[-1]["close"] == candles.close[299]
+        assert [c["close"] for c in window][:3] == candles.close[100:103].tolist()
+        with pytest.raises(IndexError):
+            window[200]
+
+    def test_slices_are_views(self, candles):
+        window = series_window(candles, 100, 300)
+
+        tail = window[-50:]
+        assert isinstance(tail, CandleWindow)
+        assert (tail.start, tail.end) == (250, 300)
+        assert len(window[10:5]) == 0
+        assert [c["close"] for c in window[0:6:2]] == candles.close[100:106:2].tolist()
+        np.testing.assert_array_equal(window.column("high"), candles.high[100:300])
+
+
+class TestIndicatorSeriesMemo:
+    @pytest.mark.parametrize("name,args", [("calculate_rsi", (14,)), ("calculate_ema", (20,)), ("calculate_macd", ())])
+    def test_window_slice_is_aligned_with_direct_computation(self, candles, name, args):
+        strategy = get_strategy("proven_balanced")
+        func = getattr(strategy.executor, f"_{name}")
+        series = series_window(candles)
+        wrapped = IndicatorSeriesMemo(series).wrap(name, func)
+
+        window = CandleWindow(series.columns, 1_000, 1_200)
+        memoized = wrapped(window, *args)
+        direct = func(series[: window.end], *args)
+
+        # 윈도우 결과 = 전체 시리즈 결과의 같은 구간 (길이 보정: INDICATOR_OFFSETS)
+        if isinstance(memoized, tuple):
+            for part, full in zip(memoized, direct):
+                assert len(part) == 200 - INDICATOR_OFFSETS[name]
+                np.testing.assert_allclose(part, np.asarray(full)[-len(part):])
+        else:
+            assert len(memoized) == 200 - INDICATOR_OFFSETS[name]
+            np.testing.assert_allclose(memoized, np.asarray(direct)[-len(memoized):])
+
+    def test_foreign_candles_bypass_the_memo(self, candles):
+        calls = []
+        wrapped = IndicatorSeriesMemo(series_window(candles)).wrap(
+            "calculate_ema", lambda c, period: calls.append(period) or [1.0] * len(c)
+        )
+
+        assert wrapped([{"close": 1.0}] * 3, 5) == [1.0] * 3
+        assert calls == [5]
+
+
+class TestDynamicStrategyAdapter:
+    @pytest.mark.parametrize("bad_close", [np.nan, 0.0, -1.0])
+    @pytest.mark.parametrize("name", ["proven_conservative", "proven_balanced", "proven_aggressive"])
+    def test_invalid_closes_keep_bar_index_in_sync(self, candles, name, bad_close):
+        """엔진 루프는 close <= 0만 건너뛰고 NaN 종가는 on_candle까지 전달"""
+        data = candles.slice(0, len(candles))
+        data.close = data.close.copy()
+        data.close[500] = bad_close
+        strategy = get_strategy(name)
+
+        BacktestEngine(strategy).run_on_candles(data, {"mode": "loop", "initial_balance": 1000})
+
+        expected_steps = len(data) - (1 if bad_close <= 0 else 0)
+        assert strategy._step == expected_steps
+
+    def test_entry_hands_stop_loss_and_take_profit_to_the_engine(self, candles):
+        strategy = get_strategy("proven_conservative")
+        strategy.prepare(candles)
+
+        position = None
+        for i in range(len(candles)):
+            action = strategy.on_candle(candles.candle(i), position)
+            if action in ("buy", "sell"):
+                position = {
+                    "direction": "long" if action == "buy" else "short",
+                    "entry_price": float(candles.close[i]),
+                }
+                break
+
+        assert position is not None
+        stop_loss, take_profit = strategy.exit_levels(position)
+        assert stop_loss is not None and take_profit is not None
+        if position["direction"] == "long":
+            assert stop_loss < position["entry_price"] < take_profit
+        else:
+            assert take_profit < position["entry_price"] < stop_loss
+
+        # 보유 중에는 진입 시점의 손절/익절 가격을 유지
+        strategy.on_candle(candles.candle(i + 1), position)
+        assert strategy.exit_levels(position) == (stop_loss, take_profit)
+
+        # 포지션이 없는 캔들에서 진입하지 않으면 이전 가격을 지움
+        if strategy.on_candle(candles.candle(i + 2), None) == "hold":
+            assert strategy.exit_levels(position) == (None, None)
@@ -0,0 +1,80 @@
+"""
+보유 포지션 청산 트리거 테스트
+
+트리거가 평가를 생략한 틱에서는 전략의 청산 판단도 청산하지 않아야 합니다
+(라이브 버퍼는 틱마다 캔들을 추가하므로 지표 조건은 틱마다 달라짐).
+"""
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from benchmarks.data import synthetic_candles
+from src.strategies.dynamic_strategy_executor import DynamicStrategyExecutor
+from src.strategies.exit_triggers import ExitTriggers, last_rsi
+
+STRATEGIES_DIR = Path(__file__).resolve().parents[2] / "src" / "strategies"
+
+
+def load_executor(name: str) -> DynamicStrategyExecutor:
+    code = (STRATEGIES_DIR / f"{name}_strategy.py").read_text(encoding="utf-8")
+    return DynamicStrategyExecutor(code, {})
+
+
+class TestExitTriggers:
+    def test_price_bounds(self):
+        triggers = ExitTriggers(bar=1).merge(lower=95.0, upper=105.0)
+
+        assert triggers.holds(100.0, 1)
+        assert not triggers.holds(94.0, 1)
+        assert not triggers.holds(106.0, 1)
+        assert not triggers.holds(100.0, 2)  # 새 바 → 평가
+
+    def test_rsi_zone_without_closes_requires_evaluation(self):
+        triggers = ExitTriggers(bar=1).merge(rsi_zones=[(14, 45, 55)])
+
+        assert not triggers.holds(100.0, 1)
+
+    def test_round_trip(self):
+        triggers = ExitTriggers(bar=3).merge(upper=110.0, rsi_zones=[(14, 55, 45)])
+        restored = ExitTriggers.from_dict(triggers.to_dict(), bar=3)
+
+        assert restored.upper == 110.0
+        assert restored.rsi_zones == [(14, 45, 55)]
+
+
+@pytest.mark.parametrize("name", ["proven_balanced", "proven_conservative", "proven_aggressive"])
+def test_skipped_ticks_never_hide_an_exit(name):
+    """윈도우 × 틱 시뮬레이션: 트리거가 hold인 틱에서 전략도 청산하지 않음"""
+    executor = load_executor(name)
+    candles = synthetic_candles(3_000, seed=7)
+    rng = np.random.default_rng(11)
+
+    skipped = 0
+    for end in range(250, 3_000 - 5, 10):
+        buffer = [candles.candle(i) for i in range(end - 200, end)]
+        entry = buffer[-1]["close"]
+        side = "LONG" if rng.random() < 0.5 else "SHORT"
+        position = {"side": side, "entry_price": entry}
+        triggers = executor.exit_triggers(position, buffer)
+        assert triggers is not None
+        triggers.bar = 0
+
+        for tick in range(5):
+            price = float(candles.close[end + tick])
+            buffer = buffer[1:] + [{**candles.candle(end + tick), "close": price}]
+            closes = [c["close"] for c in buffer]
+            if triggers.holds(price, 0, closes if triggers.rsi_zones else None):
+                skipped += 1
+                assert not executor._should_exit_position(position, price, buffer)
+
+    assert skipped > 0
+
+
+def test_last_rsi_matches_strategy_rsi():
+    executor = load_executor("proven_balanced")
+    candles = synthetic_candles(400, seed=3)
+    for n in (1, 14, 15, 16, 200):
+        rows = [candles.candle(i) for i in range(400 - n, 400)]
+        closes = [row["close"] for row in rows]
+        assert last_rsi(closes, 14) == pytest.approx(executor._calculate_rsi(rows, 14)[-1])
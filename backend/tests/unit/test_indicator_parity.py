@@ -0,0 +1,319 @@
+"""
+지표 구현 간 결과 일치 테스트
+
+- batch(numpy) vs streaming(증분 상태) - 같은 워밍업 규칙, 값은 허용 오차 내
+- DynamicStrategyExecutor.calculate_* vs 기존 파이썬 루프 구현 (아래 _legacy_*)
+- 공유 지표 메모(SharedIndicatorMemo) vs 확정 캔들 직접 계산 (봇 버퍼 간 공유)
+- exit_triggers.last_rsi vs calculate_rsi(...)[-1] (RSI 구간 청산 트리거)
+- 레거시 strategy_engine 롤링 상태(윈도우 EMA, 고가/저가) vs 윈도우 재계산
+- EmaStrategy / RsiStrategy: prepare() 배치 경로 vs 스트리밍 경로
+"""
+import numpy as np
+import pytest
+
+from benchmarks.data import synthetic_candles
+from src import indicators
+from src.indicators.memo import SharedIndicatorMemo
+from src.services import strategy_engine
+from src.services.strategies.registry import get_strategy
+from src.strategies.dynamic_strategy_executor import DynamicStrategyExecutor
+from src.strategies.exit_triggers import last_rsi
+
+RTOL = 1e-9
+ATOL = 1e-9
+
+PERIODS = (2, 9, 14, 50, 200)
+WINDOW_SIZES = (1, 5, 15, 30, 200, 2000)
+
+
+@pytest.fixture(scope="module")
+def candles():
+    return synthetic_candles(20_000, seed=42)
+
+
+@pytest.fixture(scope="module")
+def executor():
+    return DynamicStrategyExecutor("", {})
+
+
+def assert_close(expected, actual):
+    expected = np.asarray(expected, dtype=np.float64)
+    actual = np.asarray(actual, dtype=np.float64)
+    assert expected.shape == actual.shape
+    np.testing.assert_allclose(actual, expected, rtol=RTOL, atol=ATOL, equal_nan=True)
+
+
+def stream(state, *columns) -> np.ndarray:
+    values = [state.update(*row) for row in zip(*columns)]
+    return np.array([np.nan if v is None else v for v in values])
+
+
+# ===== 기존 파이썬 루프 구현 (결과 고정용) =====
+
+def _legacy_rsi(closes, period):
+    if len(closes) < period + 1:
+        return [50.0] * len(closes)
+    deltas = np.diff(closes)
+    gains = np.where(deltas > 0, deltas, 0)
+    losses = np.where(deltas < 0, -deltas, 0)
+    avg_gain = np.mean(gains[:period])
+    avg_loss = np.mean(losses[:period])
+    values = [50.0] * period
+    for i in range(period, len(deltas)):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        values.append(100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss)))
+    return values
+
+
+def _legacy_ema(closes, period):
+    if len(closes) < period:
+        return [closes[0]] * len(closes)
+    values = [np.mean(closes[:period])]
+    multiplier = 2 / (period + 1)
+    for i in range(period, len(closes)):
+        values.append((closes[i] - values[-1]) * multiplier + values[-1])
+    return [values[0]] * (period - 1) + values
+
+
+def _legacy_macd(closes, fast=12, slow=26, signal=9):
+    macd_line = [f - s for f, s in zip(_legacy_ema(closes, fast), _legacy_ema(closes, slow))]
+    signal_line = _legacy_ema(macd_line, signal)
+    return macd_line, signal_line, [m - s for m, s in zip(macd_line, signal_line)]
+
+
+def _legacy_sma(closes, period):
+    if len(closes) < period:
+        return [closes[0]] * len(closes)
+    return [
+        np.mean(closes[: i + 1]) if i < period - 1 else np.mean(closes[i - period + 1: i + 1])
+        for i in range(len(closes))
+    ]
+
+
+def _legacy_bollinger(closes, period=20, std_dev=2.0):
+    if len(closes) < period:
+        avg = np.mean(closes)
+        return [avg] * len(closes), [avg] * len(closes), [avg] * len(closes)
+    middle = _legacy_sma(closes, period)
+    std = [
+        np.std(closes[: i + 1]) if i < period - 1 else np.std(closes[i - period + 1: i + 1])
+        for i in range(len(closes))
+    ]
+    return (
+        [m + std_dev * s for m, s in zip(middle, std)],
+        middle,
+        [m - std_dev * s for m, s in zip(middle, std)],
+    )
+
+
+def _legacy_atr(high, low, close, period):
+    tr = [
+        max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        for i in range(1, len(close))
+    ]
+    values = [tr[0]]
+    for i in range(1, len(tr)):
+        values.append(np.mean(tr[: i + 1]) if i < period else (values[-1] * (period - 1) + tr[i]) / period)
+    return [values[0]] + values
+
+
+def _legacy_adx(high, low, close, period):
+    if len(close) < period + 1:
+        return [25.0] * len(close)
+    return [min(100, max(0, a * 2)) for a in _legacy_atr(high, low, close, period)]
+
+
+def _legacy_strategy_engine_ema(values, period):
+    k = 2 / (period + 1)
+    ema = values[0]
+    for price in values[1:]:
+        ema = price * k + ema * (1 - k)
+    return ema
+
+
+@pytest.mark.parametrize("period", PERIODS)
+class TestBatchVsStreaming:
+    def test_ema(self, candles, period):
+        assert_close(indicators.ema(candles.close, period), stream(indicators.EMA(period), candles.close))
+
+    def test_ema_with_start(self, candles, period):
+        assert_close(
+            indicators.ema(candles.close, period, start=250),
+            stream(indicators.EMA(period, start=250), candles.close),
+        )
+
+    def test_wilder(self, candles, period):
+        assert_close(indicators.wilder(candles.close, period), stream(indicators.Wilder(period), candles.close))
+
+    def test_sma(self, candles, period):
+        assert_close(indicators.sma(candles.close, period), stream(indicators.SMA(period), candles.close))
+
+    def test_rsi(self, candles, period):
+        assert_close(indicators.rsi(candles.close, period), stream(indicators.RSI(period), candles.close))
+
+    def test_atr(self, candles, period):
+        assert_close(
+            indicators.atr(candles.high, candles.low, candles.close, period),
+            stream(indicators.ATR(period), candles.high, candles.low, candles.close),
+        )
+
+
+@pytest.mark.parametrize("n", WINDOW_SIZES)
+class TestExecutorVsLegacy:
+    def test_rsi(self, candles, executor, n):
+        rows = [candles.candle(i) for i in range(n)]
+        assert_close(_legacy_rsi(candles.close[:n].tolist(), 14), executor._calculate_rsi(rows, 14))
+
+    def test_ema(self, candles, executor, n):
+        rows = [candles.candle(i) for i in range(n)]
+        assert_close(_legacy_ema(candles.close[:n].tolist(), 20), executor._calculate_ema(rows, 20))
+
+    def test_sma(self, candles, executor, n):
+        rows = [candles.candle(i) for i in range(n)]
+        assert_close(_legacy_sma(candles.close[:n].tolist(), 20), executor._calculate_sma(rows, 20))
+
+    def test_bollinger_bands(self, candles, executor, n):
+        rows = [candles.candle(i) for i in range(n)]
+        for expected, actual in zip(
+            _legacy_bollinger(candles.close[:n].tolist()), executor._calculate_bollinger_bands(rows)
+        ):
+            assert_close(expected, actual)
+
+    def test_macd(self, candles, executor, n):
+        rows = [candles.candle(i) for i in range(n)]
+        for expected, actual in zip(
+            _legacy_macd(candles.close[:n].tolist()), executor._calculate_macd(rows)
+        ):
+            assert_close(expected, actual)
+
+    def test_atr_and_adx(self, candles, executor, n):
+        rows = [candles.candle(i) for i in range(n)]
+        high, low, close = (candles.high[:n].tolist(), candles.low[:n].tolist(), candles.close[:n].tolist())
+        if n >= 2:
+            assert_close(_legacy_atr(high, low, close, 14), executor._calculate_atr(rows, 14))
+        assert_close(_legacy_adx(high, low, close, 14), executor._calculate_adx(rows, 14))
+
+
+def bot_buffer(candles, end: int, tick_price: float, tick_time: int = 0):
+    """봇 캔들 버퍼 형태: 확정 캔들 199개 + 진행 중 캔들 (틱마다 종가/시각이 봇별로 다름)"""
+    rows = [{**candles.candle(i), "time": int(candles.timestamp[i])} for i in range(end - 199, end)]
+    rows.append(
+        {"open": tick_price, "high": tick_price, "low": tick_price, "close": tick_price,
+         "volume": 0.0, "time": tick_time}
+    )
+    return rows
+
+
+def carry_forward(result):
+    if isinstance(result, tuple):
+        return tuple(part + part[-1:] for part in result)
+    return result + result[-1:]
+
+
+class TestSharedMemo:
+    CALLS = (
+        ("_calculate_rsi", (14,)),
+        ("_calculate_ema", (20,)),
+        ("_calculate_macd", ()),
+        ("_calculate_bollinger_bands", ()),
+    )
+
+    @pytest.mark.parametrize("name,args", CALLS)
+    def test_memo_matches_closed_bar_computation(self, candles, executor, name, args):
+        memo = SharedIndicatorMemo(bars_per_stream=4, max_entries_per_bar=16, enabled=True)
+        func = getattr(executor, name)
+        wrapped = memo.wrap("BTC/USDT", "1m", name, func)
+        for end in range(200, 220):
+            rows = bot_buffer(candles, end, float(candles.close[end]))
+            expected = carry_forward(func(rows[:-1], *args))
+            assert wrapped(rows, *args) == expected  # 계산 후 저장
+            assert wrapped(rows, *args) == expected  # 메모 적중
+            # 반환 길이(캔들 인덱스 정렬)는 직접 계산과 같음
+            direct = func(rows, *args)
+            if isinstance(direct, tuple):
+                assert [len(part) for part in expected] == [len(part) for part in direct]
+            else:
+                assert len(expected) == len(direct)
+
+        stats = memo.get_stats()
+        assert stats["hits"] == 20
+        assert stats["misses"] == 20
+
+    def test_bots_with_different_in_progress_ticks_share_results(self, candles, executor):
+        memo = SharedIndicatorMemo(enabled=True)
+        bot_a = memo.wrap("BTCUSDT", "1m", "calculate_rsi", executor._calculate_rsi)
+        bot_b = memo.wrap("BTC/USDT", "1m", "calculate_rsi", executor._calculate_rsi)
+        tick_ms = int(candles.timestamp[300]) + 12_345
+
+        # WS 수집기(시각 없음) / ccxt 수집기(초 단위 시각), 서로 다른 틱 가격
+        first = bot_a(bot_buffer(candles, 300, 101.5, tick_time=0), 14)
+        second = bot_b(bot_buffer(candles, 300, 99.25, tick_time=tick_ms // 1000), 14)
+
+        assert second == first
+        assert memo.get_stats()["hits"] == 1
+
+    def test_new_closed_bar_is_not_shared(self, candles, executor):
+        memo = SharedIndicatorMemo(enabled=True)
+        wrapped = memo.wrap("BTCUSDT", "1m", "rsi", executor._calculate_rsi)
+        rows = bot_buffer(candles, 300, 100.0)
+        first = wrapped(rows)
+
+        revised = rows[:-2] + [{**rows[-2], "close": rows[-2]["close"] * 1.01}, rows[-1]]
+        assert wrapped(revised) == carry_forward(executor._calculate_rsi(revised[:-1]))
+        assert wrapped(revised) != first
+
+    def test_results_are_copies(self, candles, executor):
+        memo = SharedIndicatorMemo(enabled=True)
+        wrapped = memo.wrap("BTCUSDT", "1m", "ema", executor._calculate_ema)
+        rows = bot_buffer(candles, 300, 100.0)
+        result = wrapped(rows, 20)
+        result[-1] = -1.0
+
+        assert wrapped(rows, 20) == carry_forward(executor._calculate_ema(rows[:-1], 20))
+
+
+@pytest.mark.parametrize("n", (1, 14, 15, 16, 30, 200))
+@pytest.mark.parametrize("end_offset", (0, 1000, 3000))
+def test_exit_trigger_rsi_matches_strategy_rsi(candles, executor, n, end_offset):
+    end = n + end_offset
+    rows = [candles.candle(i) for i in range(end - n, end)]
+    closes = [row["close"] for row in rows]
+    assert_close([executor._calculate_rsi(rows, 14)[-1]], [last_rsi(closes, 14)])
+
+
+class TestStrategyEngineRollingState:
+    @pytest.mark.parametrize("period", (1, 3, 9, 21, 50))
+    def test_windowed_ema(self, candles, period):
+        close = candles.close[:3000].tolist()
+        ema = strategy_engine._WindowedEMA(period)
+        expected, actual = [], []
+        for i, value in enumerate(close):
+            ema.push(value)
+            if i + 1 >= period:
+                expected.append(_legacy_strategy_engine_ema(close[i + 1 - period: i + 1], period))
+                actual.append(ema.value)
+        assert_close(expected, actual)
+
+    @pytest.mark.parametrize("lookback", (1, 20, 77))
+    def test_rolling_extremes(self, candles, lookback):
+        high, low = candles.high[:3000].tolist(), candles.low[:3000].tolist()
+        extremes = strategy_engine._RollingExtremes(lookback)
+        expected, actual = [], []
+        for i in range(len(high)):
+            extremes.push(high[i], low[i])
+            start = max(0, i + 1 - lookback)
+            expected.append((max(high[start: i + 1]), min(low[start: i + 1])))
+            actual.append((extremes.high, extremes.low))
+        assert_close(expected, actual)
+
+
+@pytest.mark.parametrize("name", ("ema", "rsi"))
+def test_prepared_signals_match_streaming(candles, name):
+    def signals(prepared: bool):
+        strategy = get_strategy(name)
+        if prepared:
+            strategy.prepare(candles)
+        return [strategy.on_candle(candles.candle(i), None) for i in range(len(candles))]
+
+    assert signals(True) == signals(False)
@@ -0,0 +1,46 @@
+"""
+GET /metrics 스크레이프 인증 테스트
+"""
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.api import metrics as metrics_api
+from src.config import MetricsConfig, RateLimitConfig
+
+
+@pytest.fixture
+async def client():
+    app = FastAPI()
+    app.include_router(metrics_api.router)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture
+def production(monkeypatch):
+    monkeypatch.setattr(RateLimitConfig, "IS_DEVELOPMENT", False)
+
+
+class TestScrapeToken:
+    async def test_token_is_required_when_configured(self, client, monkeypatch):
+        monkeypatch.setattr(MetricsConfig, "SCRAPE_TOKEN", "secret")
+
+        assert (await client.get("/metrics")).status_code == 401
+        wrong = await client.get("/metrics", headers={"Authorization": "Bearer nope"})
+        assert wrong.status_code == 401
+
+        response = await client.get("/metrics", headers={"Authorization": "Bearer secret"})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+
+    async def test_production_without_token_hides_metrics(self, client, monkeypatch, production):
+        monkeypatch.setattr(MetricsConfig, "SCRAPE_TOKEN", "")
+
+        assert (await client.get("/metrics")).status_code == 404
+
+    async def test_development_without_token_is_open(self, client, monkeypatch):
+        monkeypatch.setattr(MetricsConfig, "SCRAPE_TOKEN", "")
+        monkeypatch.setattr(RateLimitConfig, "IS_DEVELOPMENT", True)
+
+        assert (await client.get("/metrics")).status_code == 200
@@ -0,0 +1,78 @@
+"""
+몬테카를로 분석 테스트 (프로세스 풀 없이 같은 프로세스에서 실행)
+"""
+import numpy as np
+import pytest
+
+from src.services import backtest_sweep
+from src.services.monte_carlo import run_monte_carlo, simulate_paths
+
+PNLS = np.array([120.0, -80.0, 45.0, -30.0, 200.0, -150.0, 60.0, 10.0])
+
+
+@pytest.fixture
+def inline_pool(monkeypatch):
+    async def run_in_pool(func, *args):
+        return func(*args)
+
+    monkeypatch.setattr(backtest_sweep.sweep_runner, "run_in_pool", run_in_pool)
+    monkeypatch.setattr(backtest_sweep.sweep_runner, "max_workers", 3)
+
+
+class TestSimulatePaths:
+    def test_shuffle_keeps_total_return(self):
+        total_return, max_drawdown, _ = simulate_paths(PNLS, 1000.0, 500, "shuffle", seed=1)
+
+        assert np.allclose(total_return, PNLS.sum() / 1000.0 * 100)
+        assert max_drawdown.min() >= 0
+
+    def test_profitable_trades_never_draw_down(self):
+        _, max_drawdown, ruined = simulate_paths(np.abs(PNLS), 1000.0, 200, "bootstrap", seed=2)
+
+        assert np.all(max_drawdown == 0)
+        assert not ruined.any()
+
+    def test_ruin_level(self):
+        _, _, ruined = simulate_paths(np.array([-600.0, -600.0]), 1000.0, 10, "shuffle", ruin_level=500.0)
+
+        assert ruined.all()
+
+    def test_blocks_match_single_pass(self, monkeypatch):
+        from src.services import monte_carlo
+
+        expected = simulate_paths(PNLS, 1000.0, 100, "shuffle", seed=3)
+        monkeypatch.setattr(monte_carlo, "_BLOCK_ELEMENTS", 80)
+        actual = simulate_paths(PNLS, 1000.0, 100, "shuffle", seed=3)
+
+        for e, a in zip(expected, actual):
+            np.testing.assert_array_equal(e, a)
+
+
+class TestRunMonteCarlo:
+    async def test_seeded_runs_are_reproducible(self, inline_pool):
+        first = await run_monte_carlo(PNLS, 1000.0, n_paths=1_000, seed=42)
+        second = await run_monte_carlo(PNLS, 1000.0, n_paths=1_000, seed=42)
+
+        assert first["paths"] == 1_000
+        assert first["trades"] == len(PNLS)
+        assert first["total_return"] == second["total_return"]
+        assert first["max_drawdown"] == second["max_drawdown"]
+
+    async def test_distribution_is_ordered(self, inline_pool):
+        result = await run_monte_carlo(PNLS, 1000.0, n_paths=2_000, method="shuffle", seed=7)
+
+        percentiles = [result["max_drawdown"][f"p{p}"] for p in (1, 5, 25, 50, 75, 95, 99)]
+        assert percentiles == sorted(percentiles)
+        assert 0 <= result["probability_of_ruin"] <= result["probability_of_loss"] <= 100
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"method": "walk"}, {"ruin_threshold": 0}, {"ruin_threshold": 1.5}],
+    )
+    async def test_invalid_arguments(self, inline_pool, kwargs):
+        with pytest.raises(ValueError):
+            await run_monte_carlo(PNLS, 1000.0, n_paths=10, **kwargs)
+
+    async def test_needs_two_trades(self, inline_pool):
+        with pytest.raises(ValueError):
+            await run_monte_carlo([10.0], 1000.0, n_paths=10)
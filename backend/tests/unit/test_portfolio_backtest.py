@@ -0,0 +1,68 @@
+"""
+멀티 심볼 포트폴리오 백테스트 테스트
+"""
+import numpy as np
+import pytest
+
+from benchmarks.data import synthetic_candles
+from src.services.portfolio_backtest import align_legs, run_portfolio_backtest
+
+HOUR_MS = 3_600_000
+
+
+def make_legs():
+    return [
+        ("BTCUSDT", "1h", synthetic_candles(2_000, seed=1, step_ms=HOUR_MS)),
+        ("ETHUSDT", "1h", synthetic_candles(2_000, seed=2, step_ms=HOUR_MS)),
+        ("SOLUSDT", "4h", synthetic_candles(500, seed=3, step_ms=4 * HOUR_MS)),
+    ]
+
+
+class TestAlignLegs:
+    def test_higher_timeframe_bar_is_visible_only_after_close(self):
+        legs = [
+            ("A", "1h", synthetic_candles(8, step_ms=HOUR_MS)),
+            ("B", "4h", synthetic_candles(2, step_ms=4 * HOUR_MS)),
+        ]
+        clock, bar_at, close_at = align_legs(legs)
+
+        assert len(clock) == 8
+        assert bar_at[1].tolist() == [-1, -1, -1, 0, 0, 0, 0, 1]
+        assert close_at[1].tolist() == [3, 7]
+        assert bar_at[0].tolist() == list(range(8))
+
+
+class TestRunPortfolioBacktest:
+    @pytest.mark.parametrize("max_positions", [1, 2, 3])
+    def test_position_limit(self, max_positions):
+        result = run_portfolio_backtest(
+            make_legs(), "ema", params={"initial_balance": 10_000, "max_positions": max_positions}
+        )
+
+        assert result["trades"]
+        assert 1 <= result["max_concurrent_positions"] <= max_positions
+
+    def test_balance_and_attribution_add_up(self):
+        initial = 10_000
+        result = run_portfolio_backtest(make_legs(), "rsi", params={"initial_balance": initial})
+
+        net = sum(t["pnl"] - t["fee"] for t in result["trades"])
+        assert result["final_balance"] == pytest.approx(initial + net)
+        assert result["equity_curve"][-1] == pytest.approx(result["final_balance"])
+
+        attribution = result["attribution"]
+        assert set(attribution) == {"BTCUSDT", "ETHUSDT", "SOLUSDT"}
+        assert sum(a["trades"] for a in attribution.values()) == len(result["trades"])
+        assert sum(a["net_pnl"] for a in attribution.values()) == pytest.approx(net, abs=1e-2)
+
+    def test_equity_curve_follows_clock(self):
+        result = run_portfolio_backtest(make_legs(), "openclose")
+
+        assert len(result["equity_curve"]) in (len(result["timestamps"]), len(result["timestamps"]) + 1)
+        assert np.all(np.diff(result["timestamps"]) > 0)
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            run_portfolio_backtest([], "ema")
+        with pytest.raises(ValueError):
+            run_portfolio_backtest(make_legs(), "ema", params={"max_positions": 0})
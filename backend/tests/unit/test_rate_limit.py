@@ -0,0 +1,39 @@
+"""
+RateLimitStore 기록 / 환불 테스트
+"""
+from collections import defaultdict
+
+from src.middleware.rate_limit_improved import RateLimitStore
+
+
+class TestRefund:
+    def test_refund_removes_the_recorded_entry(self):
+        store = RateLimitStore()
+        storage = defaultdict(list)
+
+        store.check_and_record("backtest", storage, limit=5, window=60, now=1000.0)
+        # 첫 요청 처리 중 같은 키로 다른 요청이 기록됨
+        store.check_and_record("backtest", storage, limit=5, window=60, now=1000.5)
+        store.refund("backtest", storage, 1000.0)
+
+        assert storage["backtest"] == [1000.5]
+
+    def test_refunded_slot_can_be_reused(self):
+        store = RateLimitStore()
+        storage = defaultdict(list)
+
+        store.check_and_record("backtest", storage, limit=1, window=60, now=1000.0)
+        store.refund("backtest", storage, 1000.0)
+        allowed, _, _ = store.check_and_record("backtest", storage, limit=1, window=60, now=1001.0)
+
+        assert allowed
+
+    def test_refund_of_expired_entry_is_a_no_op(self):
+        store = RateLimitStore()
+        storage = defaultdict(list)
+
+        store.check_and_record("backtest", storage, limit=5, window=60, now=1000.0)
+        store.check_and_record("backtest", storage, limit=5, window=60, now=1100.0)
+        store.refund("backtest", storage, 1000.0)
+
+        assert storage["backtest"] == [1100.0]
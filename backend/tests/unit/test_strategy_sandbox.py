@@ -0,0 +1,126 @@
+"""
+StrategySandboxPool 워커 반납 테스트 (실제 워커 프로세스 없이)
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.services.strategy_sandbox import StrategySandboxPool
+
+
+class FakeWorker:
+    def __init__(self, index: int):
+        self.index = index
+        self.restarts = 0
+
+
+@pytest.fixture
+def pool():
+    sandbox = StrategySandboxPool(max_workers=1)
+    sandbox._idle = asyncio.Queue()
+    sandbox._idle.put_nowait(FakeWorker(0))
+    sandbox._threads = ThreadPoolExecutor(max_workers=1)
+    yield sandbox
+    sandbox._threads.shutdown(wait=True)
+
+
+class TestEvaluateCancellation:
+    async def test_worker_returns_only_after_roundtrip_finishes(self, pool):
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow_roundtrip(worker, *args):
+            entered.set()
+            release.wait(5)
+            return "ok", {"action": "long"}
+
+        pool._roundtrip = slow_roundtrip
+
+        task = asyncio.create_task(pool.evaluate("code", None, 100.0, []))
+        while not entered.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # 왕복 스레드가 워커를 사용 중 → 아직 반납되지 않음
+        assert pool._idle.qsize() == 0
+
+        release.set()
+        worker = await asyncio.wait_for(pool._idle.get(), timeout=5)
+        assert worker.index == 0
+
+    async def test_worker_is_reused_after_normal_call(self, pool):
+        pool._roundtrip = lambda worker, *args: ("ok", {"action": "hold", "worker": worker.index})
+
+        first = await pool.evaluate("code", None, 100.0, [])
+        second = await pool.evaluate("code", None, 100.0, [])
+
+        assert first["worker"] == second["worker"] == 0
+        await asyncio.sleep(0)
+        assert pool._idle.qsize() == 1
+
+
+class TestConcurrencyKey:
+    async def test_bots_sharing_a_strategy_use_one_worker_at_a_time(self):
+        sandbox = StrategySandboxPool(max_workers=2)
+        sandbox._idle = asyncio.Queue()
+        for index in range(2):
+            sandbox._idle.put_nowait(FakeWorker(index))
+        sandbox._threads = ThreadPoolExecutor(max_workers=2)
+
+        lock = threading.Lock()
+        running = {"now": 0, "max": 0}
+
+        def roundtrip(worker, strategy_code, *args):
+            with lock:
+                running["now"] += 1
+                running["max"] = max(running["max"], running["now"])
+            threading.Event().wait(0.05)
+            with lock:
+                running["now"] -= 1
+            return "ok", {"action": "hold"}
+
+        sandbox._roundtrip = roundtrip
+        try:
+            await asyncio.gather(
+                *(
+                    sandbox.evaluate("heavy", None, 100.0, [], key=f"bot:{user_id}")
+                    for user_id in range(4)
+                )
+            )
+        finally:
+            sandbox._threads.shutdown(wait=True)
+
+        assert running["max"] == 1
+        assert set(sandbox.get_stats()["strategies"]) == {f"bot:{i}" for i in range(4)}
+
+
+class TestEvaluateSeries:
+    async def test_series_matches_in_process_executor(self):
+        from benchmarks.data import synthetic_candles
+        from src.services.strategy_loader import load_strategy_class
+
+        candles = synthetic_candles(400, seed=5)
+        expected = load_strategy_class("proven_conservative").generate_signal_series(candles)
+
+        sandbox = StrategySandboxPool(max_workers=1)
+        try:
+            actual = await sandbox.evaluate_series("proven_conservative", None, candles)
+        finally:
+            sandbox.shutdown()
+
+        assert actual == expected.tolist()
+
+    async def test_series_rejects_too_many_candles(self, monkeypatch):
+        from benchmarks.data import synthetic_candles
+        from src.config import StrategySandboxConfig
+
+        monkeypatch.setattr(StrategySandboxConfig, "SERIES_MAX_CANDLES", 100)
+        sandbox = StrategySandboxPool(max_workers=1)
+
+        with pytest.raises(ValueError):
+            await sandbox.evaluate_series("proven_conservative", None, synthetic_candles(101))
+        assert sandbox._idle is None  # 워커를 띄우기 전에 거절
@@ -0,0 +1,120 @@
+"""
+워크포워드 fold 분할 / OOS 곡선 연결 테스트
+"""
+import numpy as np
+import pytest
+
+from benchmarks.data import synthetic_candles
+from src.services import walk_forward
+from src.services.backtest_engine import BacktestEngine
+from src.services.backtest_sweep import BacktestSweepRunner, ParameterGrid
+from src.services.strategies.registry import get_strategy
+from src.services.walk_forward import build_folds, run_walk_forward
+
+HOUR_MS = 3_600_000
+
+
+def hourly(days: int) -> np.ndarray:
+    return np.arange(days * 24, dtype=np.int64) * HOUR_MS + 1_700_000_000_000
+
+
+class TestBuildFolds:
+    def test_rolling_windows_move_by_step(self):
+        folds = build_folds(hourly(60), in_sample_days=20, out_of_sample_days=10)
+
+        assert folds == [
+            (0, 480, 480, 720),
+            (240, 720, 720, 960),
+            (480, 960, 960, 1200),
+            (720, 1200, 1200, 1440),
+        ]
+
+    def test_anchored_windows_keep_the_start(self):
+        folds = build_folds(hourly(60), 20, 10, anchored=True)
+
+        assert [f[0] for f in folds] == [0, 0, 0, 0]
+        assert [f[1] for f in folds] == [480, 720, 960, 1200]
+        assert all(f[1] == f[2] for f in folds)
+
+    def test_custom_step_allows_overlapping_oos(self):
+        folds = build_folds(hourly(40), 20, 10, step_days=5)
+
+        assert [(f[2], f[3]) for f in folds] == [(480, 720), (600, 840), (720, 960)]
+
+    def test_last_partial_oos_window_is_dropped(self):
+        # 65일: 마지막 OOS 구간(60~70일)은 5일만 존재
+        folds = build_folds(hourly(65), 20, 10)
+
+        assert folds[-1] == (720, 1200, 1200, 1440)
+        assert all(oos_end <= 65 * 24 for _, _, _, oos_end in folds)
+
+    def test_too_short_range_and_invalid_windows(self):
+        assert build_folds(hourly(25), 20, 10) == []
+        assert build_folds(np.array([], dtype=np.int64), 20, 10) == []
+        with pytest.raises(ValueError):
+            build_folds(hourly(60), 0, 10)
+        with pytest.raises(ValueError):
+            build_folds(hourly(60), 20, 10, step_days=-1)
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    runner = BacktestSweepRunner(max_workers=2)
+    monkeypatch.setattr(walk_forward, "sweep_runner", runner)
+    yield runner
+    runner.shutdown()
+
+
+class TestRunWalkForward:
+    async def test_stitched_oos_curve_matches_fold_runs(self, runner):
+        candles = synthetic_candles(60 * 24, seed=1, step_ms=HOUR_MS)
+        engine_params = {"initial_balance": 1000.0, "timeframe": "1h"}
+
+        result = await run_walk_forward(
+            candles,
+            "ema",
+            ParameterGrid({"fast_length": [5, 8], "slow_length": [20]}),
+            engine_params,
+            in_sample_days=20,
+            out_of_sample_days=10,
+        )
+
+        assert result["failed_runs"] == 0
+        assert len(result["folds"]) == 4
+
+        # 각 fold의 OOS 구간을 선택 파라미터로 단독 실행한 결과와 비교
+        balance = 1000.0
+        expected_curve, bars_in_position, trades = [], 0, 0
+        for fold, (_, _, oos_start, oos_end) in zip(
+            result["folds"], build_folds(candles.timestamp, 20, 10)
+        ):
+            strategy = get_strategy("ema", fold["best_params"])
+            output = BacktestEngine(strategy=strategy).run_on_candles(
+                candles.slice(oos_start, oos_end), engine_params
+            )
+            shift = balance - 1000.0
+            expected_curve.extend(value + shift for value in output["equity_curve"])
+            balance = output["final_balance"] + shift
+            bars_in_position += round(
+                output["metrics"]["exposure"] / 100 * len(output["equity_curve"])
+            )
+            trades += len(output["trades"])
+
+        curve = result["equity_curve"]
+        assert trades > 0
+        assert curve[0] == pytest.approx(1000.0)
+        assert curve[-1] == pytest.approx(result["final_balance"])
+        assert result["final_balance"] == pytest.approx(balance)
+        np.testing.assert_allclose(curve, expected_curve)
+        assert len(result["trades"]) == trades
+        assert result["metrics"]["exposure"] == pytest.approx(
+            round(bars_in_position / len(curve) * 100, 2)
+        )
+
+    async def test_too_short_range_is_rejected(self, runner):
+        candles = synthetic_candles(10 * 24, seed=1, step_ms=HOUR_MS)
+
+        with pytest.raises(ValueError):
+            await run_walk_forward(
+                candles, "ema", ParameterGrid({"fast_length": [5]}), {}, 20, 10
+            )